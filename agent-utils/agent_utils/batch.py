@@ -0,0 +1,203 @@
+"""Run many gh operations from JSONL specs concurrently in one process."""
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from typing import TextIO
+
+import typer
+from jira_utils.json_output import output_json
+
+from agent_utils.cli import _Commands
+
+OWNER_ENV = "GITHUB_OWNER"
+REPO_ENV = "GITHUB_REPO"
+
+DEFAULT_CONCURRENCY = 4
+
+# Only gh commands are batched: git-commit and git-push change the working
+# tree and cannot safely run side by side.
+_BATCHABLE = frozenset(name for name in _Commands.lazy_commands if name[:3] == "gh-")
+
+app = typer.Typer(invoke_without_command=True)
+
+
+def read_specs(stream: TextIO) -> list[dict]:
+    """Parse JSONL operation specs, skipping blank lines.
+
+    Raises:
+        ValueError: If a line is not a JSON object (nothing is run).
+    """
+    specs = []
+    for lineno, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            spec = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"line {lineno}: {e}") from e
+        if not isinstance(spec, dict):
+            raise ValueError(f"line {lineno}: expected a JSON object")
+        specs.append(spec)
+    return specs
+
+
+def _repo_env(env: dict[str, str] | None) -> dict[str, str]:
+    """GITHUB_OWNER and GITHUB_REPO, checked once for the whole batch.
+
+    Raises:
+        ValueError: If GITHUB_OWNER or GITHUB_REPO is not set.
+    """
+    environ = {**os.environ} if env is None else {**os.environ, **env}
+    owner = (environ.get(OWNER_ENV) or "").strip()
+    repo = (environ.get(REPO_ENV) or "").strip()
+    if not owner:
+        raise ValueError(f"{OWNER_ENV} is not set")
+    if not repo:
+        raise ValueError(f"{REPO_ENV} is not set")
+    return {**(env or {}), OWNER_ENV: owner, REPO_ENV: repo}
+
+
+def _kwargs(spec: dict) -> dict:
+    """A spec's ``args`` as run-function keyword arguments.
+
+    Raises:
+        ValueError: If ``args`` is not a JSON object.
+    """
+    args = spec.get("args", {})
+    if not isinstance(args, dict):
+        raise ValueError("args must be a JSON object")
+    return {name.replace("-", "_"): value for name, value in args.items()}
+
+
+def _pr_number(spec: dict) -> str | None:
+    """PR a spec touches, for per-PR ordering."""
+    args = spec.get("args")
+    if not isinstance(args, dict):
+        return None
+    value = args.get("pr_number", args.get("pr-number"))
+    return None if value is None else str(value)
+
+
+def _resolve(spec: dict) -> Callable:
+    """The run function for one spec.
+
+    Raises:
+        ValueError: If ``cmd`` is missing or cannot be batched.
+    """
+    cmd = spec.get("cmd")
+    if cmd not in _BATCHABLE:
+        raise ValueError(f"unsupported command: {cmd!r}")
+    module = importlib.import_module(_Commands.lazy_commands[cmd])
+    return getattr(module, f"run_{cmd.replace('-', '_')}")
+
+
+def _result(result: object) -> object:
+    """JSON-ready result of a run function.
+
+    Raises:
+        RuntimeError: If gh exited non-zero.
+    """
+    if isinstance(result, subprocess.CompletedProcess):
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr or result.stdout)
+        return result.stdout.strip()
+    if isinstance(result, tuple):
+        code, output = result
+        if code != 0:
+            raise RuntimeError(output)
+        return output.strip()
+    return result
+
+
+def _run_one(index: int, spec: dict, env: dict[str, str]) -> dict:
+    line = {"index": index, "cmd": spec.get("cmd")}
+    try:
+        line["result"] = _result(_resolve(spec)(**_kwargs(spec), env=env))
+    except Exception as e:
+        line["error"] = str(e).strip()
+    return line
+
+
+def run_batch(
+    specs: Iterable[dict],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    env: dict[str, str] | None = None,
+) -> Iterator[dict]:
+    """Run ``{"cmd", "args"}`` specs concurrently against one repo.
+
+    ``cmd`` is an agent-utils gh subcommand and ``args`` the keyword
+    arguments of its run function (dashes or underscores). GITHUB_OWNER and
+    GITHUB_REPO are checked before anything runs. Up to ``concurrency`` gh
+    invocations run at once, except that specs with the same ``pr_number``
+    run one after another in input order. A failing spec does not stop
+    later ones.
+
+    Args:
+        specs: Operation specs.
+        concurrency: Maximum gh invocations running at once.
+        env: Optional env overrides (merged with os.environ).
+
+    Yields:
+        One dict per spec as soon as it finishes (completion order, not
+        input order): the input ``index`` and ``cmd`` plus either ``result``
+        or ``error``. JSON output is returned parsed; text output as a string.
+
+    Raises:
+        ValueError: If GITHUB_OWNER or GITHUB_REPO is not set, or concurrency
+            is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    repo_env = _repo_env(env)
+
+    def after(prior: Future | None, index: int, spec: dict) -> dict:
+        # Earlier specs were queued first, so ``prior`` is running or done.
+        if prior is not None:
+            wait([prior])
+        return _run_one(index, spec, repo_env)
+
+    last: dict[str, Future] = {}
+    futures: list[Future] = []
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for index, spec in enumerate(specs):
+            pr = _pr_number(spec)
+            future = pool.submit(after, last.get(pr), index, spec)
+            if pr is not None:
+                last[pr] = future
+            futures.append(future)
+        for future in as_completed(futures):
+            yield future.result()
+
+
+@app.callback()
+def main(
+    concurrency: int = typer.Option(
+        DEFAULT_CONCURRENCY, "--concurrency", help="gh invocations to run at once"
+    ),
+) -> None:
+    """Run JSONL operation specs from stdin concurrently.
+
+    Each line is {"cmd": "gh-pr-view", "args": {"ref": "42"}}. Results are
+    written as JSONL as each operation completes. Exits non-zero if any
+    spec failed.
+    """
+    failed = False
+    try:
+        for line in run_batch(read_specs(sys.stdin), concurrency=concurrency):
+            failed = failed or "error" in line
+            output_json(line)
+    except ValueError as e:
+        typer.echo(f"batch: {e}", err=True)
+        raise typer.Exit(1) from e
+    if failed:
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
@@ -5,6 +5,7 @@ import os
 import subprocess
 
 import typer
+from jira_utils.json_output import output_json
 
 OWNER_ENV = "GITHUB_OWNER"
 REPO_ENV = "GITHUB_REPO"
@@ -73,7 +74,7 @@ def main(
         typer.echo(str(e), err=True)
         raise typer.Exit(1) from e
 
-    typer.echo(json.dumps(result, indent=2))
+    output_json(result, pretty=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+"""Check the import cost of dispatching each agent-utils subcommand.
+
+Runs one fresh interpreter per command under ``python -X importtime``::
+
+    uv run python benchmarks/bench_import_time.py
+    uv run python benchmarks/bench_import_time.py --commands gh-pr-view --repeat 9
+
+Each run imports the CLI and resolves one subcommand, exactly what
+``agent-utils <command>`` does before parsing its options, and sums the
+self time of every module imported (interpreter startup included). The
+median over ``--repeat`` runs is compared against the command's budget
+(times ``--scale`` on slower machines); the script prints a JSON summary
+and exits 1 if any command is over.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import statistics
+import subprocess
+import sys
+
+import typer
+
+from agent_utils.cli import _Commands
+
+app = typer.Typer()
+
+# Milliseconds of imports allowed before a command starts running.
+DEFAULT_BUDGET_MS = 150
+BUDGETS_MS: dict[str, int] = {}
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+_DISPATCH = (
+    "import typer; from agent_utils.cli import app; "
+    "typer.main.get_command(app).get_command(None, {command!r})"
+)
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """``(module, self_us, cumulative_us, depth)`` per ``-X importtime`` line."""
+    rows = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def _measure(command: str) -> list[tuple[str, int, int, int]]:
+    """Import rows for one fresh interpreter dispatching ``command``."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", _DISPATCH.format(command=command)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+@app.command()
+def main(
+    commands: str | None = typer.Option(
+        None, help="Comma-separated subcommands to check (default: all)"
+    ),
+    repeat: int = typer.Option(5, help="Fresh interpreters per command"),
+    top: int = typer.Option(5, help="Heaviest top-level imports to list"),
+    scale: float = typer.Option(1.0, help="Multiplier applied to every budget"),
+) -> None:
+    """Time subcommand imports and fail if any exceeds its budget."""
+    names = commands.split(",") if commands else sorted(_Commands.lazy_commands)
+    report = []
+    for command in names:
+        runs = [_measure(command) for _ in range(repeat)]
+        totals = [sum(row[1] for row in rows) / 1000 for rows in runs]
+        median = statistics.median(totals)
+        budget = BUDGETS_MS.get(command, DEFAULT_BUDGET_MS) * scale
+        heaviest = sorted(
+            (row for row in runs[-1] if row[3] == 0), key=lambda row: -row[2]
+        )[:top]
+        report.append(
+            {
+                "command": command,
+                "median_ms": round(median, 1),
+                "min_ms": round(min(totals), 1),
+                "budget_ms": budget,
+                "ok": median <= budget,
+                "modules": len(runs[-1]),
+                "heaviest": {row[0]: round(row[2] / 1000, 1) for row in heaviest},
+            }
+        )
+    typer.echo(json.dumps(report, indent=2))
+    if not all(entry["ok"] for entry in report):
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
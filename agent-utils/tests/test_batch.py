@@ -0,0 +1,139 @@
+"""Tests for batch: concurrent gh operations from JSONL specs."""
+
+import json
+import subprocess
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from agent_utils.batch import app, read_specs, run_batch
+
+ENV = {"GITHUB_OWNER": "o", "GITHUB_REPO": "r"}
+
+
+def _view(ref: str) -> dict:
+    return {"cmd": "gh-pr-view", "args": {"ref": ref}}
+
+
+def test_read_specs_skips_blank_lines() -> None:
+    specs = read_specs(['{"cmd": "gh-pr-list"}\n', "\n", '{"cmd": "gh-pr-view"}\n'])
+    assert [s["cmd"] for s in specs] == ["gh-pr-list", "gh-pr-view"]
+
+
+def test_read_specs_rejects_non_object_line() -> None:
+    with pytest.raises(ValueError, match="line 2"):
+        read_specs(['{"cmd": "gh-pr-list"}\n', "[1]\n"])
+
+
+def test_missing_repo_fails_before_running_anything() -> None:
+    with patch("agent_utils.gh_pr_view.subprocess.run") as m:
+        with pytest.raises(ValueError, match="GITHUB_REPO"):
+            list(run_batch([_view("1")], env={"GITHUB_OWNER": "o", "GITHUB_REPO": ""}))
+        m.assert_not_called()
+
+
+def test_runs_concurrently_and_yields_in_completion_order() -> None:
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_run(cmd, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        ref = cmd[3]
+        time.sleep(0.05 if ref == "0" else 0.01)
+        with lock:
+            in_flight -= 1
+        return subprocess.CompletedProcess(cmd, 0, json.dumps({"number": ref}), "")
+
+    with patch("agent_utils.gh_pr_view.subprocess.run", side_effect=fake_run):
+        results = list(run_batch([_view(str(i)) for i in range(8)], env=ENV))
+
+    assert peak == 4
+    assert sorted(r["index"] for r in results) == list(range(8))
+    assert results[0]["index"] != 0
+    assert all(r["result"] == {"number": str(r["index"])} for r in results)
+
+
+def test_specs_on_same_pr_run_in_input_order() -> None:
+    log = []
+
+    def fake_run(cmd, **kwargs):
+        body = cmd[-1]
+        time.sleep(0.02 if body == "body=first" else 0)
+        log.append(body)
+        return subprocess.CompletedProcess(cmd, 0, "{}", "")
+
+    specs = [
+        {"cmd": "gh-pr-reply", "args": {"pr_number": 7, "body": "first"}},
+        {"cmd": "gh-pr-reply", "args": {"pr-number": 7, "body": "second"}},
+    ]
+    with patch("agent_utils.gh_pr_reply.subprocess.run", side_effect=fake_run):
+        list(run_batch(specs, env=ENV))
+
+    assert log == ["body=first", "body=second"]
+
+
+def test_failures_are_reported_per_spec() -> None:
+    def fake_run(cmd, **kwargs):
+        if cmd[3] == "bad":
+            return subprocess.CompletedProcess(cmd, 1, "", "no pull requests found")
+        return subprocess.CompletedProcess(cmd, 0, "{}", "")
+
+    specs = [
+        _view("bad"),
+        _view("1"),
+        {"cmd": "git-push"},
+        {"cmd": "gh-pr-list", "args": []},
+    ]
+    with patch("agent_utils.gh_pr_view.subprocess.run", side_effect=fake_run):
+        results = {r["index"]: r for r in run_batch(specs, env=ENV)}
+
+    assert "no pull requests found" in results[0]["error"]
+    assert results[1]["result"] == {}
+    assert results[2]["error"] == "unsupported command: 'git-push'"
+    assert results[3]["error"] == "args must be a JSON object"
+
+
+def test_text_commands_return_their_output() -> None:
+    specs = [
+        {"cmd": "gh-run-view", "args": {"run_id": "5"}},
+        {"cmd": "gh-pr-reply", "args": {"pr_number": 1, "body": "hi"}},
+    ]
+    outputs = {"run": "run 5\n", "api": "posted\n"}
+
+    def fake_run(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, 0, outputs[cmd[1]], "")
+
+    with patch("agent_utils.gh_run_view.subprocess.run", side_effect=fake_run):
+        results = {r["cmd"]: r for r in run_batch(specs, env=ENV)}
+
+    assert results["gh-run-view"]["result"] == "run 5"
+    assert results["gh-pr-reply"]["result"] == "posted"
+
+
+def test_cli_streams_jsonl_and_exits_nonzero_on_failure() -> None:
+    stdin = "\n".join(json.dumps(s) for s in [_view("1"), {"cmd": "nope"}])
+    with patch("agent_utils.gh_pr_view.subprocess.run") as m:
+        m.return_value = subprocess.CompletedProcess([], 0, '{"number": 1}', "")
+        result = CliRunner().invoke(app, ["--concurrency", "2"], input=stdin, env=ENV)
+
+    assert result.exit_code == 1
+    lines = sorted(
+        (json.loads(line) for line in result.output.splitlines()),
+        key=lambda line: line["index"],
+    )
+    assert lines[0] == {"index": 0, "cmd": "gh-pr-view", "result": {"number": 1}}
+    assert lines[1]["error"] == "unsupported command: 'nope'"
+
+
+def test_cli_reports_missing_owner() -> None:
+    result = CliRunner().invoke(app, [], input="", env={"GITHUB_OWNER": ""})
+
+    assert result.exit_code == 1
+    assert "GITHUB_OWNER is not set" in result.output
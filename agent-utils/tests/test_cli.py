@@ -0,0 +1,45 @@
+"""Tests for the unified agent-utils CLI."""
+
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+from agent_utils.cli import _Commands, app
+
+_LOADED = (
+    "import sys, typer; from agent_utils.cli import app; "
+    "typer.main.get_command(app).get_command(None, {command!r}); "
+    "print(*sorted(m for m in sys.modules if m.startswith('agent_utils.')))"
+)
+
+
+def _loaded_modules(command: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", _LOADED.format(command=command)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_dispatch_imports_only_selected_command() -> None:
+    loaded = _loaded_modules("gh-pr-view")
+
+    assert loaded & set(_Commands.lazy_commands.values()) == {"agent_utils.gh_pr_view"}
+
+
+def test_help_lists_every_command() -> None:
+    result = CliRunner().invoke(app, ["--help"])
+
+    assert result.exit_code == 0
+    for name in _Commands.lazy_commands:
+        assert name in result.output
+
+
+def test_subcommand_help() -> None:
+    result = CliRunner().invoke(app, ["gh-pr-close", "--help"])
+
+    assert result.exit_code == 0
+    assert "PR number to close" in result.output
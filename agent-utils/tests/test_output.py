@@ -0,0 +1,47 @@
+"""Tests for JSON output from the commands, shared with jira-utils."""
+
+import io
+import json
+import sys
+
+import pytest
+from jira_utils import json_output
+from jira_utils.json_output import output_json
+
+from agent_utils import batch, gh_pr_close, gh_pr_fetch, gh_pr_list, gh_pr_view
+
+
+@pytest.mark.parametrize(
+    "module", [batch, gh_pr_close, gh_pr_fetch, gh_pr_list, gh_pr_view]
+)
+def test_commands_use_shared_writer(module: object) -> None:
+    assert module.output_json is output_json
+
+
+def test_stdlib_matches_orjson() -> None:
+    orjson = pytest.importorskip("orjson")
+    data = [{"number": 42, "title": "naïve “fix” ✓", "labels": [], "draft": None}]
+
+    assert json_output._stdlib_dumps(data, False) == orjson.dumps(data)
+    assert json_output._stdlib_dumps(data, True) == orjson.dumps(
+        data, option=orjson.OPT_INDENT_2
+    )
+
+
+def test_writes_after_pending_text(capsys: pytest.CaptureFixture[str]) -> None:
+    print("before")
+    output_json({"number": 42}, pretty=True)
+
+    before, document = capsys.readouterr().out.split("\n", 1)
+    assert before == "before"
+    assert json.loads(document) == {"number": 42}
+
+
+def test_text_only_stdout(monkeypatch: pytest.MonkeyPatch) -> None:
+    stream = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stream)
+
+    output_json([{"number": 1}])
+
+    assert stream.getvalue().endswith("\n")
+    assert json.loads(stream.getvalue()) == [{"number": 1}]
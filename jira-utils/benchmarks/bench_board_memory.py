@@ -0,0 +1,111 @@
+"""Compare the memory a 50k-issue board state holds as dicts vs ``BoardIssue``.
+
+Runs entirely offline via ``jira_utils.simulator``::
+
+    uv run python benchmarks/bench_board_memory.py --issues 50000
+
+The raw search results and the shared blocker graph are built before
+measuring, so the numbers only cover the per-task representation kept in
+``board_state``. ``slotted_touched`` is the slotted board after every
+task's lazy ``blocked_by`` has been read.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import tracemalloc
+from collections.abc import Callable
+
+import typer
+
+from jira_utils.blockers import BlockerGraph
+from jira_utils.client import JiraClient
+from jira_utils.fetch_task import (
+    _STATUS_MAP,
+    _blocker_graph,
+    _normalize_issue,
+    fetch_board_issues,
+)
+from jira_utils.simulator import JiraSimulator, SimulatorConfig
+
+app = typer.Typer()
+
+
+def _dict_task(issue: dict, graph: BlockerGraph) -> dict:
+    """The dict task shape fetch-task built before ``BoardIssue``."""
+    fields = issue.get("fields", {})
+    assignee_field = fields.get("assignee")
+    parent_field = fields.get("parent")
+    return {
+        "key": issue["key"],
+        "summary": fields.get("summary", ""),
+        "issue_type": fields.get("issuetype", {}).get("name", ""),
+        "priority": fields.get("priority", {}).get("name", ""),
+        "assignee": assignee_field.get("displayName") if assignee_field else None,
+        "parent_key": parent_field.get("key") if parent_field else None,
+        "labels": fields.get("labels", []),
+        "blocked_by": graph.blockers(issue["key"]),
+        "unblocks": graph.unblocks(issue["key"]),
+    }
+
+
+def _measure(build: Callable[[], object]) -> tuple[object, int]:
+    """Run ``build`` and return its result and the bytes it still holds."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, held
+
+
+@app.command()
+def main(
+    issues: int = typer.Option(50_000, help="Issues on the simulated board"),
+    link_density: float = typer.Option(0.2, help="Blocker links per issue"),
+    seed: int = typer.Option(0, help="Board generation seed"),
+) -> None:
+    """Measure dict vs slotted board state and print a JSON summary."""
+    sim = JiraSimulator(
+        SimulatorConfig(issues=issues, link_density=link_density, seed=seed)
+    )
+    with JiraClient(**sim.client_options()) as client:
+        raw = fetch_board_issues(sim.config.project, client=client)
+    board = [
+        (issue, _STATUS_MAP[issue["fields"]["status"]["name"]])
+        for issue in raw
+        if issue["fields"]["status"]["name"] in _STATUS_MAP
+    ]
+    graph = _blocker_graph(raw)
+    for issue in raw:
+        graph.unblocks(issue["key"])
+
+    dicts, dict_bytes = _measure(lambda: [_dict_task(i, graph) for i, _ in board])
+    slotted, slotted_bytes = _measure(
+        lambda: [_normalize_issue(i, column, graph) for i, column in board]
+    )
+    _, touched_bytes = _measure(lambda: [task.blocked_by for task in slotted])
+
+    tasks = len(board)
+    summary = {
+        "issues": issues,
+        "board_tasks": tasks,
+        "dict_bytes": dict_bytes,
+        "slotted_bytes": slotted_bytes,
+        "slotted_touched_bytes": slotted_bytes + touched_bytes,
+        "bytes_per_task": {
+            "dict": round(dict_bytes / tasks, 1),
+            "slotted": round(slotted_bytes / tasks, 1),
+            "slotted_touched": round((slotted_bytes + touched_bytes) / tasks, 1),
+        },
+        "saving": round(1 - slotted_bytes / dict_bytes, 3),
+        "json_compatible": [dict(task) for task in slotted] == dicts,
+    }
+    typer.echo(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    app()
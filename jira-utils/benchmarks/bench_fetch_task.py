@@ -0,0 +1,124 @@
+"""Benchmark run_fetch_task against a simulated 10k-issue Jira board.
+
+Runs entirely offline via ``jira_utils.simulator``::
+
+    uv run python benchmarks/bench_fetch_task.py --issues 10000 --latency 0.05
+
+Prints one JSON document with wall-clock timings and request counts.
+``--snapshot`` keeps the board in a throwaway local snapshot, so the first
+run reconciles and later runs only send a delta query. ``--lazy`` fetches
+columns in priority order and reports how much of the board it downloaded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import typer
+
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.fetch_task import run_fetch_task, run_fetch_task_async
+from jira_utils.metrics import MetricsRecorder
+from jira_utils.simulator import BASE_URL, JiraSimulator, SimulatorConfig
+from jira_utils.snapshot import BoardSnapshot
+
+app = typer.Typer()
+
+
+def _run_once(
+    sim: JiraSimulator,
+    recorder: MetricsRecorder,
+    use_async: bool,
+    snapshot: BoardSnapshot | None,
+    lazy: bool,
+) -> dict:
+    """Run one fetch-task pass; return its result."""
+    project = sim.config.project
+    if use_async:
+
+        async def run() -> dict:
+            options = sim.client_options(asynchronous=True)
+            async with AsyncJiraClient(**options, instrument=recorder) as client:
+                return await run_fetch_task_async(
+                    project, client=client, snapshot=snapshot, lazy=lazy
+                )
+
+        return asyncio.run(run())
+    with JiraClient(**sim.client_options(), instrument=recorder) as client:
+        return run_fetch_task(project, client=client, snapshot=snapshot, lazy=lazy)
+
+
+@app.command()
+def main(
+    issues: int = typer.Option(10_000, help="Issues on the simulated board"),
+    link_density: float = typer.Option(0.2, help="Blocker links per issue"),
+    latency: float = typer.Option(0.0, help="Seconds of latency per request"),
+    jitter: float = typer.Option(0.0, help="Extra random latency per request"),
+    throttle_rate: float = typer.Option(0.0, help="Probability of a 429 reply"),
+    retry_after: float = typer.Option(0.05, help="Retry-After on 429 replies"),
+    repeat: int = typer.Option(3, help="Timed runs"),
+    use_async: bool = typer.Option(False, "--async", help="Use AsyncJiraClient"),
+    seed: int = typer.Option(0, help="Board generation seed"),
+    use_snapshot: bool = typer.Option(
+        False, "--snapshot", help="Sync a local board snapshot between runs"
+    ),
+    lazy: bool = typer.Option(
+        False, "--lazy", help="Fetch columns lazily in priority order"
+    ),
+) -> None:
+    """Time run_fetch_task on a simulated board and print a JSON summary."""
+    sim = JiraSimulator(
+        SimulatorConfig(
+            issues=issues,
+            link_density=link_density,
+            latency=latency,
+            jitter=jitter,
+            throttle_rate=throttle_rate,
+            retry_after=retry_after,
+            seed=seed,
+        )
+    )
+    recorder = MetricsRecorder()
+    timings = []
+    result: dict = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = (
+            BoardSnapshot(BASE_URL, sim.config.project, path=Path(tmp) / "b.db")
+            if use_snapshot
+            else None
+        )
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = _run_once(sim, recorder, use_async, snapshot, lazy)
+            timings.append(time.perf_counter() - started)
+
+    board = result.get("board_state", {})
+    selected = result.get("selected_task")
+    summary = {
+        "issues": issues,
+        "client": "async" if use_async else "sync",
+        "snapshot": use_snapshot,
+        "lazy": lazy,
+        "runs": repeat,
+        "wall_s": {
+            "min": round(min(timings), 4),
+            "median": round(statistics.median(timings), 4),
+            "max": round(max(timings), 4),
+        },
+        "requests_per_run": sum(sim.requests.values()) / repeat,
+        "throttled": sim.throttled,
+        "board_issues": sum(len(tasks) for tasks in board.values()),
+        "selected": selected["key"] if selected else None,
+        "fetch_stats": result.get("fetch_stats"),
+        "endpoints": recorder.summary(),
+    }
+    typer.echo(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,46 @@
+"""Typer command group whose subcommand modules are imported on first use."""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+import typer
+from typer.core import TyperGroup
+
+
+class LazyGroup(TyperGroup):
+    """Group resolving subcommands from ``lazy_commands`` only when selected.
+
+    Subclasses map each command name to the module whose ``app`` implements
+    it. Dispatching one command imports that module alone, so a short
+    command does not pay for importing every other command's dependencies.
+    """
+
+    lazy_commands: ClassVar[dict[str, str]] = {}
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        """Lazy command names in declaration order, then eagerly added ones."""
+        return list(dict.fromkeys([*self.lazy_commands, *super().list_commands(ctx)]))
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Any:
+        """Import the command's module on first lookup."""
+        module = self.lazy_commands.get(cmd_name)
+        if module is not None and cmd_name not in self.commands:
+            # __import__ rather than importlib.import_module, which bypasses
+            # the -X importtime report.
+            app = __import__(module, fromlist=["app"]).app
+            command = typer.main.get_group(app)
+            command.name = cmd_name
+            self.commands[cmd_name] = command
+        return super().get_command(ctx, cmd_name)
+
+    def resolve_command(self, ctx: typer.Context, args: list[str]) -> Any:
+        """Load every command before resolving an unknown name.
+
+        Typer suggests close matches from the loaded commands, so a typo
+        still gets a "Did you mean" hint.
+        """
+        if args and args[0] not in self.commands and args[0] not in self.lazy_commands:
+            for name in self.lazy_commands:
+                self.get_command(ctx, name)
+        return super().resolve_command(ctx, args)
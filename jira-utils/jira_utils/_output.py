@@ -1,4 +1,8 @@
-"""Shared output helpers for CLI commands."""
+"""Shared output helpers for CLI commands.
+
+JSON output comes from ``jira_utils.json_output``; see there for how it is
+serialized.
+"""
 
 from __future__ import annotations
 
@@ -7,12 +11,10 @@ import json
 import typer
 
 from jira_utils.client import JiraApiError
+from jira_utils.json_output import output_json, output_ndjson
 
-
-def output_json(data: dict | list | None, *, pretty: bool = False) -> None:
-    """Write JSON to stdout."""
-    indent = 2 if pretty else None
-    typer.echo(json.dumps(data, indent=indent))
+# The JSON writers are re-exported so commands import all output from here.
+__all__ = ["handle_error", "output_json", "output_ndjson"]
 
 
 def handle_error(e: Exception) -> None:
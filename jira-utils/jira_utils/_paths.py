@@ -0,0 +1,30 @@
+"""Filesystem locations and environment settings shared across jira-utils.
+
+Only the standard library is imported, so the CLI entry point can read
+these names without loading httpx.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+CACHE_DIR_ENV = "JIRA_UTILS_CACHE_DIR"
+CACHE_MODE_ENV = "JIRA_HTTP_CACHE"
+METRICS_FILE_ENV = "JIRA_METRICS_FILE"
+
+
+def cache_dir() -> Path:
+    """Return (and create) the per-user jira-utils cache directory.
+
+    Honours ``JIRA_UTILS_CACHE_DIR``, then ``XDG_CACHE_HOME``, and falls back
+    to ``~/.cache/jira-utils``.
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        path = Path(override)
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        path = Path(base) / "jira-utils"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
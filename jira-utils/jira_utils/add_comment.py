@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 app = typer.Typer(invoke_without_command=True)
 
@@ -19,6 +19,18 @@ def run_add_comment(
     return client.post(f"/rest/api/2/issue/{issue_key}/comment", json={"body": body})
 
 
+async def run_add_comment_async(
+    issue_key: str,
+    body: str,
+    *,
+    client: AsyncJiraClient,
+) -> dict:
+    """Async variant of run_add_comment."""
+    return await client.post(
+        f"/rest/api/2/issue/{issue_key}/comment", json={"body": body}
+    )
+
+
 @app.callback()
 def main(
     issue_key: str = typer.Option(
@@ -34,10 +46,10 @@ def main(
     from jira_utils._output import handle_error, output_json
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_add_comment(issue_key, body, client=client)
+        ) as client:
+            result = run_add_comment(issue_key, body, client=client)
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 app = typer.Typer(invoke_without_command=True)
 
@@ -23,6 +23,20 @@ def run_add_to_sprint(
     )
 
 
+async def run_add_to_sprint_async(
+    sprint_id: int,
+    issues: str,
+    *,
+    client: AsyncJiraClient,
+) -> dict | None:
+    """Async variant of run_add_to_sprint."""
+    issue_keys = [k.strip() for k in issues.split(",")]
+    return await client.post(
+        f"/rest/agile/1.0/sprint/{sprint_id}/issue",
+        json={"issues": issue_keys},
+    )
+
+
 @app.callback()
 def main(
     sprint_id: int = typer.Option(..., "--sprint-id", help="Sprint ID"),
@@ -36,10 +50,10 @@ def main(
     from jira_utils._output import handle_error, output_json
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_add_to_sprint(sprint_id, issues, client=client)
+        ) as client:
+            result = run_add_to_sprint(sprint_id, issues, client=client)
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
@@ -0,0 +1,234 @@
+"""Run many jira-utils commands from JSONL specs on one pooled client."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+import typer
+
+from jira_utils.bulk_create_issues import read_specs
+from jira_utils.cli import _Commands
+from jira_utils.client import AsyncJiraClient, JiraApiError, JiraClient
+from jira_utils.concurrency import DEFAULT_CONCURRENCY
+
+app = typer.Typer(invoke_without_command=True)
+
+# Arguments naming the issues a command touches; specs sharing one run in order.
+_ISSUE_ARGS = ("issue_key", "inward", "outward", "issues", "keys")
+
+# Commands with no run function (or that would recurse) cannot be batched.
+_UNBATCHABLE = frozenset({"batch", "serve"})
+
+# CLI options whose run-function parameter has a different name.
+_OPTION_PARAMS = {
+    "create-issue": {"type": "issue_type"},
+    "create-issue-link": {"type": "link_type"},
+}
+
+
+def _kwargs(spec: dict) -> dict:
+    """A spec's ``args`` as run-function keyword arguments.
+
+    Raises:
+        ValueError: If ``args`` is not a JSON object.
+    """
+    args = spec.get("args", {})
+    if not isinstance(args, dict):
+        raise ValueError("args must be a JSON object")
+    renames = _OPTION_PARAMS.get(spec.get("cmd"), {})
+    kwargs = {}
+    for option, value in args.items():
+        name = option.replace("-", "_")
+        kwargs[renames.get(name, name)] = value
+    return kwargs
+
+
+def _issue_keys(spec: dict) -> list[str]:
+    """Issue keys a spec touches, for per-issue ordering."""
+    try:
+        kwargs = _kwargs(spec)
+    except ValueError:
+        return []
+    keys: list[str] = []
+    for name in _ISSUE_ARGS:
+        value = kwargs.get(name)
+        if isinstance(value, str):
+            keys += [k.strip() for k in value.split(",") if k.strip()]
+        elif isinstance(value, list):
+            keys += [k for k in value if isinstance(k, str)]
+    return keys
+
+
+def _resolve(spec: dict, asynchronous: bool) -> tuple[Callable, dict]:
+    """The run function and keyword arguments for one spec.
+
+    Raises:
+        ValueError: If ``cmd`` is missing or cannot be batched.
+    """
+    cmd = spec.get("cmd")
+    module = _Commands.lazy_commands.get(cmd) if isinstance(cmd, str) else None
+    if module is None or cmd in _UNBATCHABLE:
+        raise ValueError(f"unsupported command: {cmd!r}")
+    name = f"run_{cmd.replace('-', '_')}" + ("_async" if asynchronous else "")
+    return getattr(importlib.import_module(module), name), _kwargs(spec)
+
+
+def _outcome(index: int, spec: dict, result: object) -> dict:
+    """One JSONL result line: the input ``index`` and ``result`` or ``error``."""
+    line = {"index": index, "cmd": spec.get("cmd")}
+    if isinstance(result, JiraApiError):
+        line.update(error=str(result), status=result.status_code)
+    elif isinstance(result, Exception):
+        line["error"] = str(result)
+    else:
+        line["result"] = result
+    return line
+
+
+def _run_one(index: int, spec: dict, client: JiraClient) -> dict:
+    try:
+        func, kwargs = _resolve(spec, asynchronous=False)
+        result = func(**kwargs, client=client)
+    except Exception as exc:
+        result = exc
+    return _outcome(index, spec, result)
+
+
+async def _run_one_async(index: int, spec: dict, client: AsyncJiraClient) -> dict:
+    try:
+        func, kwargs = _resolve(spec, asynchronous=True)
+        result = await func(**kwargs, client=client)
+    except Exception as exc:
+        result = exc
+    return _outcome(index, spec, result)
+
+
+def run_batch(
+    specs: Iterable[dict],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    client: JiraClient,
+) -> Iterator[dict]:
+    """Run ``{"cmd", "args"}`` specs concurrently on one client.
+
+    ``cmd`` is a jira-utils subcommand and ``args`` the keyword arguments of
+    its run function, with dashes or underscores. The CLI option names are
+    accepted too where they differ: ``type`` for ``issue_type``
+    (create-issue) and ``link_type`` (create-issue-link). Up to
+    ``concurrency`` specs run at once, except that specs touching the same
+    issue (``issue_key``, ``inward``, ``outward``, ``issues`` or ``keys``)
+    run one after another in input order. A failing spec does not stop
+    later ones, including those on the same issue.
+
+    Yields:
+        One dict per spec, in input order, as soon as it and every earlier
+        spec finished: the input ``index`` and ``cmd`` plus either
+        ``result`` or ``error`` (and ``status`` for Jira API errors).
+
+    Raises:
+        ValueError: If concurrency is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    def after(prior: list[Future], index: int, spec: dict) -> dict:
+        # Earlier specs were queued first, so ``prior`` is running or done.
+        wait(prior)
+        return _run_one(index, spec, client)
+
+    last: dict[str, Future] = {}
+    futures: list[Future] = []
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for index, spec in enumerate(specs):
+            keys = _issue_keys(spec)
+            prior = list({id(f): f for k in keys if (f := last.get(k))}.values())
+            future = pool.submit(after, prior, index, spec)
+            last.update(dict.fromkeys(keys, future))
+            futures.append(future)
+        for future in futures:
+            yield future.result()
+
+
+async def run_batch_async(
+    specs: Iterable[dict],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    client: AsyncJiraClient,
+) -> AsyncIterator[dict]:
+    """Async variant of run_batch."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def after(prior: list[asyncio.Task], index: int, spec: dict) -> dict:
+        if prior:
+            await asyncio.wait(prior)
+        async with semaphore:
+            return await _run_one_async(index, spec, client)
+
+    last: dict[str, asyncio.Task] = {}
+    tasks: list[asyncio.Task] = []
+    for index, spec in enumerate(specs):
+        keys = _issue_keys(spec)
+        prior = list({id(t): t for k in keys if (t := last.get(k))}.values())
+        task = asyncio.create_task(after(prior, index, spec))
+        last.update(dict.fromkeys(keys, task))
+        tasks.append(task)
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+@app.callback()
+def main(
+    concurrency: int = typer.Option(
+        DEFAULT_CONCURRENCY, "--concurrency", help="Specs to run at once"
+    ),
+    base_url: str = typer.Option(..., envvar="JIRA_URL", help="Jira base URL"),
+    username: str = typer.Option(..., envvar="JIRA_USERNAME", help="Jira username"),
+    api_token: str = typer.Option(..., envvar="JIRA_API_TOKEN", help="Jira API token"),
+) -> None:
+    """Run JSONL command specs from stdin on one connection.
+
+    Each line is {"cmd": "add-comment", "args": {"issue_key": ..., ...}},
+    with the run function's parameters or the command's option names as
+    ``args``. Results are written as JSONL in input order. Exits non-zero if any spec
+    failed.
+    """
+    from jira_utils._output import handle_error, output_ndjson
+
+    failed = False
+
+    def track(results: Iterator[dict]) -> Iterator[dict]:
+        nonlocal failed
+        for result in results:
+            failed = failed or "error" in result
+            yield result
+
+    try:
+        specs = read_specs(sys.stdin)
+        with JiraClient(
+            base_url=base_url.rstrip("/"),
+            username=username,
+            api_token=api_token,
+            max_connections=max(concurrency, 10),
+            max_keepalive_connections=max(concurrency, 10),
+        ) as client:
+            output_ndjson(
+                track(run_batch(specs, concurrency=concurrency, client=client))
+            )
+    except Exception as exc:
+        handle_error(exc)
+    if failed:
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
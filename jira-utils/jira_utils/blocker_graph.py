@@ -0,0 +1,108 @@
+"""Dump the blocker dependency graph of a Jira project board."""
+
+from __future__ import annotations
+
+import typer
+
+from jira_utils.blockers import BlockerGraph
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.fetch_task import (
+    _blocker_graph,
+    _snapshot_issues,
+    _snapshot_issues_async,
+)
+from jira_utils.snapshot import BoardSnapshot, snapshot_from_env
+
+app = typer.Typer(invoke_without_command=True)
+
+
+def _summary(issues: list[dict], graph: BlockerGraph, limit: int) -> dict:
+    """Graph report: critical paths, top unblockers, order and cycles."""
+    unblockers = sorted(
+        (
+            {
+                "key": issue["key"],
+                "summary": issue.get("fields", {}).get("summary", ""),
+                "unblocks": graph.unblocks(issue["key"]),
+            }
+            for issue in issues
+            if not graph.is_blocked(issue["key"]) and graph.unblocks(issue["key"])
+        ),
+        key=lambda row: row["unblocks"],
+        reverse=True,
+    )
+    return {
+        "issues": len(issues),
+        "blocked": sum(1 for issue in issues if graph.is_blocked(issue["key"])),
+        "critical_paths": graph.critical_paths(limit),
+        "top_unblockers": unblockers[:limit],
+        "order": graph.order,
+        "cycles": graph.cycles,
+    }
+
+
+def run_blocker_graph(
+    project: str,
+    *,
+    limit: int = 10,
+    client: JiraClient,
+    snapshot: BoardSnapshot | None = None,
+) -> dict:
+    """Build the blocker graph of a project's active board.
+
+    Returns the board size, how many issues are blocked, the ``limit``
+    longest blocker chains and the issues that unblock the most downstream
+    work, plus the topological order of all linked issues and any issues
+    caught in blocker cycles.
+    """
+    if not project:
+        raise ValueError("Project is required: pass --project or set JIRA_PROJECT_ID")
+    issues = _snapshot_issues(project, client, snapshot)
+    return _summary(issues, _blocker_graph(issues), limit)
+
+
+async def run_blocker_graph_async(
+    project: str,
+    *,
+    limit: int = 10,
+    client: AsyncJiraClient,
+    snapshot: BoardSnapshot | None = None,
+) -> dict:
+    """Async variant of run_blocker_graph."""
+    if not project:
+        raise ValueError("Project is required: pass --project or set JIRA_PROJECT_ID")
+    issues = await _snapshot_issues_async(project, client, snapshot)
+    return _summary(issues, _blocker_graph(issues), limit)
+
+
+@app.callback()
+def main(
+    project: str | None = typer.Option(
+        None, "--project", envvar="JIRA_PROJECT_ID", help="Jira project key"
+    ),
+    limit: int = typer.Option(
+        10, "--limit", help="Critical paths and top unblockers to show"
+    ),
+    base_url: str = typer.Option(..., envvar="JIRA_URL", help="Jira base URL"),
+    username: str = typer.Option(..., envvar="JIRA_USERNAME", help="Jira username"),
+    api_token: str = typer.Option(..., envvar="JIRA_API_TOKEN", help="Jira API token"),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON"),
+) -> None:
+    """Dump critical blocker paths and the tasks that unblock the most work."""
+    from jira_utils._output import handle_error, output_json
+
+    try:
+        snapshot = snapshot_from_env(base_url.rstrip("/"), project)
+        with JiraClient(
+            base_url=base_url.rstrip("/"), username=username, api_token=api_token
+        ) as client:
+            result = run_blocker_graph(
+                project, limit=limit, client=client, snapshot=snapshot
+            )
+        output_json(result, pretty=pretty)
+    except Exception as exc:
+        handle_error(exc)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,165 @@
+"""Blocker dependency graph over a fetched board."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Collection, Iterable
+from functools import cached_property
+
+_BLOCKED_BY = "is blocked by"
+_BLOCKS = "blocks"
+
+
+class BlockerGraph:
+    """Directed "blocks" graph between the issues of a board.
+
+    Built once from raw search results; every query afterwards is a lookup.
+    A blocker is active unless its status is resolved. For issues on the
+    board, their own ``status`` field is used rather than the copy embedded
+    in other issues' links. Only edges between unresolved issues are kept,
+    so an issue is blocked exactly when it has an incoming edge.
+
+    Both link directions are read (``inwardIssue`` of "is blocked by" and
+    ``outwardIssue`` of "blocks"), so an edge is found from either end.
+    """
+
+    def __init__(
+        self, issues: Iterable[dict], *, resolved_statuses: Collection[str]
+    ) -> None:
+        issues = list(issues)
+        self._resolved = set(resolved_statuses)
+        self._info: dict[str, dict] = {}
+        for issue in issues:
+            fields = issue.get("fields", {})
+            self._info[issue["key"]] = {
+                "summary": fields.get("summary", ""),
+                "status": fields.get("status", {}).get("name", ""),
+            }
+        self.board: frozenset[str] = frozenset(self._info)
+
+        # Inward links first, so each issue's blockers keep its own link order.
+        inward_edges: list[tuple[str, str]] = []
+        outward_edges: list[tuple[str, str]] = []
+        for issue in issues:
+            key = issue["key"]
+            for link in issue.get("fields", {}).get("issuelinks", []):
+                link_type = link.get("type", {})
+                inward, outward = link.get("inwardIssue"), link.get("outwardIssue")
+                if inward and link_type.get("inward") == _BLOCKED_BY:
+                    self._remember(inward)
+                    inward_edges.append((inward["key"], key))
+                elif outward and link_type.get("outward") == _BLOCKS:
+                    self._remember(outward)
+                    outward_edges.append((key, outward["key"]))
+
+        self._blocked_by: dict[str, dict[str, None]] = {}
+        self._blocks: dict[str, dict[str, None]] = {}
+        for blocker, blocked in [*inward_edges, *outward_edges]:
+            if self._resolved & {
+                self._info[blocker]["status"],
+                self._info[blocked]["status"],
+            }:
+                continue
+            self._blocked_by.setdefault(blocked, {})[blocker] = None
+            self._blocks.setdefault(blocker, {})[blocked] = None
+        self._downstream: dict[str, frozenset[str]] = {}
+
+    def _remember(self, linked: dict) -> None:
+        """Record a linked issue's embedded summary/status if not on the board."""
+        if linked["key"] in self._info:
+            return
+        fields = linked.get("fields", {})
+        self._info[linked["key"]] = {
+            "summary": fields.get("summary", ""),
+            "status": fields.get("status", {}).get("name", ""),
+        }
+
+    def is_blocked(self, key: str) -> bool:
+        """Whether ``key`` has at least one active blocker."""
+        return key in self._blocked_by
+
+    def blockers(self, key: str) -> list[dict]:
+        """Active direct blockers of ``key`` as ``{key, summary, status}``."""
+        return [{"key": b, **self._info[b]} for b in self._blocked_by.get(key, ())]
+
+    def downstream(self, key: str) -> frozenset[str]:
+        """Every issue transitively blocked by ``key``."""
+        cached = self._downstream.get(key)
+        if cached is not None:
+            return cached
+        seen: set[str] = set()
+        queue = deque(self._blocks.get(key, ()))
+        while queue:
+            current = queue.popleft()
+            if current in seen:
+                continue
+            seen.add(current)
+            queue.extend(self._blocks.get(current, ()))
+        seen.discard(key)
+        result = self._downstream[key] = frozenset(seen)
+        return result
+
+    def unblocks(self, key: str) -> int:
+        """How many issues finishing ``key`` would (transitively) help unblock."""
+        return len(self.downstream(key))
+
+    @cached_property
+    def order(self) -> list[str]:
+        """Issues with blocker edges, blockers before the issues they block.
+
+        Issues on a blocker cycle cannot be ordered and are left out; see
+        ``cycles``.
+        """
+        nodes = list(dict.fromkeys([*self._blocks, *self._blocked_by]))
+        pending = {n: len(self._blocked_by.get(n, ())) for n in nodes}
+        ready = deque(n for n in nodes if not pending[n])
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for blocked in self._blocks.get(node, ()):
+                pending[blocked] -= 1
+                if not pending[blocked]:
+                    ready.append(blocked)
+        return order
+
+    @cached_property
+    def cycles(self) -> list[str]:
+        """Issues that are part of (or blocked by) a blocker cycle."""
+        ordered = set(self.order)
+        return [
+            n
+            for n in dict.fromkeys([*self._blocks, *self._blocked_by])
+            if n not in ordered
+        ]
+
+    def critical_paths(self, limit: int = 10) -> list[dict]:
+        """Longest chains of active blockers, longest first.
+
+        Each path starts at an unblocked issue and follows, at every step,
+        the blocked issue with the longest remaining chain. ``unblocks`` is
+        the transitive downstream size of the path's first issue.
+        """
+        height: dict[str, int] = {}
+        following: dict[str, str | None] = {}
+        for node in reversed(self.order):
+            best = max(
+                (b for b in self._blocks.get(node, ()) if b in height),
+                key=height.__getitem__,
+                default=None,
+            )
+            following[node] = best
+            height[node] = 1 + (height[best] if best is not None else 0)
+
+        roots = [n for n in self.order if n not in self._blocked_by]
+        roots.sort(key=lambda n: (height[n], self.unblocks(n)), reverse=True)
+        paths = []
+        for root in roots[:limit]:
+            path, node = [], root
+            while node is not None:
+                path.append({"key": node, **self._info[node]})
+                node = following[node]
+            paths.append(
+                {"length": len(path), "unblocks": self.unblocks(root), "path": path}
+            )
+        return paths
@@ -0,0 +1,119 @@
+"""Compact in-memory model for the tasks of a fetched board."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from jira_utils.blockers import BlockerGraph
+
+# Keys of the JSON task shape, in output order.
+_JSON_KEYS = (
+    "key",
+    "summary",
+    "issue_type",
+    "priority",
+    "assignee",
+    "parent_key",
+    "labels",
+    "blocked_by",
+    "unblocks",
+)
+
+
+class Blocker(NamedTuple):
+    """An active direct blocker of a board issue."""
+
+    key: str
+    summary: str
+    status: str
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if value is not None else None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class BoardIssue(Mapping[str, object]):
+    """One task on the board, slotted and immutable.
+
+    Status, column, project, issue type, priority and assignee strings are
+    interned, so a 50k-issue board holds one copy of each distinct value.
+    Blockers are looked up in the board's shared ``BlockerGraph`` on first
+    access rather than copied into every issue.
+
+    The mapping interface is the JSON view: it exposes exactly the keys the
+    dict task shape always had (``blocked_by`` as a list of
+    ``{key, summary, status}`` dicts, ``labels`` as a list), so
+    ``task["key"]``, ``dict(task)`` and comparisons with plain dicts keep
+    working. ``status``, ``column`` and ``project`` are attributes only.
+    """
+
+    key: str
+    summary: str
+    issue_type: str
+    priority: str
+    assignee: str | None
+    parent_key: str | None
+    labels: tuple[str, ...]
+    status: str
+    column: str
+    project: str
+    unblocks: int
+    _graph: BlockerGraph = field(repr=False)
+    _blocked_by: tuple[Blocker, ...] | None = field(
+        default=None, init=False, repr=False
+    )
+
+    @classmethod
+    def from_issue(cls, issue: dict, column: str, graph: BlockerGraph) -> BoardIssue:
+        """Build a board issue from a raw Jira search result."""
+        fields = issue.get("fields", {})
+        assignee = fields.get("assignee")
+        parent = fields.get("parent")
+        return cls(
+            key=issue["key"],
+            summary=fields.get("summary", ""),
+            issue_type=sys.intern(fields.get("issuetype", {}).get("name", "")),
+            priority=sys.intern(fields.get("priority", {}).get("name", "")),
+            assignee=_intern(assignee.get("displayName") if assignee else None),
+            parent_key=parent.get("key") if parent else None,
+            labels=tuple(map(sys.intern, fields.get("labels", []))),
+            status=sys.intern(fields.get("status", {}).get("name", "")),
+            column=sys.intern(column),
+            project=sys.intern(issue["key"].rsplit("-", 1)[0]),
+            unblocks=graph.unblocks(issue["key"]),
+            _graph=graph,
+        )
+
+    @property
+    def blocked_by(self) -> tuple[Blocker, ...]:
+        """Active direct blockers, computed from the graph on first access."""
+        if self._blocked_by is None:
+            blockers = tuple(Blocker(**b) for b in self._graph.blockers(self.key))
+            object.__setattr__(self, "_blocked_by", blockers)
+        return self._blocked_by  # type: ignore[return-value]
+
+    def to_json(self) -> dict:
+        """The task as a plain JSON-ready dict."""
+        return {key: self[key] for key in _JSON_KEYS}
+
+    def __getitem__(self, key: str) -> object:
+        """Look up a JSON view key."""
+        if key == "blocked_by":
+            return [b._asdict() for b in self.blocked_by]
+        if key == "labels":
+            return list(self.labels)
+        if key not in _JSON_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the JSON view keys."""
+        return iter(_JSON_KEYS)
+
+    def __len__(self) -> int:
+        """Number of JSON view keys."""
+        return len(_JSON_KEYS)
@@ -0,0 +1,187 @@
+"""Circuit breaker that stops hammering Jira while it is degraded."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+class BreakerState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the breaker is open."""
+
+    def __init__(self, retry_in: float) -> None:
+        self.retry_in = retry_in
+        super().__init__(f"Jira circuit breaker is open; retry in {retry_in:.0f}s")
+
+
+def is_failure(status: int | None) -> bool:
+    """Whether a response status means Jira itself is unhealthy.
+
+    Transport errors (``None``), throttling and 5xx count; other 4xx are the
+    caller's problem and leave the breaker alone.
+    """
+    return status is None or status == 429 or status >= 500
+
+
+@dataclass
+class CircuitBreaker:
+    """Failure-rate circuit breaker over a sliding window of outcomes.
+
+    CLOSED: requests flow; once ``min_requests`` outcomes are in the window
+    and at least ``failure_rate`` of them failed, the breaker OPENs.
+    OPEN: requests are rejected with ``CircuitOpenError`` for
+    ``reset_timeout`` seconds, then the breaker goes HALF_OPEN.
+    HALF_OPEN: up to ``half_open_requests`` trial requests are let through;
+    a success closes the breaker, a failure re-opens it.
+
+    Every transition starts a new generation. ``before_request`` returns the
+    generation a request was admitted in, and ``record`` ignores outcomes
+    from earlier ones, so a slow request sent while the breaker was CLOSED
+    cannot close or re-open it after it tripped.
+
+    Attributes:
+        window: Number of recent outcomes considered.
+        min_requests: Outcomes required before the rate is evaluated.
+        failure_rate: Fraction of failures (0-1) that opens the breaker.
+        reset_timeout: Seconds to stay open before allowing a trial.
+        half_open_requests: Concurrent trial requests allowed when half-open.
+        on_change: Called with ``(old, new)`` on every state transition.
+    """
+
+    window: int = 20
+    min_requests: int = 5
+    failure_rate: float = 0.5
+    reset_timeout: float = 30.0
+    half_open_requests: int = 1
+    on_change: Callable[[BreakerState, BreakerState], None] | None = None
+    _clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+    _outcomes: deque = field(init=False, repr=False)
+    _state: BreakerState = field(init=False, default=BreakerState.CLOSED)
+    _opened_at: float = field(init=False, default=0.0)
+    _trials: int = field(init=False, default=0)
+    _generation: int = field(init=False, default=0)
+    _lock: threading.RLock = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Create the outcome window and lock."""
+        self._outcomes = deque(maxlen=self.window)
+        self._lock = threading.RLock()
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state, moving OPEN to HALF_OPEN once the timeout elapses."""
+        with self._lock:
+            return self._current()
+
+    def _current(self) -> BreakerState:
+        if self._state is BreakerState.OPEN:
+            if self._clock() - self._opened_at >= self.reset_timeout:
+                self._transition(BreakerState.HALF_OPEN)
+        return self._state
+
+    def _transition(self, new: BreakerState) -> None:
+        old, self._state = self._state, new
+        self._generation += 1
+        if new is BreakerState.OPEN:
+            self._opened_at = self._clock()
+        if new is not BreakerState.CLOSED:
+            self._trials = 0
+        else:
+            self._outcomes.clear()
+        if old is not new and self.on_change is not None:
+            self.on_change(old, new)
+
+    def retry_in(self) -> float:
+        """Seconds until an open breaker admits a trial request (0 if not open)."""
+        with self._lock:
+            if self._current() is not BreakerState.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+
+    def before_request(self) -> int:
+        """Admit a request or raise ``CircuitOpenError``.
+
+        Returns:
+            The generation to pass to ``record`` or ``release``.
+        """
+        with self._lock:
+            state = self._current()
+            if state is BreakerState.CLOSED:
+                return self._generation
+            if state is BreakerState.HALF_OPEN:
+                if self._trials < self.half_open_requests:
+                    self._trials += 1
+                    return self._generation
+                retry_in = 0.0
+            else:
+                retry_in = self.reset_timeout - (self._clock() - self._opened_at)
+        raise CircuitOpenError(max(0.0, retry_in))
+
+    def record(self, status: int | None, generation: int | None = None) -> None:
+        """Record the outcome of a request.
+
+        Args:
+            status: Response status, or None for a transport error.
+            generation: What ``before_request`` returned for the request.
+                Outcomes from an earlier generation are ignored. None (a
+                health probe) always counts.
+        """
+        failed = is_failure(status)
+        with self._lock:
+            state = self._current()
+            if generation is not None and generation != self._generation:
+                return
+            if state is not BreakerState.CLOSED:
+                # A trial or health probe decides; a failure restarts the timer.
+                self._transition(BreakerState.OPEN if failed else BreakerState.CLOSED)
+                return
+            self._outcomes.append(failed)
+            if len(self._outcomes) < self.min_requests:
+                return
+            if sum(self._outcomes) / len(self._outcomes) >= self.failure_rate:
+                self._transition(BreakerState.OPEN)
+
+    def release(self, generation: int) -> None:
+        """Return the trial slot of an admitted request that has no outcome.
+
+        Call this instead of ``record`` when the request was abandoned (an
+        unexpected error or cancellation), so a half-open breaker keeps
+        admitting trials.
+
+        Args:
+            generation: What ``before_request`` returned for the request.
+        """
+        with self._lock:
+            if (
+                self._state is BreakerState.HALF_OPEN
+                and generation == self._generation
+                and self._trials > 0
+            ):
+                self._trials -= 1
+
+    def snapshot(self) -> dict:
+        """State and window counters, for logging."""
+        with self._lock:
+            state = self._current()
+            return {
+                "state": state.value,
+                "failures": sum(self._outcomes),
+                "requests": len(self._outcomes),
+                "retry_in": (
+                    max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+                    if state is BreakerState.OPEN
+                    else 0.0
+                ),
+            }
@@ -0,0 +1,259 @@
+"""Create many Jira issues at once through the bulk endpoint."""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+
+import typer
+
+from jira_utils.client import AsyncJiraClient, JiraApiError, JiraClient
+from jira_utils.concurrency import gather_limited
+from jira_utils.create_issue import _issue_fields
+
+app = typer.Typer(invoke_without_command=True)
+
+# Jira Cloud accepts at most 50 issues per /rest/api/2/issue/bulk request.
+BULK_CHUNK_SIZE = 50
+
+_REQUIRED = ("project", "summary", "type")
+
+
+def read_specs(stream: TextIO) -> list[dict]:
+    """Parse JSONL issue specs, skipping blank lines.
+
+    Raises:
+        ValueError: If a line is not a JSON object (nothing is submitted).
+    """
+    specs = []
+    for lineno, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            spec = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"line {lineno}: {exc}") from exc
+        if not isinstance(spec, dict):
+            raise ValueError(f"line {lineno}: expected a JSON object")
+        specs.append(spec)
+    return specs
+
+
+def _spec_fields(spec: dict, accounts: dict[str, str]) -> dict:
+    """Build the ``fields`` object for one spec (same keys as create-issue)."""
+    missing = [key for key in _REQUIRED if not spec.get(key)]
+    if missing:
+        raise ValueError(f"missing required field(s): {', '.join(missing)}")
+    components = spec.get("components")
+    if isinstance(components, list):
+        components = ",".join(components)
+    additional = spec.get("additional_fields")
+    if isinstance(additional, dict):
+        additional = json.dumps(additional)
+    assignee = spec.get("assignee")
+    return _issue_fields(
+        spec["project"],
+        spec["summary"],
+        spec["type"],
+        description=spec.get("description"),
+        assignee_id=accounts[assignee] if assignee else None,
+        components=components,
+        additional_fields=additional,
+    )
+
+
+def _assignees(specs: list[dict]) -> list[str]:
+    """Distinct assignee names across all specs, in first-seen order."""
+    return list(dict.fromkeys(s["assignee"] for s in specs if s.get("assignee")))
+
+
+def _prepare(
+    specs: list[dict], accounts: dict[str, str], failures: dict[str, str]
+) -> tuple[list[dict], list[tuple[int, dict]]]:
+    """Split specs into per-item results (pre-filled on error) and payloads."""
+    results: list[dict] = [{"index": i} for i in range(len(specs))]
+    payloads = []
+    for i, spec in enumerate(specs):
+        assignee = spec.get("assignee")
+        if assignee in failures:
+            results[i]["error"] = failures[assignee]
+            continue
+        try:
+            payloads.append((i, {"fields": _spec_fields(spec, accounts)}))
+        except (ValueError, TypeError) as exc:
+            results[i]["error"] = str(exc)
+    return results, payloads
+
+
+def _chunks(items: list, size: int) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _chunk_error(exc: JiraApiError) -> dict | None:
+    """Bulk error body from a fully failed chunk, if Jira sent one."""
+    try:
+        body = json.loads(exc.body)
+    except (TypeError, ValueError):
+        return None
+    return body if isinstance(body, dict) and "errors" in body else None
+
+
+def _describe(error: dict) -> str:
+    """One-line message for a ``failedElementNumber`` error entry."""
+    details = error.get("elementErrors") or {}
+    messages = list(details.get("errorMessages") or [])
+    messages += [f"{k}: {v}" for k, v in (details.get("errors") or {}).items()]
+    return "; ".join(messages) or f"HTTP {error.get('status', '?')}"
+
+
+def _record(
+    results: list[dict], chunk: list[tuple[int, dict]], response: dict | JiraApiError
+) -> None:
+    """Map a bulk response (or rejected chunk) back onto per-item results."""
+    if isinstance(response, JiraApiError):
+        body = _chunk_error(response)
+        if body is None:
+            for index, _ in chunk:
+                results[index]["error"] = str(response)
+            return
+        response = body
+
+    failed = {}
+    for error in response.get("errors", []):
+        position = error.get("failedElementNumber")
+        if position is not None and 0 <= position < len(chunk):
+            failed[position] = _describe(error)
+    created = iter(response.get("issues", []))
+    for position, (index, _) in enumerate(chunk):
+        if position in failed:
+            results[index]["error"] = failed[position]
+            continue
+        issue = next(created, None)
+        if issue is None:
+            results[index]["error"] = "not reported by Jira"
+        else:
+            results[index].update(key=issue.get("key"), id=issue.get("id"))
+
+
+def _summary(results: list[dict]) -> dict:
+    failed = sum(1 for r in results if "error" in r)
+    return {"created": len(results) - failed, "failed": failed, "results": results}
+
+
+def run_bulk_create_issues(
+    specs: Iterable[dict],
+    *,
+    chunk_size: int = BULK_CHUNK_SIZE,
+    client: JiraClient,
+) -> dict:
+    """Create issues from specs, resolving each distinct assignee once.
+
+    Each spec uses the create-issue option names: ``project``, ``summary``,
+    ``type`` and optionally ``description``, ``assignee``, ``components``
+    (list or comma-separated) and ``additional_fields`` (object). Failures
+    are reported per item; one bad spec never blocks the rest.
+
+    Returns:
+        ``{"created": n, "failed": m, "results": [...]}`` where each result
+        carries its input ``index`` and either ``key``/``id`` or ``error``.
+    """
+    specs = list(specs)
+    accounts: dict[str, str] = {}
+    failures: dict[str, str] = {}
+    for name in _assignees(specs):
+        try:
+            accounts[name] = client.resolve_account_id(name)
+        except ValueError as exc:
+            failures[name] = str(exc)
+
+    results, payloads = _prepare(specs, accounts, failures)
+    for chunk in _chunks(payloads, chunk_size):
+        body = {"issueUpdates": [payload for _, payload in chunk]}
+        try:
+            response = client.post("/rest/api/2/issue/bulk", json=body)
+        except JiraApiError as exc:
+            response = exc
+        _record(results, chunk, response)
+    return _summary(results)
+
+
+async def run_bulk_create_issues_async(
+    specs: Iterable[dict],
+    *,
+    chunk_size: int = BULK_CHUNK_SIZE,
+    client: AsyncJiraClient,
+) -> dict:
+    """Async variant of run_bulk_create_issues; chunks are posted concurrently."""
+    specs = list(specs)
+    names = _assignees(specs)
+    resolved = await gather_limited(
+        (client.resolve_account_id(name) for name in names), return_exceptions=True
+    )
+    accounts: dict[str, str] = {}
+    failures: dict[str, str] = {}
+    for name, outcome in zip(names, resolved, strict=True):
+        if isinstance(outcome, ValueError):
+            failures[name] = str(outcome)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            accounts[name] = outcome
+
+    results, payloads = _prepare(specs, accounts, failures)
+    chunks = list(_chunks(payloads, chunk_size))
+    responses = await gather_limited(
+        (
+            client.post(
+                "/rest/api/2/issue/bulk",
+                json={"issueUpdates": [payload for _, payload in chunk]},
+            )
+            for chunk in chunks
+        ),
+        return_exceptions=True,
+    )
+    for chunk, response in zip(chunks, responses, strict=True):
+        if isinstance(response, BaseException):
+            if not isinstance(response, JiraApiError):
+                raise response
+        _record(results, chunk, response)
+    return _summary(results)
+
+
+@app.callback()
+def main(
+    file: str = typer.Option(
+        "-", "--file", help="JSONL file of issue specs ('-' for stdin)"
+    ),
+    base_url: str = typer.Option(..., envvar="JIRA_URL", help="Jira base URL"),
+    username: str = typer.Option(..., envvar="JIRA_USERNAME", help="Jira username"),
+    api_token: str = typer.Option(..., envvar="JIRA_API_TOKEN", help="Jira API token"),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON"),
+) -> None:
+    """Create Jira issues in bulk from JSONL specs.
+
+    Exits non-zero if any item failed; per-item results are printed either way.
+    """
+    from jira_utils._output import handle_error, output_json
+
+    try:
+        if file == "-":
+            specs = read_specs(sys.stdin)
+        else:
+            with open(file) as f:
+                specs = read_specs(f)
+        with JiraClient(
+            base_url=base_url.rstrip("/"), username=username, api_token=api_token
+        ) as client:
+            result = run_bulk_create_issues(specs, client=client)
+        output_json(result, pretty=pretty)
+    except Exception as exc:
+        handle_error(exc)
+    if result["failed"]:
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
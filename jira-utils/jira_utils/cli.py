@@ -1,54 +1,86 @@
 """Unified CLI entry point for jira-utils."""
 
+import os
+
 import typer
 from dotenv import load_dotenv
 
-from jira_utils.add_comment import app as add_comment_app
-from jira_utils.add_to_sprint import app as add_to_sprint_app
-from jira_utils.create_issue import app as create_issue_app
-from jira_utils.create_issue_link import app as create_issue_link_app
-from jira_utils.fetch_task import app as fetch_task_app
-from jira_utils.get_board_issues import app as get_board_issues_app
-from jira_utils.get_boards import app as get_boards_app
-from jira_utils.get_issue import app as get_issue_app
-from jira_utils.get_link_types import app as get_link_types_app
-from jira_utils.get_project_components import app as get_project_components_app
-from jira_utils.get_project_versions import app as get_project_versions_app
-from jira_utils.get_sprints import app as get_sprints_app
-from jira_utils.get_transitions import app as get_transitions_app
-from jira_utils.move_to_backlog import app as move_to_backlog_app
-from jira_utils.move_to_board import app as move_to_board_app
-from jira_utils.search import app as search_app
-from jira_utils.transition_issue import app as transition_issue_app
-from jira_utils.update_issue import app as update_issue_app
-
-app = typer.Typer(help="Jira CLI utilities.")
+from jira_utils._lazy import LazyGroup
+from jira_utils._paths import CACHE_MODE_ENV, METRICS_FILE_ENV
+
+
+class _Commands(LazyGroup):
+    lazy_commands = {
+        "add-comment": "jira_utils.add_comment",
+        "add-to-sprint": "jira_utils.add_to_sprint",
+        "batch": "jira_utils.batch",
+        "blocker-graph": "jira_utils.blocker_graph",
+        "bulk-create-issues": "jira_utils.bulk_create_issues",
+        "create-issue": "jira_utils.create_issue",
+        "create-issue-link": "jira_utils.create_issue_link",
+        "fetch-task": "jira_utils.fetch_task",
+        "fetch-tasks": "jira_utils.fetch_tasks",
+        "get-board-issues": "jira_utils.get_board_issues",
+        "get-boards": "jira_utils.get_boards",
+        "get-issue": "jira_utils.get_issue",
+        "get-issues": "jira_utils.get_issues",
+        "get-link-types": "jira_utils.get_link_types",
+        "get-project-components": "jira_utils.get_project_components",
+        "get-project-versions": "jira_utils.get_project_versions",
+        "get-sprints": "jira_utils.get_sprints",
+        "get-transitions": "jira_utils.get_transitions",
+        "move-to-backlog": "jira_utils.move_to_backlog",
+        "move-to-board": "jira_utils.move_to_board",
+        "search": "jira_utils.search",
+        "serve": "jira_utils.serve",
+        "transition-issue": "jira_utils.transition_issue",
+        "update-issue": "jira_utils.update_issue",
+        "warm-users": "jira_utils.warm_users",
+    }
+
+
+app = typer.Typer(cls=_Commands, help="Jira CLI utilities.")
 
 
 @app.callback()
-def _load_env() -> None:
+def _load_env(
+    ctx: typer.Context,
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the on-disk HTTP response cache"
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Ignore cached responses and re-fetch from Jira"
+    ),
+    stats: bool = typer.Option(
+        False, "--stats", help="Print per-endpoint request timings to stderr"
+    ),
+    stats_file: str | None = typer.Option(
+        None,
+        "--stats-file",
+        envvar=METRICS_FILE_ENV,
+        help="Append one JSON line per Jira request to this file",
+    ),
+) -> None:
     """Load .env from CWD or parent directories before running any subcommand."""
     load_dotenv()
+    if no_cache:
+        os.environ[CACHE_MODE_ENV] = "off"
+    elif refresh:
+        os.environ[CACHE_MODE_ENV] = "refresh"
+    if stats_file:
+        os.environ[METRICS_FILE_ENV] = stats_file
+    if stats:
+        from jira_utils.metrics import MetricsRecorder, install, uninstall
+
+        recorder = MetricsRecorder()
+        install(recorder)
+
+        def _report() -> None:
+            uninstall(recorder)
+            typer.echo(recorder.format_summary(), err=True)
 
+        ctx.call_on_close(_report)
 
-app.add_typer(add_comment_app, name="add-comment")
-app.add_typer(add_to_sprint_app, name="add-to-sprint")
-app.add_typer(create_issue_app, name="create-issue")
-app.add_typer(create_issue_link_app, name="create-issue-link")
-app.add_typer(fetch_task_app, name="fetch-task")
-app.add_typer(get_board_issues_app, name="get-board-issues")
-app.add_typer(get_boards_app, name="get-boards")
-app.add_typer(get_issue_app, name="get-issue")
-app.add_typer(get_link_types_app, name="get-link-types")
-app.add_typer(get_project_components_app, name="get-project-components")
-app.add_typer(get_project_versions_app, name="get-project-versions")
-app.add_typer(get_sprints_app, name="get-sprints")
-app.add_typer(get_transitions_app, name="get-transitions")
-app.add_typer(move_to_backlog_app, name="move-to-backlog")
-app.add_typer(move_to_board_app, name="move-to-board")
-app.add_typer(search_app, name="search")
-app.add_typer(transition_issue_app, name="transition-issue")
-app.add_typer(update_issue_app, name="update-issue")
 
 if __name__ == "__main__":
     app()
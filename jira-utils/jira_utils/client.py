@@ -1,12 +1,60 @@
-"""Synchronous Jira HTTP client wrapping httpx."""
+"""Jira HTTP clients wrapping httpx (synchronous and asyncio)."""
 
 from __future__ import annotations
 
+import asyncio
 import os
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 
 import httpx
 
+from jira_utils.breaker import CircuitBreaker, is_failure
+from jira_utils.httpcache import CacheEntry, ResponseCache, cache_mode_from_env
+from jira_utils.metrics import (
+    Instrument,
+    RequestMetric,
+    default_instrument,
+    template_path,
+)
+from jira_utils.ratelimit import RetryPolicy, TokenBucket
+from jira_utils.singleflight import (
+    AsyncSingleFlight,
+    FlightStats,
+    SingleFlight,
+    flight_key,
+)
+from jira_utils.usercache import AccountCache
+
+# Cheap endpoint used to check whether Jira is reachable again.
+HEALTH_PATH = "/rest/api/3/serverInfo"
+PROBE_TIMEOUT = 5.0
+
+
+# Open httpx pools reused by every JiraClient once ``keep_pools()`` was called.
+_shared_pools: dict[tuple, httpx.Client] | None = None
+
+
+def keep_pools() -> None:
+    """Share one open connection pool per site and credentials from now on.
+
+    Every ``JiraClient`` created afterwards with the same connection settings
+    reuses the same ``httpx.Client``, and ``close()`` leaves it open. Used
+    by ``jira-utils serve`` so each forwarded command starts on a warm
+    TLS connection.
+    """
+    global _shared_pools
+    if _shared_pools is None:
+        _shared_pools = {}
+
+
+def close_pools() -> None:
+    """Close every shared pool and stop sharing."""
+    global _shared_pools
+    pools, _shared_pools = _shared_pools or {}, None
+    for http in pools.values():
+        http.close()
+
 
 class JiraApiError(Exception):
     """Non-2xx response from Jira."""
@@ -17,13 +65,276 @@ class JiraApiError(Exception):
         super().__init__(f"Jira API {status_code}: {body}")
 
 
+def _parse_response(response: httpx.Response) -> dict | list | None:
+    """Raise on non-2xx, otherwise return parsed JSON (or None for empty body)."""
+    if not response.is_success:
+        raise JiraApiError(response.status_code, response.text)
+    if not response.content:
+        return None
+    return response.json()
+
+
+def _page_size(params: dict | None, json: dict | list | None) -> int | None:
+    """The ``maxResults`` a paginated request asks for, if any."""
+    source = json if isinstance(json, dict) else params
+    size = source.get("maxResults") if source else None
+    return int(size) if size is not None else None
+
+
+def _first_account_id(name: str, results: dict | list | None) -> str:
+    """Pick the accountId out of a user search result."""
+    if not results:
+        raise ValueError(f"No Jira user found matching '{name}'")
+    return results[0]["accountId"]
+
+
 @dataclass
-class JiraClient:
-    """Thin wrapper around httpx for Jira REST calls."""
+class _JiraConnection:
+    """Connection settings shared by the sync and async clients."""
 
     base_url: str
     username: str
     api_token: str
+    http2: bool = True
+    max_connections: int = 10
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    timeout: float = 30
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    rate_limited: bool = True
+    cache_mode: str | None = None
+    instrument: Instrument | None = None
+    breaker: CircuitBreaker | None = None
+    transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = field(
+        default=None, repr=False, compare=False
+    )
+    _bucket: TokenBucket | None = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    _cache: ResponseCache | None = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    _accounts: AccountCache | None = field(
+        init=False, default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Attach the shared token bucket, caches and instrumentation hook."""
+        if self.instrument is None:
+            self.instrument = default_instrument()
+        if self.rate_limited:
+            self._bucket = TokenBucket.for_site(self.base_url)
+        mode = self.cache_mode or cache_mode_from_env()
+        if mode != "off":
+            self._cache = ResponseCache(self.base_url, self.username, mode=mode)
+            self._accounts = AccountCache(self.base_url, mode=mode)
+
+    @property
+    def flight_stats(self) -> FlightStats:
+        """How many GETs were sent vs. coalesced onto an identical one."""
+        return self._flights.stats
+
+    def _cached_account(self, name: str) -> str | object:
+        """Cached accountId for a name, or ``AccountCache.MISSING``.
+
+        Raises:
+            ValueError: If the name is cached as having no matching user.
+        """
+        if self._accounts is None:
+            return AccountCache.MISSING
+        account_id = self._accounts.lookup(name)
+        if account_id is None:
+            return _first_account_id(name, None)
+        return account_id
+
+    def _remember_account(self, name: str, results: dict | list | None) -> str:
+        """Cache a user search result (hit or miss) and return its accountId."""
+        account_id = results[0]["accountId"] if results else None
+        if self._accounts is not None:
+            self._accounts.store(name, account_id)
+        return _first_account_id(name, results)
+
+    def _cached(self, method: str, path: str, params: dict | None) -> CacheEntry | None:
+        """Stored response for a cacheable GET, if any."""
+        if method != "GET" or self._cache is None:
+            return None
+        return self._cache.lookup(path, params)
+
+    def _complete(
+        self,
+        method: str,
+        path: str,
+        params: dict | None,
+        response: httpx.Response,
+        entry: CacheEntry | None,
+    ) -> dict | list | None:
+        """Turn the final response into a result, updating the cache."""
+        if entry is not None and response.status_code == 304:
+            self._cache.revalidated(entry, response)
+            return entry.body
+        result = _parse_response(response)
+        if method == "GET" and self._cache is not None:
+            self._cache.store(path, params, response, result)
+        return result
+
+    def _observe(
+        self,
+        method: str,
+        path: str,
+        started: float,
+        response: httpx.Response | None,
+        *,
+        attempt: int = 1,
+        cached: bool = False,
+        page_size: int | None = None,
+        observer: Instrument | None = None,
+    ) -> None:
+        """Report one request (or cache hit) to the instrumentation hooks.
+
+        ``observer`` is a per-call hook that sees the same metric as
+        ``self.instrument``.
+        """
+        if self.instrument is None and observer is None:
+            return
+        metric = RequestMetric(
+            method=method,
+            path=template_path(path),
+            status=response.status_code if response is not None else None,
+            duration=time.perf_counter() - started,
+            bytes=len(response.content) if response is not None else 0,
+            attempt=attempt,
+            cached=cached,
+            page_size=page_size,
+        )
+        for hook in (self.instrument, observer):
+            if hook is not None:
+                hook(metric)
+
+    def _admit(self) -> int | None:
+        """Raise ``CircuitOpenError`` if the breaker rejects the request.
+
+        Returns the breaker generation the attempt was admitted in.
+        """
+        if self.breaker is not None:
+            return self.breaker.before_request()
+        return None
+
+    def _settle(
+        self, response: httpx.Response | None, generation: int | None = None
+    ) -> None:
+        """Feed an attempt's outcome to the breaker."""
+        if self.breaker is not None:
+            status = response.status_code if response is not None else None
+            self.breaker.record(status, generation)
+
+    def _release(self, generation: int | None) -> None:
+        """Hand an admitted attempt that produced no outcome back to the breaker."""
+        if self.breaker is not None and generation is not None:
+            self.breaker.release(generation)
+
+    def _probed(
+        self, path: str, started: float, response: httpx.Response | None
+    ) -> bool:
+        """Record a health probe's outcome; return whether Jira looks healthy."""
+        self._observe("GET", path, started, response)
+        self._settle(response)
+        return not is_failure(response.status_code if response is not None else None)
+
+    def _reserve(self) -> float:
+        """Seconds to wait for a rate-limit token before sending."""
+        return self._bucket.reserve() if self._bucket is not None else 0.0
+
+    def _backoff(self, delay: float, response: httpx.Response | None) -> float:
+        """Seconds to sleep before a retry.
+
+        A 429 empties the shared bucket instead, so every process on the
+        host waits out the throttle and the next ``_reserve()`` absorbs it.
+        """
+        if self._bucket is not None and response is not None:
+            if response.status_code == 429:
+                self._bucket.pause(delay)
+                return 0.0
+        return delay
+
+    def _pool_key(self) -> tuple | None:
+        """Key under which this client's pool is shared, or None if it is not.
+
+        Clients with a custom transport always get a private pool.
+        """
+        if _shared_pools is None or self.transport is not None:
+            return None
+        return (
+            self.base_url,
+            self.username,
+            self.api_token,
+            self.http2,
+            self.max_connections,
+            self.max_keepalive_connections,
+            self.keepalive_expiry,
+            self.timeout,
+        )
+
+    def _http_options(self) -> dict:
+        """Keyword arguments for constructing the underlying httpx client.
+
+        A custom ``transport`` (e.g. ``jira_utils.simulator``) replaces the
+        network connection pool entirely.
+        """
+        options = {
+            "base_url": self.base_url,
+            "auth": (self.username, self.api_token),
+            "headers": {"Accept": "application/json"},
+            "timeout": self.timeout,
+            "http2": self.http2,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        }
+        if self.transport is not None:
+            options["transport"] = self.transport
+        return options
+
+
+@dataclass
+class JiraClient(_JiraConnection):
+    """Thin wrapper around a pooled ``httpx.Client`` for Jira REST calls.
+
+    The underlying connection pool is kept alive for the lifetime of the
+    client, so consecutive calls reuse the same TCP/TLS connection. Use the
+    client as a context manager (or call ``close()``) to release it.
+    """
+
+    _http: httpx.Client = field(init=False, repr=False, compare=False)
+    _flights: SingleFlight = field(init=False, repr=False, compare=False)
+    _shared: bool = field(init=False, default=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Open the pooled HTTP client, or reuse a shared one."""
+        super().__post_init__()
+        key = self._pool_key()
+        self._shared = key is not None
+        if key is None:
+            self._http = httpx.Client(**self._http_options())
+        else:
+            if key not in _shared_pools:
+                _shared_pools[key] = httpx.Client(**self._http_options())
+            self._http = _shared_pools[key]
+        self._flights = SingleFlight()
+
+    def __enter__(self) -> JiraClient:
+        """Return self for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the connection pool on block exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection pool unless it is shared."""
+        if not self._shared:
+            self._http.close()
 
     def _request(
         self,
@@ -32,31 +343,145 @@ class JiraClient:
         *,
         params: dict | None = None,
         json: dict | list | None = None,
+        idempotent: bool | None = None,
+        observer: Instrument | None = None,
+        retry_timeouts: bool = True,
     ) -> dict | list | None:
-        """Send an HTTP request and return parsed JSON (or None for 204)."""
-        url = f"{self.base_url}{path}"
-        response = httpx.request(
+        """Send an HTTP request and return parsed JSON (or None for 204).
+
+        Cacheable GETs are served from the on-disk cache while fresh and
+        revalidated with If-None-Match / If-Modified-Since once stale.
+        """
+        started = time.perf_counter()
+        entry = self._cached(method, path, params)
+        if entry is not None and self._cache.fresh(entry):
+            self._observe(method, path, started, None, cached=True, observer=observer)
+            return entry.body
+        response = self._send(
             method,
-            url,
+            path,
             params=params,
             json=json,
-            auth=(self.username, self.api_token),
-            headers={"Accept": "application/json"},
-            timeout=30,
+            headers=entry.validators() if entry else None,
+            idempotent=idempotent,
+            observer=observer,
+            retry_timeouts=retry_timeouts,
         )
-        if not response.is_success:
-            raise JiraApiError(response.status_code, response.text)
-        if not response.content:
-            return None
-        return response.json()
+        return self._complete(method, path, params, response, entry)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict | None,
+        json: dict | list | None,
+        headers: dict | None,
+        idempotent: bool | None,
+        observer: Instrument | None = None,
+        retry_timeouts: bool = True,
+    ) -> httpx.Response:
+        """Send a request, retrying per ``self.retry``; return the final response.
+
+        Throttled (429), transient 5xx and transport failures are retried
+        when the call is idempotent. With ``retry_timeouts=False`` a timeout
+        is raised at once so the caller can retry with a smaller request.
+        Every attempt is reported to ``observer`` as well as the instrument.
+        """
+        retryable = self.retry.allows(method, idempotent)
+        page_size = _page_size(params, json)
+        delay: float | None = None
+        attempt = 1
+        while True:
+            if wait := self._reserve():
+                time.sleep(wait)
+            final = not retryable or attempt >= self.retry.max_attempts
+            generation = self._admit()
+            started = time.perf_counter()
+            try:
+                response = self._http.request(
+                    method, path, params=params, json=json, headers=headers
+                )
+            except httpx.TransportError as e:
+                self._observe(
+                    method,
+                    path,
+                    started,
+                    None,
+                    attempt=attempt,
+                    page_size=page_size,
+                    observer=observer,
+                )
+                self._settle(None, generation)
+                if final or (
+                    not retry_timeouts and isinstance(e, httpx.TimeoutException)
+                ):
+                    raise
+                response = None
+            except BaseException:
+                # Cancelled or failed before an outcome: free a half-open trial.
+                self._release(generation)
+                raise
+            else:
+                self._observe(
+                    method,
+                    path,
+                    started,
+                    response,
+                    attempt=attempt,
+                    page_size=page_size,
+                    observer=observer,
+                )
+                self._settle(response, generation)
+                if response.is_success or final:
+                    return response
+            delay = self.retry.next_delay(delay, response)
+            if delay is None:
+                return response
+            if wait := self._backoff(delay, response):
+                time.sleep(wait)
+            attempt += 1
+
+    def probe(self) -> bool:
+        """Send a cheap health check, even while the breaker is open.
+
+        The outcome is fed to the breaker, so a healthy reply closes it.
+        """
+        started = time.perf_counter()
+        try:
+            response = self._http.get(HEALTH_PATH, timeout=PROBE_TIMEOUT)
+        except httpx.TransportError:
+            response = None
+        return self._probed(HEALTH_PATH, started, response)
 
     def get(self, path: str, params: dict | None = None) -> dict | list | None:
-        """HTTP GET."""
-        return self._request("GET", path, params=params)
+        """HTTP GET. Identical GETs issued concurrently share one request."""
+        return self._flights.do(
+            flight_key("GET", path, params),
+            lambda: self._request("GET", path, params=params),
+        )
+
+    def post(
+        self,
+        path: str,
+        json: dict | list | None = None,
+        *,
+        idempotent: bool | None = None,
+        observer: Instrument | None = None,
+        retry_timeouts: bool = True,
+    ) -> dict | list | None:
+        """HTTP POST. Pass ``idempotent=True`` for read-only POSTs to allow retries.
 
-    def post(self, path: str, json: dict | list | None = None) -> dict | list | None:
-        """HTTP POST."""
-        return self._request("POST", path, json=json)
+        ``observer`` and ``retry_timeouts`` are passed to ``_send``.
+        """
+        return self._request(
+            "POST",
+            path,
+            json=json,
+            idempotent=idempotent,
+            observer=observer,
+            retry_timeouts=retry_timeouts,
+        )
 
     def put(self, path: str, json: dict | list | None = None) -> dict | list | None:
         """HTTP PUT."""
@@ -66,15 +491,207 @@ class JiraClient:
         """Resolve a display name to a Jira Cloud accountId.
 
         If the input already looks like an accountId (contains ':'),
-        it is returned as-is without making an API call.
+        it is returned as-is without making an API call. Resolutions (and
+        misses) are cached on disk, see ``jira_utils.usercache``.
         """
         if ":" in name_or_id:
             return name_or_id
+        cached = self._cached_account(name_or_id)
+        if cached is not AccountCache.MISSING:
+            return cached
 
         results = self.get("/rest/api/2/user/search", params={"query": name_or_id})
-        if not results:
-            raise ValueError(f"No Jira user found matching '{name_or_id}'")
-        return results[0]["accountId"]
+        return self._remember_account(name_or_id, results)
+
+
+@dataclass
+class AsyncJiraClient(_JiraConnection):
+    """Asyncio counterpart of JiraClient on a pooled ``httpx.AsyncClient``.
+
+    Exposes the same get/post/put/resolve_account_id surface as coroutines.
+    Use it as an async context manager (or await ``aclose()``).
+    """
+
+    _http: httpx.AsyncClient = field(init=False, repr=False, compare=False)
+    _flights: AsyncSingleFlight = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Open the pooled async HTTP client."""
+        super().__post_init__()
+        self._http = httpx.AsyncClient(**self._http_options())
+        self._flights = AsyncSingleFlight()
+
+    async def __aenter__(self) -> AsyncJiraClient:
+        """Return self for use in an ``async with`` block."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the connection pool on block exit."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._http.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict | None = None,
+        json: dict | list | None = None,
+        idempotent: bool | None = None,
+        observer: Instrument | None = None,
+        retry_timeouts: bool = True,
+    ) -> dict | list | None:
+        """Send an HTTP request and return parsed JSON (or None for 204).
+
+        Caching and retries follow the same rules as ``JiraClient._request``.
+        """
+        started = time.perf_counter()
+        entry = self._cached(method, path, params)
+        if entry is not None and self._cache.fresh(entry):
+            self._observe(method, path, started, None, cached=True, observer=observer)
+            return entry.body
+        response = await self._send(
+            method,
+            path,
+            params=params,
+            json=json,
+            headers=entry.validators() if entry else None,
+            idempotent=idempotent,
+            observer=observer,
+            retry_timeouts=retry_timeouts,
+        )
+        return self._complete(method, path, params, response, entry)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict | None,
+        json: dict | list | None,
+        headers: dict | None,
+        idempotent: bool | None,
+        observer: Instrument | None = None,
+        retry_timeouts: bool = True,
+    ) -> httpx.Response:
+        """Async variant of ``JiraClient._send``."""
+        retryable = self.retry.allows(method, idempotent)
+        page_size = _page_size(params, json)
+        delay: float | None = None
+        attempt = 1
+        while True:
+            if wait := self._reserve():
+                await asyncio.sleep(wait)
+            final = not retryable or attempt >= self.retry.max_attempts
+            generation = self._admit()
+            started = time.perf_counter()
+            try:
+                response = await self._http.request(
+                    method, path, params=params, json=json, headers=headers
+                )
+            except httpx.TransportError as e:
+                self._observe(
+                    method,
+                    path,
+                    started,
+                    None,
+                    attempt=attempt,
+                    page_size=page_size,
+                    observer=observer,
+                )
+                self._settle(None, generation)
+                if final or (
+                    not retry_timeouts and isinstance(e, httpx.TimeoutException)
+                ):
+                    raise
+                response = None
+            except BaseException:
+                # Cancelled or failed before an outcome: free a half-open trial.
+                self._release(generation)
+                raise
+            else:
+                self._observe(
+                    method,
+                    path,
+                    started,
+                    response,
+                    attempt=attempt,
+                    page_size=page_size,
+                    observer=observer,
+                )
+                self._settle(response, generation)
+                if response.is_success or final:
+                    return response
+            delay = self.retry.next_delay(delay, response)
+            if delay is None:
+                return response
+            if wait := self._backoff(delay, response):
+                await asyncio.sleep(wait)
+            attempt += 1
+
+    async def probe(self) -> bool:
+        """Async variant of ``JiraClient.probe``."""
+        started = time.perf_counter()
+        try:
+            response = await self._http.get(HEALTH_PATH, timeout=PROBE_TIMEOUT)
+        except httpx.TransportError:
+            response = None
+        return self._probed(HEALTH_PATH, started, response)
+
+    async def get(self, path: str, params: dict | None = None) -> dict | list | None:
+        """HTTP GET. Identical GETs issued concurrently share one request."""
+        return await self._flights.do(
+            flight_key("GET", path, params),
+            lambda: self._request("GET", path, params=params),
+        )
+
+    async def post(
+        self,
+        path: str,
+        json: dict | list | None = None,
+        *,
+        idempotent: bool | None = None,
+        observer: Instrument | None = None,
+        retry_timeouts: bool = True,
+    ) -> dict | list | None:
+        """HTTP POST. Pass ``idempotent=True`` for read-only POSTs to allow retries.
+
+        ``observer`` and ``retry_timeouts`` are passed to ``_send``.
+        """
+        return await self._request(
+            "POST",
+            path,
+            json=json,
+            idempotent=idempotent,
+            observer=observer,
+            retry_timeouts=retry_timeouts,
+        )
+
+    async def put(
+        self, path: str, json: dict | list | None = None
+    ) -> dict | list | None:
+        """HTTP PUT."""
+        return await self._request("PUT", path, json=json)
+
+    async def resolve_account_id(self, name_or_id: str) -> str:
+        """Resolve a display name to a Jira Cloud accountId.
+
+        If the input already looks like an accountId (contains ':'),
+        it is returned as-is without making an API call.
+        """
+        if ":" in name_or_id:
+            return name_or_id
+        cached = self._cached_account(name_or_id)
+        if cached is not AccountCache.MISSING:
+            return cached
+
+        results = await self.get(
+            "/rest/api/2/user/search", params={"query": name_or_id}
+        )
+        return self._remember_account(name_or_id, results)
 
 
 def load_config() -> dict[str, str]:
@@ -0,0 +1,45 @@
+"""Bounded-concurrency helpers for fanning out async Jira calls."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Default number of in-flight Jira requests; keeps bursts under rate limits.
+DEFAULT_CONCURRENCY = 8
+
+
+async def gather_limited(
+    aws: Iterable[Awaitable[T]],
+    *,
+    limit: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list[T | BaseException]:
+    """Await many awaitables with at most ``limit`` running at once.
+
+    Results are returned in input order, like ``asyncio.gather``.
+
+    Args:
+        aws: Awaitables to run (e.g. ``run_get_issue_async(...)`` calls).
+        limit: Maximum number of awaitables in flight at the same time.
+        return_exceptions: If True, exceptions are returned in the result
+            list instead of cancelling the remaining work.
+
+    Raises:
+        ValueError: If limit is less than 1.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(_run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
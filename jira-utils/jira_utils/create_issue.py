@@ -6,23 +6,22 @@ import json
 
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 app = typer.Typer(invoke_without_command=True)
 
 
-def run_create_issue(
+def _issue_fields(
     project: str,
     summary: str,
     issue_type: str,
     *,
-    description: str | None = None,
-    assignee: str | None = None,
-    components: str | None = None,
-    additional_fields: str | None = None,
-    client: JiraClient,
+    description: str | None,
+    assignee_id: str | None,
+    components: str | None,
+    additional_fields: str | None,
 ) -> dict:
-    """Create an issue. Returns the created issue dict."""
+    """Build the ``fields`` object for a new issue."""
     fields: dict = {
         "project": {"key": project},
         "summary": summary,
@@ -30,16 +29,63 @@ def run_create_issue(
     }
     if description:
         fields["description"] = description
-    if assignee:
-        fields["assignee"] = {"accountId": client.resolve_account_id(assignee)}
+    if assignee_id:
+        fields["assignee"] = {"accountId": assignee_id}
     if components:
         fields["components"] = [{"name": c.strip()} for c in components.split(",")]
     if additional_fields:
         fields.update(json.loads(additional_fields))
+    return fields
+
 
+def run_create_issue(
+    project: str,
+    summary: str,
+    issue_type: str,
+    *,
+    description: str | None = None,
+    assignee: str | None = None,
+    components: str | None = None,
+    additional_fields: str | None = None,
+    client: JiraClient,
+) -> dict:
+    """Create an issue. Returns the created issue dict."""
+    fields = _issue_fields(
+        project,
+        summary,
+        issue_type,
+        description=description,
+        assignee_id=client.resolve_account_id(assignee) if assignee else None,
+        components=components,
+        additional_fields=additional_fields,
+    )
     return client.post("/rest/api/2/issue", json={"fields": fields})
 
 
+async def run_create_issue_async(
+    project: str,
+    summary: str,
+    issue_type: str,
+    *,
+    description: str | None = None,
+    assignee: str | None = None,
+    components: str | None = None,
+    additional_fields: str | None = None,
+    client: AsyncJiraClient,
+) -> dict:
+    """Async variant of run_create_issue."""
+    fields = _issue_fields(
+        project,
+        summary,
+        issue_type,
+        description=description,
+        assignee_id=await client.resolve_account_id(assignee) if assignee else None,
+        components=components,
+        additional_fields=additional_fields,
+    )
+    return await client.post("/rest/api/2/issue", json={"fields": fields})
+
+
 @app.callback()
 def main(
     project: str = typer.Option(..., "--project", help="Project key"),
@@ -64,19 +110,19 @@ def main(
     from jira_utils._output import handle_error, output_json
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_create_issue(
-            project,
-            summary,
-            type,
-            description=description,
-            assignee=assignee,
-            components=components,
-            additional_fields=additional_fields,
-            client=client,
-        )
+        ) as client:
+            result = run_create_issue(
+                project,
+                summary,
+                type,
+                description=description,
+                assignee=assignee,
+                components=components,
+                additional_fields=additional_fields,
+                client=client,
+            )
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
@@ -4,11 +4,20 @@ from __future__ import annotations
 
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 app = typer.Typer(invoke_without_command=True)
 
 
+def _link_payload(link_type: str, inward: str, outward: str) -> dict:
+    """Build the issueLink request body."""
+    return {
+        "type": {"name": link_type},
+        "inwardIssue": {"key": inward},
+        "outwardIssue": {"key": outward},
+    }
+
+
 def run_create_issue_link(
     link_type: str,
     inward: str,
@@ -18,12 +27,20 @@ def run_create_issue_link(
 ) -> dict | None:
     """Create an issue link. Returns None (201/204) on success."""
     return client.post(
-        "/rest/api/2/issueLink",
-        json={
-            "type": {"name": link_type},
-            "inwardIssue": {"key": inward},
-            "outwardIssue": {"key": outward},
-        },
+        "/rest/api/2/issueLink", json=_link_payload(link_type, inward, outward)
+    )
+
+
+async def run_create_issue_link_async(
+    link_type: str,
+    inward: str,
+    outward: str,
+    *,
+    client: AsyncJiraClient,
+) -> dict | None:
+    """Async variant of run_create_issue_link."""
+    return await client.post(
+        "/rest/api/2/issueLink", json=_link_payload(link_type, inward, outward)
     )
 
 
@@ -41,10 +58,10 @@ def main(
     from jira_utils._output import handle_error, output_json
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_create_issue_link(type, inward, outward, client=client)
+        ) as client:
+            result = run_create_issue_link(type, inward, outward, client=client)
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
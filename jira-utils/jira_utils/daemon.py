@@ -0,0 +1,114 @@
+"""Thin client forwarding CLI invocations to a running ``jira-utils serve``.
+
+Only the standard library is imported here, so a forwarded command skips
+importing typer, httpx and the command modules altogether. The protocol is
+JSON lines over a Unix socket: ``{"argv", "env", "cwd"}`` in, then
+``{"stdout": text}`` and ``{"stderr": text}`` out as the command writes,
+ending with ``{"code": n}``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import BinaryIO
+
+from jira_utils._paths import cache_dir
+
+SOCKET_ENV = "JIRA_UTILS_SOCKET"
+NO_DAEMON_ENV = "JIRA_UTILS_NO_DAEMON"
+
+# Commands that read stdin or manage the daemon always run in-process.
+_LOCAL_COMMANDS = frozenset({"serve", "batch", "bulk-create-issues"})
+
+# Top-level options taking a value: the argument after them is not a command.
+_VALUE_OPTIONS = frozenset({"--stats-file"})
+
+
+def socket_path() -> Path:
+    """Socket the daemon listens on: ``JIRA_UTILS_SOCKET`` or the cache dir."""
+    override = os.environ.get(SOCKET_ENV)
+    return Path(override) if override else cache_dir() / "daemon.sock"
+
+
+def read_message(stream: BinaryIO) -> dict:
+    """Read one JSON line.
+
+    Raises:
+        ConnectionError: If the peer closed the connection first.
+    """
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("connection closed")
+    return json.loads(line)
+
+
+def write_message(stream: BinaryIO, message: dict) -> None:
+    """Write one JSON line and flush it."""
+    stream.write(json.dumps(message).encode() + b"\n")
+    stream.flush()
+
+
+def _subcommand(argv: list[str]) -> str | None:
+    """The subcommand ``argv`` runs, skipping top-level options before it."""
+    args = iter(argv)
+    for arg in args:
+        if arg in _VALUE_OPTIONS:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def connect(path: Path) -> socket.socket | None:
+    """Connect to the daemon socket, or return None if nothing listens there."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def forward(argv: list[str], path: Path | None = None) -> int | None:
+    """Run ``argv`` on the daemon, relaying its output to stdout/stderr live.
+
+    Returns the command's exit code, or None when it should run in-process:
+    no daemon is listening, ``JIRA_UTILS_NO_DAEMON`` is set, or the command
+    reads stdin. Once connected, a lost connection is reported as a failure
+    rather than retried locally, since the command may already have changed
+    Jira.
+    """
+    if os.environ.get(NO_DAEMON_ENV) or _subcommand(argv) in _LOCAL_COMMANDS:
+        return None
+    sock = connect(path or socket_path())
+    if sock is None:
+        return None
+    request = {"argv": argv, "env": dict(os.environ), "cwd": os.getcwd()}
+    try:
+        with sock, sock.makefile("rwb") as stream:
+            write_message(stream, request)
+            while "code" not in (message := read_message(stream)):
+                if "stdout" in message:
+                    sys.stdout.write(message["stdout"])
+                    sys.stdout.flush()
+                if "stderr" in message:
+                    sys.stderr.write(message["stderr"])
+    except (OSError, ValueError) as exc:
+        sys.stderr.write(f"error: jira-utils daemon: {exc}\n")
+        return 1
+    return message["code"]
+
+
+def main() -> None:
+    """Console entry point: forward to the daemon, else run the CLI here."""
+    code = forward(sys.argv[1:])
+    if code is not None:
+        sys.exit(code)
+    from jira_utils.cli import app
+
+    app()
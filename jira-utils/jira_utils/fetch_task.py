@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
+import sqlite3
+from collections.abc import Collection, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
 import typer
 
-from jira_utils.client import JiraClient
-from jira_utils.search import run_search
+from jira_utils.blockers import BlockerGraph
+from jira_utils.board_issue import BoardIssue
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.concurrency import DEFAULT_CONCURRENCY, gather_limited
+from jira_utils.search import (
+    iter_search,
+    iter_search_async,
+    search_all,
+    search_all_async,
+)
+from jira_utils.snapshot import BoardSnapshot, snapshots_from_env
 
 app = typer.Typer(invoke_without_command=True)
 
@@ -40,125 +53,491 @@ _RESOLVED_STATUSES = {"Done", "Invalid"}
 _SEARCH_FIELDS = "summary,status,issuetype,priority,assignee,parent,issuelinks,labels"
 
 
+# One board snapshot, or one per project when selecting across projects
+Snapshots = BoardSnapshot | Mapping[str, BoardSnapshot]
+
+
+def split_projects(project: str | Sequence[str]) -> list[str]:
+    """Project keys from a comma-separated string or a sequence, in order."""
+    values = project.split(",") if isinstance(project, str) else project
+    return list(dict.fromkeys(p.strip() for p in values if p.strip()))
+
+
+def _board_jql(project: str) -> str:
+    """JQL selecting every active issue on the project board."""
+    return f"project = {project} AND status NOT IN (Done, Invalid) ORDER BY rank ASC"
+
+
+def _delta_jql(project: str, minutes: int) -> str:
+    """JQL selecting every project issue changed in the last ``minutes``."""
+    return f'project = {project} AND updated >= "-{minutes}m" ORDER BY rank ASC'
+
+
+def _is_resolved(issue: dict) -> bool:
+    status = issue.get("fields", {}).get("status", {}).get("name", "")
+    return status in _RESOLVED_STATUSES
+
+
 def _fetch_all_issues(project: str, client: JiraClient) -> list[dict]:
-    """Fetch all active issues, paginating if needed."""
-    jql = f"project = {project} AND status NOT IN (Done, Invalid) ORDER BY rank ASC"
-    all_issues: list[dict] = []
-    next_page_token: str | None = None
-
-    while True:
-        result = run_search(
-            jql,
-            fields=_SEARCH_FIELDS,
-            limit=50,
-            next_page_token=next_page_token,
-            client=client,
-        )
-        all_issues.extend(result.get("issues", []))
-        next_page_token = result.get("nextPageToken")
-        if not next_page_token:
-            break
+    """Fetch all active issues, with adaptively sized pages."""
+    return search_all(_board_jql(project), fields=_SEARCH_FIELDS, client=client)
 
-    return all_issues
 
+async def _fetch_all_issues_async(project: str, client: AsyncJiraClient) -> list[dict]:
+    """Async variant of _fetch_all_issues."""
+    return await search_all_async(
+        _board_jql(project), fields=_SEARCH_FIELDS, client=client
+    )
 
-def _extract_blockers(issuelinks: list[dict]) -> list[dict]:
-    """Extract active blockers from issuelinks."""
-    blockers = []
-    for link in issuelinks:
-        if link.get("type", {}).get("inward") != "is blocked by":
-            continue
-        inward = link.get("inwardIssue")
-        if not inward:
-            continue
-        status = inward.get("fields", {}).get("status", {}).get("name", "")
-        if status in _RESOLVED_STATUSES:
-            continue
-        blockers.append(
-            {
-                "key": inward["key"],
-                "summary": inward.get("fields", {}).get("summary", ""),
-                "status": status,
-            }
+
+def _snapshot_issues(
+    project: str, client: JiraClient, snapshot: BoardSnapshot | None
+) -> list[dict]:
+    """Active board issues, via a delta sync of the local snapshot if given.
+
+    Falls back to a full fetch when the snapshot store is unusable.
+    """
+    if snapshot is None:
+        return _fetch_all_issues(project, client)
+    try:
+        started = snapshot.clock()
+        minutes = snapshot.delta_minutes()
+        if minutes is None:
+            snapshot.replace(_fetch_all_issues(project, client), started)
+        else:
+            changed = list(
+                iter_search(
+                    _delta_jql(project, minutes), fields=_SEARCH_FIELDS, client=client
+                )
+            )
+            snapshot.apply(
+                [i for i in changed if not _is_resolved(i)],
+                [i for i in changed if _is_resolved(i)],
+                started,
+            )
+        return snapshot.issues()
+    except sqlite3.Error:
+        return _fetch_all_issues(project, client)
+
+
+async def _snapshot_issues_async(
+    project: str, client: AsyncJiraClient, snapshot: BoardSnapshot | None
+) -> list[dict]:
+    """Async variant of _snapshot_issues."""
+    if snapshot is None:
+        return await _fetch_all_issues_async(project, client)
+    try:
+        started = snapshot.clock()
+        minutes = snapshot.delta_minutes()
+        if minutes is None:
+            snapshot.replace(await _fetch_all_issues_async(project, client), started)
+        else:
+            changed = [
+                issue
+                async for issue in iter_search_async(
+                    _delta_jql(project, minutes), fields=_SEARCH_FIELDS, client=client
+                )
+            ]
+            snapshot.apply(
+                [i for i in changed if not _is_resolved(i)],
+                [i for i in changed if _is_resolved(i)],
+                started,
+            )
+        return snapshot.issues()
+    except sqlite3.Error:
+        return await _fetch_all_issues_async(project, client)
+
+
+def _snapshot_for(snapshot: Snapshots | None, project: str) -> BoardSnapshot | None:
+    if isinstance(snapshot, Mapping):
+        return snapshot.get(project)
+    return snapshot
+
+
+def _check_projects(projects: list[str], snapshot: Snapshots | None) -> None:
+    if not projects:
+        raise ValueError("Project is required: pass --project or set JIRA_PROJECT_ID")
+    if len(projects) > 1 and isinstance(snapshot, BoardSnapshot):
+        raise ValueError("pass one board snapshot per project")
+
+
+def _fetch_projects(
+    projects: list[str], client: JiraClient, snapshot: Snapshots | None
+) -> list[dict]:
+    """Active issues of every project board, concatenated in project order.
+
+    Boards are fetched concurrently, so the wait is the slowest project's
+    fetch rather than the sum of them.
+    """
+    _check_projects(projects, snapshot)
+    if len(projects) == 1:
+        return _snapshot_issues(
+            projects[0], client, _snapshot_for(snapshot, projects[0])
         )
-    return blockers
-
-
-def _normalize_issue(issue: dict) -> dict:
-    """Normalize a raw Jira issue into the task shape."""
-    fields = issue.get("fields", {})
-    assignee_field = fields.get("assignee")
-    parent_field = fields.get("parent")
-
-    return {
-        "key": issue["key"],
-        "summary": fields.get("summary", ""),
-        "issue_type": fields.get("issuetype", {}).get("name", ""),
-        "priority": fields.get("priority", {}).get("name", ""),
-        "assignee": assignee_field.get("displayName") if assignee_field else None,
-        "parent_key": parent_field.get("key") if parent_field else None,
-        "labels": fields.get("labels", []),
-        "blocked_by": _extract_blockers(fields.get("issuelinks", [])),
-    }
+    workers = min(DEFAULT_CONCURRENCY, len(projects))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        boards = pool.map(
+            lambda p: _snapshot_issues(p, client, _snapshot_for(snapshot, p)),
+            projects,
+        )
+        return [issue for board in boards for issue in board]
+
 
+async def _fetch_projects_async(
+    projects: list[str], client: AsyncJiraClient, snapshot: Snapshots | None
+) -> list[dict]:
+    """Async variant of _fetch_projects."""
+    _check_projects(projects, snapshot)
+    boards = await gather_limited(
+        _snapshot_issues_async(p, client, _snapshot_for(snapshot, p)) for p in projects
+    )
+    return [issue for board in boards for issue in board]
+
+
+def _blocker_graph(issues: list[dict]) -> BlockerGraph:
+    """Blocker graph over fetched issues, ignoring resolved blockers."""
+    return BlockerGraph(issues, resolved_statuses=_RESOLVED_STATUSES)
+
+
+def _normalize_issue(issue: dict, column: str, graph: BlockerGraph) -> BoardIssue:
+    """Normalize a raw Jira issue into the task shape.
 
-def _group_by_column(issues: list[dict]) -> dict[str, list[dict]]:
+    ``blocked_by`` lists active direct blockers; ``unblocks`` counts the
+    issues it transitively blocks among those in ``graph``.
+    """
+    return BoardIssue.from_issue(issue, column, graph)
+
+
+def _group_by_column(issues: list[dict]) -> dict[str, list[BoardIssue]]:
     """Group normalized issues by status column."""
-    columns: dict[str, list[dict]] = {}
+    graph = _blocker_graph(issues)
+    columns: dict[str, list[BoardIssue]] = {}
     for issue in issues:
         status_name = issue.get("fields", {}).get("status", {}).get("name", "")
         column = _STATUS_MAP.get(status_name)
         if column is None:
             continue
-        normalized = _normalize_issue(issue)
+        normalized = _normalize_issue(issue, column, graph)
         columns.setdefault(column, []).append(normalized)
     return columns
 
 
-def _wip_count(tasks: list[dict]) -> int:
-    """Count non-Epic tasks for WIP limit purposes."""
-    return sum(1 for t in tasks if t["issue_type"] != "Epic")
+def _wip_count(tasks: list[BoardIssue], project: str | None = None) -> int:
+    """Count non-Epic tasks (of ``project`` if given) for WIP limit purposes."""
+    return sum(
+        1
+        for t in tasks
+        if t.issue_type != "Epic" and (project is None or t.project == project)
+    )
+
+
+def _wip_columns(column: str) -> list[str]:
+    """Downstream columns whose WIP limits gate picking from ``column``."""
+    return [ds for ds in _DOWNSTREAM.get(column, []) if ds in _WIP_LIMITS]
+
+
+def _wip_blocked(
+    board_state: dict[str, list[BoardIssue]],
+    column: str,
+    reserved: Mapping[str, int] | None = None,
+    project: str | None = None,
+) -> bool:
+    """Whether a downstream column of ``column`` is at its WIP limit.
+
+    ``reserved`` adds slots already promised to tasks picked earlier in the
+    same allocation. With ``project``, only that project's tasks count
+    against the limit.
+    """
+    reserved = reserved or {}
+    return any(
+        _wip_count(board_state.get(ds, []), project) + reserved.get(ds, 0)
+        >= _WIP_LIMITS[ds]
+        for ds in _wip_columns(column)
+    )
+
+
+def _open_tasks(
+    board_state: dict[str, list[BoardIssue]],
+    column: str,
+    reserved: Mapping[str, int] | None,
+    projects: Sequence[str] | None,
+) -> list[BoardIssue]:
+    """Tasks in ``column`` whose downstream columns have room.
+
+    Without ``projects`` the whole board shares one set of WIP limits;
+    otherwise each project is checked against its own.
+    """
+    tasks = board_state.get(column, [])
+    if projects is None:
+        return [] if _wip_blocked(board_state, column, reserved) else tasks
+    open_projects = {
+        p for p in projects if not _wip_blocked(board_state, column, reserved, p)
+    }
+    return [t for t in tasks if t.project in open_projects]
+
+
+def _first_eligible(
+    tasks: list[BoardIssue],
+    assigned_to_user_name: str,
+    *,
+    favor_unblocking: bool = False,
+    taken: Collection[str] = (),
+) -> BoardIssue | None:
+    """First unblocked task assigned to the user, in board order.
+
+    With ``favor_unblocking``, the eligible task that unblocks the most
+    downstream issues wins instead; board order breaks ties. Keys in
+    ``taken`` are skipped.
+    """
+    user = assigned_to_user_name.strip()
+    eligible = (
+        task
+        for task in tasks
+        if (task.assignee or "").strip() == user
+        and not task.blocked_by
+        and task.key not in taken
+    )
+    if favor_unblocking:
+        return max(eligible, key=lambda task: task.unblocks, default=None)
+    return next(eligible, None)
+
+
+def _selected(
+    task: BoardIssue | None, column: str | None, assigned_to_user_name: str
+) -> tuple[BoardIssue | None, str | None, str]:
+    """Build the (task, column, reason) selection result."""
+    if task is None:
+        return None, None, f"No eligible tasks found for {assigned_to_user_name}"
+    reason = (
+        f"Selected {task.key} from {column} column "
+        f"(assigned to {assigned_to_user_name}, no active blockers)"
+    )
+    return task, column, reason
 
 
 def _select_task(
-    board_state: dict[str, list[dict]], assigned_to_user_name: str
-) -> tuple[dict | None, str | None, str]:
-    """Select the next task for the given user."""
+    board_state: dict[str, list[BoardIssue]],
+    assigned_to_user_name: str,
+    *,
+    favor_unblocking: bool = False,
+    taken: Collection[str] = (),
+    reserved: Mapping[str, int] | None = None,
+    projects: Sequence[str] | None = None,
+) -> tuple[BoardIssue | None, str | None, str]:
+    """Select the next task for the given user.
+
+    ``taken`` and ``reserved`` let a caller allocating several tasks from
+    one board exclude tasks already handed out and count the downstream
+    WIP slots they will occupy. ``projects`` applies WIP limits per project
+    on a board merged from several projects.
+    """
     for column in _COLUMN_PRIORITY:
         if column in _SKIP_COLUMNS:
             continue
+        task = _first_eligible(
+            _open_tasks(board_state, column, reserved, projects),
+            assigned_to_user_name,
+            favor_unblocking=favor_unblocking,
+            taken=taken,
+        )
+        if task is not None:
+            return _selected(task, column, assigned_to_user_name)
+
+    return _selected(None, None, assigned_to_user_name)
+
+
+def _column_jql(project: str, column: str) -> str:
+    """JQL selecting the issues of one board column, in rank order."""
+    statuses = ", ".join(f'"{s}"' for s, c in _STATUS_MAP.items() if c == column)
+    return f"project = {project} AND status IN ({statuses}) ORDER BY rank ASC"
 
-        # Check downstream WIP limits
-        downstreams = _DOWNSTREAM.get(column, [])
-        blocked = False
-        for ds in downstreams:
-            if ds in _WIP_LIMITS:
-                ds_tasks = board_state.get(ds, [])
-                if _wip_count(ds_tasks) >= _WIP_LIMITS[ds]:
-                    blocked = True
-                    break
-        if blocked:
-            continue
 
-        tasks = board_state.get(column, [])
-        for task in tasks:
-            assignee = (task["assignee"] or "").strip()
-            if assignee != assigned_to_user_name.strip():
-                continue
-            if task["blocked_by"]:
-                continue
-            reason = (
-                f"Selected {task['key']} from {column} column "
-                f"(assigned to {assigned_to_user_name}, no active blockers)"
+def _count_board_issues(project: str, client: JiraClient) -> int:
+    """Approximate size of the full board, without downloading it."""
+    result = client.post(
+        "/rest/api/3/search/approximate-count",
+        json={"jql": _board_jql(project)},
+        idempotent=True,
+    )
+    return (result or {}).get("count", 0)
+
+
+async def _count_board_issues_async(project: str, client: AsyncJiraClient) -> int:
+    """Async variant of _count_board_issues."""
+    result = await client.post(
+        "/rest/api/3/search/approximate-count",
+        json={"jql": _board_jql(project)},
+        idempotent=True,
+    )
+    return (result or {}).get("count", 0)
+
+
+def _lazy_stats(
+    board_state: dict[str, list[BoardIssue]], board_issues: int | None = None
+) -> dict:
+    """Issues downloaded by a lazy selection, and the full board size if known."""
+    stats = {
+        "columns_fetched": list(board_state),
+        "issues_downloaded": sum(len(tasks) for tasks in board_state.values()),
+    }
+    if board_issues is not None:
+        stats["board_issues"] = board_issues
+    return stats
+
+
+def _select_task_lazy(
+    project: str,
+    assigned_to_user_name: str,
+    client: JiraClient,
+    *,
+    favor_unblocking: bool = False,
+) -> tuple[dict[str, list[BoardIssue]], tuple[BoardIssue | None, str | None, str]]:
+    """Select like _select_task, fetching one column at a time.
+
+    Columns are fetched in priority order, each only when the selection
+    first needs it (for a WIP check or to pick from), and fetching stops
+    at the first eligible task. ``unblocks`` only counts issues within the
+    same column. Returns the columns fetched and the selection.
+    """
+    board_state: dict[str, list[BoardIssue]] = {}
+
+    def load(column: str) -> list[BoardIssue]:
+        if column not in board_state:
+            issues = list(
+                iter_search(
+                    _column_jql(project, column), fields=_SEARCH_FIELDS, client=client
+                )
             )
-            return task, column, reason
+            graph = _blocker_graph(issues)
+            board_state[column] = [_normalize_issue(i, column, graph) for i in issues]
+        return board_state[column]
+
+    for column in _COLUMN_PRIORITY:
+        if column in _SKIP_COLUMNS:
+            continue
+        for ds in _wip_columns(column):
+            load(ds)
+        if _wip_blocked(board_state, column):
+            continue
+        task = _first_eligible(
+            load(column), assigned_to_user_name, favor_unblocking=favor_unblocking
+        )
+        if task is not None:
+            return board_state, _selected(task, column, assigned_to_user_name)
+
+    return board_state, _selected(None, None, assigned_to_user_name)
+
+
+async def _select_task_lazy_async(
+    project: str,
+    assigned_to_user_name: str,
+    client: AsyncJiraClient,
+    *,
+    favor_unblocking: bool = False,
+) -> tuple[dict[str, list[BoardIssue]], tuple[BoardIssue | None, str | None, str]]:
+    """Async variant of _select_task_lazy."""
+    board_state: dict[str, list[BoardIssue]] = {}
+
+    async def load(column: str) -> list[BoardIssue]:
+        if column not in board_state:
+            issues = [
+                issue
+                async for issue in iter_search_async(
+                    _column_jql(project, column), fields=_SEARCH_FIELDS, client=client
+                )
+            ]
+            graph = _blocker_graph(issues)
+            board_state[column] = [_normalize_issue(i, column, graph) for i in issues]
+        return board_state[column]
+
+    for column in _COLUMN_PRIORITY:
+        if column in _SKIP_COLUMNS:
+            continue
+        for ds in _wip_columns(column):
+            await load(ds)
+        if _wip_blocked(board_state, column):
+            continue
+        task = _first_eligible(
+            await load(column),
+            assigned_to_user_name,
+            favor_unblocking=favor_unblocking,
+        )
+        if task is not None:
+            return board_state, _selected(task, column, assigned_to_user_name)
+
+    return board_state, _selected(None, None, assigned_to_user_name)
+
 
-    return None, None, f"No eligible tasks found for {assigned_to_user_name}"
+def fetch_board_issues(
+    project: str | Sequence[str],
+    *,
+    client: JiraClient,
+    snapshot: Snapshots | None = None,
+) -> list[dict]:
+    """Raw active issues of one or more project boards in rank order.
+
+    These are the search results fetch-task selects from, for callers that
+    keep their own copy of the board and pass it back through ``issues``.
+    Several projects are fetched concurrently and concatenated in order.
+    """
+    return _fetch_projects(split_projects(project), client, snapshot)
+
+
+async def fetch_board_issues_async(
+    project: str | Sequence[str],
+    *,
+    client: AsyncJiraClient,
+    snapshot: Snapshots | None = None,
+) -> list[dict]:
+    """Async variant of fetch_board_issues."""
+    return await _fetch_projects_async(split_projects(project), client, snapshot)
+
+
+def _check_sources(
+    projects: list[str],
+    lazy: bool,
+    snapshot: Snapshots | None,
+    issues: list[dict] | None,
+) -> None:
+    _check_projects(projects, snapshot)
+    if lazy and len(projects) > 1:
+        raise ValueError("lazy selection supports a single project")
+    if lazy and snapshot is not None:
+        raise ValueError("lazy selection cannot be combined with a board snapshot")
+    if issues is not None and (lazy or snapshot is not None):
+        raise ValueError(
+            "issues cannot be combined with lazy selection or a board snapshot"
+        )
+
+
+def _merged(
+    projects: list[str], board_state: dict[str, list[BoardIssue]], selection: tuple
+) -> dict:
+    """fetch-task result; a multi-project board also lists its projects."""
+    selected_task, selected_column, reason = selection
+    result = {
+        "board_state": board_state,
+        "selected_task": selected_task,
+        "selected_column": selected_column,
+        "reason": reason,
+    }
+    if len(projects) > 1:
+        result["projects"] = projects
+    return result
 
 
 def _resolve_current_user(client: JiraClient) -> str:
     """Fetch the authenticated user's display name via the myself endpoint."""
-    result = client.get("/rest/api/3/myself")
+    return _display_name(client.get("/rest/api/3/myself"))
+
+
+async def _resolve_current_user_async(client: AsyncJiraClient) -> str:
+    """Async variant of _resolve_current_user."""
+    return _display_name(await client.get("/rest/api/3/myself"))
+
+
+def _display_name(result: dict | list | None) -> str:
+    """Extract displayName from a /myself response."""
     if not result or not isinstance(result, dict):
         raise ValueError("Could not determine current user from Jira /myself endpoint")
     name = result.get("displayName", "")
@@ -168,45 +547,141 @@ def _resolve_current_user(client: JiraClient) -> str:
 
 
 def run_fetch_task(
-    project: str,
+    project: str | Sequence[str],
     assigned_to_user_name: str | None = None,
     *,
     client: JiraClient,
+    snapshot: Snapshots | None = None,
+    lazy: bool = False,
+    board_counts: bool = False,
+    favor_unblocking: bool = False,
+    issues: list[dict] | None = None,
 ) -> dict:
-    """Fetch the next task for a user from a Jira project.
+    """Fetch the next task for a user from one or more Jira projects.
 
     Args:
-        project: Jira project key.
+        project: Jira project key, or several (a sequence or a
+            comma-separated string) in priority order. Several boards are
+            fetched concurrently and merged: each column lists the projects'
+            tasks in that order, and WIP limits apply per project.
         assigned_to_user_name: Jira display name to filter by. Falls back to
             the authenticated user via /myself endpoint.
         client: JiraClient instance.
-
-    Returns a dict with board_state, selected_task, selected_column, reason.
+        snapshot: Local board snapshot to select from, or a mapping of one
+            snapshot per project. It is brought up to date with one
+            ``updated >=`` delta query (or a periodic full reconcile)
+            instead of re-downloading the board.
+        lazy: Fetch one column at a time in priority order and stop at the
+            first eligible task (single project only). ``board_state`` then
+            only holds the columns that were fetched, and ``fetch_stats``
+            lists them with the number of issues downloaded.
+        board_counts: With ``lazy``, also count the full board (one extra
+            approximate-count request) into ``fetch_stats.board_issues``.
+        favor_unblocking: Within the selected column, pick the eligible
+            task that transitively unblocks the most issues rather than the
+            highest-ranked one.
+        issues: Board issues the caller already holds, as returned by
+            ``fetch_board_issues`` (e.g. kept current from webhooks). No
+            search is sent; cannot be combined with ``snapshot`` or ``lazy``.
+
+    Returns a dict with board_state, selected_task, selected_column, reason
+    (plus fetch_stats when lazy, and projects for a multi-project board).
     """
-    if not project:
-        raise ValueError("Project is required: pass --project or set JIRA_PROJECT_ID")
+    projects = split_projects(project or "")
+    _check_sources(projects, lazy, snapshot, issues)
 
     if not assigned_to_user_name:
         assigned_to_user_name = _resolve_current_user(client)
 
-    issues = _fetch_all_issues(project, client)
+    if lazy:
+        board_state, selection = _select_task_lazy(
+            projects[0],
+            assigned_to_user_name,
+            client,
+            favor_unblocking=favor_unblocking,
+        )
+        selected_task, selected_column, reason = selection
+        return {
+            "board_state": board_state,
+            "selected_task": selected_task,
+            "selected_column": selected_column,
+            "reason": reason,
+            "fetch_stats": _lazy_stats(
+                board_state,
+                _count_board_issues(projects[0], client) if board_counts else None,
+            ),
+        }
+
+    if issues is None:
+        issues = _fetch_projects(projects, client, snapshot)
     board_state = _group_by_column(issues)
-    selected_task, selected_column, reason = _select_task(
-        board_state, assigned_to_user_name
+    selection = _select_task(
+        board_state,
+        assigned_to_user_name,
+        favor_unblocking=favor_unblocking,
+        projects=projects if len(projects) > 1 else None,
     )
+    return _merged(projects, board_state, selection)
 
-    return {
-        "board_state": board_state,
-        "selected_task": selected_task,
-        "selected_column": selected_column,
-        "reason": reason,
-    }
+
+async def run_fetch_task_async(
+    project: str | Sequence[str],
+    assigned_to_user_name: str | None = None,
+    *,
+    client: AsyncJiraClient,
+    snapshot: Snapshots | None = None,
+    lazy: bool = False,
+    board_counts: bool = False,
+    favor_unblocking: bool = False,
+    issues: list[dict] | None = None,
+) -> dict:
+    """Async variant of run_fetch_task."""
+    projects = split_projects(project or "")
+    _check_sources(projects, lazy, snapshot, issues)
+
+    if not assigned_to_user_name:
+        assigned_to_user_name = await _resolve_current_user_async(client)
+
+    if lazy:
+        board_state, selection = await _select_task_lazy_async(
+            projects[0],
+            assigned_to_user_name,
+            client,
+            favor_unblocking=favor_unblocking,
+        )
+        selected_task, selected_column, reason = selection
+        return {
+            "board_state": board_state,
+            "selected_task": selected_task,
+            "selected_column": selected_column,
+            "reason": reason,
+            "fetch_stats": _lazy_stats(
+                board_state,
+                await _count_board_issues_async(projects[0], client)
+                if board_counts
+                else None,
+            ),
+        }
+
+    if issues is None:
+        issues = await _fetch_projects_async(projects, client, snapshot)
+    board_state = _group_by_column(issues)
+    selection = _select_task(
+        board_state,
+        assigned_to_user_name,
+        favor_unblocking=favor_unblocking,
+        projects=projects if len(projects) > 1 else None,
+    )
+    return _merged(projects, board_state, selection)
 
 
 @app.callback()
 def main(
     project: str | None = typer.Option(
-        None, "--project", envvar="JIRA_PROJECT_ID", help="Jira project key"
+        None,
+        "--project",
+        envvar="JIRA_PROJECT_ID",
+        help="Jira project key, or comma-separated keys in priority order",
     ),
     assigned_to_user_name: str | None = typer.Option(
         None,
@@ -217,16 +692,44 @@ def main(
     base_url: str = typer.Option(..., envvar="JIRA_URL", help="Jira base URL"),
     username: str = typer.Option(..., envvar="JIRA_USERNAME", help="Jira username"),
     api_token: str = typer.Option(..., envvar="JIRA_API_TOKEN", help="Jira API token"),
+    lazy: bool = typer.Option(
+        False,
+        "--lazy",
+        help="Fetch columns in priority order and stop at the first eligible task",
+    ),
+    board_counts: bool = typer.Option(
+        False,
+        "--board-counts",
+        help="With --lazy, also count the full board into fetch_stats.board_issues",
+    ),
+    favor_unblocking: bool = typer.Option(
+        False,
+        "--favor-unblocking",
+        help="Prefer the eligible task that unblocks the most downstream work",
+    ),
     pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON"),
 ) -> None:
     """Fetch the next task for a user from a Jira project board."""
     from jira_utils._output import handle_error, output_json
 
     try:
-        client = JiraClient(
-            base_url=base_url.rstrip("/"), username=username, api_token=api_token
+        snapshot = (
+            None
+            if lazy
+            else snapshots_from_env(base_url.rstrip("/"), split_projects(project or ""))
         )
-        result = run_fetch_task(project, assigned_to_user_name, client=client)
+        with JiraClient(
+            base_url=base_url.rstrip("/"), username=username, api_token=api_token
+        ) as client:
+            result = run_fetch_task(
+                project,
+                assigned_to_user_name,
+                client=client,
+                snapshot=snapshot,
+                lazy=lazy,
+                board_counts=board_counts,
+                favor_unblocking=favor_unblocking,
+            )
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
@@ -0,0 +1,193 @@
+"""Plan next-task assignments for several agents from one board fetch."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import typer
+
+from jira_utils.board_issue import BoardIssue
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.fetch_task import (
+    _group_by_column,
+    _resolve_current_user,
+    _resolve_current_user_async,
+    _select_task,
+    _snapshot_issues,
+    _snapshot_issues_async,
+    _wip_columns,
+)
+from jira_utils.snapshot import BoardSnapshot, snapshot_from_env
+
+app = typer.Typer(invoke_without_command=True)
+
+
+def _allocate(
+    board_state: dict[str, list[BoardIssue]],
+    agents: list[str],
+    n: int,
+    *,
+    favor_unblocking: bool,
+) -> dict:
+    """Hand out up to ``n`` distinct tasks to ``agents`` round-robin.
+
+    Each pick runs the same selection as fetch-task, skipping tasks already
+    handed out and counting the downstream WIP slots earlier picks will
+    occupy once they move on, so the plan never overfills a column that a
+    single fetch-task call would have respected.
+    """
+    taken: set[str] = set()
+    reserved: Counter[str] = Counter()
+    assignments: list[dict] = []
+    reasons: dict[str, str] = {}
+    active = list(agents)
+
+    while active and len(assignments) < n:
+        for agent in list(active):
+            if len(assignments) >= n:
+                break
+            if agent not in active:
+                continue
+            task, column, reason = _select_task(
+                board_state,
+                agent,
+                favor_unblocking=favor_unblocking,
+                taken=taken,
+                reserved=reserved,
+            )
+            if task is None:
+                active = [a for a in active if a != agent]
+                reasons[agent] = reason
+                continue
+            taken.add(task.key)
+            if task.issue_type != "Epic":
+                reserved.update(_wip_columns(column))
+            assignments.append(
+                {"agent": agent, "task": task, "column": column, "reason": reason}
+            )
+
+    assigned = {a["agent"] for a in assignments}
+    return {
+        "board_state": board_state,
+        "assignments": assignments,
+        "unassigned": [
+            {
+                "agent": agent,
+                "reason": reasons.get(agent, f"Plan limit of {n} tasks reached"),
+            }
+            for agent in dict.fromkeys(agents)
+            if agent not in assigned
+        ],
+        "reserved_wip": dict(reserved),
+    }
+
+
+def _plan_size(agents: list[str], n: int | None) -> int:
+    if n is None:
+        return len(agents)
+    if n < 0:
+        raise ValueError("n must be zero or greater")
+    return n
+
+
+def run_fetch_tasks(
+    project: str,
+    agents: list[str] | None = None,
+    *,
+    n: int | None = None,
+    client: JiraClient,
+    snapshot: BoardSnapshot | None = None,
+    favor_unblocking: bool = False,
+) -> dict:
+    """Assign up to ``n`` distinct eligible tasks to agents from one board fetch.
+
+    Args:
+        project: Jira project key.
+        agents: Jira display names to plan for, in priority order. A name
+            may repeat when several workers share one Jira account. Falls
+            back to the authenticated user via /myself endpoint.
+        n: Maximum number of tasks to assign. Defaults to one per agent;
+            a larger value hands agents further tasks round-robin.
+        client: JiraClient instance.
+        snapshot: Local board snapshot to select from, as in fetch-task.
+        favor_unblocking: Prefer the eligible task that unblocks the most
+            downstream work within each column.
+
+    Returns a dict with board_state, assignments (agent, task, column,
+    reason), unassigned agents with the reason, and reserved_wip — the
+    downstream WIP slots the plan consumes per column.
+    """
+    if not project:
+        raise ValueError("Project is required: pass --project or set JIRA_PROJECT_ID")
+    agents = agents or [_resolve_current_user(client)]
+    size = _plan_size(agents, n)
+    board_state = _group_by_column(_snapshot_issues(project, client, snapshot))
+    return _allocate(board_state, agents, size, favor_unblocking=favor_unblocking)
+
+
+async def run_fetch_tasks_async(
+    project: str,
+    agents: list[str] | None = None,
+    *,
+    n: int | None = None,
+    client: AsyncJiraClient,
+    snapshot: BoardSnapshot | None = None,
+    favor_unblocking: bool = False,
+) -> dict:
+    """Async variant of run_fetch_tasks."""
+    if not project:
+        raise ValueError("Project is required: pass --project or set JIRA_PROJECT_ID")
+    agents = agents or [await _resolve_current_user_async(client)]
+    size = _plan_size(agents, n)
+    issues = await _snapshot_issues_async(project, client, snapshot)
+    board_state = _group_by_column(issues)
+    return _allocate(board_state, agents, size, favor_unblocking=favor_unblocking)
+
+
+@app.callback()
+def main(
+    project: str | None = typer.Option(
+        None, "--project", envvar="JIRA_PROJECT_ID", help="Jira project key"
+    ),
+    agents: str | None = typer.Option(
+        None,
+        "--agents",
+        help="Comma-separated Jira display names (defaults to authenticated user)",
+    ),
+    n: int | None = typer.Option(
+        None, "--n", help="Maximum tasks to assign (defaults to one per agent)"
+    ),
+    base_url: str = typer.Option(..., envvar="JIRA_URL", help="Jira base URL"),
+    username: str = typer.Option(..., envvar="JIRA_USERNAME", help="Jira username"),
+    api_token: str = typer.Option(..., envvar="JIRA_API_TOKEN", help="Jira API token"),
+    favor_unblocking: bool = typer.Option(
+        False,
+        "--favor-unblocking",
+        help="Prefer the eligible task that unblocks the most downstream work",
+    ),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON"),
+) -> None:
+    """Plan distinct next tasks for several agents from one board fetch."""
+    from jira_utils._output import handle_error, output_json
+
+    try:
+        names = [a.strip() for a in agents.split(",") if a.strip()] if agents else []
+        snapshot = snapshot_from_env(base_url.rstrip("/"), project)
+        with JiraClient(
+            base_url=base_url.rstrip("/"), username=username, api_token=api_token
+        ) as client:
+            result = run_fetch_tasks(
+                project,
+                names,
+                n=n,
+                client=client,
+                snapshot=snapshot,
+                favor_unblocking=favor_unblocking,
+            )
+        output_json(result, pretty=pretty)
+    except Exception as exc:
+        handle_error(exc)
+
+
+if __name__ == "__main__":
+    app()
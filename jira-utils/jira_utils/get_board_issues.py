@@ -4,11 +4,23 @@ from __future__ import annotations
 
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 app = typer.Typer(invoke_without_command=True)
 
 
+def _board_issue_params(
+    *, jql: str | None, fields: str | None, limit: int, start_at: int
+) -> dict:
+    """Build query params for the board issue endpoint."""
+    params: dict = {"maxResults": limit, "startAt": start_at}
+    if jql:
+        params["jql"] = jql
+    if fields:
+        params["fields"] = fields
+    return params
+
+
 def run_get_board_issues(
     board_id: int,
     *,
@@ -19,14 +31,24 @@ def run_get_board_issues(
     client: JiraClient,
 ) -> dict:
     """Fetch issues from a board."""
-    params: dict = {"maxResults": limit, "startAt": start_at}
-    if jql:
-        params["jql"] = jql
-    if fields:
-        params["fields"] = fields
+    params = _board_issue_params(jql=jql, fields=fields, limit=limit, start_at=start_at)
     return client.get(f"/rest/agile/1.0/board/{board_id}/issue", params=params)
 
 
+async def run_get_board_issues_async(
+    board_id: int,
+    *,
+    jql: str | None = None,
+    fields: str | None = None,
+    limit: int = 50,
+    start_at: int = 0,
+    client: AsyncJiraClient,
+) -> dict:
+    """Async variant of run_get_board_issues."""
+    params = _board_issue_params(jql=jql, fields=fields, limit=limit, start_at=start_at)
+    return await client.get(f"/rest/agile/1.0/board/{board_id}/issue", params=params)
+
+
 @app.callback()
 def main(
     board_id: int = typer.Option(..., "--board-id", help="Board ID"),
@@ -34,27 +56,33 @@ def main(
     fields: str | None = typer.Option(None, "--fields", help="Comma-separated fields"),
     limit: int = typer.Option(50, "--limit", help="Max results"),
     start_at: int = typer.Option(0, "--start-at", help="Pagination offset"),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Stream issues as newline-delimited JSON"
+    ),
     base_url: str = typer.Option(..., envvar="JIRA_URL", help="Jira base URL"),
     username: str = typer.Option(..., envvar="JIRA_USERNAME", help="Jira username"),
     api_token: str = typer.Option(..., envvar="JIRA_API_TOKEN", help="Jira API token"),
     pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON"),
 ) -> None:
     """Get issues from a Jira agile board."""
-    from jira_utils._output import handle_error, output_json
+    from jira_utils._output import handle_error, output_json, output_ndjson
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_get_board_issues(
-            board_id,
-            jql=jql,
-            fields=fields,
-            limit=limit,
-            start_at=start_at,
-            client=client,
-        )
-        output_json(result, pretty=pretty)
+        ) as client:
+            result = run_get_board_issues(
+                board_id,
+                jql=jql,
+                fields=fields,
+                limit=limit,
+                start_at=start_at,
+                client=client,
+            )
+        if ndjson:
+            output_ndjson(result.get("issues", []))
+        else:
+            output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
 
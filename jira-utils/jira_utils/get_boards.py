@@ -4,11 +4,25 @@ from __future__ import annotations
 
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 app = typer.Typer(invoke_without_command=True)
 
 
+def _board_params(
+    *, project: str | None, name: str | None, type: str | None
+) -> dict | None:
+    """Build query params for the board listing endpoint."""
+    params: dict = {}
+    if project:
+        params["projectKeyOrId"] = project
+    if name:
+        params["name"] = name
+    if type:
+        params["type"] = type
+    return params or None
+
+
 def run_get_boards(
     *,
     project: str | None = None,
@@ -17,14 +31,20 @@ def run_get_boards(
     client: JiraClient,
 ) -> dict:
     """Fetch agile boards, optionally filtered."""
-    params: dict = {}
-    if project:
-        params["projectKeyOrId"] = project
-    if name:
-        params["name"] = name
-    if type:
-        params["type"] = type
-    return client.get("/rest/agile/1.0/board", params=params or None)
+    params = _board_params(project=project, name=name, type=type)
+    return client.get("/rest/agile/1.0/board", params=params)
+
+
+async def run_get_boards_async(
+    *,
+    project: str | None = None,
+    name: str | None = None,
+    type: str | None = None,
+    client: AsyncJiraClient,
+) -> dict:
+    """Async variant of run_get_boards."""
+    params = _board_params(project=project, name=name, type=type)
+    return await client.get("/rest/agile/1.0/board", params=params)
 
 
 @app.callback()
@@ -41,10 +61,12 @@ def main(
     from jira_utils._output import handle_error, output_json
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_get_boards(project=project, name=name, type=type, client=client)
+        ) as client:
+            result = run_get_boards(
+                project=project, name=name, type=type, client=client
+            )
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
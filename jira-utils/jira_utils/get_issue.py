@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 app = typer.Typer(invoke_without_command=True)
 
@@ -22,6 +22,17 @@ def run_get_issue(
     return client.get(f"/rest/api/2/issue/{issue_key}", params=params or None)
 
 
+async def run_get_issue_async(
+    issue_key: str,
+    *,
+    fields: str | None = None,
+    client: AsyncJiraClient,
+) -> dict:
+    """Async variant of run_get_issue."""
+    params = {"fields": fields} if fields else None
+    return await client.get(f"/rest/api/2/issue/{issue_key}", params=params)
+
+
 @app.callback()
 def main(
     issue_key: str = typer.Option(
@@ -39,10 +50,10 @@ def main(
     from jira_utils._output import handle_error, output_json
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_get_issue(issue_key, fields=fields, client=client)
+        ) as client:
+            result = run_get_issue(issue_key, fields=fields, client=client)
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
@@ -0,0 +1,264 @@
+"""Get several Jira issues by key with batched JQL searches."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import typer
+
+from jira_utils.client import AsyncJiraClient, JiraApiError, JiraClient
+from jira_utils.concurrency import DEFAULT_CONCURRENCY, gather_limited
+from jira_utils.get_issue import run_get_issue, run_get_issue_async
+from jira_utils.search import iter_search, iter_search_async
+
+app = typer.Typer(invoke_without_command=True)
+
+# Keys per ``key in (...)`` clause. Matches the search page size, so each
+# chunk is normally answered by a single request.
+KEY_CHUNK_SIZE = 100
+
+# Keys are interpolated into JQL, so anything else is refused up front.
+_ISSUE_KEY = re.compile(r"[A-Z][A-Z0-9_]*-\d+")
+
+
+def _unique_keys(keys: str | Sequence[str]) -> list[str]:
+    """Strip, upper-case and de-duplicate keys, keeping first-seen order.
+
+    Raises:
+        ValueError: If a key is not of the form ``PROJ-123``.
+    """
+    values = keys.split(",") if isinstance(keys, str) else keys
+    unique = list(dict.fromkeys(k.strip().upper() for k in values if k.strip()))
+    for key in unique:
+        if not _ISSUE_KEY.fullmatch(key):
+            raise ValueError(f"invalid issue key: {key!r}")
+    return unique
+
+
+def _chunk_jql(chunk: list[str]) -> str:
+    quoted = ", ".join(f'"{key}"' for key in chunk)
+    return f"key in ({quoted})"
+
+
+def _chunks(keys: list[str], size: int) -> list[list[str]]:
+    if size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    return [keys[i : i + size] for i in range(0, len(keys), size)]
+
+
+def _retry_parts(
+    exc: JiraApiError, chunk: list[str], rejected: set[str]
+) -> list[list[str]]:
+    """Sub-chunks to search again after Jira rejected ``chunk``.
+
+    Jira answers ``key in (...)`` with a 400 naming every listed key that
+    does not exist. Those keys are dropped and added to ``rejected``; if
+    none is named, the chunk is split in half to isolate them.
+
+    Raises:
+        JiraApiError: If the error is not a 400 about this chunk's keys.
+    """
+    if exc.status_code != 400:
+        raise exc
+    named = {key for key in chunk if f"'{key}'" in exc.body}
+    if named:
+        rejected.update(named)
+        rest = [key for key in chunk if key not in named]
+        return [rest] if rest else []
+    if len(chunk) == 1:
+        raise exc
+    middle = len(chunk) // 2
+    return [chunk[:middle], chunk[middle:]]
+
+
+def _search_keys(
+    chunk: list[str],
+    rejected: set[str],
+    *,
+    fields: str | None,
+    page_size: int,
+    client: JiraClient,
+) -> list[dict]:
+    """Issues for ``chunk``, adding keys Jira rejects as unknown to ``rejected``."""
+    jql = _chunk_jql(chunk)
+    try:
+        return list(iter_search(jql, fields=fields, page_size=page_size, client=client))
+    except JiraApiError as exc:
+        parts = _retry_parts(exc, chunk, rejected)
+    return [
+        issue
+        for part in parts
+        for issue in _search_keys(
+            part, rejected, fields=fields, page_size=page_size, client=client
+        )
+    ]
+
+
+async def _search_keys_async(
+    chunk: list[str],
+    rejected: set[str],
+    *,
+    fields: str | None,
+    page_size: int,
+    client: AsyncJiraClient,
+) -> list[dict]:
+    """Async variant of _search_keys."""
+    jql = _chunk_jql(chunk)
+    try:
+        return [
+            issue
+            async for issue in iter_search_async(
+                jql, fields=fields, page_size=page_size, client=client
+            )
+        ]
+    except JiraApiError as exc:
+        parts = _retry_parts(exc, chunk, rejected)
+    found = []
+    for part in parts:
+        found += await _search_keys_async(
+            part, rejected, fields=fields, page_size=page_size, client=client
+        )
+    return found
+
+
+def _unmatched(keys: list[str], found: list[dict], rejected: set[str]) -> list[str]:
+    """Requested keys missing from ``found`` that may have been moved.
+
+    A moved issue is returned under its new key, so keys are only worth
+    looking up one by one when Jira returned issues nobody asked for.
+    Rejected keys do not exist and are never looked up.
+    """
+    returned = {issue["key"] for issue in found}
+    if returned <= set(keys):
+        return []
+    return [key for key in keys if key not in returned and key not in rejected]
+
+
+def _keyed(
+    keys: list[str], found: list[dict], moved: dict[str, dict | None] | None = None
+) -> dict[str, dict | None]:
+    """Map every requested key to its issue, or None if Jira returned none."""
+    by_key = {issue["key"]: issue for issue in found}
+    return {key: by_key.get(key) or (moved or {}).get(key) for key in keys}
+
+
+def _missing_issue(exc: JiraApiError) -> None:
+    """None for a 404 (deleted or not visible), otherwise re-raise."""
+    if exc.status_code != 404:
+        raise exc
+
+
+def run_get_issues(
+    keys: str | Sequence[str],
+    *,
+    fields: str | None = None,
+    chunk_size: int = KEY_CHUNK_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    client: JiraClient,
+) -> dict[str, dict | None]:
+    """Fetch many issues with one ``key in (...)`` search per chunk of keys.
+
+    ``keys`` is a sequence or a comma-separated string of issue keys. Chunks
+    are searched concurrently on the shared client. Keys Jira rejects
+    or does not return (deleted or not visible) map to None; the rest of
+    their chunk is still fetched. Keys of moved issues map to the issue
+    under its new key.
+
+    Returns:
+        Issues keyed by issue key, in the order the keys were given.
+
+    Raises:
+        ValueError: If a key is not of the form ``PROJ-123``.
+    """
+    keys = _unique_keys(keys)
+    chunks = _chunks(keys, chunk_size)
+    if not chunks:
+        return {}
+
+    rejected: set[str] = set()
+
+    def _fetch(chunk: list[str]) -> list[dict]:
+        return _search_keys(
+            chunk, rejected, fields=fields, page_size=chunk_size, client=client
+        )
+
+    def _lookup(key: str) -> dict | None:
+        try:
+            return run_get_issue(key, fields=fields, client=client)
+        except JiraApiError as exc:
+            return _missing_issue(exc)
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as pool:
+        found = [issue for page in pool.map(_fetch, chunks) for issue in page]
+        unmatched = _unmatched(keys, found, rejected)
+        moved = dict(zip(unmatched, pool.map(_lookup, unmatched), strict=True))
+    return _keyed(keys, found, moved)
+
+
+async def run_get_issues_async(
+    keys: str | Sequence[str],
+    *,
+    fields: str | None = None,
+    chunk_size: int = KEY_CHUNK_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    client: AsyncJiraClient,
+) -> dict[str, dict | None]:
+    """Async variant of run_get_issues."""
+    keys = _unique_keys(keys)
+    chunks = _chunks(keys, chunk_size)
+
+    rejected: set[str] = set()
+
+    async def _fetch(chunk: list[str]) -> list[dict]:
+        return await _search_keys_async(
+            chunk, rejected, fields=fields, page_size=chunk_size, client=client
+        )
+
+    async def _lookup(key: str) -> dict | None:
+        try:
+            return await run_get_issue_async(key, fields=fields, client=client)
+        except JiraApiError as exc:
+            return _missing_issue(exc)
+
+    pages = await gather_limited((_fetch(c) for c in chunks), limit=concurrency)
+    found = [issue for page in pages for issue in page]
+    unmatched = _unmatched(keys, found, rejected)
+    lookups = await gather_limited((_lookup(k) for k in unmatched), limit=concurrency)
+    return _keyed(keys, found, dict(zip(unmatched, lookups, strict=True)))
+
+
+@app.callback()
+def main(
+    keys: str = typer.Option(
+        ..., "--keys", help="Comma-separated issue keys (e.g. GFD-1,GFD-2)"
+    ),
+    fields: str | None = typer.Option(
+        None, "--fields", help="Comma-separated fields to return"
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_CONCURRENCY, "--concurrency", help="Maximum searches in flight"
+    ),
+    base_url: str = typer.Option(..., envvar="JIRA_URL", help="Jira base URL"),
+    username: str = typer.Option(..., envvar="JIRA_USERNAME", help="Jira username"),
+    api_token: str = typer.Option(..., envvar="JIRA_API_TOKEN", help="Jira API token"),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON"),
+) -> None:
+    """Get several Jira issues by key in a few batched searches."""
+    from jira_utils._output import handle_error, output_json
+
+    try:
+        with JiraClient(
+            base_url=base_url.rstrip("/"), username=username, api_token=api_token
+        ) as client:
+            result = run_get_issues(
+                keys, fields=fields, concurrency=concurrency, client=client
+            )
+        output_json(result, pretty=pretty)
+    except Exception as exc:
+        handle_error(exc)
+
+
+if __name__ == "__main__":
+    app()
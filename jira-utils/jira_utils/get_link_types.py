@@ -4,18 +4,13 @@ from __future__ import annotations
 
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 app = typer.Typer(invoke_without_command=True)
 
 
-def run_get_link_types(
-    *,
-    filter: str | None = None,
-    client: JiraClient,
-) -> dict:
-    """Fetch issue link types, optionally filtered by name substring."""
-    result = client.get("/rest/api/2/issueLinkType")
+def _filter_link_types(result: dict, filter: str | None) -> dict:
+    """Keep only link types whose name contains the filter substring."""
     if filter:
         lower = filter.lower()
         result["issueLinkTypes"] = [
@@ -26,6 +21,24 @@ def run_get_link_types(
     return result
 
 
+def run_get_link_types(
+    *,
+    filter: str | None = None,
+    client: JiraClient,
+) -> dict:
+    """Fetch issue link types, optionally filtered by name substring."""
+    return _filter_link_types(client.get("/rest/api/2/issueLinkType"), filter)
+
+
+async def run_get_link_types_async(
+    *,
+    filter: str | None = None,
+    client: AsyncJiraClient,
+) -> dict:
+    """Async variant of run_get_link_types."""
+    return _filter_link_types(await client.get("/rest/api/2/issueLinkType"), filter)
+
+
 @app.callback()
 def main(
     filter: str | None = typer.Option(
@@ -40,10 +53,10 @@ def main(
     from jira_utils._output import handle_error, output_json
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_get_link_types(filter=filter, client=client)
+        ) as client:
+            result = run_get_link_types(filter=filter, client=client)
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
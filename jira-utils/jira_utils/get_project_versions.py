@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 app = typer.Typer(invoke_without_command=True)
 
@@ -18,6 +18,15 @@ def run_get_project_versions(
     return client.get(f"/rest/api/2/project/{project_key}/versions")
 
 
+async def run_get_project_versions_async(
+    project_key: str,
+    *,
+    client: AsyncJiraClient,
+) -> list:
+    """Async variant of run_get_project_versions."""
+    return await client.get(f"/rest/api/2/project/{project_key}/versions")
+
+
 @app.callback()
 def main(
     project_key: str = typer.Option(
@@ -32,10 +41,10 @@ def main(
     from jira_utils._output import handle_error, output_json
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_get_project_versions(project_key, client=client)
+        ) as client:
+            result = run_get_project_versions(project_key, client=client)
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 app = typer.Typer(invoke_without_command=True)
 
@@ -22,6 +22,17 @@ def run_get_sprints(
     return client.get(f"/rest/agile/1.0/board/{board_id}/sprint", params=params or None)
 
 
+async def run_get_sprints_async(
+    board_id: int,
+    *,
+    state: str | None = None,
+    client: AsyncJiraClient,
+) -> dict:
+    """Async variant of run_get_sprints."""
+    params = {"state": state} if state else None
+    return await client.get(f"/rest/agile/1.0/board/{board_id}/sprint", params=params)
+
+
 @app.callback()
 def main(
     board_id: int = typer.Option(..., "--board-id", help="Board ID"),
@@ -37,10 +48,10 @@ def main(
     from jira_utils._output import handle_error, output_json
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_get_sprints(board_id, state=state, client=client)
+        ) as client:
+            result = run_get_sprints(board_id, state=state, client=client)
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
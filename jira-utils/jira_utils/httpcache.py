@@ -0,0 +1,159 @@
+"""On-disk conditional-GET cache for read-mostly Jira endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+import httpx
+
+from jira_utils._paths import CACHE_MODE_ENV, cache_dir
+
+# Cache modes: "use" serves fresh entries and revalidates stale ones,
+# "refresh" ignores stored entries but records new responses, "off" bypasses
+# the cache entirely.
+CACHE_MODES = ("use", "refresh", "off")
+
+# Per-endpoint freshness (seconds). Only paths matching a rule are cached.
+# A TTL of 0 means "always revalidate": the entry is kept only for its
+# ETag/Last-Modified so Jira can answer 304 Not Modified.
+_TTL_RULES: list[tuple[re.Pattern[str], float]] = [
+    (re.compile(r"^/rest/agile/1\.0/board$"), 3600),
+    (re.compile(r"^/rest/agile/1\.0/board/\d+/sprint$"), 300),
+    (re.compile(r"^/rest/api/2/issueLinkType$"), 86400),
+    (re.compile(r"^/rest/api/2/project/[^/]+/(components|versions)$"), 3600),
+    (re.compile(r"^/rest/api/2/issue/[^/]+$"), 0),
+]
+
+
+def ttl_for(path: str) -> float | None:
+    """Return the TTL for a path, or None if the endpoint is not cacheable."""
+    for pattern, ttl in _TTL_RULES:
+        if pattern.match(path):
+            return ttl
+    return None
+
+
+def cache_mode_from_env() -> str:
+    """Read the cache mode from ``JIRA_HTTP_CACHE`` (defaults to "use")."""
+    mode = os.environ.get(CACHE_MODE_ENV, "use").strip().lower() or "use"
+    if mode not in CACHE_MODES:
+        raise ValueError(f"{CACHE_MODE_ENV} must be one of {', '.join(CACHE_MODES)}")
+    return mode
+
+
+@dataclass
+class CacheEntry:
+    """A stored GET response plus its validators."""
+
+    key: str
+    path: str
+    body: dict | list | None
+    stored_at: float
+    ttl: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def is_fresh(self, now: float) -> bool:
+        """Whether the entry can be served without contacting Jira."""
+        return now - self.stored_at < self.ttl
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """File-per-entry cache of JSON GET responses, scoped to site and user."""
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        *,
+        mode: str = "use",
+        root: Path | None = None,
+    ) -> None:
+        self.mode = mode
+        host = urlsplit(base_url).netloc or base_url
+        safe_host = "".join(c if c.isalnum() or c in ".-" else "_" for c in host)
+        self._dir = (root or cache_dir() / "http") / safe_host
+        self._scope = username
+        self._clock = time.time
+
+    def _key(self, path: str, params: dict | None) -> str:
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        raw = f"{self._scope}\n{path}?{query}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def lookup(self, path: str, params: dict | None) -> CacheEntry | None:
+        """Return the stored entry for a GET, or None on miss / refresh mode."""
+        if self.mode != "use" or ttl_for(path) is None:
+            return None
+        file = self._dir / f"{self._key(path, params)}.json"
+        try:
+            data = json.loads(file.read_text())
+            return CacheEntry(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def fresh(self, entry: CacheEntry | None) -> bool:
+        """Whether ``entry`` can be returned without a network round trip."""
+        return entry is not None and entry.is_fresh(self._clock())
+
+    def store(
+        self,
+        path: str,
+        params: dict | None,
+        response: httpx.Response,
+        body: dict | list | None,
+    ) -> None:
+        """Record a successful GET if its endpoint is cacheable."""
+        ttl = ttl_for(path)
+        if ttl is None:
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if ttl <= 0 and not (etag or last_modified):
+            return
+        self._write(
+            CacheEntry(
+                key=self._key(path, params),
+                path=path,
+                body=body,
+                stored_at=self._clock(),
+                ttl=ttl,
+                etag=etag,
+                last_modified=last_modified,
+            )
+        )
+
+    def revalidated(self, entry: CacheEntry, response: httpx.Response) -> None:
+        """Restart an entry's TTL after Jira answered 304 Not Modified."""
+        entry.stored_at = self._clock()
+        entry.etag = response.headers.get("ETag") or entry.etag
+        self._write(entry)
+
+    def _write(self, entry: CacheEntry) -> None:
+        """Atomically persist an entry so concurrent readers never see a torn file."""
+        self._dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(asdict(entry), f)
+            os.replace(tmp, self._dir / f"{entry.key}.json")
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,107 @@
+"""JSON output written as bytes to stdout, shared by the CLI packages.
+
+JSON is serialized straight to bytes and written to the stdout buffer. The
+serializer is orjson when it is installed (the ``orjson`` extra) and the
+standard library otherwise; ``JIRA_UTILS_JSON=json`` forces the standard
+library. Both produce the same bytes: compact separators, UTF-8 text left
+unescaped, two-space indents when pretty.
+
+Only the standard library is imported here, so packages that do not talk to
+Jira can use it without loading httpx.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import BinaryIO
+
+SERIALIZER_ENV = "JIRA_UTILS_JSON"
+
+
+def _json_default(value: object) -> object:
+    """Serialize read-only mappings such as ``BoardIssue`` as JSON objects."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(data: object, pretty: bool) -> bytes:
+    if pretty:
+        text = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+    else:
+        text = json.dumps(
+            data, separators=(",", ":"), ensure_ascii=False, default=_json_default
+        )
+    return text.encode()
+
+
+def _serializer() -> Callable[[object, bool], bytes]:
+    """The ``dumps`` of orjson when installed and not overridden, else stdlib."""
+    if os.environ.get(SERIALIZER_ENV) == "json":
+        return _stdlib_dumps
+    try:
+        import orjson
+    except ImportError:
+        return _stdlib_dumps
+    # orjson serializes dataclasses field by field on its own; pass them to
+    # ``_json_default`` so ``BoardIssue`` keeps its JSON view.
+    compact = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+    indented = compact | orjson.OPT_INDENT_2
+
+    def dumps(data: object, pretty: bool) -> bytes:
+        return orjson.dumps(
+            data, default=_json_default, option=indented if pretty else compact
+        )
+
+    return dumps
+
+
+_dumps = _serializer()
+
+
+def dumps(data: object, *, pretty: bool = False) -> bytes:
+    """Serialize ``data`` to UTF-8 JSON bytes with the selected serializer."""
+    return _dumps(data, pretty)
+
+
+def _stdout_buffer() -> BinaryIO | None:
+    """Byte stream under ``sys.stdout``, flushed, or None if it has none.
+
+    None is also returned for non-UTF-8 streams, which need re-encoding.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    encoding = (getattr(sys.stdout, "encoding", None) or "").lower()
+    if buffer is None or encoding.replace("-", "") != "utf8":
+        return None
+    sys.stdout.flush()
+    return buffer
+
+
+def _write(chunks: Iterable[bytes]) -> None:
+    buffer = _stdout_buffer()
+    if buffer is None:
+        for chunk in chunks:
+            sys.stdout.write(chunk.decode())
+        sys.stdout.flush()
+        return
+    for chunk in chunks:
+        buffer.write(chunk)
+    buffer.flush()
+
+
+def output_json(data: object, *, pretty: bool = False) -> None:
+    """Write ``data`` as JSON, indented if ``pretty``, and a newline to stdout."""
+    _write([dumps(data, pretty=pretty), b"\n"])
+
+
+def output_ndjson(items: Iterable[object]) -> None:
+    """Write one compact JSON document per line as items are produced."""
+
+    def lines() -> Iterable[bytes]:
+        for item in items:
+            yield dumps(item) + b"\n"
+
+    _write(lines())
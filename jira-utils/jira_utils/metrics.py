@@ -0,0 +1,253 @@
+"""Per-request timing and payload instrumentation for the Jira clients.
+
+A client calls its ``instrument`` hook with one ``RequestMetric`` per HTTP
+exchange (each retry attempt counts) and per response served from the
+on-disk cache. ``MetricsRecorder`` aggregates metrics into in-process
+histograms; ``JsonlSink`` appends them to a file for offline analysis.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from jira_utils._paths import METRICS_FILE_ENV
+
+# Histogram bucket upper bounds.
+DURATION_BOUNDS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+BYTES_BOUNDS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+_TEMPLATES = [
+    (re.compile(r"/[A-Z][A-Z0-9_]+-\d+(?=/|$)"), "/{issue}"),
+    (re.compile(r"(/project/)[^/]+"), r"\1{project}"),
+    (re.compile(r"(?<!/api)/\d+(?=/|$)"), "/{id}"),
+]
+
+
+def template_path(path: str) -> str:
+    """Collapse issue keys, project keys and numeric IDs in a REST path.
+
+    ``/rest/api/2/issue/GFD-12/transitions`` becomes
+    ``/rest/api/2/issue/{issue}/transitions`` so metrics group by endpoint.
+    """
+    for pattern, replacement in _TEMPLATES:
+        path = pattern.sub(replacement, path)
+    return path
+
+
+@dataclass(frozen=True)
+class RequestMetric:
+    """One observed Jira request.
+
+    ``status`` is None when the attempt failed at the transport level;
+    ``cached`` marks responses served from the local cache without a round
+    trip; ``page_size`` is the ``maxResults`` a paginated request asked for.
+    """
+
+    method: str
+    path: str
+    status: int | None
+    duration: float
+    bytes: int
+    attempt: int = 1
+    cached: bool = False
+    page_size: int | None = None
+    timestamp: float = field(default_factory=time.time)
+
+
+Instrument = Callable[[RequestMetric], None]
+
+
+class Histogram:
+    """Fixed-bucket histogram with count/sum/min/max."""
+
+    def __init__(self, bounds: Iterable[float]) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one sample."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile: upper bound of the bucket holding rank ``q``."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                return min(upper, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        """Serializable view including bucket counts."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "buckets": dict(zip([*self.bounds, "inf"], self.counts, strict=True)),
+        }
+
+
+@dataclass
+class EndpointStats:
+    """Aggregated metrics for one (method, templated path)."""
+
+    duration_ms: Histogram = field(
+        default_factory=lambda: Histogram(DURATION_BOUNDS_MS)
+    )
+    response_bytes: Histogram = field(default_factory=lambda: Histogram(BYTES_BOUNDS))
+    statuses: Counter = field(default_factory=Counter)
+    page_sizes: Counter = field(default_factory=Counter)
+    retries: int = 0
+    cached: int = 0
+
+
+class MetricsRecorder:
+    """Instrument hook that aggregates metrics into per-endpoint histograms."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.endpoints: dict[tuple[str, str], EndpointStats] = {}
+
+    def __call__(self, metric: RequestMetric) -> None:
+        """Record one metric."""
+        key = (metric.method, metric.path)
+        with self._lock:
+            stats = self.endpoints.setdefault(key, EndpointStats())
+            if metric.cached:
+                stats.cached += 1
+                return
+            stats.duration_ms.observe(metric.duration * 1000)
+            stats.response_bytes.observe(metric.bytes)
+            stats.statuses[metric.status or "error"] += 1
+            if metric.page_size is not None:
+                stats.page_sizes[metric.page_size] += 1
+            if metric.attempt > 1:
+                stats.retries += 1
+
+    def summary(self) -> list[dict]:
+        """Per-endpoint summary rows, slowest total time first."""
+        rows = []
+        with self._lock:
+            for (method, path), stats in self.endpoints.items():
+                hist = stats.duration_ms
+                rows.append(
+                    {
+                        "method": method,
+                        "path": path,
+                        "requests": hist.count,
+                        "cached": stats.cached,
+                        "retries": stats.retries,
+                        "total_ms": round(hist.total, 1),
+                        "p50_ms": hist.quantile(0.5),
+                        "p95_ms": hist.quantile(0.95),
+                        "max_ms": round(hist.max, 1),
+                        "bytes": int(stats.response_bytes.total),
+                        "statuses": {str(k): v for k, v in stats.statuses.items()},
+                        "page_sizes": {
+                            str(k): v for k, v in sorted(stats.page_sizes.items())
+                        },
+                    }
+                )
+        return sorted(rows, key=lambda r: r["total_ms"], reverse=True)
+
+    def format_summary(self) -> str:
+        """Human-readable table of ``summary()`` for stderr."""
+        rows = self.summary()
+        if not rows:
+            return "jira-utils: no Jira requests"
+        lines = [
+            f"{'endpoint':<52} {'reqs':>5} {'cache':>5} {'retry':>5} "
+            f"{'total ms':>9} {'p50':>6} {'p95':>6} {'bytes':>9}  statuses"
+        ]
+        for r in rows:
+            endpoint = f"{r['method']} {r['path']}"
+            statuses = " ".join(f"{k}:{v}" for k, v in sorted(r["statuses"].items()))
+            lines.append(
+                f"{endpoint:<52} {r['requests']:>5} {r['cached']:>5} "
+                f"{r['retries']:>5} {r['total_ms']:>9.1f} {r['p50_ms']:>6g} "
+                f"{r['p95_ms']:>6g} {r['bytes']:>9}  {statuses}"
+            )
+        total = sum(r["total_ms"] for r in rows)
+        count = sum(r["requests"] for r in rows)
+        lines.append(f"{'total':<52} {count:>5} {'':>5} {'':>5} {total:>9.1f}")
+        for r in rows:
+            if r["page_sizes"]:
+                sizes = " ".join(f"{k}x{v}" for k, v in r["page_sizes"].items())
+                lines.append(f"page sizes {r['method']} {r['path']}: {sizes}")
+        return "\n".join(lines)
+
+
+class JsonlSink:
+    """Instrument hook that appends each metric as one JSON line."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def __call__(self, metric: RequestMetric) -> None:
+        """Append one metric; O_APPEND keeps lines whole across processes."""
+        line = json.dumps({**asdict(metric), "pid": os.getpid()}) + "\n"
+        with self._lock, open(self.path, "a") as f:
+            f.write(line)
+
+
+# Per context, so concurrent invocations in one process (``jira-utils serve``
+# runs each on its own thread) only see the hooks they installed.
+_installed: ContextVar[tuple[Instrument, ...]] = ContextVar(
+    "jira_utils_instruments", default=()
+)
+
+
+def install(hook: Instrument) -> None:
+    """Attach ``hook`` to every client created afterwards in this context."""
+    _installed.set((*_installed.get(), hook))
+
+
+def uninstall(hook: Instrument) -> None:
+    """Detach a hook previously passed to ``install``."""
+    _installed.set(tuple(h for h in _installed.get() if h is not hook))
+
+
+def default_instrument() -> Instrument | None:
+    """Hook for a client created without one.
+
+    Combines installed hooks with a ``JsonlSink`` when ``JIRA_METRICS_FILE``
+    is set, so subprocess invocations can be traced via the environment.
+    """
+    hooks = list(_installed.get())
+    path = os.environ.get(METRICS_FILE_ENV)
+    if path:
+        hooks.append(JsonlSink(Path(path)))
+    if not hooks:
+        return None
+    if len(hooks) == 1:
+        return hooks[0]
+
+    def fan_out(metric: RequestMetric) -> None:
+        for hook in hooks:
+            hook(metric)
+
+    return fan_out
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 app = typer.Typer(invoke_without_command=True)
 
@@ -22,6 +22,19 @@ def run_move_to_backlog(
     )
 
 
+async def run_move_to_backlog_async(
+    issues: str,
+    *,
+    client: AsyncJiraClient,
+) -> dict | None:
+    """Async variant of run_move_to_backlog."""
+    issue_keys = [k.strip() for k in issues.split(",")]
+    return await client.post(
+        "/rest/agile/1.0/backlog/issue",
+        json={"issues": issue_keys},
+    )
+
+
 @app.callback()
 def main(
     issues: str = typer.Option(..., "--issues", help="Comma-separated issue keys"),
@@ -34,10 +47,10 @@ def main(
     from jira_utils._output import handle_error, output_json
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_move_to_backlog(issues, client=client)
+        ) as client:
+            result = run_move_to_backlog(issues, client=client)
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
@@ -0,0 +1,74 @@
+"""Adaptive page sizing for paginated Jira searches."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+# Jira Cloud never returns more than 5000 issues per /search/jql page, and
+# fewer when wide field sets are requested.
+MAX_PAGE_SIZE = 5000
+MIN_PAGE_SIZE = 50
+
+
+@dataclass
+class AdaptivePageSize:
+    """Page size that follows observed search response times and sizes.
+
+    Starts at ``minimum`` and doubles after every page that came back in
+    under ``fast`` seconds and under half of ``max_bytes``, up to
+    ``maximum``. A page slower than ``slow`` seconds or larger than
+    ``max_bytes`` halves it; so does a timeout, before the page is retried.
+    A page shorter than requested while more results remain means the
+    server capped it, and that count becomes the new ceiling.
+
+    Attributes:
+        size: Page size to request next.
+        history: Every page size requested, in order (including retries).
+    """
+
+    minimum: int = MIN_PAGE_SIZE
+    maximum: int = MAX_PAGE_SIZE
+    fast: float = 1.0
+    slow: float = 5.0
+    max_bytes: int = 4 * 1024 * 1024
+    size: int = field(init=False)
+    history: list[int] = field(init=False, default_factory=list)
+
+    def __post_init__(self) -> None:
+        """Start from the smallest page."""
+        self.size = self.minimum
+
+    def next(self) -> int:
+        """Page size for the next request, recorded in ``history``."""
+        self.history.append(self.size)
+        return self.size
+
+    def observe(
+        self, requested: int, returned: int, duration: float, nbytes: int, more: bool
+    ) -> None:
+        """Adjust the size after a page arrived.
+
+        Args:
+            requested: ``maxResults`` sent for the page.
+            returned: Issues the page contained.
+            duration: Seconds the request took.
+            nbytes: Length of the response body in bytes.
+            more: Whether another page follows.
+        """
+        if more and 0 < returned < requested:
+            self.maximum = max(self.minimum, returned)
+        if duration > self.slow or nbytes > self.max_bytes:
+            self._shrink()
+        elif duration < self.fast and nbytes * 2 < self.max_bytes:
+            self.size *= 2
+        self.size = min(self.size, self.maximum)
+
+    def timed_out(self) -> bool:
+        """Halve the size after a timeout; False if it is already minimal."""
+        if self.size <= self.minimum:
+            return False
+        self._shrink()
+        return True
+
+    def _shrink(self) -> None:
+        self.size = max(self.minimum, self.size // 2)
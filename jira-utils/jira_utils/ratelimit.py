@@ -0,0 +1,156 @@
+"""Retry policy and host-wide token bucket for Jira requests."""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import httpx
+
+from jira_utils._paths import cache_dir
+
+RATE_ENV = "JIRA_RATE_LIMIT"
+BURST_ENV = "JIRA_RATE_BURST"
+
+# Requests per second shared by every jira-utils process on the host.
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 20
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before re-sending a failed request.
+
+    Delays follow decorrelated-jitter backoff: each delay is drawn uniformly
+    from ``[base_delay, previous * 3]`` and capped at ``max_delay``. A
+    ``Retry-After`` header always wins; if it asks for more than
+    ``max_delay`` the request is not retried.
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    idempotent_methods: frozenset[str] = frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    )
+
+    def allows(self, method: str, idempotent: bool | None = None) -> bool:
+        """Whether a request may be retried at all.
+
+        Args:
+            method: HTTP method.
+            idempotent: Explicit override for calls whose safety differs from
+                their method (e.g. a read-only POST search).
+        """
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.idempotent_methods
+
+    def next_delay(
+        self, previous: float | None, response: httpx.Response | None = None
+    ) -> float | None:
+        """Seconds to wait before the next attempt, or None to give up.
+
+        Args:
+            previous: The delay used before the last attempt (None on first
+                retry).
+            response: The failed response, or None for a transport error.
+        """
+        if response is not None:
+            if response.status_code not in self.retry_statuses:
+                return None
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_delay else None
+        upper = max(self.base_delay, (previous or self.base_delay) * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))  # noqa: S311
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket whose state lives in a lock-protected file.
+
+    Every process that points at the same ``path`` draws from the same
+    bucket, so concurrent jira-utils invocations on one host share a single
+    request budget. ``reserve()`` never sleeps itself; it returns how long
+    the caller must wait, which lets sync and async clients share it.
+    """
+
+    path: Path
+    rate: float = DEFAULT_RATE
+    capacity: int = DEFAULT_BURST
+    _clock: Callable[[], float] = field(default=time.time, repr=False, compare=False)
+
+    @classmethod
+    def for_site(cls, base_url: str) -> TokenBucket | None:
+        """Build the shared bucket for a Jira site from environment settings.
+
+        Returns None when ``JIRA_RATE_LIMIT`` is set to 0 (limiting disabled).
+        """
+        rate = float(os.environ.get(RATE_ENV, DEFAULT_RATE))
+        if rate <= 0:
+            return None
+        capacity = int(os.environ.get(BURST_ENV, DEFAULT_BURST))
+        host = urlsplit(base_url).netloc or base_url
+        safe_host = "".join(c if c.isalnum() or c in ".-" else "_" for c in host)
+        return cls(cache_dir() / f"ratelimit-{safe_host}.json", rate, capacity)
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens from the bucket; return seconds to wait before sending."""
+        return self._update(lambda level: level - tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Empty the bucket so every sharer waits at least ``seconds``.
+
+        Used when Jira answers 429 — the whole host backs off, not just the
+        process that was throttled.
+        """
+        self._update(lambda level: min(level, -seconds * self.rate))
+
+    def _update(self, change: Callable[[float], float]) -> float:
+        """Refill, apply ``change`` to the level, persist, return wait time."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read()
+                now = self._clock()
+                try:
+                    state = json.loads(raw)
+                    level, updated = float(state["tokens"]), float(state["updated"])
+                except (ValueError, KeyError, TypeError):
+                    level, updated = float(self.capacity), now
+                level = min(self.capacity, level + max(0.0, now - updated) * self.rate)
+                level = change(level)
+                f.seek(0)
+                f.truncate()
+                json.dump({"tokens": level, "updated": now}, f)
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return 0.0 if level >= 0 else -level / self.rate
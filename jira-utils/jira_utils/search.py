@@ -2,13 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.metrics import RequestMetric
+from jira_utils.paging import AdaptivePageSize
 
 app = typer.Typer(invoke_without_command=True)
 
 
+def _search_body(
+    jql: str, *, fields: str | None, limit: int, next_page_token: str | None
+) -> dict:
+    """Build the request body for the v3 JQL search endpoint."""
+    body: dict = {"jql": jql, "maxResults": limit}
+    if fields:
+        body["fields"] = [f.strip() for f in fields.split(",")]
+    if next_page_token:
+        body["nextPageToken"] = next_page_token
+    return body
+
+
 def run_search(
     jql: str,
     *,
@@ -18,13 +38,202 @@ def run_search(
     client: JiraClient,
 ) -> dict:
     """Search issues by JQL. Returns the raw search result dict."""
-    body: dict = {"jql": jql, "maxResults": limit}
-    if fields:
-        body["fields"] = [f.strip() for f in fields.split(",")]
-    if next_page_token:
-        body["nextPageToken"] = next_page_token
+    body = _search_body(
+        jql, fields=fields, limit=limit, next_page_token=next_page_token
+    )
     # v3 search endpoint — v2 /rest/api/2/search was removed (410) on Jira Cloud.
-    return client.post("/rest/api/3/search/jql", json=body)
+    return client.post("/rest/api/3/search/jql", json=body, idempotent=True)
+
+
+async def run_search_async(
+    jql: str,
+    *,
+    fields: str | None = None,
+    limit: int = 50,
+    next_page_token: str | None = None,
+    client: AsyncJiraClient,
+) -> dict:
+    """Async variant of run_search."""
+    body = _search_body(
+        jql, fields=fields, limit=limit, next_page_token=next_page_token
+    )
+    return await client.post("/rest/api/3/search/jql", json=body, idempotent=True)
+
+
+def iter_search(
+    jql: str,
+    *,
+    fields: str | None = None,
+    page_size: int = 100,
+    client: JiraClient,
+) -> Iterator[dict]:
+    """Yield every issue matching ``jql``, following ``nextPageToken``.
+
+    The next page is requested on a background thread as soon as the
+    current one arrives, so the network round trip overlaps with the
+    caller consuming the current page. Only two pages are held at a time.
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(
+            run_search, jql, fields=fields, limit=page_size, client=client
+        )
+        try:
+            while pending is not None:
+                page = pending.result()
+                token = page.get("nextPageToken")
+                pending = None
+                if token and not page.get("isLast"):
+                    pending = pool.submit(
+                        run_search,
+                        jql,
+                        fields=fields,
+                        limit=page_size,
+                        next_page_token=token,
+                        client=client,
+                    )
+                yield from page.get("issues", [])
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
+async def iter_search_async(
+    jql: str,
+    *,
+    fields: str | None = None,
+    page_size: int = 100,
+    client: AsyncJiraClient,
+) -> AsyncIterator[dict]:
+    """Async variant of iter_search; the next page is fetched as a task."""
+    pending = asyncio.ensure_future(
+        run_search_async(jql, fields=fields, limit=page_size, client=client)
+    )
+    try:
+        while pending is not None:
+            page = await pending
+            token = page.get("nextPageToken")
+            pending = None
+            if token and not page.get("isLast"):
+                pending = asyncio.ensure_future(
+                    run_search_async(
+                        jql,
+                        fields=fields,
+                        limit=page_size,
+                        next_page_token=token,
+                        client=client,
+                    )
+                )
+            for issue in page.get("issues", []):
+                yield issue
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _page_request(
+    paging: AdaptivePageSize,
+    jql: str,
+    *,
+    fields: str | None,
+    token: str | None,
+    metrics: list[RequestMetric],
+) -> tuple[int, dict]:
+    """Page size to request next and the ``client.post`` arguments for it.
+
+    Timeouts are left to ``search_all`` (which shrinks the page) until the
+    size is minimal; after that the client's own retries apply.
+    """
+    size = paging.next()
+    body = _search_body(jql, fields=fields, limit=size, next_page_token=token)
+    return size, {
+        "json": body,
+        "idempotent": True,
+        "observer": metrics.append,
+        "retry_timeouts": size <= paging.minimum,
+    }
+
+
+def _observe_page(
+    paging: AdaptivePageSize,
+    size: int,
+    page: dict,
+    started: float,
+    metrics: list[RequestMetric],
+) -> list[dict]:
+    """Feed one search page to ``paging`` and return its issues.
+
+    The page's size is the response body length the client reported.
+    """
+    issues = page.get("issues", [])
+    nbytes = metrics[-1].bytes if metrics else 0
+    more = bool(page.get("nextPageToken")) and not page.get("isLast")
+    paging.observe(size, len(issues), time.perf_counter() - started, nbytes, more)
+    return issues
+
+
+def search_all(
+    jql: str,
+    *,
+    fields: str | None = None,
+    paging: AdaptivePageSize | None = None,
+    client: JiraClient,
+) -> list[dict]:
+    """Fetch every issue matching ``jql`` with adaptively sized pages.
+
+    Pages grow while Jira answers quickly and shrink after slow or large
+    responses, see ``AdaptivePageSize``. A page that times out is retried
+    at half the size straight away, without the client retrying it at the
+    same size, until the minimum is reached. Pass ``paging`` to
+    inspect the sizes chosen afterwards.
+    """
+    paging = paging if paging is not None else AdaptivePageSize()
+    issues: list[dict] = []
+    token: str | None = None
+    while True:
+        metrics: list[RequestMetric] = []
+        size, request = _page_request(
+            paging, jql, fields=fields, token=token, metrics=metrics
+        )
+        started = time.perf_counter()
+        try:
+            page = client.post("/rest/api/3/search/jql", **request)
+        except httpx.TimeoutException:
+            if not paging.timed_out():
+                raise
+            continue
+        issues.extend(_observe_page(paging, size, page, started, metrics))
+        token = page.get("nextPageToken")
+        if not token or page.get("isLast"):
+            return issues
+
+
+async def search_all_async(
+    jql: str,
+    *,
+    fields: str | None = None,
+    paging: AdaptivePageSize | None = None,
+    client: AsyncJiraClient,
+) -> list[dict]:
+    """Async variant of search_all."""
+    paging = paging if paging is not None else AdaptivePageSize()
+    issues: list[dict] = []
+    token: str | None = None
+    while True:
+        metrics: list[RequestMetric] = []
+        size, request = _page_request(
+            paging, jql, fields=fields, token=token, metrics=metrics
+        )
+        started = time.perf_counter()
+        try:
+            page = await client.post("/rest/api/3/search/jql", **request)
+        except httpx.TimeoutException:
+            if not paging.timed_out():
+                raise
+            continue
+        issues.extend(_observe_page(paging, size, page, started, metrics))
+        token = page.get("nextPageToken")
+        if not token or page.get("isLast"):
+            return issues
 
 
 @app.callback()
@@ -33,29 +242,45 @@ def main(
     fields: str | None = typer.Option(
         None, "--fields", help="Comma-separated fields to return"
     ),
-    limit: int = typer.Option(50, "--limit", help="Max results"),
+    limit: int = typer.Option(50, "--limit", help="Max results (page size with --all)"),
     next_page_token: str | None = typer.Option(
         None, "--next-page-token", help="Pagination token from previous result"
     ),
+    all_pages: bool = typer.Option(
+        False, "--all", help="Follow pagination and return every matching issue"
+    ),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Stream issues as newline-delimited JSON"
+    ),
     base_url: str = typer.Option(..., envvar="JIRA_URL", help="Jira base URL"),
     username: str = typer.Option(..., envvar="JIRA_USERNAME", help="Jira username"),
     api_token: str = typer.Option(..., envvar="JIRA_API_TOKEN", help="Jira API token"),
     pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON"),
 ) -> None:
     """Search Jira issues using JQL."""
-    from jira_utils._output import handle_error, output_json
+    from jira_utils._output import handle_error, output_json, output_ndjson
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_search(
-            jql,
-            fields=fields,
-            limit=limit,
-            next_page_token=next_page_token,
-            client=client,
-        )
+        ) as client:
+            if all_pages:
+                issues = iter_search(jql, fields=fields, page_size=limit, client=client)
+                if ndjson:
+                    output_ndjson(issues)
+                    return
+                result = {"issues": list(issues)}
+            else:
+                result = run_search(
+                    jql,
+                    fields=fields,
+                    limit=limit,
+                    next_page_token=next_page_token,
+                    client=client,
+                )
+                if ndjson:
+                    output_ndjson(result.get("issues", []))
+                    return
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
@@ -0,0 +1,310 @@
+"""Serve jira-utils commands from a long-lived process on a Unix socket."""
+
+from __future__ import annotations
+
+import codecs
+import contextlib
+import functools
+import io
+import os
+import signal
+import socketserver
+import sys
+import threading
+import traceback
+from collections.abc import Callable, Iterator, MutableMapping
+from pathlib import Path
+from typing import IO, Any
+
+import typer
+
+from jira_utils.cli import _Commands
+from jira_utils.cli import app as cli_app
+from jira_utils.client import close_pools, keep_pools
+from jira_utils.daemon import (
+    SOCKET_ENV,
+    connect,
+    read_message,
+    socket_path,
+    write_message,
+)
+
+app = typer.Typer(invoke_without_command=True)
+
+# Environment and stdio of the thread running a forwarded command.
+_local = threading.local()
+
+
+@functools.cache
+def _command() -> typer.core.TyperGroup:
+    """The CLI's click group, built once so loaded subcommands stay loaded."""
+    return typer.main.get_command(cli_app)
+
+
+class _ThreadStream:
+    """Stand-in for a ``sys`` stream that follows the current thread's stream.
+
+    Threads not running a forwarded command see the original stream.
+    """
+
+    def __init__(self, name: str, default: IO[str]) -> None:
+        self._name = name
+        self._default = default
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(getattr(_local, self._name, self._default), attr)
+
+
+class _ThreadEnviron(MutableMapping[str, str]):
+    """Stand-in for ``os.environ`` giving each forwarded command its own copy.
+
+    Threads not running a forwarded command see the process environment.
+    """
+
+    def __init__(self, default: MutableMapping[str, str]) -> None:
+        self._default = default
+
+    def _env(self) -> MutableMapping[str, str]:
+        return getattr(_local, "environ", self._default)
+
+    def __getitem__(self, key: str) -> str:
+        return self._env()[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self._env()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._env()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._env())
+
+    def __len__(self) -> int:
+        return len(self._env())
+
+    def copy(self) -> dict[str, str]:
+        """A plain dict of the current thread's environment."""
+        return dict(self._env())
+
+
+class _Workdir:
+    """Lets forwarded commands run side by side while they share a cwd.
+
+    The working directory is the one piece of process state that cannot be
+    made per-thread, so a command from another directory waits until the
+    running ones finish. The first command in swaps in the per-thread
+    environment and stdio stand-ins; the last one out restores the originals.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._cwd: str | None = None
+        self._active = 0
+        self._saved: tuple = ()
+
+    @contextlib.contextmanager
+    def enter(self, cwd: str) -> Iterator[None]:
+        """Run the body with the process in ``cwd``.
+
+        Raises:
+            OSError: If ``cwd`` cannot be entered.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._active == 0 or self._cwd == cwd)
+            if self._active == 0:
+                saved_cwd = os.getcwd()
+                os.chdir(cwd)
+                self._saved = (saved_cwd, os.environ, sys.stdin, sys.stdout, sys.stderr)
+                os.environ = _ThreadEnviron(os.environ)  # noqa: B003
+                sys.stdin = _ThreadStream("stdin", sys.stdin)
+                sys.stdout = _ThreadStream("stdout", sys.stdout)
+                sys.stderr = _ThreadStream("stderr", sys.stderr)
+                self._cwd = cwd
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                if self._active == 0:
+                    saved_cwd, os.environ, sys.stdin, sys.stdout, sys.stderr = (
+                        self._saved
+                    )
+                    os.chdir(saved_cwd)
+                    self._cwd = None
+                    self._cond.notify_all()
+
+
+_workdir = _Workdir()
+
+
+class _Relay(io.RawIOBase):
+    """Byte sink passing what is written to ``send`` as ``{name: text}``.
+
+    Output is dropped once the client has gone away, so the command still
+    runs to completion.
+    """
+
+    def __init__(self, name: str, send: Callable[[dict], None]) -> None:
+        super().__init__()
+        self._name = name
+        self._send: Callable[[dict], None] | None = send
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def writable(self) -> bool:
+        """Always writable."""
+        return True
+
+    def write(self, data: bytes) -> int:
+        """Send ``data``, holding back a trailing partial UTF-8 sequence."""
+        text = self._decoder.decode(bytes(data))
+        if text and self._send is not None:
+            try:
+                self._send({self._name: text})
+            except OSError:
+                self._send = None
+        return len(data)
+
+
+def _relay(name: str, send: Callable[[dict], None]) -> io.TextIOWrapper:
+    """Text stream shaped like a real ``sys.stdout`` that relays its output.
+
+    Output is buffered like a pipe's and sent whenever the buffer fills or
+    is flushed.
+    """
+    return io.TextIOWrapper(
+        io.BufferedWriter(_Relay(name, send)), encoding="utf-8", write_through=True
+    )
+
+
+def _exit_code(exc: SystemExit, stderr: IO[str]) -> int:
+    """Exit status for a ``SystemExit`` the way the interpreter computes it."""
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=stderr)
+    return 1
+
+
+def run_command(
+    argv: list[str], env: dict[str, str], cwd: str, send: Callable[[dict], None]
+) -> int:
+    """Run one CLI invocation here, as if started from ``cwd`` with ``env``.
+
+    Output goes to ``send`` as it is written, as ``{"stdout": text}`` and
+    ``{"stderr": text}`` messages; the exit code is returned. stdin is
+    empty; commands that read it are never forwarded. Commands from the
+    same directory run concurrently, each seeing its own ``env`` and stdio
+    (threads they start see the server's).
+    """
+    out, err = _relay("stdout", send), _relay("stderr", send)
+    _local.stdin, _local.stdout, _local.stderr = io.StringIO(), out, err
+    _local.environ = dict(env)
+    try:
+        with _workdir.enter(cwd):
+            _command().main(args=argv, prog_name="jira-utils")
+        code = 0
+    except SystemExit as exc:
+        code = _exit_code(exc, err)
+    except Exception:
+        traceback.print_exc(file=err)
+        code = 1
+    finally:
+        del _local.stdin, _local.stdout, _local.stderr, _local.environ
+    out.flush()
+    err.flush()
+    return code
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        """Run one forwarded invocation, streaming its output back."""
+        try:
+            request = read_message(self.rfile)
+        except (ConnectionError, ValueError):
+            return
+        send = functools.partial(write_message, self.wfile)
+        code = run_command(request["argv"], request["env"], request["cwd"], send)
+        with contextlib.suppress(OSError):
+            write_message(self.wfile, {"code": code})
+
+
+class CommandServer(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server running forwarded jira-utils invocations.
+
+    The socket is created readable by the current user only. A leftover
+    socket file from a crashed server is replaced.
+
+    Raises:
+        RuntimeError: If another server is already listening on ``path``.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        if self.path.exists():
+            sock = connect(self.path)
+            if sock is not None:
+                sock.close()
+                raise RuntimeError(f"jira-utils serve is already running on {path}")
+            self.path.unlink()
+        umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.path), _Handler)
+        finally:
+            os.umask(umask)
+
+    def server_close(self) -> None:
+        """Close the socket and remove its file."""
+        super().server_close()
+        self.path.unlink(missing_ok=True)
+
+
+def run_serve(path: Path) -> None:
+    """Serve forwarded commands on ``path`` until SIGINT or SIGTERM.
+
+    Every command module is imported up front, and Jira connection pools
+    stay open between commands (see ``keep_pools``).
+    """
+    for name in _Commands.lazy_commands:
+        _command().get_command(None, name)
+    keep_pools()
+    server = CommandServer(path)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        close_pools()
+
+
+@app.callback()
+def main(
+    path: str | None = typer.Option(
+        None,
+        "--socket",
+        envvar=SOCKET_ENV,
+        help="Unix socket to listen on (default: in the jira-utils cache dir)",
+    ),
+) -> None:
+    """Serve jira-utils commands from a warm process on a Unix socket.
+
+    While it runs, every jira-utils invocation that finds the socket is
+    executed here instead of starting its own interpreter and connection.
+    """
+    from jira_utils._output import handle_error
+
+    try:
+        path = Path(path) if path else socket_path()
+        typer.echo(f"jira-utils: serving on {path}", err=True)
+        run_serve(path)
+    except Exception as exc:
+        handle_error(exc)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,742 @@
+"""In-process Jira Cloud stand-in for offline benchmarks and integration tests.
+
+``JiraSimulator`` keeps a generated board in memory and answers the REST
+endpoints jira_utils uses through an ``httpx.MockTransport``::
+
+    sim = JiraSimulator(SimulatorConfig(issues=10_000, latency=0.02))
+    with JiraClient(**sim.client_options()) as client:
+        run_fetch_task("GFD", client=client)
+    print(sim.requests)
+
+Knobs on ``SimulatorConfig`` control board size, blocker-link density,
+per-request latency, 429 throttling and 503 outages. Only the JQL subset
+jira_utils emits is understood (``AND``-joined clauses on project, key,
+status, issuetype, assignee and updated, plus ``ORDER BY``); anything else
+answers 400 like Jira does for invalid JQL.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+import httpx
+
+from jira_utils.metrics import template_path
+
+BASE_URL = "https://jira.simulator"
+
+STATUSES = ("Planning", "Plan Review", "To Do", "In Progress", "Review", "Done")
+ISSUE_TYPES = ("Task", "Task", "Task", "Story", "Bug", "Epic")
+PRIORITIES = ("Highest", "High", "Medium", "Low")
+
+_BLOCKS = {
+    "id": "10000",
+    "name": "Blocks",
+    "inward": "is blocked by",
+    "outward": "blocks",
+}
+_LINK_TYPES = [
+    _BLOCKS,
+    {"id": "10001", "name": "Relates", "inward": "relates to", "outward": "relates to"},
+]
+
+
+@dataclass
+class SimulatorConfig:
+    """Shape and behaviour of the simulated Jira site.
+
+    Attributes:
+        project: Project key of the generated board.
+        issues: Number of issues to generate.
+        link_density: Expected "is blocked by" links per issue.
+        status_weights: Relative frequency of each status in ``STATUSES``.
+        users: Display names issues are assigned to; the first is "myself".
+        latency: Seconds added to every response.
+        jitter: Extra uniformly random latency, in seconds.
+        throttle_rate: Probability that a request is answered 429.
+        throttle_every: Answer every Nth request 429 (0 disables).
+        retry_after: Value of the Retry-After header on 429 responses.
+        error_rate: Probability that a request is answered 503 (an outage
+            at 1.0); may be changed while the simulator is running.
+        max_page_size: Cap on ``maxResults`` for search and board pages.
+        seed: Random seed, so generated boards are reproducible.
+    """
+
+    project: str = "GFD"
+    issues: int = 200
+    link_density: float = 0.2
+    status_weights: tuple[float, ...] = (1, 1, 4, 1, 1, 2)
+    users: tuple[str, ...] = ("Agent One", "Agent Two", "Human Reviewer")
+    latency: float = 0.0
+    jitter: float = 0.0
+    throttle_rate: float = 0.0
+    throttle_every: int = 0
+    retry_after: float = 1.0
+    error_rate: float = 0.0
+    max_page_size: int = 100
+    seed: int = 0
+
+
+class _JiraError(Exception):
+    def __init__(self, status: int, *messages: str) -> None:
+        super().__init__(status, messages)
+        self.status = status
+        self.messages = list(messages)
+
+
+@dataclass
+class _Issue:
+    id: int
+    key: str
+    fields: dict
+    rank: int
+    sprint: int | None = None
+    comments: list[dict] = field(default_factory=list)
+
+
+_CLAUSE = re.compile(
+    r"^\s*(?P<field>\w+)\s*(?P<op>not\s+in|in|!=|>=|<=|=|>|<)\s*(?P<value>.+?)\s*$",
+    re.IGNORECASE,
+)
+
+_RELATIVE = re.compile(r"^-(?P<amount>\d+)(?P<unit>[mhdw])$", re.IGNORECASE)
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def _parse_jql_time(value: str) -> datetime:
+    """Parse the absolute date forms JQL accepts ("yyyy-mm-dd [HH:MM]")."""
+    value = _unquote(value)
+    for fmt in ("%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M", "%Y-%m-%d", "%Y/%m/%d"):
+        try:
+            return datetime.strptime(value, fmt).replace(tzinfo=UTC)
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise _JiraError(400, f"Date value '{value}' is invalid") from None
+
+
+class JiraSimulator:
+    """Stateful fake Jira site served through ``httpx.MockTransport``."""
+
+    def __init__(self, config: SimulatorConfig | None = None) -> None:
+        self.config = config or SimulatorConfig()
+        self.requests: Counter[str] = Counter()
+        self.throttled = 0
+        self.failed = 0
+        self._rng = random.Random(self.config.seed)  # noqa: S311
+        self._lock = threading.Lock()
+        self._issues: dict[str, _Issue] = {}
+        # Old key -> current key of issues moved to another project.
+        self._moved: dict[str, str] = {}
+        self._blocked_by: dict[str, set[str]] = {}
+        self._blocks: dict[str, set[str]] = {}
+        # JQL results are memoised until the next mutation bumps the version.
+        self._version = 0
+        self._query_cache: dict[str, tuple[int, list[_Issue]]] = {}
+        self._next_id = 10000
+        self._clock = datetime(2026, 1, 1, tzinfo=UTC)
+        self._accounts = {
+            name: f"557058:{i:08d}-sim" for i, name in enumerate(self.config.users)
+        }
+        self._sprints = [
+            {"id": 1, "name": f"{self.config.project} Sprint 1", "state": "closed"},
+            {"id": 2, "name": f"{self.config.project} Sprint 2", "state": "active"},
+            {"id": 3, "name": f"{self.config.project} Sprint 3", "state": "future"},
+        ]
+        self._routes: list[tuple[str, re.Pattern[str], Callable[..., object]]] = [
+            ("POST", r"/rest/api/3/search/jql", self._search),
+            ("POST", r"/rest/api/3/search/approximate-count", self._count),
+            ("GET", r"/rest/api/3/myself", self._myself),
+            ("GET", r"/rest/api/3/serverInfo", self._server_info),
+            ("GET", r"/rest/api/2/user/search", self._user_search),
+            ("GET", r"/rest/api/2/users/search", self._users),
+            ("POST", r"/rest/api/2/issue", self._create_issue),
+            ("POST", r"/rest/api/2/issue/bulk", self._bulk_create),
+            ("GET", r"/rest/api/2/issue/(?P<key>[^/]+)", self._get_issue),
+            ("PUT", r"/rest/api/2/issue/(?P<key>[^/]+)", self._update_issue),
+            ("GET", r"/rest/api/2/issue/(?P<key>[^/]+)/transitions", self._transitions),
+            ("POST", r"/rest/api/2/issue/(?P<key>[^/]+)/transitions", self._transition),
+            ("POST", r"/rest/api/2/issue/(?P<key>[^/]+)/comment", self._comment),
+            ("POST", r"/rest/api/2/issueLink", self._link),
+            ("GET", r"/rest/api/2/issueLinkType", self._link_types),
+            ("GET", r"/rest/api/2/project/(?P<project>[^/]+)/components", self._empty),
+            ("GET", r"/rest/api/2/project/(?P<project>[^/]+)/versions", self._empty),
+            ("GET", r"/rest/agile/1.0/board", self._boards),
+            ("GET", r"/rest/agile/1.0/board/(?P<board>\d+)/issue", self._board_issues),
+            ("POST", r"/rest/agile/1.0/board/(?P<board>\d+)/issue", self._to_board),
+            ("GET", r"/rest/agile/1.0/board/(?P<board>\d+)/sprint", self._sprint_list),
+            ("POST", r"/rest/agile/1.0/sprint/(?P<sprint>\d+)/issue", self._to_sprint),
+            ("POST", r"/rest/agile/1.0/backlog/issue", self._to_backlog),
+        ]
+        self._routes = [(m, re.compile(f"^{p}$"), h) for m, p, h in self._routes]
+        self._generate()
+
+    # -- wiring -----------------------------------------------------------
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport for a sync ``JiraClient`` (latency via ``time.sleep``)."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            delay = self._delay()
+            if delay:
+                time.sleep(delay)
+            return self.handle(request)
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Transport for an ``AsyncJiraClient`` (latency via ``asyncio.sleep``)."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            delay = self._delay()
+            if delay:
+                await asyncio.sleep(delay)
+            return self.handle(request)
+
+        return httpx.MockTransport(handler)
+
+    def client_options(self, *, asynchronous: bool = False) -> dict:
+        """Keyword arguments for ``JiraClient(**...)`` pointed at this site.
+
+        Rate limiting and the disk caches are disabled so measurements only
+        reflect the simulated server.
+        """
+        return {
+            "base_url": BASE_URL,
+            "username": "bench@example.com",
+            "api_token": "simulated",
+            "transport": self.async_transport() if asynchronous else self.transport(),
+            "rate_limited": False,
+            "cache_mode": "off",
+        }
+
+    def _delay(self) -> float:
+        cfg = self.config
+        if not (cfg.latency or cfg.jitter):
+            return 0.0
+        with self._lock:
+            return cfg.latency + self._rng.uniform(0, cfg.jitter)
+
+    def _throttle(self) -> bool:
+        cfg = self.config
+        total = sum(self.requests.values())
+        if cfg.throttle_every and total % cfg.throttle_every == 0:
+            return True
+        return bool(cfg.throttle_rate) and self._rng.random() < cfg.throttle_rate
+
+    def _route(
+        self, method: str, path: str
+    ) -> tuple[Callable[..., object], dict] | None:
+        for route_method, pattern, route in self._routes:
+            match = pattern.match(path)
+            if match and route_method == method:
+                return route, match.groupdict()
+        return None
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer one request against the in-memory site."""
+        path = request.url.path
+        with self._lock:
+            self.requests[f"{request.method} {template_path(path)}"] += 1
+            if self._throttle():
+                self.throttled += 1
+                return httpx.Response(
+                    429,
+                    headers={"Retry-After": f"{self.config.retry_after:g}"},
+                    json={"errorMessages": ["Rate limit exceeded"]},
+                )
+            if self.config.error_rate and self._rng.random() < self.config.error_rate:
+                self.failed += 1
+                return httpx.Response(
+                    503, json={"errorMessages": ["Service unavailable"]}
+                )
+            found = self._route(request.method, path)
+            if found is None:
+                return httpx.Response(404, json={"errorMessages": ["Not found"]})
+            route, path_args = found
+            params = dict(request.url.params)
+            body = json.loads(request.content) if request.content else None
+            try:
+                result = route(params=params, body=body, **path_args)
+            except _JiraError as exc:
+                return httpx.Response(
+                    exc.status, json={"errorMessages": exc.messages, "errors": {}}
+                )
+        if result is None:
+            return httpx.Response(204)
+        status, payload = result if isinstance(result, tuple) else (200, result)
+        return httpx.Response(status, json=payload)
+
+    # -- data -------------------------------------------------------------
+
+    def _generate(self) -> None:
+        cfg = self.config
+        rng = self._rng
+        keys = []
+        for n in range(1, cfg.issues + 1):
+            status = rng.choices(STATUSES, weights=cfg.status_weights)[0]
+            issue_type = rng.choice(ISSUE_TYPES)
+            assignee = rng.choice(cfg.users) if rng.random() < 0.9 else None
+            issue = self._add_issue(
+                summary=f"Simulated issue {n}",
+                issue_type=issue_type,
+                status=status,
+                assignee=assignee,
+                priority=rng.choice(PRIORITIES),
+                labels=["sim"] if rng.random() < 0.3 else [],
+            )
+            keys.append(issue.key)
+        links = int(cfg.issues * cfg.link_density)
+        for _ in range(links):
+            blocked, blocker = rng.sample(keys, 2) if len(keys) > 1 else (None, None)
+            if blocked:
+                self._add_block(blocker, blocked)
+        # The generated board was last touched a while ago, so relative
+        # ``updated >= -5m`` queries only see changes made through the API.
+        self._clock += timedelta(days=1)
+
+    def _tick(self) -> str:
+        self._clock += timedelta(seconds=1)
+        return self._clock.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+    def _add_issue(
+        self,
+        *,
+        summary: str,
+        issue_type: str,
+        status: str = "Planning",
+        assignee: str | None = None,
+        priority: str = "Medium",
+        labels: list[str] | None = None,
+        project: str | None = None,
+        extra: dict | None = None,
+    ) -> _Issue:
+        self._next_id += 1
+        number = len(self._issues) + 1
+        key = f"{project or self.config.project}-{number}"
+        now = self._tick()
+        fields = {
+            "summary": summary,
+            "status": {"name": status},
+            "issuetype": {"name": issue_type},
+            "priority": {"name": priority},
+            "assignee": self._user(assignee) if assignee else None,
+            "labels": labels or [],
+            "project": {"key": project or self.config.project},
+            "created": now,
+            "updated": now,
+            **(extra or {}),
+        }
+        issue = _Issue(self._next_id, key, fields, rank=number)
+        self._issues[key] = issue
+        self._version += 1
+        return issue
+
+    def _user(self, name: str) -> dict:
+        return {
+            "accountId": self._accounts[name],
+            "displayName": name,
+            "active": True,
+            "accountType": "atlassian",
+        }
+
+    def _name_for(self, account_id: str) -> str | None:
+        for name, aid in self._accounts.items():
+            if aid == account_id:
+                return name
+        return None
+
+    def move_issue(self, key: str, project: str) -> str:
+        """Move an issue to ``project`` under a new key and return that key.
+
+        Like Jira, the old key keeps resolving to the issue in JQL and when
+        fetching the issue. Links are not carried over.
+        """
+        with self._lock:
+            issue = self._issues.pop(self._moved.get(key, key))
+            numbers = [
+                int(k.rpartition("-")[2])
+                for k in self._issues
+                if k.startswith(f"{project}-")
+            ]
+            old_key, issue.key = issue.key, f"{project}-{max(numbers, default=0) + 1}"
+            issue.fields["project"] = {"key": project}
+            self._issues[issue.key] = issue
+            for alias, current in self._moved.items():
+                if current == old_key:
+                    self._moved[alias] = issue.key
+            self._moved[old_key] = issue.key
+            self._touch(issue)
+            return issue.key
+
+    def _issue(self, key: str) -> _Issue:
+        issue = self._issues.get(self._moved.get(key, key))
+        if issue is None:
+            raise _JiraError(404, "Issue does not exist or you do not have permission")
+        return issue
+
+    def _add_block(self, blocker: str, blocked: str) -> None:
+        self._blocked_by.setdefault(blocked, set()).add(blocker)
+        self._blocks.setdefault(blocker, set()).add(blocked)
+        self._version += 1
+
+    def _links(self, issue: _Issue) -> list[dict]:
+        links = [
+            {"type": _BLOCKS, "inwardIssue": self._ref(self._issues[key])}
+            for key in sorted(self._blocked_by.get(issue.key, ()))
+        ]
+        links += [
+            {"type": _BLOCKS, "outwardIssue": self._ref(self._issues[key])}
+            for key in sorted(self._blocks.get(issue.key, ()))
+        ]
+        return links
+
+    def _ref(self, issue: _Issue) -> dict:
+        return {
+            "id": str(issue.id),
+            "key": issue.key,
+            "fields": {
+                "summary": issue.fields["summary"],
+                "status": issue.fields["status"],
+            },
+        }
+
+    def _render(self, issue: _Issue, fields: list[str] | None = None) -> dict:
+        data = dict(issue.fields)
+        if fields is None or "issuelinks" in fields or "*all" in fields:
+            data["issuelinks"] = self._links(issue)
+        if fields is not None and "*all" not in fields:
+            data = {k: v for k, v in data.items() if k in fields}
+        return {"id": str(issue.id), "key": issue.key, "fields": data}
+
+    def _touch(self, issue: _Issue) -> None:
+        issue.fields["updated"] = self._tick()
+        self._version += 1
+
+    # -- JQL --------------------------------------------------------------
+
+    def _query(self, jql: str) -> list[_Issue]:
+        cached = self._query_cache.get(jql)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        result = self._evaluate(jql)
+        self._query_cache[jql] = (self._version, result)
+        return result
+
+    def _evaluate(self, jql: str) -> list[_Issue]:
+        parts = re.split(r"\s+ORDER\s+BY\s+", jql.strip(), flags=re.IGNORECASE)
+        where = parts[0]
+        order = parts[1] if len(parts) > 1 else "rank ASC"
+        predicates = []
+        if where and not re.match(r"^ORDER\s+BY", where, re.IGNORECASE):
+            for clause in re.split(r"\s+AND\s+", where, flags=re.IGNORECASE):
+                predicates.append(self._predicate(clause))
+        matched = [i for i in self._issues.values() if all(p(i) for p in predicates)]
+        field_name, _, direction = order.strip().partition(" ")
+        sort_key = {
+            "rank": lambda i: i.rank,
+            "key": lambda i: i.rank,
+            "created": lambda i: i.fields["created"],
+            "updated": lambda i: i.fields["updated"],
+        }.get(field_name.lower())
+        if sort_key is None:
+            raise _JiraError(400, f"Not able to sort using field '{field_name}'.")
+        return sorted(
+            matched, key=sort_key, reverse=direction.strip().upper() == "DESC"
+        )
+
+    def _predicate(self, clause: str) -> Callable[[_Issue], bool]:
+        match = _CLAUSE.match(clause)
+        if not match:
+            raise _JiraError(400, f"Error in the JQL Query: '{clause}'")
+        name = match["field"].lower()
+        op = " ".join(match["op"].lower().split())
+        raw = match["value"]
+        if op in ("in", "not in"):
+            if not (raw.startswith("(") and raw.endswith(")")):
+                raise _JiraError(400, f"Expected a list after '{op}' in '{clause}'")
+            values = {_unquote(v) for v in raw[1:-1].split(",") if v.strip()}
+        else:
+            values = {_unquote(raw)}
+
+        getters: dict[str, Callable[[_Issue], str | None]] = {
+            "project": lambda i: i.fields["project"]["key"],
+            "key": lambda i: i.key,
+            "issuekey": lambda i: i.key,
+            "status": lambda i: i.fields["status"]["name"],
+            "issuetype": lambda i: i.fields["issuetype"]["name"],
+            "assignee": lambda i: (i.fields["assignee"] or {}).get("accountId"),
+        }
+        if name == "updated":
+            if op not in (">=", ">", "<=", "<"):
+                raise _JiraError(400, f"Unsupported operator '{op}' for updated")
+            bound = self._jql_time(raw)
+            compare = {
+                ">=": lambda a, b: a >= b,
+                ">": lambda a, b: a > b,
+                "<=": lambda a, b: a <= b,
+                "<": lambda a, b: a < b,
+            }[op]
+            return lambda i: compare(
+                datetime.strptime(i.fields["updated"], "%Y-%m-%dT%H:%M:%S.%f%z"),
+                bound,
+            )
+        getter = getters.get(name)
+        if getter is None or op not in ("=", "!=", "in", "not in"):
+            raise _JiraError(400, f"Field '{name}' is not supported by the simulator")
+        if name in ("key", "issuekey"):
+            values = self._resolve_keys(values, match["field"])
+        if name == "assignee":
+            values = {self._accounts.get(v, v) for v in values}
+            if "currentUser()" in values:
+                values.add(self._accounts[self.config.users[0]])
+        if name in ("status", "issuetype"):
+            values = {v.lower() for v in values}
+            base = getter
+
+            def getter(i: _Issue) -> str | None:
+                value = base(i)
+                return value.lower() if value else value
+
+        if op in ("=", "in"):
+            return lambda i: getter(i) in values
+        return lambda i: getter(i) not in values
+
+    def _resolve_keys(self, keys: set[str], field_name: str) -> set[str]:
+        """Current keys for JQL key values; Jira rejects unknown keys with 400."""
+        unknown = sorted(k for k in keys if self._moved.get(k, k) not in self._issues)
+        if unknown:
+            raise _JiraError(
+                400,
+                *(
+                    f"An issue with key '{k}' does not exist for field '{field_name}'."
+                    for k in unknown
+                ),
+            )
+        return {self._moved.get(k, k) for k in keys}
+
+    def _jql_time(self, value: str) -> datetime:
+        """Absolute JQL date, or a relative one ("-15m", "-2h") on the site clock."""
+        relative = _RELATIVE.match(_unquote(value))
+        if relative is None:
+            return _parse_jql_time(value)
+        amount, unit = int(relative["amount"]), relative["unit"].lower()
+        span = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}[unit]
+        return self._clock - timedelta(**{span: amount})
+
+    def _page(self, items: list, start: int, limit: int) -> tuple[list, int]:
+        size = max(1, min(limit, self.config.max_page_size))
+        return items[start : start + size], size
+
+    # -- handlers ---------------------------------------------------------
+
+    def _search(self, *, params: dict, body: dict | None) -> dict:
+        body = body or {}
+        matched = self._query(body.get("jql", ""))
+        token = body.get("nextPageToken")
+        start = int(base64.urlsafe_b64decode(token)) if token else 0
+        page, size = self._page(matched, start, int(body.get("maxResults", 50)))
+        fields = body.get("fields")
+        result: dict = {"issues": [self._render(i, fields) for i in page]}
+        if start + size < len(matched):
+            result["nextPageToken"] = base64.urlsafe_b64encode(
+                str(start + size).encode()
+            ).decode()
+        else:
+            result["isLast"] = True
+        return result
+
+    def _count(self, *, params: dict, body: dict | None) -> dict:
+        return {"count": len(self._query((body or {}).get("jql", "")))}
+
+    def _myself(self, **_: object) -> dict:
+        return self._user(self.config.users[0])
+
+    def _server_info(self, **_: object) -> dict:
+        return {
+            "baseUrl": BASE_URL,
+            "deploymentType": "Cloud",
+            "serverTime": self._clock.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+        }
+
+    def _user_search(self, *, params: dict, body: None) -> list:
+        query = params.get("query", "").lower()
+        return [self._user(n) for n in self.config.users if query in n.lower()]
+
+    def _users(self, *, params: dict, body: None) -> list:
+        start = int(params.get("startAt", 0))
+        users = [self._user(n) for n in self.config.users]
+        return users[start : start + int(params.get("maxResults", 50))]
+
+    def _new_issue(self, fields: dict) -> _Issue:
+        try:
+            project = fields["project"]["key"]
+            summary = fields["summary"]
+            issue_type = fields["issuetype"]["name"]
+        except (KeyError, TypeError):
+            raise _JiraError(
+                400, "project, summary and issuetype are required"
+            ) from None
+        assignee = (fields.get("assignee") or {}).get("accountId")
+        extra = {
+            k: v
+            for k, v in fields.items()
+            if k not in ("project", "summary", "issuetype", "assignee")
+        }
+        return self._add_issue(
+            summary=summary,
+            issue_type=issue_type,
+            assignee=self._name_for(assignee) if assignee else None,
+            project=project,
+            extra=extra,
+        )
+
+    def _created(self, issue: _Issue) -> dict:
+        return {
+            "id": str(issue.id),
+            "key": issue.key,
+            "self": f"{BASE_URL}/rest/api/2/issue/{issue.id}",
+        }
+
+    def _create_issue(self, *, params: dict, body: dict | None) -> tuple:
+        return 201, self._created(self._new_issue((body or {}).get("fields", {})))
+
+    def _bulk_create(self, *, params: dict, body: dict | None) -> tuple:
+        issues, errors = [], []
+        for n, update in enumerate((body or {}).get("issueUpdates", [])):
+            try:
+                issues.append(self._created(self._new_issue(update.get("fields", {}))))
+            except _JiraError as exc:
+                errors.append(
+                    {
+                        "status": exc.status,
+                        "failedElementNumber": n,
+                        "elementErrors": {"errorMessages": exc.messages},
+                    }
+                )
+        return (201 if issues else 400), {"issues": issues, "errors": errors}
+
+    def _get_issue(self, *, key: str, params: dict, body: None) -> dict:
+        fields = params.get("fields")
+        return self._render(self._issue(key), fields.split(",") if fields else None)
+
+    def _update_issue(self, *, key: str, params: dict, body: dict | None) -> None:
+        issue = self._issue(key)
+        for name, value in (body or {}).get("fields", {}).items():
+            if name == "assignee":
+                account = (value or {}).get("accountId")
+                name_for = self._name_for(account) if account else None
+                issue.fields["assignee"] = self._user(name_for) if name_for else None
+            else:
+                issue.fields[name] = value
+        self._touch(issue)
+
+    def _transitions(self, *, key: str, params: dict, body: None) -> dict:
+        self._issue(key)
+        return {
+            "transitions": [
+                {"id": str(11 + n), "name": status, "to": {"name": status}}
+                for n, status in enumerate(STATUSES)
+            ]
+        }
+
+    def _transition(self, *, key: str, params: dict, body: dict | None) -> None:
+        issue = self._issue(key)
+        transition_id = int((body or {}).get("transition", {}).get("id", 0))
+        if not 11 <= transition_id < 11 + len(STATUSES):
+            raise _JiraError(400, f"Transition id '{transition_id}' is not valid")
+        issue.fields["status"] = {"name": STATUSES[transition_id - 11]}
+        comment = (body or {}).get("update", {}).get("comment")
+        if comment:
+            issue.comments.append({"body": comment[0].get("add", {}).get("body")})
+        self._touch(issue)
+
+    def _comment(self, *, key: str, params: dict, body: dict | None) -> tuple:
+        issue = self._issue(key)
+        comment = {"id": str(len(issue.comments) + 1), "body": (body or {}).get("body")}
+        issue.comments.append(comment)
+        self._touch(issue)
+        return 201, comment
+
+    def _link(self, *, params: dict, body: dict | None) -> tuple:
+        body = body or {}
+        blocker = self._issue(body.get("inwardIssue", {}).get("key", "")).key
+        blocked = self._issue(body.get("outwardIssue", {}).get("key", "")).key
+        if body.get("type", {}).get("name") == "Blocks":
+            self._add_block(blocker, blocked)
+            self._touch(self._issues[blocked])
+        return 201, None
+
+    def _link_types(self, **_: object) -> dict:
+        return {"issueLinkTypes": _LINK_TYPES}
+
+    def _empty(self, **_: object) -> list:
+        return []
+
+    def _boards(self, **_: object) -> dict:
+        project = self.config.project
+        return {
+            "values": [
+                {
+                    "id": 1,
+                    "name": f"{project} board",
+                    "type": "scrum",
+                    "location": {"projectKey": project},
+                }
+            ],
+            "isLast": True,
+        }
+
+    def _board_issues(self, *, board: str, params: dict, body: None) -> dict:
+        jql = f"project = {self.config.project}"
+        if params.get("jql"):
+            jql = f"{jql} AND {params['jql']}"
+        matched = self._query(jql)
+        start = int(params.get("startAt", 0))
+        page, size = self._page(matched, start, int(params.get("maxResults", 50)))
+        fields = params.get("fields")
+        return {
+            "startAt": start,
+            "maxResults": size,
+            "total": len(matched),
+            "issues": [
+                self._render(i, fields.split(",") if fields else None) for i in page
+            ],
+        }
+
+    def _to_board(self, *, board: str, params: dict, body: dict | None) -> None:
+        for key in (body or {}).get("issues", []):
+            self._issue(key)
+
+    def _sprint_list(self, *, board: str, params: dict, body: None) -> dict:
+        state = params.get("state")
+        sprints = [
+            s for s in self._sprints if not state or s["state"] in state.split(",")
+        ]
+        return {"values": sprints, "isLast": True}
+
+    def _to_sprint(self, *, sprint: str, params: dict, body: dict | None) -> None:
+        for key in (body or {}).get("issues", []):
+            self._issue(key).sprint = int(sprint)
+
+    def _to_backlog(self, *, params: dict, body: dict | None) -> None:
+        for key in (body or {}).get("issues", []):
+            self._issue(key).sprint = None
@@ -0,0 +1,117 @@
+"""Single-flight de-duplication of identical in-flight Jira requests."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import TypeVar
+from urllib.parse import urlencode
+
+T = TypeVar("T")
+
+
+def flight_key(method: str, path: str, params: dict | None) -> tuple[str, str, str]:
+    """Identity of a request for coalescing: method, path and sorted query."""
+    query = urlencode(sorted((params or {}).items()), doseq=True)
+    return method.upper(), path, query
+
+
+@dataclass
+class FlightStats:
+    """Counters for a single-flight group.
+
+    ``executed`` counts calls that actually went out; ``coalesced`` counts
+    callers that piggy-backed on an identical call already in flight.
+    """
+
+    executed: int = 0
+    coalesced: int = 0
+
+
+@dataclass
+class _Call:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: object = None
+    error: BaseException | None = None
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Thread-safe group: concurrent ``do()`` calls with one key share a result.
+
+    Followers receive a deep copy of the leader's result so callers that
+    mutate the returned JSON cannot affect each other.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.stats = FlightStats()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless an identical call is in flight; then wait for it."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats.executed += 1
+            else:
+                call.waiters += 1
+                self.stats.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                shared = call.waiters > 0
+            call.done.set()
+        return copy.deepcopy(call.result) if shared else call.result
+
+
+@dataclass
+class _AsyncCall:
+    task: asyncio.Future
+    waiters: int = 0
+
+
+class AsyncSingleFlight:
+    """Asyncio counterpart of SingleFlight for use within one event loop.
+
+    The shared call runs as its own task, so cancelling one caller does not
+    cancel the request for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _AsyncCall] = {}
+        self.stats = FlightStats()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()`` unless an identical call is in flight; then join it."""
+        call = self._calls.get(key)
+        leader = call is None
+        if leader:
+            call = self._calls[key] = _AsyncCall(asyncio.ensure_future(fn()))
+            call.task.add_done_callback(lambda _: self._calls.pop(key, None))
+            self.stats.executed += 1
+        else:
+            call.waiters += 1
+            self.stats.coalesced += 1
+
+        result = await asyncio.shield(call.task)
+        if leader and not call.waiters:
+            return result
+        return copy.deepcopy(result)
@@ -0,0 +1,243 @@
+"""Persistent local copy of a project board, kept current with delta syncs."""
+
+from __future__ import annotations
+
+import json
+import math
+import sqlite3
+import time
+from collections.abc import Callable, Iterable
+from contextlib import closing
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from jira_utils._paths import cache_dir
+from jira_utils.httpcache import cache_mode_from_env
+
+# How often the whole board is re-fetched. Delta queries only see issues
+# whose ``updated`` moved, so deletions, moves to another project and rank
+# changes are picked up here.
+RECONCILE_INTERVAL = 15 * 60
+
+# Extra look-back on delta queries. JQL ``updated`` has minute resolution and
+# the two clocks are not synchronised; re-reading an issue is harmless.
+DELTA_OVERLAP = 60
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS issues (
+        site TEXT NOT NULL,
+        project TEXT NOT NULL,
+        key TEXT NOT NULL,
+        active INTEGER NOT NULL,
+        status TEXT,
+        assignee TEXT,
+        position REAL NOT NULL,
+        data TEXT,
+        PRIMARY KEY (site, key)
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS issues_board
+        ON issues (site, project, active, status, assignee)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS syncs (
+        site TEXT NOT NULL,
+        project TEXT NOT NULL,
+        synced_at REAL NOT NULL,
+        reconciled_at REAL NOT NULL,
+        PRIMARY KEY (site, project)
+    )
+    """,
+)
+
+
+def _status(issue: dict) -> str | None:
+    return ((issue.get("fields") or {}).get("status") or {}).get("name")
+
+
+def _assignee(issue: dict) -> str | None:
+    return ((issue.get("fields") or {}).get("assignee") or {}).get("displayName")
+
+
+class BoardSnapshot:
+    """SQLite-backed snapshot of one project's active issues.
+
+    The snapshot stores raw search results. ``replace`` loads a full board
+    fetch; ``apply`` merges the result of an ``updated >= ...`` delta query.
+    Issues that left the board through a delta are kept as inactive rows
+    carrying their last status, so blocker links embedded in other issues
+    can be corrected when read back.
+
+    ``mode`` follows the HTTP cache modes: "refresh" forces every sync to be
+    a full reconcile.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        project: str,
+        *,
+        mode: str = "use",
+        path: Path | None = None,
+        reconcile_interval: float = RECONCILE_INTERVAL,
+    ) -> None:
+        self.project = project
+        self.mode = mode
+        self.path = path or cache_dir() / "boards.sqlite"
+        self.reconcile_interval = reconcile_interval
+        self._site = urlsplit(base_url).netloc or base_url
+        self.clock: Callable[[], float] = time.time
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5)
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        return conn
+
+    def _sync_times(self, conn: sqlite3.Connection) -> tuple[float, float] | None:
+        return conn.execute(
+            "SELECT synced_at, reconciled_at FROM syncs WHERE site = ? AND project = ?",
+            (self._site, self.project),
+        ).fetchone()
+
+    def delta_minutes(self) -> int | None:
+        """Look-back window for the next delta query, or None to reconcile."""
+        if self.mode == "refresh":
+            return None
+        with closing(self._connect()) as conn:
+            times = self._sync_times(conn)
+        if times is None:
+            return None
+        synced_at, reconciled_at = times
+        now = self.clock()
+        if now - reconciled_at >= self.reconcile_interval:
+            return None
+        return max(1, math.ceil((now - synced_at + DELTA_OVERLAP) / 60))
+
+    def replace(self, issues: Iterable[dict], synced_at: float) -> None:
+        """Replace the board with a full fetch of its active issues."""
+        rows = [
+            self._row(issue, active=True, position=float(i))
+            for i, issue in enumerate(issues)
+        ]
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM issues WHERE site = ? AND project = ?",
+                (self._site, self.project),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._mark_synced(conn, synced_at, reconciled=True)
+
+    def apply(
+        self, updated: Iterable[dict], removed: Iterable[dict], synced_at: float
+    ) -> None:
+        """Merge a delta: upsert ``updated``, deactivate ``removed``.
+
+        Issues already on the board keep their position; new ones are
+        appended in the order given until the next reconcile re-ranks them.
+        """
+        with closing(self._connect()) as conn, conn:
+            positions = dict(
+                conn.execute(
+                    "SELECT key, position FROM issues WHERE site = ? AND project = ?",
+                    (self._site, self.project),
+                ).fetchall()
+            )
+            last = max(positions.values(), default=-1.0)
+            rows = []
+            for issue, active in [
+                *((i, True) for i in updated),
+                *((i, False) for i in removed),
+            ]:
+                position = positions.get(issue["key"])
+                if position is None:
+                    last += 1
+                    position = last
+                rows.append(self._row(issue, active=active, position=position))
+            conn.executemany(
+                "INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._mark_synced(conn, synced_at, reconciled=False)
+
+    def issues(
+        self, *, status: str | None = None, assignee: str | None = None
+    ) -> list[dict]:
+        """Active issues in board order, optionally filtered.
+
+        Blocker links are patched with the latest status the snapshot knows
+        for the linked issue, since a blocker moving to Done does not touch
+        the blocked issue's ``updated`` timestamp.
+        """
+        query = "SELECT data FROM issues WHERE site = ? AND project = ? AND active = 1"
+        params: list = [self._site, self.project]
+        if status is not None:
+            query += " AND status = ?"
+            params.append(status)
+        if assignee is not None:
+            query += " AND assignee = ?"
+            params.append(assignee)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query + " ORDER BY position", params).fetchall()
+            statuses = dict(
+                conn.execute(
+                    "SELECT key, status FROM issues WHERE site = ?", (self._site,)
+                ).fetchall()
+            )
+        issues = [json.loads(data) for (data,) in rows]
+        for issue in issues:
+            for link in (issue.get("fields") or {}).get("issuelinks") or []:
+                for side in ("inwardIssue", "outwardIssue"):
+                    linked = link.get(side)
+                    if linked and statuses.get(linked.get("key")):
+                        fields = linked.setdefault("fields", {})
+                        fields["status"] = {
+                            **(fields.get("status") or {}),
+                            "name": statuses[linked["key"]],
+                        }
+        return issues
+
+    def _row(self, issue: dict, *, active: bool, position: float) -> tuple:
+        return (
+            self._site,
+            self.project,
+            issue["key"],
+            int(active),
+            _status(issue),
+            _assignee(issue),
+            position,
+            json.dumps(issue) if active else None,
+        )
+
+    def _mark_synced(
+        self, conn: sqlite3.Connection, synced_at: float, *, reconciled: bool
+    ) -> None:
+        times = self._sync_times(conn)
+        reconciled_at = synced_at if reconciled or times is None else times[1]
+        conn.execute(
+            "INSERT OR REPLACE INTO syncs VALUES (?, ?, ?, ?)",
+            (self._site, self.project, synced_at, reconciled_at),
+        )
+
+
+def snapshot_from_env(base_url: str, project: str | None) -> BoardSnapshot | None:
+    """Snapshot for ``project`` honouring ``JIRA_HTTP_CACHE``; None when "off"."""
+    mode = cache_mode_from_env()
+    if not project or mode == "off":
+        return None
+    return BoardSnapshot(base_url, project, mode=mode)
+
+
+def snapshots_from_env(
+    base_url: str, projects: Iterable[str]
+) -> dict[str, BoardSnapshot] | None:
+    """One snapshot per project honouring ``JIRA_HTTP_CACHE``; None when "off"."""
+    mode = cache_mode_from_env()
+    projects = list(projects)
+    if not projects or mode == "off":
+        return None
+    return {p: BoardSnapshot(base_url, p, mode=mode) for p in projects}
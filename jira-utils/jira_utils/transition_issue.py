@@ -4,11 +4,19 @@ from __future__ import annotations
 
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 app = typer.Typer(invoke_without_command=True)
 
 
+def _transition_payload(transition_id: str, comment: str | None) -> dict:
+    """Build the transition request body, with an optional comment."""
+    payload: dict = {"transition": {"id": transition_id}}
+    if comment:
+        payload["update"] = {"comment": [{"add": {"body": comment}}]}
+    return payload
+
+
 def run_transition_issue(
     issue_key: str,
     transition_id: str,
@@ -17,11 +25,24 @@ def run_transition_issue(
     client: JiraClient,
 ) -> dict | None:
     """Transition an issue. Returns None (204) on success."""
-    payload: dict = {"transition": {"id": transition_id}}
-    if comment:
-        payload["update"] = {"comment": [{"add": {"body": comment}}]}
+    return client.post(
+        f"/rest/api/2/issue/{issue_key}/transitions",
+        json=_transition_payload(transition_id, comment),
+    )
+
 
-    return client.post(f"/rest/api/2/issue/{issue_key}/transitions", json=payload)
+async def run_transition_issue_async(
+    issue_key: str,
+    transition_id: str,
+    *,
+    comment: str | None = None,
+    client: AsyncJiraClient,
+) -> dict | None:
+    """Async variant of run_transition_issue."""
+    return await client.post(
+        f"/rest/api/2/issue/{issue_key}/transitions",
+        json=_transition_payload(transition_id, comment),
+    )
 
 
 @app.callback()
@@ -42,12 +63,12 @@ def main(
     from jira_utils._output import handle_error, output_json
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_transition_issue(
-            issue_key, transition_id, comment=comment, client=client
-        )
+        ) as client:
+            result = run_transition_issue(
+                issue_key, transition_id, comment=comment, client=client
+            )
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
@@ -6,11 +6,27 @@ import json
 
 import typer
 
-from jira_utils.client import JiraClient
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 app = typer.Typer(invoke_without_command=True)
 
 
+def _update_payload(
+    *, fields: str | None, assignee_id: str | None, components: str | None
+) -> dict:
+    """Build the issue update request body."""
+    payload: dict = {}
+    if fields:
+        payload["fields"] = json.loads(fields)
+    if assignee_id:
+        payload.setdefault("fields", {})["assignee"] = {"accountId": assignee_id}
+    if components:
+        payload.setdefault("fields", {})["components"] = [
+            {"name": c.strip()} for c in components.split(",")
+        ]
+    return payload
+
+
 def run_update_issue(
     issue_key: str,
     *,
@@ -20,21 +36,31 @@ def run_update_issue(
     client: JiraClient,
 ) -> dict | None:
     """Update an issue's fields. Returns None (204) on success."""
-    payload: dict = {}
-    if fields:
-        payload["fields"] = json.loads(fields)
-    if assignee:
-        payload.setdefault("fields", {})["assignee"] = {
-            "accountId": client.resolve_account_id(assignee)
-        }
-    if components:
-        payload.setdefault("fields", {})["components"] = [
-            {"name": c.strip()} for c in components.split(",")
-        ]
-
+    payload = _update_payload(
+        fields=fields,
+        assignee_id=client.resolve_account_id(assignee) if assignee else None,
+        components=components,
+    )
     return client.put(f"/rest/api/2/issue/{issue_key}", json=payload)
 
 
+async def run_update_issue_async(
+    issue_key: str,
+    *,
+    fields: str | None = None,
+    assignee: str | None = None,
+    components: str | None = None,
+    client: AsyncJiraClient,
+) -> dict | None:
+    """Async variant of run_update_issue."""
+    payload = _update_payload(
+        fields=fields,
+        assignee_id=await client.resolve_account_id(assignee) if assignee else None,
+        components=components,
+    )
+    return await client.put(f"/rest/api/2/issue/{issue_key}", json=payload)
+
+
 @app.callback()
 def main(
     issue_key: str = typer.Option(
@@ -58,16 +84,16 @@ def main(
     from jira_utils._output import handle_error, output_json
 
     try:
-        client = JiraClient(
+        with JiraClient(
             base_url=base_url.rstrip("/"), username=username, api_token=api_token
-        )
-        result = run_update_issue(
-            issue_key,
-            fields=fields,
-            assignee=assignee,
-            components=components,
-            client=client,
-        )
+        ) as client:
+            result = run_update_issue(
+                issue_key,
+                fields=fields,
+                assignee=assignee,
+                components=components,
+                client=client,
+            )
         output_json(result, pretty=pretty)
     except Exception as exc:
         handle_error(exc)
@@ -0,0 +1,109 @@
+"""Persistent display-name → accountId cache shared across CLI invocations."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Callable, Iterable
+from contextlib import closing
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from jira_utils._paths import cache_dir
+
+# How long a resolved accountId is trusted. Account IDs never change, but a
+# display name can be reassigned, so entries still expire eventually.
+POSITIVE_TTL = 7 * 24 * 3600
+
+# How long "no such user" is remembered, so a typo does not hit Jira on
+# every retry yet a newly invited user shows up within the hour.
+NEGATIVE_TTL = 3600
+
+_MISSING = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    site TEXT NOT NULL,
+    name TEXT NOT NULL,
+    account_id TEXT,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (site, name)
+)
+"""
+
+
+def _normalize(name: str) -> str:
+    """Cache key for a user query: case- and whitespace-insensitive."""
+    return " ".join(name.split()).casefold()
+
+
+class AccountCache:
+    """SQLite-backed cache of user search results, scoped to one Jira site.
+
+    ``lookup`` returns the cached accountId, ``None`` for a remembered miss,
+    or the ``MISSING`` sentinel when the name must be resolved against Jira.
+    """
+
+    MISSING = _MISSING
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        mode: str = "use",
+        path: Path | None = None,
+        positive_ttl: float = POSITIVE_TTL,
+        negative_ttl: float = NEGATIVE_TTL,
+    ) -> None:
+        self.mode = mode
+        self.path = path or cache_dir() / "users.sqlite"
+        self._site = urlsplit(base_url).netloc or base_url
+        self._positive_ttl = positive_ttl
+        self._negative_ttl = negative_ttl
+        self._clock: Callable[[], float] = time.time
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute(_SCHEMA)
+        return conn
+
+    def lookup(self, name: str) -> str | None | object:
+        """Return the cached accountId, None for a cached miss, or MISSING."""
+        if self.mode != "use":
+            return _MISSING
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT account_id, stored_at FROM accounts"
+                    " WHERE site = ? AND name = ?",
+                    (self._site, _normalize(name)),
+                ).fetchone()
+        except sqlite3.Error:
+            return _MISSING
+        if row is None:
+            return _MISSING
+        account_id, stored_at = row
+        ttl = self._positive_ttl if account_id else self._negative_ttl
+        if self._clock() - stored_at >= ttl:
+            return _MISSING
+        return account_id
+
+    def store(self, name: str, account_id: str | None) -> None:
+        """Remember a resolution; ``account_id=None`` records a miss."""
+        self.store_many([(name, account_id)])
+
+    def store_many(self, pairs: Iterable[tuple[str, str | None]]) -> int:
+        """Record several resolutions in one transaction; return rows written."""
+        now = self._clock()
+        rows = [(self._site, _normalize(n), a, now) for n, a in pairs if n]
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO accounts"
+                    " (site, name, account_id, stored_at) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error:
+            return 0
+        return len(rows)
@@ -0,0 +1,145 @@
+"""Pre-populate the display-name → accountId cache."""
+
+from __future__ import annotations
+
+import typer
+
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.concurrency import gather_limited
+from jira_utils.usercache import AccountCache
+
+app = typer.Typer(invoke_without_command=True)
+
+_PAGE_SIZE = 1000
+
+
+def _user_names(user: dict) -> list[tuple[str, str]]:
+    """(name, accountId) pairs a user can be looked up by."""
+    if not user.get("active", True):
+        return []
+    if user.get("accountType", "atlassian") != "atlassian":
+        return []
+    account_id = user["accountId"]
+    return [
+        (user[key], account_id)
+        for key in ("displayName", "emailAddress")
+        if user.get(key)
+    ]
+
+
+def _summary(cached: int, resolved: list[str], unresolved: list[str]) -> dict:
+    """Result payload shared by the sync and async variants."""
+    return {"cached": cached, "resolved": resolved, "unresolved": unresolved}
+
+
+def run_warm_users(
+    names: list[str] | None = None,
+    *,
+    client: JiraClient,
+    cache: AccountCache | None = None,
+) -> dict:
+    """Resolve names (or every active user on the site) into the account cache.
+
+    With ``names``, each one is looked up through ``client.resolve_account_id``
+    (construct the client with ``cache_mode="refresh"`` to bypass stale
+    entries). Without names, the full user directory is paged through and
+    stored by display name and email address.
+    """
+    if names:
+        resolved, unresolved = [], []
+        for name in names:
+            try:
+                client.resolve_account_id(name)
+            except ValueError:
+                unresolved.append(name)
+            else:
+                resolved.append(name)
+        return _summary(len(resolved), resolved, unresolved)
+
+    cache = cache or AccountCache(client.base_url)
+    cached = 0
+    start_at = 0
+    while True:
+        page = client.get(
+            "/rest/api/2/users/search",
+            params={"startAt": start_at, "maxResults": _PAGE_SIZE},
+        )
+        page = page or []
+        cached += cache.store_many(pair for user in page for pair in _user_names(user))
+        if len(page) < _PAGE_SIZE:
+            break
+        start_at += len(page)
+    return _summary(cached, [], [])
+
+
+async def run_warm_users_async(
+    names: list[str] | None = None,
+    *,
+    client: AsyncJiraClient,
+    cache: AccountCache | None = None,
+) -> dict:
+    """Async variant of run_warm_users; named lookups run concurrently."""
+    if names:
+        outcomes = await gather_limited(
+            (client.resolve_account_id(name) for name in names),
+            return_exceptions=True,
+        )
+        resolved, unresolved = [], []
+        for name, outcome in zip(names, outcomes, strict=True):
+            if isinstance(outcome, ValueError):
+                unresolved.append(name)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                resolved.append(name)
+        return _summary(len(resolved), resolved, unresolved)
+
+    cache = cache or AccountCache(client.base_url)
+    cached = 0
+    start_at = 0
+    while True:
+        page = await client.get(
+            "/rest/api/2/users/search",
+            params={"startAt": start_at, "maxResults": _PAGE_SIZE},
+        )
+        page = page or []
+        cached += cache.store_many(pair for user in page for pair in _user_names(user))
+        if len(page) < _PAGE_SIZE:
+            break
+        start_at += len(page)
+    return _summary(cached, [], [])
+
+
+@app.callback()
+def main(
+    names: str | None = typer.Option(
+        None,
+        "--names",
+        help="Comma-separated display names to resolve (default: every active user)",
+    ),
+    base_url: str = typer.Option(..., envvar="JIRA_URL", help="Jira base URL"),
+    username: str = typer.Option(..., envvar="JIRA_USERNAME", help="Jira username"),
+    api_token: str = typer.Option(..., envvar="JIRA_API_TOKEN", help="Jira API token"),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON"),
+) -> None:
+    """Pre-populate the accountId cache used for assignee resolution."""
+    from jira_utils._output import handle_error, output_json
+
+    try:
+        with JiraClient(
+            base_url=base_url.rstrip("/"),
+            username=username,
+            api_token=api_token,
+            cache_mode="refresh",
+        ) as client:
+            result = run_warm_users(
+                [n.strip() for n in names.split(",")] if names else None,
+                client=client,
+            )
+        output_json(result, pretty=pretty)
+    except Exception as exc:
+        handle_error(exc)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep rate-limit and cache state out of the real user cache dir."""
+    monkeypatch.setenv("JIRA_UTILS_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture(autouse=True)
+def _http_cache_off(monkeypatch):
+    """Disable the response and account caches unless a test opts back in."""
+    monkeypatch.setenv("JIRA_HTTP_CACHE", "off")
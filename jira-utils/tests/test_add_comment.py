@@ -1,9 +1,10 @@
 """Tests for add_comment command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.add_comment import run_add_comment
-from jira_utils.client import JiraClient
+from jira_utils.add_comment import run_add_comment, run_add_comment_async
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 
 class TestRunAddComment:
@@ -18,3 +19,16 @@ class TestRunAddComment:
             "/rest/api/2/issue/GFD-42/comment",
             json={"body": "Hello"},
         )
+
+
+class TestRunAddCommentAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.return_value = {"id": "10001", "body": "Hello"}
+
+        asyncio.run(run_add_comment_async("GFD-42", "Hello", client=client))
+
+        client.post.assert_awaited_once_with(
+            "/rest/api/2/issue/GFD-42/comment",
+            json={"body": "Hello"},
+        )
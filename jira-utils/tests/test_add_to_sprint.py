@@ -1,9 +1,10 @@
 """Tests for add_to_sprint command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.add_to_sprint import run_add_to_sprint
-from jira_utils.client import JiraClient
+from jira_utils.add_to_sprint import run_add_to_sprint, run_add_to_sprint_async
+from jira_utils.client import AsyncJiraClient, JiraClient
 
 
 class TestRunAddToSprint:
@@ -18,3 +19,16 @@ class TestRunAddToSprint:
             "/rest/agile/1.0/sprint/10/issue",
             json={"issues": ["GFD-1", "GFD-2"]},
         )
+
+
+class TestRunAddToSprintAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.return_value = None
+
+        asyncio.run(run_add_to_sprint_async(7, "GFD-1, GFD-2", client=client))
+
+        client.post.assert_awaited_once_with(
+            "/rest/agile/1.0/sprint/7/issue",
+            json={"issues": ["GFD-1", "GFD-2"]},
+        )
@@ -0,0 +1,248 @@
+"""Tests for batch command."""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from jira_utils.batch import app, run_batch, run_batch_async
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.simulator import JiraSimulator, SimulatorConfig
+
+
+def _comment(key, body):
+    return {"cmd": "add-comment", "args": {"issue_key": key, "body": body}}
+
+
+class _Recorder:
+    """Client post side effect logging comments with random latency."""
+
+    def __init__(self):
+        self.log = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def _leave(self, path, json):
+        with self._lock:
+            self.in_flight -= 1
+            self.log.append((path.split("/")[-2], json["body"]))
+        return {"id": "1"}
+
+    def __call__(self, path, json=None, **kwargs):
+        self._enter()
+        time.sleep(random.uniform(0, 0.01))  # noqa: S311
+        return self._leave(path, json)
+
+    async def async_call(self, path, json=None, **kwargs):
+        self._enter()
+        await asyncio.sleep(random.uniform(0, 0.01))  # noqa: S311
+        return self._leave(path, json)
+
+
+def _specs():
+    return [_comment(f"GFD-{i % 3}", f"c{i}") for i in range(30)]
+
+
+def _per_issue(log):
+    order = {}
+    for key, body in log:
+        order.setdefault(key, []).append(int(body[1:]))
+    return order
+
+
+class TestRunBatch:
+    def test_same_issue_runs_in_input_order(self):
+        recorder = _Recorder()
+        client = MagicMock(spec=JiraClient)
+        client.post.side_effect = recorder
+
+        results = list(run_batch(_specs(), concurrency=6, client=client))
+
+        assert [r["index"] for r in results] == list(range(30))
+        for indexes in _per_issue(recorder.log).values():
+            assert indexes == sorted(indexes)
+        assert 1 < recorder.peak <= 3
+
+    def test_independent_specs_run_concurrently(self):
+        recorder = _Recorder()
+        client = MagicMock(spec=JiraClient)
+        client.post.side_effect = recorder
+        specs = [_comment(f"GFD-{i}", "c0") for i in range(8)]
+
+        list(run_batch(specs, concurrency=4, client=client))
+
+        assert recorder.peak == 4
+
+    def test_errors_are_reported_per_spec(self):
+        sim = JiraSimulator(SimulatorConfig(issues=5))
+        specs = [
+            {"cmd": "get-issue", "args": {"issue-key": "GFD-1", "fields": "summary"}},
+            {"cmd": "get-issue", "args": {"issue_key": "GFD-999"}},
+            {"cmd": "no-such-command"},
+            {"cmd": "serve"},
+            {"cmd": "get-issue", "args": {"bogus": 1}},
+            {"cmd": "get-issue", "args": ["GFD-1"]},
+        ]
+        with JiraClient(**sim.client_options()) as client:
+            results = list(run_batch(specs, client=client))
+
+        assert results[0]["result"]["key"] == "GFD-1"
+        assert results[1]["status"] == 404
+        assert results[2]["error"] == "unsupported command: 'no-such-command'"
+        assert "unsupported" in results[3]["error"]
+        assert "bogus" in results[4]["error"]
+        assert results[5]["error"] == "args must be a JSON object"
+
+    def test_link_waits_for_earlier_spec_on_either_issue(self):
+        paths = []
+
+        def post(path, json=None, **kwargs):
+            if path.endswith("/comment"):
+                time.sleep(0.05)
+            paths.append(path)
+            return {}
+
+        client = MagicMock(spec=JiraClient)
+        client.post.side_effect = post
+        specs = [
+            _comment("GFD-2", "c0"),
+            {
+                "cmd": "create-issue-link",
+                "args": {"link_type": "Blocks", "inward": "GFD-1", "outward": "GFD-2"},
+            },
+        ]
+
+        list(run_batch(specs, concurrency=4, client=client))
+
+        assert paths == ["/rest/api/2/issue/GFD-2/comment", "/rest/api/2/issueLink"]
+
+    def test_create_specs_accept_parameter_and_option_names(self):
+        sim = JiraSimulator(SimulatorConfig(issues=2))
+        specs = [
+            {
+                "cmd": "create-issue",
+                "args": {"project": "GFD", "summary": "A", "issue_type": "Bug"},
+            },
+            {
+                "cmd": "create-issue",
+                "args": {"project": "GFD", "summary": "B", "type": "Task"},
+            },
+            {
+                "cmd": "create-issue-link",
+                "args": {"type": "Blocks", "inward": "GFD-1", "outward": "GFD-2"},
+            },
+        ]
+        with JiraClient(**sim.client_options()) as client:
+            results = list(run_batch(specs, client=client))
+            created = [
+                client.get(f"/rest/api/2/issue/{r['result']['key']}")
+                for r in results[:2]
+            ]
+
+        assert all("error" not in r for r in results), results
+        assert [i["fields"]["issuetype"]["name"] for i in created] == ["Bug", "Task"]
+
+    def test_get_issues_accepts_comma_separated_keys(self):
+        sim = JiraSimulator(SimulatorConfig(issues=5))
+        specs = [
+            {"cmd": "get-issues", "args": {"keys": "GFD-1,GFD-2", "fields": "summary"}},
+            {"cmd": "get-issues", "args": {"keys": "GFD-1,x)"}},
+        ]
+        with JiraClient(**sim.client_options()) as client:
+            results = list(run_batch(specs, client=client))
+
+        assert list(results[0]["result"]) == ["GFD-1", "GFD-2"]
+        assert results[0]["result"]["GFD-2"]["key"] == "GFD-2"
+        assert results[1]["error"] == "invalid issue key: 'X)'"
+
+    def test_rejects_bad_concurrency(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            list(run_batch([], concurrency=0, client=MagicMock(spec=JiraClient)))
+
+
+class TestRunBatchAsync:
+    def test_same_issue_runs_in_input_order(self):
+        recorder = _Recorder()
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.side_effect = recorder.async_call
+
+        async def collect():
+            return [
+                r async for r in run_batch_async(_specs(), concurrency=6, client=client)
+            ]
+
+        results = asyncio.run(collect())
+
+        assert [r["index"] for r in results] == list(range(30))
+        assert all("result" in r for r in results)
+        for indexes in _per_issue(recorder.log).values():
+            assert indexes == sorted(indexes)
+        assert recorder.peak > 1
+
+
+class TestBatchCli:
+    def _invoke(self, sim, lines):
+        with patch(
+            "jira_utils.batch.JiraClient",
+            side_effect=lambda **_: JiraClient(**sim.client_options()),
+        ):
+            return CliRunner().invoke(
+                app,
+                [],
+                input="\n".join(json.dumps(line) for line in lines) + "\n\n",
+                env={"JIRA_URL": "u", "JIRA_USERNAME": "u", "JIRA_API_TOKEN": "t"},
+            )
+
+    def test_streams_results_in_input_order(self):
+        sim = JiraSimulator(SimulatorConfig(issues=5))
+
+        result = self._invoke(
+            sim,
+            [
+                _comment("GFD-1", "first"),
+                {"cmd": "get-transitions", "args": {"issue_key": "GFD-2"}},
+                _comment("GFD-1", "second"),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        lines = [json.loads(line) for line in result.output.splitlines()]
+        assert [line["index"] for line in lines] == [0, 1, 2]
+        assert lines[0]["result"]["body"] == "first"
+        assert sim.requests["POST /rest/api/2/issue/{issue}/comment"] == 2
+
+    def test_exits_non_zero_when_a_spec_fails(self):
+        sim = JiraSimulator(SimulatorConfig(issues=5))
+
+        result = self._invoke(sim, [_comment("GFD-999", "x"), _comment("GFD-1", "y")])
+
+        assert result.exit_code == 1
+        lines = [json.loads(line) for line in result.output.splitlines()]
+        assert lines[0]["status"] == 404
+        assert "result" in lines[1]
+
+    def test_invalid_jsonl_runs_nothing(self):
+        sim = JiraSimulator(SimulatorConfig(issues=5))
+        with patch("jira_utils.batch.JiraClient") as mock_cls:
+            result = CliRunner().invoke(
+                app,
+                [],
+                input="not json\n",
+                env={"JIRA_URL": "u", "JIRA_USERNAME": "u", "JIRA_API_TOKEN": "t"},
+            )
+
+        assert result.exit_code == 1
+        assert "line 1" in result.output
+        mock_cls.assert_not_called()
+        assert not sim.requests
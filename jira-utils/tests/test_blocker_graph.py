@@ -0,0 +1,101 @@
+"""Tests for blocker-graph command."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from jira_utils.blocker_graph import app, run_blocker_graph, run_blocker_graph_async
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.simulator import JiraSimulator, SimulatorConfig
+
+
+def _issue(key, blocked_by=()):
+    return {
+        "key": key,
+        "fields": {
+            "summary": f"S {key}",
+            "status": {"name": "To Do"},
+            "issuelinks": [
+                {
+                    "type": {"inward": "is blocked by"},
+                    "inwardIssue": {
+                        "key": b,
+                        "fields": {"summary": f"S {b}", "status": {"name": "To Do"}},
+                    },
+                }
+                for b in blocked_by
+            ],
+        },
+    }
+
+
+_BOARD = {
+    "issues": [
+        _issue("GFD-1", blocked_by=["GFD-2"]),
+        _issue("GFD-2", blocked_by=["GFD-3"]),
+        _issue("GFD-3"),
+        _issue("GFD-4", blocked_by=["GFD-3"]),
+        _issue("GFD-5"),
+    ]
+}
+
+
+class TestRunBlockerGraph:
+    def test_summary(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.return_value = _BOARD
+
+        result = run_blocker_graph("GFD", client=client)
+
+        assert result["issues"] == 5
+        assert result["blocked"] == 3
+        assert result["top_unblockers"] == [
+            {"key": "GFD-3", "summary": "S GFD-3", "unblocks": 3}
+        ]
+        assert [s["key"] for s in result["critical_paths"][0]["path"]] == [
+            "GFD-3",
+            "GFD-2",
+            "GFD-1",
+        ]
+        assert result["order"][0] == "GFD-3"
+        assert result["cycles"] == []
+
+    def test_project_required(self):
+        with pytest.raises(ValueError, match="Project is required"):
+            run_blocker_graph("", client=MagicMock(spec=JiraClient))
+
+    def test_against_simulator(self):
+        sim = JiraSimulator(SimulatorConfig(issues=300, link_density=0.8))
+        with JiraClient(**sim.client_options()) as client:
+            result = run_blocker_graph("GFD", limit=3, client=client)
+
+        assert len(result["critical_paths"]) == 3
+        lengths = [p["length"] for p in result["critical_paths"]]
+        assert lengths == sorted(lengths, reverse=True)
+
+
+class TestRunBlockerGraphAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.return_value = _BOARD
+
+        result = asyncio.run(run_blocker_graph_async("GFD", client=client))
+
+        assert result["blocked"] == 3
+
+
+class TestCli:
+    def test_outputs_graph(self):
+        with patch("jira_utils.blocker_graph.JiraClient") as mock_cls:
+            mock_cls.return_value.__enter__.return_value.post.return_value = _BOARD
+            result = CliRunner().invoke(
+                app,
+                ["--project", "GFD", "--limit", "1"],
+                env={"JIRA_URL": "u", "JIRA_USERNAME": "u", "JIRA_API_TOKEN": "t"},
+            )
+
+        assert result.exit_code == 0
+        assert len(json.loads(result.stdout)["critical_paths"]) == 1
@@ -0,0 +1,131 @@
+"""Tests for the blocker dependency graph."""
+
+from jira_utils.blockers import BlockerGraph
+
+
+def _issue(key, status="To Do", blocked_by=(), blocks=()):
+    links = [
+        {
+            "type": {"inward": "is blocked by", "outward": "blocks"},
+            "inwardIssue": {
+                "key": k,
+                "fields": {"summary": f"S {k}", "status": {"name": s}},
+            },
+        }
+        for k, s in blocked_by
+    ]
+    links += [
+        {
+            "type": {"inward": "is blocked by", "outward": "blocks"},
+            "outwardIssue": {
+                "key": k,
+                "fields": {"summary": f"S {k}", "status": {"name": s}},
+            },
+        }
+        for k, s in blocks
+    ]
+    return {
+        "key": key,
+        "fields": {
+            "summary": f"S {key}",
+            "status": {"name": status},
+            "issuelinks": links,
+        },
+    }
+
+
+def _graph(*issues):
+    return BlockerGraph(issues, resolved_statuses={"Done", "Invalid"})
+
+
+def _chain():
+    """A blocked by B blocked by C; C also blocks D."""
+    return _graph(
+        _issue("A", blocked_by=[("B", "To Do")]),
+        _issue("B", blocked_by=[("C", "In Progress")], blocks=[("A", "To Do")]),
+        _issue("C", "In Progress", blocks=[("B", "To Do"), ("D", "To Do")]),
+        _issue("D", blocked_by=[("C", "In Progress")]),
+    )
+
+
+class TestBlockerGraph:
+    def test_direct_blockers(self):
+        graph = _chain()
+
+        assert graph.is_blocked("A")
+        assert not graph.is_blocked("C")
+        assert graph.blockers("A") == [
+            {"key": "B", "summary": "S B", "status": "To Do"}
+        ]
+
+    def test_resolved_blockers_ignored(self):
+        graph = _graph(
+            _issue("A", blocked_by=[("X", "Done"), ("Y", "Invalid")]),
+        )
+
+        assert not graph.is_blocked("A")
+        assert graph.blockers("A") == []
+
+    def test_off_board_blocker_uses_embedded_status(self):
+        graph = _graph(_issue("A", blocked_by=[("OPS-1", "In Progress")]))
+
+        assert graph.blockers("A")[0]["status"] == "In Progress"
+
+    def test_board_status_wins_over_embedded_copy(self):
+        graph = _graph(
+            _issue("A", blocked_by=[("B", "In Progress")]),
+            _issue("B", "Done"),
+        )
+
+        assert not graph.is_blocked("A")
+
+    def test_edge_found_from_blocker_side(self):
+        graph = _graph(_issue("C", blocks=[("A", "To Do")]), _issue("A"))
+
+        assert graph.is_blocked("A")
+        assert graph.unblocks("C") == 1
+
+    def test_transitive_downstream(self):
+        graph = _chain()
+
+        assert graph.downstream("C") == {"A", "B", "D"}
+        assert graph.unblocks("B") == 1
+        assert graph.unblocks("A") == 0
+
+    def test_topological_order(self):
+        order = _chain().order
+
+        assert order.index("C") < order.index("B") < order.index("A")
+        assert order.index("C") < order.index("D")
+
+    def test_cycles_are_reported_not_ordered(self):
+        graph = _graph(
+            _issue("A", blocked_by=[("B", "To Do")]),
+            _issue("B", blocked_by=[("A", "To Do")]),
+            _issue("C", blocked_by=[("A", "To Do")]),
+        )
+
+        assert graph.order == []
+        assert sorted(graph.cycles) == ["A", "B", "C"]
+        assert graph.critical_paths() == []
+
+    def test_critical_paths(self):
+        graph = _chain()
+
+        (path,) = graph.critical_paths()
+
+        assert path["length"] == 3
+        assert path["unblocks"] == 3
+        assert [step["key"] for step in path["path"]] == ["C", "B", "A"]
+
+    def test_critical_paths_limit(self):
+        graph = _graph(
+            _issue("A", blocked_by=[("B", "To Do")]),
+            _issue("C", blocked_by=[("D", "To Do")]),
+            _issue("E", blocked_by=[("F", "To Do"), ("D", "To Do")]),
+        )
+
+        paths = graph.critical_paths(limit=1)
+
+        assert len(paths) == 1
+        assert paths[0]["path"][0]["key"] == "D"
@@ -0,0 +1,110 @@
+"""Tests for the slotted board issue model."""
+
+import dataclasses
+import json
+from unittest.mock import patch
+
+import pytest
+
+from jira_utils._output import output_json
+from jira_utils.blockers import BlockerGraph
+from jira_utils.board_issue import Blocker, BoardIssue
+
+
+def _issue(key, status="To Do", assignee="Bot", blocked_by=()):
+    return json.loads(
+        json.dumps(
+            {
+                "key": key,
+                "fields": {
+                    "summary": f"S {key}",
+                    "status": {"name": status},
+                    "issuetype": {"name": "Task"},
+                    "priority": {"name": "High"},
+                    "assignee": {"displayName": assignee} if assignee else None,
+                    "parent": {"key": "GFD-100"},
+                    "labels": ["plan"],
+                    "issuelinks": [
+                        {
+                            "type": {"inward": "is blocked by"},
+                            "inwardIssue": {
+                                "key": b,
+                                "fields": {"summary": f"S {b}", "status": {"name": s}},
+                            },
+                        }
+                        for b, s in blocked_by
+                    ],
+                },
+            }
+        )
+    )
+
+
+def _board(*issues):
+    graph = BlockerGraph(issues, resolved_statuses={"Done"})
+    return [BoardIssue.from_issue(i, "to_do", graph) for i in issues]
+
+
+class TestBoardIssue:
+    def test_json_view_matches_dict_shape(self):
+        task, _ = _board(
+            _issue("GFD-1", blocked_by=[("GFD-2", "To Do")]), _issue("GFD-2")
+        )
+
+        assert task == {
+            "key": "GFD-1",
+            "summary": "S GFD-1",
+            "issue_type": "Task",
+            "priority": "High",
+            "assignee": "Bot",
+            "parent_key": "GFD-100",
+            "labels": ["plan"],
+            "blocked_by": [{"key": "GFD-2", "summary": "S GFD-2", "status": "To Do"}],
+            "unblocks": 0,
+        }
+        assert task.to_json() == dict(task)
+        assert list(task) == list(task.to_json())
+
+    def test_slotted_and_frozen(self):
+        (task,) = _board(_issue("GFD-1"))
+
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            task.key = "GFD-2"
+
+    def test_repeated_strings_are_interned(self):
+        first, second = _board(_issue("GFD-1"), _issue("GFD-2"))
+
+        assert first.status is second.status
+        assert first.assignee is second.assignee
+        assert first.column is second.column
+        assert first.labels[0] is second.labels[0]
+
+    def test_blocked_by_is_lazy_and_cached(self):
+        first, _ = _board(
+            _issue("GFD-1", blocked_by=[("GFD-2", "To Do")]), _issue("GFD-2")
+        )
+
+        graph = first._graph
+        with patch.object(graph, "blockers", wraps=graph.blockers) as blockers:
+            assert first.blocked_by == (Blocker("GFD-2", "S GFD-2", "To Do"),)
+            assert first.blocked_by is first.blocked_by
+
+        blockers.assert_called_once_with("GFD-1")
+
+    def test_attributes_outside_json_view(self):
+        (task,) = _board(_issue("GFD-1"))
+
+        assert task.column == "to_do"
+        assert task.status == "To Do"
+        assert "status" not in task
+        with pytest.raises(KeyError):
+            task["status"]
+
+    def test_output_json_serializes_board_issues(self, capsys):
+        (task,) = _board(_issue("GFD-1"))
+
+        output_json({"board_state": {"to_do": [task]}})
+
+        data = json.loads(capsys.readouterr().out)
+        assert data["board_state"]["to_do"][0] == task.to_json()
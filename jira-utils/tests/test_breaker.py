@@ -0,0 +1,286 @@
+"""Tests for the Jira circuit breaker."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from jira_utils.breaker import (
+    BreakerState,
+    CircuitBreaker,
+    CircuitOpenError,
+    is_failure,
+)
+from jira_utils.client import AsyncJiraClient, JiraApiError, JiraClient
+from jira_utils.ratelimit import RetryPolicy
+from jira_utils.simulator import JiraSimulator, SimulatorConfig
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(**kwargs):
+    clock = _Clock()
+    kwargs.setdefault("min_requests", 4)
+    kwargs.setdefault("reset_timeout", 10.0)
+    return CircuitBreaker(_clock=clock, **kwargs), clock
+
+
+def _half_open():
+    breaker, clock = _breaker()
+    for _ in range(4):
+        breaker.record(503)
+    clock.now = 10.0
+    return breaker
+
+
+class TestIsFailure:
+    @pytest.mark.parametrize("status", [None, 429, 500, 502, 503, 504])
+    def test_failures(self, status):
+        assert is_failure(status)
+
+    @pytest.mark.parametrize("status", [200, 204, 304, 400, 401, 404])
+    def test_not_failures(self, status):
+        assert not is_failure(status)
+
+
+class TestCircuitBreaker:
+    def test_stays_closed_below_min_requests(self):
+        breaker, _ = _breaker()
+        for _ in range(3):
+            breaker.record(503)
+
+        assert breaker.state is BreakerState.CLOSED
+        breaker.before_request()
+
+    def test_opens_at_failure_rate(self):
+        breaker, _ = _breaker(failure_rate=0.5)
+        for status in (200, 503, 200, 503):
+            breaker.record(status)
+
+        assert breaker.state is BreakerState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.retry_in == 10.0
+
+    def test_client_errors_do_not_open(self):
+        breaker, _ = _breaker()
+        for _ in range(10):
+            breaker.record(404)
+
+        assert breaker.state is BreakerState.CLOSED
+
+    def test_window_forgets_old_failures(self):
+        breaker, _ = _breaker(window=4, failure_rate=0.75)
+        for status in (503, 503, 200, 200, 200, 503):
+            breaker.record(status)
+
+        assert breaker.state is BreakerState.CLOSED
+
+    def test_half_open_after_timeout(self):
+        breaker, clock = _breaker()
+        for _ in range(4):
+            breaker.record(None)
+        clock.now = 9.0
+        assert breaker.retry_in() == 1.0
+
+        clock.now = 10.0
+
+        assert breaker.state is BreakerState.HALF_OPEN
+        assert breaker.retry_in() == 0.0
+
+    def test_half_open_admits_limited_trials(self):
+        breaker, clock = _breaker(half_open_requests=1)
+        for _ in range(4):
+            breaker.record(503)
+        clock.now = 10.0
+
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_trial_success_closes(self):
+        breaker, clock = _breaker()
+        for _ in range(4):
+            breaker.record(503)
+        clock.now = 10.0
+        breaker.before_request()
+
+        breaker.record(200)
+
+        assert breaker.state is BreakerState.CLOSED
+        assert breaker.snapshot() == {
+            "state": "closed",
+            "failures": 0,
+            "requests": 0,
+            "retry_in": 0.0,
+        }
+
+    def test_trial_failure_reopens_and_restarts_timer(self):
+        breaker, clock = _breaker()
+        for _ in range(4):
+            breaker.record(503)
+        clock.now = 10.0
+        breaker.before_request()
+
+        breaker.record(503)
+
+        assert breaker.state is BreakerState.OPEN
+        assert breaker.retry_in() == 10.0
+
+    def test_on_change_reports_transitions(self):
+        on_change = MagicMock()
+        breaker, clock = _breaker(on_change=on_change)
+        for _ in range(4):
+            breaker.record(503)
+        clock.now = 10.0
+        breaker.before_request()
+        breaker.record(200)
+
+        assert [c.args for c in on_change.call_args_list] == [
+            (BreakerState.CLOSED, BreakerState.OPEN),
+            (BreakerState.OPEN, BreakerState.HALF_OPEN),
+            (BreakerState.HALF_OPEN, BreakerState.CLOSED),
+        ]
+
+    def test_release_frees_trial_slot(self):
+        breaker = _half_open()
+        generation = breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.release(generation)
+
+        breaker.before_request()
+        assert breaker.state is BreakerState.HALF_OPEN
+
+    def test_late_closed_outcomes_leave_open_breaker_alone(self):
+        breaker, clock = _breaker(min_requests=5)
+        admitted = [breaker.before_request() for _ in range(8)]
+        for generation in admitted[:5]:
+            breaker.record(503, generation)
+        assert breaker.state is BreakerState.OPEN
+        opened = breaker.retry_in()
+
+        clock.now = 5.0
+        breaker.record(200, admitted[5])
+        breaker.record(503, admitted[6])
+
+        assert breaker.state is BreakerState.OPEN
+        assert breaker.retry_in() == opened - 5.0
+
+    def test_late_outcomes_do_not_decide_half_open(self):
+        breaker, clock = _breaker()
+        early = breaker.before_request()
+        for _ in range(4):
+            breaker.record(503)
+        clock.now = 10.0
+        trial = breaker.before_request()
+
+        breaker.record(200, early)
+        assert breaker.state is BreakerState.HALF_OPEN
+
+        breaker.record(200, trial)
+        assert breaker.state is BreakerState.CLOSED
+
+
+def _client(sim, breaker, **kwargs):
+    return JiraClient(**sim.client_options(), breaker=breaker, **kwargs)
+
+
+class TestClientBreaker:
+    @patch("jira_utils.client.time.sleep")
+    def test_outage_opens_breaker_and_short_circuits(self, mock_sleep):
+        sim = JiraSimulator(SimulatorConfig(issues=5, error_rate=1.0))
+        breaker, _ = _breaker()
+        with _client(sim, breaker) as client:
+            with pytest.raises(JiraApiError):
+                client.get("/rest/api/2/issue/GFD-1")
+            with pytest.raises(CircuitOpenError):
+                client.get("/rest/api/2/issue/GFD-2")
+
+        # Four attempts (one retried GET) opened the breaker; the second GET
+        # never reached the server.
+        assert sim.failed == 4
+        assert breaker.state is BreakerState.OPEN
+
+    def test_probe_bypasses_open_breaker_and_closes_it(self):
+        sim = JiraSimulator(SimulatorConfig(issues=5, error_rate=1.0))
+        breaker, clock = _breaker()
+        with _client(sim, breaker, retry=RetryPolicy(max_attempts=1)) as client:
+            for _ in range(4):
+                with pytest.raises(JiraApiError):
+                    client.get("/rest/api/2/issue/GFD-1")
+            assert breaker.state is BreakerState.OPEN
+
+            assert client.probe() is False
+            assert breaker.retry_in() == 10.0
+
+            sim.config.error_rate = 0.0
+            assert client.probe() is True
+            assert breaker.state is BreakerState.CLOSED
+            assert client.get("/rest/api/2/issue/GFD-1")["key"] == "GFD-1"
+
+        assert sim.requests["GET /rest/api/3/serverInfo"] == 2
+
+    def test_probe_transport_error_is_unhealthy(self):
+        breaker, _ = _breaker()
+        with patch("jira_utils.client.httpx.Client") as mock_cls:
+            mock_cls.return_value.get.side_effect = httpx.ConnectError("refused")
+            client = JiraClient(
+                base_url="https://x", username="u", api_token="t", breaker=breaker
+            )
+            assert client.probe() is False
+
+    def test_async_probe(self):
+        sim = JiraSimulator(SimulatorConfig(issues=5))
+        breaker, _ = _breaker()
+
+        async def run():
+            options = sim.client_options(asynchronous=True)
+            async with AsyncJiraClient(**options, breaker=breaker) as client:
+                return await client.probe()
+
+        assert asyncio.run(run()) is True
+
+    def test_unexpected_error_frees_half_open_trial(self):
+        sim = JiraSimulator(SimulatorConfig(issues=5))
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return sim.handle(request)
+
+        breaker = _half_open()
+        options = {**sim.client_options(), "transport": httpx.MockTransport(handler)}
+        with JiraClient(**options, breaker=breaker) as client:
+            with pytest.raises(RuntimeError):
+                client.get("/rest/api/2/issue/GFD-1")
+            assert client.get("/rest/api/2/issue/GFD-1")["key"] == "GFD-1"
+
+        assert breaker.state is BreakerState.CLOSED
+
+    def test_cancelled_async_trial_frees_slot(self):
+        sim = JiraSimulator(SimulatorConfig(issues=5, latency=5.0))
+        breaker = _half_open()
+
+        async def run():
+            options = sim.client_options(asynchronous=True)
+            async with AsyncJiraClient(**options, breaker=breaker) as client:
+                search = client.post("/rest/api/3/search/jql", json={"jql": ""})
+                task = asyncio.create_task(search)
+                await asyncio.sleep(0.01)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+            breaker.before_request()
+
+        asyncio.run(run())
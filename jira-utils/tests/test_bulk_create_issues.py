@@ -0,0 +1,161 @@
+"""Tests for bulk_create_issues command."""
+
+import asyncio
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from jira_utils.bulk_create_issues import (
+    app,
+    read_specs,
+    run_bulk_create_issues,
+    run_bulk_create_issues_async,
+)
+from jira_utils.client import AsyncJiraClient, JiraApiError, JiraClient
+
+
+def _spec(summary, **extra):
+    return {"project": "GFD", "summary": summary, "type": "Task", **extra}
+
+
+class TestReadSpecs:
+    def test_skips_blank_lines(self):
+        stream = io.StringIO('{"summary": "a"}\n\n{"summary": "b"}\n')
+
+        assert read_specs(stream) == [{"summary": "a"}, {"summary": "b"}]
+
+    def test_reports_bad_line(self):
+        with pytest.raises(ValueError, match="line 2"):
+            read_specs(io.StringIO('{"summary": "a"}\nnot json\n'))
+
+
+class TestRunBulkCreateIssues:
+    def test_resolves_each_assignee_once(self):
+        client = MagicMock(spec=JiraClient)
+        client.resolve_account_id.return_value = "abc-123"
+        client.post.return_value = {
+            "issues": [{"key": "GFD-1", "id": "1"}, {"key": "GFD-2", "id": "2"}],
+            "errors": [],
+        }
+
+        result = run_bulk_create_issues(
+            [_spec("A", assignee="matt"), _spec("B", assignee="matt")],
+            client=client,
+        )
+
+        client.resolve_account_id.assert_called_once_with("matt")
+        updates = client.post.call_args[1]["json"]["issueUpdates"]
+        assert updates[0]["fields"]["assignee"] == {"accountId": "abc-123"}
+        assert result["created"] == 2
+        assert result["results"][1] == {"index": 1, "key": "GFD-2", "id": "2"}
+
+    def test_chunks_requests(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.side_effect = [
+            {"issues": [{"key": "GFD-1"}, {"key": "GFD-2"}]},
+            {"issues": [{"key": "GFD-3"}]},
+        ]
+
+        result = run_bulk_create_issues(
+            [_spec("A"), _spec("B"), _spec("C")], chunk_size=2, client=client
+        )
+
+        assert client.post.call_count == 2
+        assert [r["key"] for r in result["results"]] == ["GFD-1", "GFD-2", "GFD-3"]
+
+    def test_maps_partial_failures(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.return_value = {
+            "issues": [{"key": "GFD-1"}, {"key": "GFD-3"}],
+            "errors": [
+                {
+                    "status": 400,
+                    "failedElementNumber": 1,
+                    "elementErrors": {"errors": {"summary": "too long"}},
+                }
+            ],
+        }
+
+        result = run_bulk_create_issues(
+            [_spec("A"), _spec("B"), _spec("C")], client=client
+        )
+
+        assert result["created"] == 2
+        assert result["results"][1] == {"index": 1, "error": "summary: too long"}
+        assert result["results"][2]["key"] == "GFD-3"
+
+    def test_invalid_specs_fail_locally(self):
+        client = MagicMock(spec=JiraClient)
+        client.resolve_account_id.side_effect = ValueError("No Jira user found")
+        client.post.return_value = {"issues": [{"key": "GFD-1"}]}
+
+        result = run_bulk_create_issues(
+            [{"summary": "no project"}, _spec("B", assignee="ghost"), _spec("C")],
+            client=client,
+        )
+
+        assert (
+            "missing required field(s): project, type" in result["results"][0]["error"]
+        )
+        assert result["results"][1]["error"] == "No Jira user found"
+        assert len(client.post.call_args[1]["json"]["issueUpdates"]) == 1
+        assert result["failed"] == 2
+
+    def test_rejected_chunk_marks_every_item(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.side_effect = JiraApiError(
+            400,
+            json.dumps(
+                {
+                    "issues": [],
+                    "errors": [
+                        {"failedElementNumber": 0, "elementErrors": {}, "status": 400},
+                        {"failedElementNumber": 1, "elementErrors": {}, "status": 400},
+                    ],
+                }
+            ),
+        )
+
+        result = run_bulk_create_issues([_spec("A"), _spec("B")], client=client)
+
+        assert result["failed"] == 2
+        assert result["results"][0]["error"] == "HTTP 400"
+
+
+class TestRunBulkCreateIssuesAsync:
+    def test_posts_chunks_concurrently(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.side_effect = [
+            {"issues": [{"key": "GFD-1"}]},
+            {"issues": [{"key": "GFD-2"}]},
+        ]
+
+        result = asyncio.run(
+            run_bulk_create_issues_async(
+                [_spec("A"), _spec("B")], chunk_size=1, client=client
+            )
+        )
+
+        assert client.post.await_count == 2
+        assert [r["key"] for r in result["results"]] == ["GFD-1", "GFD-2"]
+
+
+@patch("jira_utils.bulk_create_issues.JiraClient")
+class TestBulkCreateIssuesCli:
+    def test_reads_stdin_and_exits_nonzero_on_failure(self, mock_client_cls):
+        client = mock_client_cls.return_value.__enter__.return_value
+        client.post.return_value = {"issues": [{"key": "GFD-1"}]}
+        lines = "\n".join(json.dumps(s) for s in [_spec("A"), {"summary": "x"}])
+
+        result = CliRunner().invoke(
+            app,
+            [],
+            input=lines,
+            env={"JIRA_URL": "u", "JIRA_USERNAME": "u", "JIRA_API_TOKEN": "t"},
+        )
+
+        assert result.exit_code == 1
+        assert json.loads(result.output)["created"] == 1
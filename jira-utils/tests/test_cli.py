@@ -0,0 +1,67 @@
+"""Tests for the unified CLI entry point."""
+
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+from jira_utils.cli import _Commands, app
+
+_LOADED = (
+    "import sys, typer; from jira_utils.cli import app; "
+    "typer.main.get_command(app).get_command(None, {command!r}); "
+    "print(*sorted(m for m in sys.modules if m.startswith('jira_utils.')))"
+)
+
+
+def _run(code):
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def _loaded_modules(command):
+    return set(_run(_LOADED.format(command=command)).split())
+
+
+class TestLazyCommands:
+    def test_dispatch_imports_only_selected_command(self):
+        loaded = _loaded_modules("get-issue")
+
+        command_modules = set(_Commands.lazy_commands.values())
+        assert loaded & command_modules == {"jira_utils.get_issue"}
+
+    def test_cli_import_skips_httpx_and_metrics(self):
+        loaded = _run(
+            "import sys, jira_utils.cli; "
+            "print('httpx' in sys.modules, 'jira_utils.metrics' in sys.modules)"
+        )
+
+        assert loaded.split() == ["False", "False"]
+
+    def test_help_lists_every_command(self):
+        result = CliRunner().invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name in _Commands.lazy_commands:
+            assert name in result.output
+
+    def test_subcommand_help(self):
+        result = CliRunner().invoke(app, ["get-transitions", "--help"])
+
+        assert result.exit_code == 0
+        assert "--issue-key" in result.output
+
+    def test_typo_suggests_command(self):
+        result = CliRunner().invoke(app, ["get-isue"])
+
+        assert result.exit_code != 0
+        assert "get-issue" in result.output
+
+    def test_commands_map_to_modules_with_apps(self):
+        for module in _Commands.lazy_commands.values():
+            assert hasattr(__import__(module, fromlist=["app"]), "app")
@@ -1,10 +1,20 @@
 """Tests for JiraClient."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
-from jira_utils.client import JiraApiError, JiraClient, load_config
+from jira_utils.client import (
+    AsyncJiraClient,
+    JiraApiError,
+    JiraClient,
+    close_pools,
+    keep_pools,
+    load_config,
+)
+from jira_utils.ratelimit import RetryPolicy
 
 
 class TestLoadConfig:
@@ -41,6 +51,90 @@ class TestLoadConfig:
             load_config()
 
 
+@patch("jira_utils.client.httpx.Client")
+class TestSharedPools:
+    def _client(self, **options):
+        return JiraClient(
+            base_url="https://jira.test", username="u", api_token="t", **options
+        )
+
+    def test_private_pool_by_default(self, mock_http_cls):
+        with self._client():
+            pass
+
+        mock_http_cls.return_value.close.assert_called_once()
+
+    def test_kept_pools_are_shared_and_left_open(self, mock_http_cls):
+        keep_pools()
+        try:
+            with self._client() as first, self._client() as second:
+                assert first._http is second._http
+            self._client(timeout=5).close()
+
+            assert mock_http_cls.call_count == 2
+            mock_http_cls.return_value.close.assert_not_called()
+        finally:
+            close_pools()
+
+        assert mock_http_cls.return_value.close.call_count == 2
+
+    def test_custom_transport_not_shared(self, mock_http_cls):
+        keep_pools()
+        try:
+            client = self._client(transport=MagicMock())
+            client.close()
+        finally:
+            close_pools()
+
+        mock_http_cls.return_value.close.assert_called_once()
+
+
+class TestConnectionPool:
+    @patch("jira_utils.client.httpx.Client")
+    def test_builds_pooled_http2_client(self, mock_http_cls):
+        JiraClient(
+            base_url="https://jira.test",
+            username="user",
+            api_token="token",
+            max_connections=4,
+            max_keepalive_connections=2,
+        )
+
+        kwargs = mock_http_cls.call_args[1]
+        assert kwargs["base_url"] == "https://jira.test"
+        assert kwargs["auth"] == ("user", "token")
+        assert kwargs["headers"] == {"Accept": "application/json"}
+        assert kwargs["timeout"] == 30
+        assert kwargs["http2"] is True
+        assert kwargs["limits"].max_connections == 4
+        assert kwargs["limits"].max_keepalive_connections == 2
+
+    @patch("jira_utils.client.httpx.Client")
+    def test_reuses_one_http_client_across_calls(self, mock_http_cls):
+        resp = MagicMock()
+        resp.is_success = True
+        resp.content = b""
+        mock_http_cls.return_value.request.return_value = resp
+
+        client = JiraClient(base_url="https://jira.test", username="u", api_token="t")
+        client.get("/a")
+        client.post("/b")
+        client.put("/c")
+
+        mock_http_cls.assert_called_once()
+        assert mock_http_cls.return_value.request.call_count == 3
+
+    @patch("jira_utils.client.httpx.Client")
+    def test_context_manager_closes_pool(self, mock_http_cls):
+        with JiraClient(
+            base_url="https://jira.test", username="u", api_token="t"
+        ) as client:
+            assert isinstance(client, JiraClient)
+            mock_http_cls.return_value.close.assert_not_called()
+
+        mock_http_cls.return_value.close.assert_called_once()
+
+
 class TestRequest:
     def _make_client(self):
         return JiraClient(
@@ -49,8 +143,9 @@ class TestRequest:
             api_token="token",
         )
 
-    @patch("jira_utils.client.httpx.request")
-    def test_get_success(self, mock_request):
+    @patch("jira_utils.client.httpx.Client")
+    def test_get_success(self, mock_http_cls):
+        mock_request = mock_http_cls.return_value.request
         resp = MagicMock()
         resp.status_code = 200
         resp.is_success = True
@@ -61,17 +156,12 @@ class TestRequest:
 
         assert result == {"key": "GFD-1"}
         mock_request.assert_called_once_with(
-            "GET",
-            "https://jira.test/rest/api/2/issue/GFD-1",
-            params=None,
-            json=None,
-            auth=("user", "token"),
-            headers={"Accept": "application/json"},
-            timeout=30,
+            "GET", "/rest/api/2/issue/GFD-1", params=None, json=None, headers=None
         )
 
-    @patch("jira_utils.client.httpx.request")
-    def test_post_with_json(self, mock_request):
+    @patch("jira_utils.client.httpx.Client")
+    def test_post_with_json(self, mock_http_cls):
+        mock_request = mock_http_cls.return_value.request
         resp = MagicMock()
         resp.status_code = 201
         resp.is_success = True
@@ -85,8 +175,9 @@ class TestRequest:
         call_kwargs = mock_request.call_args[1]
         assert call_kwargs["json"] == payload
 
-    @patch("jira_utils.client.httpx.request")
-    def test_empty_body_returns_none(self, mock_request):
+    @patch("jira_utils.client.httpx.Client")
+    def test_empty_body_returns_none(self, mock_http_cls):
+        mock_request = mock_http_cls.return_value.request
         resp = MagicMock()
         resp.status_code = 204
         resp.is_success = True
@@ -96,8 +187,9 @@ class TestRequest:
         result = self._make_client().post("/rest/agile/1.0/backlog/issue")
         assert result is None
 
-    @patch("jira_utils.client.httpx.request")
-    def test_201_empty_body_returns_none(self, mock_request):
+    @patch("jira_utils.client.httpx.Client")
+    def test_201_empty_body_returns_none(self, mock_http_cls):
+        mock_request = mock_http_cls.return_value.request
         resp = MagicMock()
         resp.status_code = 201
         resp.is_success = True
@@ -107,8 +199,9 @@ class TestRequest:
         result = self._make_client().post("/rest/api/2/issueLink")
         assert result is None
 
-    @patch("jira_utils.client.httpx.request")
-    def test_error_raises(self, mock_request):
+    @patch("jira_utils.client.httpx.Client")
+    def test_error_raises(self, mock_http_cls):
+        mock_request = mock_http_cls.return_value.request
         resp = MagicMock()
         resp.status_code = 404
         resp.is_success = False
@@ -121,8 +214,9 @@ class TestRequest:
         assert exc_info.value.status_code == 404
         assert "Not Found" in str(exc_info.value)
 
-    @patch("jira_utils.client.httpx.request")
-    def test_get_with_params(self, mock_request):
+    @patch("jira_utils.client.httpx.Client")
+    def test_get_with_params(self, mock_http_cls):
+        mock_request = mock_http_cls.return_value.request
         resp = MagicMock()
         resp.status_code = 200
         resp.is_success = True
@@ -134,6 +228,110 @@ class TestRequest:
         assert call_kwargs["params"] == {"jql": "x"}
 
 
+def _resp(status, *, headers=None, body=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.is_success = 200 <= status < 300
+    resp.headers = headers or {}
+    resp.text = "err"
+    resp.content = b"{}" if body is not None else b""
+    resp.json.return_value = body
+    return resp
+
+
+@patch("jira_utils.client.time.sleep")
+@patch("jira_utils.client.httpx.Client")
+class TestRetry:
+    def _make_client(self, **kwargs):
+        return JiraClient(
+            base_url="https://jira.test",
+            username="user",
+            api_token="token",
+            rate_limited=False,
+            **kwargs,
+        )
+
+    def test_get_retried_on_503(self, mock_http_cls, mock_sleep):
+        mock_http_cls.return_value.request.side_effect = [
+            _resp(503),
+            _resp(200, body={"ok": True}),
+        ]
+
+        result = self._make_client().get("/x")
+
+        assert result == {"ok": True}
+        assert mock_http_cls.return_value.request.call_count == 2
+        mock_sleep.assert_called_once()
+
+    def test_retry_after_honoured(self, mock_http_cls, mock_sleep):
+        mock_http_cls.return_value.request.side_effect = [
+            _resp(429, headers={"Retry-After": "2"}),
+            _resp(200, body={}),
+        ]
+
+        self._make_client().get("/x")
+
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_post_not_retried_by_default(self, mock_http_cls, mock_sleep):
+        mock_http_cls.return_value.request.return_value = _resp(503)
+
+        with pytest.raises(JiraApiError):
+            self._make_client().post("/x", json={})
+
+        assert mock_http_cls.return_value.request.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_idempotent_post_retried(self, mock_http_cls, mock_sleep):
+        mock_http_cls.return_value.request.side_effect = [
+            _resp(429),
+            _resp(200, body={"issues": []}),
+        ]
+
+        result = self._make_client().post("/search", json={}, idempotent=True)
+
+        assert result == {"issues": []}
+
+    def test_gives_up_after_max_attempts(self, mock_http_cls, mock_sleep):
+        mock_http_cls.return_value.request.return_value = _resp(503)
+
+        with pytest.raises(JiraApiError) as exc_info:
+            self._make_client(retry=RetryPolicy(max_attempts=3)).get("/x")
+
+        assert exc_info.value.status_code == 503
+        assert mock_http_cls.return_value.request.call_count == 3
+
+    def test_client_error_not_retried(self, mock_http_cls, mock_sleep):
+        mock_http_cls.return_value.request.return_value = _resp(400)
+
+        with pytest.raises(JiraApiError):
+            self._make_client().get("/x")
+
+        assert mock_http_cls.return_value.request.call_count == 1
+
+    def test_transport_error_retried(self, mock_http_cls, mock_sleep):
+        mock_http_cls.return_value.request.side_effect = [
+            httpx.ConnectError("boom"),
+            _resp(200, body={"ok": True}),
+        ]
+
+        assert self._make_client().get("/x") == {"ok": True}
+
+    def test_rate_limited_request_waits_for_token(
+        self, mock_http_cls, mock_sleep, monkeypatch
+    ):
+        monkeypatch.setenv("JIRA_RATE_LIMIT", "1")
+        monkeypatch.setenv("JIRA_RATE_BURST", "1")
+        mock_http_cls.return_value.request.return_value = _resp(200, body={})
+        client = JiraClient(base_url="https://jira.test", username="u", api_token="t")
+
+        client.get("/a")
+        client.get("/b")
+
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 1
+
+
 class TestResolveAccountId:
     def _make_client(self):
         return JiraClient(
@@ -142,8 +340,9 @@ class TestResolveAccountId:
             api_token="token",
         )
 
-    @patch("jira_utils.client.httpx.request")
-    def test_resolves_display_name(self, mock_request):
+    @patch("jira_utils.client.httpx.Client")
+    def test_resolves_display_name(self, mock_http_cls):
+        mock_request = mock_http_cls.return_value.request
         resp = MagicMock()
         resp.status_code = 200
         resp.is_success = True
@@ -159,8 +358,9 @@ class TestResolveAccountId:
         call_kwargs = mock_request.call_args[1]
         assert call_kwargs["params"] == {"query": "Jane Doe"}
 
-    @patch("jira_utils.client.httpx.request")
-    def test_raises_on_no_match(self, mock_request):
+    @patch("jira_utils.client.httpx.Client")
+    def test_raises_on_no_match(self, mock_http_cls):
+        mock_request = mock_http_cls.return_value.request
         resp = MagicMock()
         resp.status_code = 200
         resp.is_success = True
@@ -171,10 +371,103 @@ class TestResolveAccountId:
         with pytest.raises(ValueError, match="No Jira user found"):
             self._make_client().resolve_account_id("Nobody")
 
-    @patch("jira_utils.client.httpx.request")
-    def test_returns_accountid_as_is(self, mock_request):
+    @patch("jira_utils.client.httpx.Client")
+    def test_returns_accountid_as_is(self, mock_http_cls):
+        mock_request = mock_http_cls.return_value.request
         """If input looks like an accountId (contains ':'), skip the lookup."""
         result = self._make_client().resolve_account_id("712020:f516654f-76e2")
 
         assert result == "712020:f516654f-76e2"
         mock_request.assert_not_called()
+
+    @patch("jira_utils.client.httpx.Client")
+    def test_cached_across_clients(self, mock_http_cls, monkeypatch):
+        monkeypatch.setenv("JIRA_HTTP_CACHE", "use")
+        mock_request = mock_http_cls.return_value.request
+        mock_request.return_value = _resp(200, body=[{"accountId": "abc-123"}])
+
+        first = self._make_client().resolve_account_id("Jane Doe")
+        second = self._make_client().resolve_account_id("jane  doe")
+
+        assert first == second == "abc-123"
+        assert mock_request.call_count == 1
+
+    @patch("jira_utils.client.httpx.Client")
+    def test_negative_result_cached(self, mock_http_cls, monkeypatch):
+        monkeypatch.setenv("JIRA_HTTP_CACHE", "use")
+        mock_request = mock_http_cls.return_value.request
+        mock_request.return_value = _resp(200, body=[])
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="No Jira user found"):
+                self._make_client().resolve_account_id("Nobody")
+
+        assert mock_request.call_count == 1
+
+
+class TestAsyncJiraClient:
+    def _make_client(self):
+        return AsyncJiraClient(
+            base_url="https://jira.test",
+            username="user",
+            api_token="token",
+        )
+
+    @patch("jira_utils.client.httpx.AsyncClient")
+    def test_builds_pooled_async_client(self, mock_http_cls):
+        self._make_client()
+
+        kwargs = mock_http_cls.call_args[1]
+        assert kwargs["base_url"] == "https://jira.test"
+        assert kwargs["auth"] == ("user", "token")
+        assert kwargs["http2"] is True
+
+    @patch("jira_utils.client.httpx.AsyncClient")
+    def test_get_success(self, mock_http_cls):
+        resp = MagicMock()
+        resp.is_success = True
+        resp.json.return_value = {"key": "GFD-1"}
+        mock_http_cls.return_value.request = AsyncMock(return_value=resp)
+
+        result = asyncio.run(self._make_client().get("/rest/api/2/issue/GFD-1"))
+
+        assert result == {"key": "GFD-1"}
+        mock_http_cls.return_value.request.assert_awaited_once_with(
+            "GET", "/rest/api/2/issue/GFD-1", params=None, json=None, headers=None
+        )
+
+    @patch("jira_utils.client.httpx.AsyncClient")
+    def test_error_raises(self, mock_http_cls):
+        resp = MagicMock()
+        resp.status_code = 404
+        resp.is_success = False
+        resp.text = "Not Found"
+        mock_http_cls.return_value.request = AsyncMock(return_value=resp)
+
+        with pytest.raises(JiraApiError) as exc_info:
+            asyncio.run(self._make_client().post("/rest/api/2/issue", json={}))
+
+        assert exc_info.value.status_code == 404
+
+    @patch("jira_utils.client.httpx.AsyncClient")
+    def test_resolves_display_name(self, mock_http_cls):
+        resp = MagicMock()
+        resp.is_success = True
+        resp.json.return_value = [{"accountId": "abc-123"}]
+        mock_http_cls.return_value.request = AsyncMock(return_value=resp)
+
+        result = asyncio.run(self._make_client().resolve_account_id("Jane Doe"))
+
+        assert result == "abc-123"
+
+    @patch("jira_utils.client.httpx.AsyncClient")
+    def test_async_context_manager_closes_pool(self, mock_http_cls):
+        mock_http_cls.return_value.aclose = AsyncMock()
+
+        async def use():
+            async with self._make_client() as client:
+                assert isinstance(client, AsyncJiraClient)
+
+        asyncio.run(use())
+
+        mock_http_cls.return_value.aclose.assert_awaited_once()
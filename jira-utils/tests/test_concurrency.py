@@ -0,0 +1,51 @@
+"""Tests for bounded-concurrency helpers."""
+
+import asyncio
+
+import pytest
+
+from jira_utils.concurrency import gather_limited
+
+
+class TestGatherLimited:
+    def test_preserves_input_order(self):
+        async def delayed(value, delay):
+            await asyncio.sleep(delay)
+            return value
+
+        result = asyncio.run(
+            gather_limited([delayed("a", 0.02), delayed("b", 0), delayed("c", 0.01)])
+        )
+
+        assert result == ["a", "b", "c"]
+
+    def test_caps_in_flight_awaitables(self):
+        in_flight = 0
+        peak = 0
+
+        async def tracked():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+
+        asyncio.run(gather_limited([tracked() for _ in range(20)], limit=3))
+
+        assert peak == 3
+
+    def test_returns_exceptions_when_asked(self):
+        async def boom():
+            raise RuntimeError("boom")
+
+        async def ok():
+            return 1
+
+        result = asyncio.run(gather_limited([ok(), boom()], return_exceptions=True))
+
+        assert result[0] == 1
+        assert isinstance(result[1], RuntimeError)
+
+    def test_rejects_non_positive_limit(self):
+        with pytest.raises(ValueError, match="limit"):
+            asyncio.run(gather_limited([], limit=0))
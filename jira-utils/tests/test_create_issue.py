@@ -1,9 +1,10 @@
 """Tests for create_issue command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.client import JiraClient
-from jira_utils.create_issue import run_create_issue
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.create_issue import run_create_issue, run_create_issue_async
 
 
 class TestRunCreateIssue:
@@ -48,3 +49,22 @@ class TestRunCreateIssue:
         assert fields["assignee"] == {"accountId": "abc-123"}
         assert fields["components"] == [{"name": "Frontend"}, {"name": "API"}]
         assert fields["priority"] == {"name": "High"}
+
+
+class TestRunCreateIssueAsync:
+    def test_resolves_assignee_and_posts(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.return_value = {"key": "GFD-101"}
+        client.resolve_account_id.return_value = "abc-123"
+
+        result = asyncio.run(
+            run_create_issue_async(
+                "GFD", "Async issue", "Task", assignee="matt", client=client
+            )
+        )
+
+        assert result["key"] == "GFD-101"
+        client.resolve_account_id.assert_awaited_once_with("matt")
+        fields = client.post.call_args[1]["json"]["fields"]
+        assert fields["assignee"] == {"accountId": "abc-123"}
+        assert fields["summary"] == "Async issue"
@@ -1,9 +1,13 @@
 """Tests for create_issue_link command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.client import JiraClient
-from jira_utils.create_issue_link import run_create_issue_link
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.create_issue_link import (
+    run_create_issue_link,
+    run_create_issue_link_async,
+)
 
 
 class TestRunCreateIssueLink:
@@ -22,3 +26,22 @@ class TestRunCreateIssueLink:
                 "outwardIssue": {"key": "GFD-2"},
             },
         )
+
+
+class TestRunCreateIssueLinkAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.return_value = None
+
+        asyncio.run(
+            run_create_issue_link_async("Blocks", "GFD-1", "GFD-2", client=client)
+        )
+
+        client.post.assert_awaited_once_with(
+            "/rest/api/2/issueLink",
+            json={
+                "type": {"name": "Blocks"},
+                "inwardIssue": {"key": "GFD-1"},
+                "outwardIssue": {"key": "GFD-2"},
+            },
+        )
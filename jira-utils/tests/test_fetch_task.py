@@ -1,11 +1,22 @@
 """Tests for fetch-task command."""
 
-from unittest.mock import MagicMock
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
+from typer.testing import CliRunner
 
-from jira_utils.client import JiraClient
-from jira_utils.fetch_task import run_fetch_task
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.fetch_task import (
+    _WIP_LIMITS,
+    app,
+    fetch_board_issues,
+    run_fetch_task,
+    run_fetch_task_async,
+)
+from jira_utils.snapshot import BoardSnapshot
 
 
 def _issue(
@@ -414,3 +425,401 @@ class TestEnvVarFallbacks:
         result = run_fetch_task("GFD", "Bot", client=client)
 
         assert result["selected_task"]["key"] == "GFD-1"
+
+
+class TestRunFetchTaskAsync:
+    def test_paginates_and_selects(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.side_effect = [
+            _search_response(
+                [_issue("GFD-1", "To Do", assignee="Bot")], next_page_token="p2"
+            ),
+            _search_response([_issue("GFD-2", "Review", assignee="Bot")]),
+        ]
+        client.get.return_value = {"displayName": "Bot"}
+
+        result = asyncio.run(run_fetch_task_async("GFD", client=client))
+
+        assert client.post.await_count == 2
+        assert client.post.call_args[1]["json"]["nextPageToken"] == "p2"
+        assert result["selected_task"]["key"] == "GFD-2"
+        assert result["selected_column"] == "review"
+
+
+class TestRunFetchTaskLazy:
+    def _client(self, columns, count=0):
+        """Mock client answering per-column searches from ``columns``."""
+        client = MagicMock(spec=JiraClient)
+
+        def post(path, json, **kwargs):
+            if path.endswith("approximate-count"):
+                return {"count": count}
+            status = json["jql"].split('IN ("')[1].split('"')[0]
+            return _search_response(columns.get(status, []))
+
+        client.post.side_effect = post
+        return client
+
+    def _jqls(self, client):
+        return [
+            c[1]["json"]["jql"]
+            for c in client.post.call_args_list
+            if "search/jql" in c[0][0]
+        ]
+
+    def test_stops_at_first_eligible_column(self):
+        client = self._client(
+            {"In Progress": [_issue("GFD-1", "In Progress", assignee="Bot")]},
+            count=40,
+        )
+
+        result = run_fetch_task("GFD", "Bot", client=client, lazy=True)
+
+        assert result["selected_task"]["key"] == "GFD-1"
+        assert self._jqls(client) == [
+            'project = GFD AND status IN ("In Progress") ORDER BY rank ASC'
+        ]
+        assert client.post.call_count == 1
+        assert result["fetch_stats"] == {
+            "columns_fetched": ["in_progress"],
+            "issues_downloaded": 1,
+        }
+
+    def test_board_counts_count_full_board(self):
+        client = self._client(
+            {"In Progress": [_issue("GFD-1", "In Progress", assignee="Bot")]},
+            count=40,
+        )
+
+        result = run_fetch_task(
+            "GFD", "Bot", client=client, lazy=True, board_counts=True
+        )
+
+        assert client.post.call_count == 2
+        assert result["fetch_stats"] == {
+            "columns_fetched": ["in_progress"],
+            "issues_downloaded": 1,
+            "board_issues": 40,
+        }
+
+    def test_cli_board_counts_flag(self):
+        client = self._client(
+            {"In Progress": [_issue("GFD-1", "In Progress", assignee="Bot")]},
+            count=40,
+        )
+        with patch("jira_utils.fetch_task.JiraClient") as mock_cls:
+            mock_cls.return_value.__enter__.return_value = client
+            result = CliRunner().invoke(
+                app,
+                [
+                    "--project",
+                    "GFD",
+                    "--assigned-to-user-name",
+                    "Bot",
+                    "--lazy",
+                    "--board-counts",
+                ],
+                env={"JIRA_URL": "u", "JIRA_USERNAME": "u", "JIRA_API_TOKEN": "t"},
+            )
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout)["fetch_stats"]["board_issues"] == 40
+
+    def test_fetches_downstream_columns_for_wip_checks(self):
+        client = self._client(
+            {"To Do": [_issue("GFD-1", "To Do", assignee="Bot")]},
+        )
+
+        result = run_fetch_task("GFD", "Bot", client=client, lazy=True)
+
+        assert result["selected_column"] == "to_do"
+        # Columns are fetched in the order the selection first needs them:
+        # to_do is pulled in early for plan_review's WIP check.
+        assert result["fetch_stats"]["columns_fetched"] == [
+            "in_progress",
+            "review",
+            "to_do",
+            "plan_review",
+            "planning",
+        ]
+
+    def test_skips_column_when_downstream_full(self):
+        review = [_issue(f"GFD-{n}", "Review") for n in range(3)]
+        client = self._client(
+            {"Review": review, "To Do": [_issue("GFD-9", "To Do", assignee="Bot")]}
+        )
+
+        result = run_fetch_task("GFD", "Bot", client=client, lazy=True)
+
+        assert result["selected_task"] is None
+        assert "to_do" in result["board_state"]
+
+    def test_rejects_snapshot(self, tmp_path):
+        from jira_utils.snapshot import BoardSnapshot
+
+        snapshot = BoardSnapshot("x", "GFD", path=tmp_path / "b.db")
+
+        with pytest.raises(ValueError, match="lazy"):
+            run_fetch_task(
+                "GFD", "Bot", client=MagicMock(), snapshot=snapshot, lazy=True
+            )
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("user", ["Agent One", "Agent Two", "Human Reviewer"])
+    def test_same_selection_as_full_fetch(self, seed, user):
+        from jira_utils.simulator import JiraSimulator, SimulatorConfig
+
+        sim = JiraSimulator(SimulatorConfig(issues=120, link_density=1.0, seed=seed))
+        with JiraClient(**sim.client_options()) as client:
+            full = run_fetch_task("GFD", user, client=client)
+            lazy = run_fetch_task(
+                "GFD", user, client=client, lazy=True, board_counts=True
+            )
+
+        def without_unblocks(task):
+            # Lazy mode only counts downstream issues within a fetched column.
+            return {k: v for k, v in (task or {}).items() if k != "unblocks"}
+
+        assert without_unblocks(lazy["selected_task"]) == without_unblocks(
+            full["selected_task"]
+        )
+        assert lazy["reason"] == full["reason"]
+        for column, tasks in lazy["board_state"].items():
+            expected = full["board_state"].get(column, [])
+            assert list(map(without_unblocks, tasks)) == list(
+                map(without_unblocks, expected)
+            )
+        assert lazy["fetch_stats"]["board_issues"] == sum(
+            len(t) for t in full["board_state"].values()
+        )
+
+    def test_async(self):
+        from jira_utils.simulator import JiraSimulator, SimulatorConfig
+
+        sim = JiraSimulator(SimulatorConfig(issues=200))
+
+        async def run(lazy):
+            options = sim.client_options(asynchronous=True)
+            async with AsyncJiraClient(**options) as client:
+                return await run_fetch_task_async(
+                    "GFD", "Agent One", client=client, lazy=lazy, board_counts=True
+                )
+
+        full, lazy = asyncio.run(run(False)), asyncio.run(run(True))
+
+        assert lazy["selected_task"] == full["selected_task"]
+        stats = lazy["fetch_stats"]
+        assert stats["issues_downloaded"] < stats["board_issues"]
+
+
+class TestFavorUnblocking:
+    def _board(self):
+        # GFD-2 blocks two issues; GFD-1 is ranked higher but blocks nothing.
+        return _search_response(
+            [
+                _issue("GFD-1", "To Do", assignee="Bot"),
+                _issue("GFD-2", "To Do", assignee="Bot"),
+                _issue("GFD-3", "To Do", issuelinks=[_blocker_link("GFD-2", "To Do")]),
+                _issue("GFD-4", "To Do", issuelinks=[_blocker_link("GFD-3", "To Do")]),
+            ]
+        )
+
+    def test_rank_order_by_default(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.return_value = self._board()
+
+        result = run_fetch_task("GFD", "Bot", client=client)
+
+        assert result["selected_task"]["key"] == "GFD-1"
+        assert result["selected_task"]["unblocks"] == 0
+
+    def test_prefers_task_unblocking_most_work(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.return_value = self._board()
+
+        result = run_fetch_task("GFD", "Bot", client=client, favor_unblocking=True)
+
+        assert result["selected_task"]["key"] == "GFD-2"
+        assert result["selected_task"]["unblocks"] == 2
+
+
+class TestProvidedIssues:
+    def test_selects_from_given_issues_without_search(self):
+        client = MagicMock(spec=JiraClient)
+        issues = [_issue("GFD-1", "Review", assignee="Bot")]
+
+        result = run_fetch_task("GFD", "Bot", client=client, issues=issues)
+
+        assert result["selected_task"]["key"] == "GFD-1"
+        client.post.assert_not_called()
+
+    def test_round_trips_fetch_board_issues(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.return_value = _search_response(
+            [_issue("GFD-1", "To Do", assignee="Bot")]
+        )
+
+        issues = fetch_board_issues("GFD", client=client)
+        result = run_fetch_task("GFD", "Bot", client=client, issues=issues)
+
+        assert [i["key"] for i in issues] == ["GFD-1"]
+        assert result["selected_task"]["key"] == "GFD-1"
+        client.post.assert_called_once()
+
+    def test_rejects_other_sources(self):
+        client = MagicMock(spec=JiraClient)
+
+        with pytest.raises(ValueError, match="issues cannot be combined"):
+            run_fetch_task("GFD", "Bot", client=client, issues=[], lazy=True)
+
+    def test_async(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        issues = [_issue("GFD-1", "Review", assignee="Bot")]
+
+        result = asyncio.run(
+            run_fetch_task_async("GFD", "Bot", client=client, issues=issues)
+        )
+
+        assert result["selected_task"]["key"] == "GFD-1"
+        client.post.assert_not_called()
+
+
+class TestMultiProject:
+    def _client(self, boards, delay=0.0):
+        """Mock client answering board searches per project from ``boards``."""
+        client = MagicMock(spec=JiraClient)
+
+        def post(path, json, **kwargs):
+            time.sleep(delay)
+            project = json["jql"].split("project = ")[1].split(" ")[0]
+            return _search_response(boards.get(project, []))
+
+        client.post.side_effect = post
+        return client
+
+    def test_merges_boards_in_project_order(self):
+        client = self._client(
+            {
+                "GFD": [_issue("GFD-1", "To Do", assignee="Bot")],
+                "OPS": [
+                    _issue("OPS-1", "To Do", assignee="Bot"),
+                    _issue("OPS-2", "Review", assignee="Bot"),
+                ],
+            }
+        )
+
+        result = run_fetch_task("GFD,OPS", "Bot", client=client)
+
+        assert result["projects"] == ["GFD", "OPS"]
+        assert [t["key"] for t in result["board_state"]["to_do"]] == [
+            "GFD-1",
+            "OPS-1",
+        ]
+        # Column priority still wins over project order.
+        assert result["selected_task"]["key"] == "OPS-2"
+
+    def test_wip_limits_apply_per_project(self):
+        review = [
+            _issue(f"GFD-{n}", "Review", assignee="Human")
+            for n in range(10, 10 + _WIP_LIMITS["review"])
+        ]
+        client = self._client(
+            {
+                "GFD": [*review, _issue("GFD-1", "To Do", assignee="Bot")],
+                "OPS": [_issue("OPS-1", "To Do", assignee="Bot")],
+            }
+        )
+
+        result = run_fetch_task(["GFD", "OPS"], "Bot", client=client)
+
+        assert result["selected_task"]["key"] == "OPS-1"
+
+    def test_projects_fetched_concurrently(self):
+        boards = {p: [_issue(f"{p}-1", "To Do")] for p in ("A", "B", "C", "D")}
+        client = self._client(boards, delay=0.2)
+
+        started = time.perf_counter()
+        result = run_fetch_task(list(boards), "Bot", client=client)
+        elapsed = time.perf_counter() - started
+
+        assert len(result["board_state"]["to_do"]) == 4
+        assert elapsed < 0.6
+
+    def test_single_project_result_unchanged(self):
+        client = self._client({"GFD": [_issue("GFD-1", "To Do", assignee="Bot")]})
+
+        result = run_fetch_task(["GFD"], "Bot", client=client)
+
+        assert "projects" not in result
+        assert result["selected_task"]["key"] == "GFD-1"
+
+    def test_rejects_unsupported_combinations(self, tmp_path):
+        client = MagicMock(spec=JiraClient)
+        snapshot = BoardSnapshot("https://x", "GFD", path=tmp_path / "b.db")
+
+        with pytest.raises(ValueError, match="single project"):
+            run_fetch_task("GFD,OPS", "Bot", client=client, lazy=True)
+        with pytest.raises(ValueError, match="one board snapshot per project"):
+            run_fetch_task("GFD,OPS", "Bot", client=client, snapshot=snapshot)
+        with pytest.raises(ValueError, match="Project is required"):
+            run_fetch_task(" , ", "Bot", client=client)
+
+    def test_snapshot_per_project(self, tmp_path):
+        client = self._client(
+            {
+                "GFD": [_issue("GFD-1", "To Do", assignee="Bot")],
+                "OPS": [_issue("OPS-1", "To Do", assignee="Bot")],
+            }
+        )
+        snapshots = {
+            p: BoardSnapshot("https://x", p, path=tmp_path / "b.db")
+            for p in ("GFD", "OPS")
+        }
+
+        run_fetch_task("GFD,OPS", "Bot", client=client, snapshot=snapshots)
+
+        assert [i["key"] for i in snapshots["OPS"].issues()] == ["OPS-1"]
+
+    def test_fetch_board_issues(self):
+        client = self._client(
+            {"GFD": [_issue("GFD-1", "To Do")], "OPS": [_issue("OPS-1", "To Do")]}
+        )
+
+        issues = fetch_board_issues(["OPS", "GFD"], client=client)
+
+        assert [i["key"] for i in issues] == ["OPS-1", "GFD-1"]
+
+    def test_async(self):
+        boards = {
+            "GFD": _search_response([_issue("GFD-1", "To Do", assignee="Bot")]),
+            "OPS": _search_response([_issue("OPS-1", "Review", assignee="Bot")]),
+        }
+        client = MagicMock(spec=AsyncJiraClient)
+
+        async def post(path, json, **kwargs):
+            await asyncio.sleep(0)
+            return boards[json["jql"].split("project = ")[1].split(" ")[0]]
+
+        client.post.side_effect = post
+
+        result = asyncio.run(run_fetch_task_async("GFD,OPS", "Bot", client=client))
+
+        assert result["selected_task"]["key"] == "OPS-1"
+        assert result["projects"] == ["GFD", "OPS"]
+
+    def test_cli_accepts_comma_separated_projects(self):
+        with patch("jira_utils.fetch_task.JiraClient") as mock_cls:
+            mock_cls.return_value.__enter__.return_value = self._client(
+                {
+                    "GFD": [_issue("GFD-1", "To Do", assignee="Bot")],
+                    "OPS": [_issue("OPS-1", "To Do", assignee="Bot")],
+                }
+            )
+            result = CliRunner().invoke(
+                app,
+                ["--project", "GFD,OPS", "--assigned-to-user-name", "Bot"],
+                env={"JIRA_URL": "u", "JIRA_USERNAME": "u", "JIRA_API_TOKEN": "t"},
+            )
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)["projects"] == ["GFD", "OPS"]
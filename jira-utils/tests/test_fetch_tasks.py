@@ -0,0 +1,185 @@
+"""Tests for fetch-tasks command."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.fetch_task import _WIP_LIMITS
+from jira_utils.fetch_tasks import app, run_fetch_tasks, run_fetch_tasks_async
+from jira_utils.simulator import JiraSimulator, SimulatorConfig
+
+
+def _issue(key, status, *, assignee=None, issue_type="Task"):
+    return {
+        "key": key,
+        "fields": {
+            "summary": f"Summary for {key}",
+            "status": {"name": status},
+            "issuetype": {"name": issue_type},
+            "priority": {"name": "Medium"},
+            "assignee": {"displayName": assignee} if assignee else None,
+            "parent": None,
+            "labels": [],
+            "issuelinks": [],
+        },
+    }
+
+
+def _client(issues):
+    client = MagicMock(spec=JiraClient)
+    client.post.return_value = {"issues": issues}
+    return client
+
+
+def _keys(result):
+    return [(a["agent"], a["task"]["key"]) for a in result["assignments"]]
+
+
+class TestRunFetchTasks:
+    def test_one_distinct_task_per_agent(self):
+        client = _client(
+            [
+                _issue("T-1", "In Progress", assignee="Bot"),
+                _issue("T-2", "In Progress", assignee="Bot"),
+                _issue("T-3", "To Do", assignee="Other"),
+            ]
+        )
+
+        result = run_fetch_tasks("T", ["Bot", "Bot 2", "Bot"], n=2, client=client)
+
+        assert _keys(result) == [("Bot", "T-1"), ("Bot", "T-2")]
+        assert result["unassigned"] == [
+            {"agent": "Bot 2", "reason": "No eligible tasks found for Bot 2"}
+        ]
+        client.post.assert_called_once()
+
+    def test_agent_dropped_once_out_of_tasks(self):
+        client = _client([_issue("T-1", "In Progress", assignee="A")])
+
+        result = run_fetch_tasks("T", ["A", "A", "B"], n=5, client=client)
+
+        assert _keys(result) == [("A", "T-1")]
+        assert [u["agent"] for u in result["unassigned"]] == ["B"]
+
+    def test_round_robin_up_to_n(self):
+        client = _client(
+            [
+                _issue("T-1", "In Progress", assignee="A"),
+                _issue("T-2", "In Progress", assignee="A"),
+                _issue("T-3", "In Progress", assignee="B"),
+                _issue("T-4", "In Progress", assignee="A"),
+            ]
+        )
+
+        result = run_fetch_tasks("T", ["A", "B"], n=3, client=client)
+
+        assert _keys(result) == [("A", "T-1"), ("B", "T-3"), ("A", "T-2")]
+        assert result["unassigned"] == []
+
+    def test_reserved_wip_blocks_later_picks(self):
+        # Review has room for one more task; only the first to_do pick fits.
+        review = [
+            _issue(f"R-{i}", "Review", assignee="X")
+            for i in range(_WIP_LIMITS["review"] - 1)
+        ]
+        client = _client(
+            [
+                *review,
+                _issue("T-1", "To Do", assignee="A"),
+                _issue("T-2", "To Do", assignee="B"),
+            ]
+        )
+
+        result = run_fetch_tasks("T", ["A", "B"], client=client)
+
+        assert _keys(result) == [("A", "T-1")]
+        assert result["reserved_wip"] == {"review": 1}
+        assert result["unassigned"][0]["agent"] == "B"
+
+    def test_epics_do_not_reserve_wip(self):
+        review = [
+            _issue(f"R-{i}", "Review", assignee="X")
+            for i in range(_WIP_LIMITS["review"] - 1)
+        ]
+        client = _client(
+            [
+                *review,
+                _issue("E-1", "To Do", assignee="A", issue_type="Epic"),
+                _issue("T-2", "To Do", assignee="B"),
+            ]
+        )
+
+        result = run_fetch_tasks("T", ["A", "B"], client=client)
+
+        assert _keys(result) == [("A", "E-1"), ("B", "T-2")]
+
+    def test_limit_reached_reason(self):
+        client = _client([_issue("T-1", "In Progress", assignee="A")])
+
+        result = run_fetch_tasks("T", ["A", "B"], n=1, client=client)
+
+        assert result["unassigned"] == [
+            {"agent": "B", "reason": "Plan limit of 1 tasks reached"}
+        ]
+
+    def test_defaults_to_current_user(self):
+        client = _client([_issue("T-1", "In Progress", assignee="Me")])
+        client.get.return_value = {"displayName": "Me"}
+
+        result = run_fetch_tasks("T", client=client)
+
+        assert _keys(result) == [("Me", "T-1")]
+
+    def test_validation(self):
+        with pytest.raises(ValueError, match="Project is required"):
+            run_fetch_tasks("", ["A"], client=MagicMock(spec=JiraClient))
+        with pytest.raises(ValueError, match="n must be"):
+            run_fetch_tasks("T", ["A"], n=-1, client=MagicMock(spec=JiraClient))
+
+    def test_against_simulator(self):
+        config = SimulatorConfig(issues=400, link_density=0.3)
+        sim = JiraSimulator(config)
+        with JiraClient(**sim.client_options()) as client:
+            result = run_fetch_tasks("GFD", list(config.users), n=20, client=client)
+
+        keys = [a["task"]["key"] for a in result["assignments"]]
+        assert len(keys) == len(set(keys))
+        board = result["board_state"]
+        for column, used in result["reserved_wip"].items():
+            current = sum(1 for t in board.get(column, []) if t["issue_type"] != "Epic")
+            assert current + used <= max(_WIP_LIMITS[column], current)
+
+
+class TestRunFetchTasksAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.return_value = {
+            "issues": [_issue("T-1", "In Progress", assignee="A")]
+        }
+
+        result = asyncio.run(run_fetch_tasks_async("T", ["A"], client=client))
+
+        assert _keys(result) == [("A", "T-1")]
+
+
+class TestCli:
+    def test_outputs_plan(self):
+        with patch("jira_utils.fetch_tasks.JiraClient") as mock_cls:
+            mock_cls.return_value.__enter__.return_value.post.return_value = {
+                "issues": [
+                    _issue("T-1", "In Progress", assignee="A"),
+                    _issue("T-2", "In Progress", assignee="B"),
+                ]
+            }
+            result = CliRunner().invoke(
+                app,
+                ["--project", "T", "--agents", "A, B", "--n", "2"],
+                env={"JIRA_URL": "u", "JIRA_USERNAME": "u", "JIRA_API_TOKEN": "t"},
+            )
+
+        assert result.exit_code == 0
+        assert _keys(json.loads(result.stdout)) == [("A", "T-1"), ("B", "T-2")]
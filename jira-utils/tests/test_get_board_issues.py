@@ -1,9 +1,17 @@
 """Tests for get_board_issues command."""
 
-from unittest.mock import MagicMock
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
 
-from jira_utils.client import JiraClient
-from jira_utils.get_board_issues import run_get_board_issues
+from typer.testing import CliRunner
+
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.get_board_issues import (
+    app,
+    run_get_board_issues,
+    run_get_board_issues_async,
+)
 
 
 class TestRunGetBoardIssues:
@@ -36,3 +44,44 @@ class TestRunGetBoardIssues:
                 "fields": "summary",
             },
         )
+
+
+class TestRunGetBoardIssuesAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.get.return_value = {"issues": []}
+
+        asyncio.run(run_get_board_issues_async(1, jql="status = Done", client=client))
+
+        client.get.assert_awaited_once_with(
+            "/rest/agile/1.0/board/1/issue",
+            params={"maxResults": 50, "startAt": 0, "jql": "status = Done"},
+        )
+
+
+@patch("jira_utils.get_board_issues.JiraClient")
+class TestGetBoardIssuesCli:
+    def _invoke(self, *args):
+        return CliRunner().invoke(
+            app,
+            ["--board-id", "1", *args],
+            env={"JIRA_URL": "u", "JIRA_USERNAME": "u", "JIRA_API_TOKEN": "t"},
+        )
+
+    def test_ndjson_streams_one_issue_per_line(self, mock_client_cls):
+        client = mock_client_cls.return_value.__enter__.return_value
+        client.get.return_value = {"issues": [{"key": "GFD-1"}, {"key": "GFD-2"}]}
+
+        result = self._invoke("--ndjson")
+
+        assert result.exit_code == 0, result.output
+        lines = result.output.splitlines()
+        assert [json.loads(line)["key"] for line in lines] == ["GFD-1", "GFD-2"]
+
+    def test_default_writes_one_document(self, mock_client_cls):
+        client = mock_client_cls.return_value.__enter__.return_value
+        client.get.return_value = {"issues": [{"key": "GFD-1"}], "total": 1}
+
+        result = self._invoke()
+
+        assert json.loads(result.output) == {"issues": [{"key": "GFD-1"}], "total": 1}
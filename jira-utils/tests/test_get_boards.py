@@ -1,9 +1,10 @@
 """Tests for get_boards command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.client import JiraClient
-from jira_utils.get_boards import run_get_boards
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.get_boards import run_get_boards, run_get_boards_async
 
 
 class TestRunGetBoards:
@@ -37,3 +38,15 @@ class TestRunGetBoards:
             "/rest/agile/1.0/board",
             params={"name": "Sprint", "type": "scrum"},
         )
+
+
+class TestRunGetBoardsAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.get.return_value = {"values": []}
+
+        asyncio.run(run_get_boards_async(project="GFD", client=client))
+
+        client.get.assert_awaited_once_with(
+            "/rest/agile/1.0/board", params={"projectKeyOrId": "GFD"}
+        )
@@ -1,9 +1,10 @@
 """Tests for get_issue command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.client import JiraClient
-from jira_utils.get_issue import run_get_issue
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.get_issue import run_get_issue, run_get_issue_async
 
 
 class TestRunGetIssue:
@@ -33,3 +34,15 @@ class TestRunGetIssue:
 
         result = run_get_issue("GFD-1", client=client)
         assert result["key"] == "GFD-1"
+
+
+class TestRunGetIssueAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.get.return_value = {"key": "GFD-42"}
+
+        asyncio.run(run_get_issue_async("GFD-42", fields="summary", client=client))
+
+        client.get.assert_awaited_once_with(
+            "/rest/api/2/issue/GFD-42", params={"fields": "summary"}
+        )
@@ -0,0 +1,222 @@
+"""Tests for get_issues command."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from jira_utils.client import AsyncJiraClient, JiraApiError, JiraClient
+from jira_utils.get_issues import app, run_get_issues, run_get_issues_async
+from jira_utils.simulator import JiraSimulator, SimulatorConfig
+
+
+def _unknown(*keys):
+    messages = [
+        f"An issue with key '{k}' does not exist for field 'key'." for k in keys
+    ]
+    return json.dumps({"errorMessages": messages, "errors": {}})
+
+
+def _page(*keys):
+    return {"issues": [{"key": k, "fields": {}} for k in keys], "isLast": True}
+
+
+class TestRunGetIssues:
+    def test_single_chunk(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.return_value = _page("GFD-2", "GFD-1")
+
+        result = run_get_issues(["GFD-1", "GFD-2"], fields="summary", client=client)
+
+        assert list(result) == ["GFD-1", "GFD-2"]
+        assert result["GFD-2"]["key"] == "GFD-2"
+        client.post.assert_called_once_with(
+            "/rest/api/3/search/jql",
+            json={
+                "jql": 'key in ("GFD-1", "GFD-2")',
+                "maxResults": 100,
+                "fields": ["summary"],
+            },
+            idempotent=True,
+        )
+
+    def test_missing_keys_map_to_none(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.return_value = _page("GFD-1")
+
+        result = run_get_issues(["GFD-1", "GFD-404"], client=client)
+
+        assert result == {"GFD-1": {"key": "GFD-1", "fields": {}}, "GFD-404": None}
+
+    def test_normalises_and_deduplicates_keys(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.return_value = _page("GFD-1")
+
+        result = run_get_issues([" gfd-1", "GFD-1", ""], client=client)
+
+        assert list(result) == ["GFD-1"]
+        client.post.assert_called_once()
+
+    def test_accepts_comma_separated_string(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.return_value = _page("GFD-1", "GFD-2")
+
+        result = run_get_issues("GFD-1, gfd-2,", client=client)
+
+        assert list(result) == ["GFD-1", "GFD-2"]
+        assert client.post.call_args[1]["json"]["jql"] == 'key in ("GFD-1", "GFD-2")'
+
+    @pytest.mark.parametrize("key", ['GFD-1") OR ("x', "GFD", "1-GFD", "GFD-1a"])
+    def test_rejects_malformed_keys_before_searching(self, key):
+        client = MagicMock(spec=JiraClient)
+
+        with pytest.raises(ValueError, match="invalid issue key"):
+            run_get_issues(["GFD-2", key], client=client)
+        client.post.assert_not_called()
+
+    def test_no_keys_no_requests(self):
+        client = MagicMock(spec=JiraClient)
+
+        assert run_get_issues([], client=client) == {}
+        client.post.assert_not_called()
+
+    def test_chunks_keys(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.side_effect = lambda path, json, idempotent: _page(
+            *[k.strip('"') for k in json["jql"][8:-1].split(", ")]
+        )
+
+        result = run_get_issues(
+            [f"GFD-{n}" for n in range(5)], chunk_size=2, client=client
+        )
+
+        assert client.post.call_count == 3
+        assert all(result.values())
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            run_get_issues(["GFD-1"], chunk_size=0, client=MagicMock(spec=JiraClient))
+
+    def test_against_simulator(self):
+        sim = JiraSimulator(SimulatorConfig(issues=250))
+        keys = [f"GFD-{n}" for n in range(1, 251, 2)] + ["GFD-999"]
+        with JiraClient(**sim.client_options()) as client:
+            result = run_get_issues(
+                keys, fields="summary", chunk_size=50, client=client
+            )
+
+        assert len(result) == 126
+        assert result["GFD-999"] is None
+        assert result["GFD-7"]["fields"] == {"summary": "Simulated issue 7"}
+        # The chunk holding GFD-999 is rejected once and searched again.
+        assert sim.requests["POST /rest/api/3/search/jql"] == 4
+        assert sim.requests["GET /rest/api/2/issue/{issue}"] == 0
+
+    def test_unknown_key_does_not_fail_its_chunk(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.side_effect = [
+            JiraApiError(400, _unknown("GFD-404", "GFD-405")),
+            _page("GFD-1", "GFD-2"),
+        ]
+
+        result = run_get_issues(["GFD-1", "GFD-404", "GFD-2", "GFD-405"], client=client)
+
+        assert result == {
+            "GFD-1": {"key": "GFD-1", "fields": {}},
+            "GFD-404": None,
+            "GFD-2": {"key": "GFD-2", "fields": {}},
+            "GFD-405": None,
+        }
+        retry = client.post.call_args_list[1].kwargs["json"]["jql"]
+        assert retry == 'key in ("GFD-1", "GFD-2")'
+
+    def test_unnamed_rejection_is_bisected(self):
+        def search(path, json, idempotent):
+            if "GFD-3" in json["jql"]:
+                raise JiraApiError(400, '{"errorMessages": ["bad key"]}')
+            return _page(*[k.strip('"') for k in json["jql"][8:-1].split(", ")])
+
+        client = MagicMock(spec=JiraClient)
+        client.post.side_effect = search
+
+        with pytest.raises(JiraApiError):
+            run_get_issues(["GFD-1", "GFD-2", "GFD-3", "GFD-4"], client=client)
+
+        searched = [c.kwargs["json"]["jql"] for c in client.post.call_args_list]
+        assert searched[-1] == 'key in ("GFD-3")'
+
+    def test_other_errors_propagate(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.side_effect = JiraApiError(401, "unauthorized")
+
+        with pytest.raises(JiraApiError):
+            run_get_issues(["GFD-1"], client=client)
+
+        client.post.assert_called_once()
+
+    def test_moved_and_deleted_keys_against_simulator(self):
+        sim = JiraSimulator(SimulatorConfig(issues=10))
+        new_key = sim.move_issue("GFD-3", "OPS")
+
+        with JiraClient(**sim.client_options()) as client:
+            result = run_get_issues(["GFD-1", "GFD-3", "GFD-404"], client=client)
+
+        assert result["GFD-1"]["key"] == "GFD-1"
+        assert result["GFD-3"]["key"] == new_key == "OPS-1"
+        assert result["GFD-404"] is None
+        assert sim.requests["POST /rest/api/3/search/jql"] == 2
+        assert sim.requests["GET /rest/api/2/issue/{issue}"] == 1
+
+
+class TestRunGetIssuesAsync:
+    def test_chunks_searched_concurrently(self):
+        sim = JiraSimulator(SimulatorConfig(issues=40))
+        keys = [f"GFD-{n}" for n in range(1, 41)]
+
+        async def run():
+            options = sim.client_options(asynchronous=True)
+            async with AsyncJiraClient(**options) as client:
+                return await run_get_issues_async(keys, chunk_size=10, client=client)
+
+        result = asyncio.run(run())
+
+        assert list(result) == keys
+        assert all(result.values())
+        assert sim.requests["POST /rest/api/3/search/jql"] == 4
+
+    def test_moved_and_unknown_keys(self):
+        sim = JiraSimulator(SimulatorConfig(issues=10))
+        sim.move_issue("GFD-2", "OPS")
+
+        async def run():
+            options = sim.client_options(asynchronous=True)
+            async with AsyncJiraClient(**options) as client:
+                return await run_get_issues_async(
+                    ["GFD-1", "GFD-2", "GFD-99"], client=client
+                )
+
+        result = asyncio.run(run())
+
+        assert result["GFD-1"]["key"] == "GFD-1"
+        assert result["GFD-2"]["key"] == "OPS-1"
+        assert result["GFD-99"] is None
+
+
+class TestCli:
+    def test_outputs_issues_by_key(self):
+        with patch("jira_utils.get_issues.JiraClient") as mock_cls:
+            client = mock_cls.return_value.__enter__.return_value
+            client.post.return_value = _page("GFD-1")
+            result = CliRunner().invoke(
+                app,
+                ["--keys", "GFD-1,GFD-2"],
+                env={"JIRA_URL": "u", "JIRA_USERNAME": "u", "JIRA_API_TOKEN": "t"},
+            )
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == {
+            "GFD-1": {"key": "GFD-1", "fields": {}},
+            "GFD-2": None,
+        }
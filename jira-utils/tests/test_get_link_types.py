@@ -1,9 +1,10 @@
 """Tests for get_link_types command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.client import JiraClient
-from jira_utils.get_link_types import run_get_link_types
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.get_link_types import run_get_link_types, run_get_link_types_async
 
 
 class TestRunGetLinkTypes:
@@ -35,3 +36,15 @@ class TestRunGetLinkTypes:
 
         assert len(result["issueLinkTypes"]) == 1
         assert result["issueLinkTypes"][0]["name"] == "Blocks"
+
+
+class TestRunGetLinkTypesAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.get.return_value = {
+            "issueLinkTypes": [{"name": "Blocks"}, {"name": "Relates"}]
+        }
+
+        result = asyncio.run(run_get_link_types_async(filter="block", client=client))
+
+        assert result["issueLinkTypes"] == [{"name": "Blocks"}]
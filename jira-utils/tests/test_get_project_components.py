@@ -1,9 +1,13 @@
 """Tests for get_project_components command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.client import JiraClient
-from jira_utils.get_project_components import run_get_project_components
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.get_project_components import (
+    run_get_project_components,
+    run_get_project_components_async,
+)
 
 
 class TestRunGetProjectComponents:
@@ -15,3 +19,13 @@ class TestRunGetProjectComponents:
 
         assert len(result) == 2
         client.get.assert_called_once_with("/rest/api/2/project/GFD/components")
+
+
+class TestRunGetProjectComponentsAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.get.return_value = [{"name": "API"}]
+
+        asyncio.run(run_get_project_components_async("GFD", client=client))
+
+        client.get.assert_awaited_once_with("/rest/api/2/project/GFD/components")
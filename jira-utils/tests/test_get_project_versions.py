@@ -1,9 +1,13 @@
 """Tests for get_project_versions command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.client import JiraClient
-from jira_utils.get_project_versions import run_get_project_versions
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.get_project_versions import (
+    run_get_project_versions,
+    run_get_project_versions_async,
+)
 
 
 class TestRunGetProjectVersions:
@@ -15,3 +19,13 @@ class TestRunGetProjectVersions:
 
         assert len(result) == 2
         client.get.assert_called_once_with("/rest/api/2/project/GFD/versions")
+
+
+class TestRunGetProjectVersionsAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.get.return_value = [{"name": "1.0"}]
+
+        asyncio.run(run_get_project_versions_async("GFD", client=client))
+
+        client.get.assert_awaited_once_with("/rest/api/2/project/GFD/versions")
@@ -1,9 +1,10 @@
 """Tests for get_sprints command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.client import JiraClient
-from jira_utils.get_sprints import run_get_sprints
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.get_sprints import run_get_sprints, run_get_sprints_async
 
 
 class TestRunGetSprints:
@@ -28,3 +29,15 @@ class TestRunGetSprints:
             "/rest/agile/1.0/board/1/sprint",
             params={"state": "active"},
         )
+
+
+class TestRunGetSprintsAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.get.return_value = {"values": []}
+
+        asyncio.run(run_get_sprints_async(3, state="active", client=client))
+
+        client.get.assert_awaited_once_with(
+            "/rest/agile/1.0/board/3/sprint", params={"state": "active"}
+        )
@@ -1,9 +1,10 @@
 """Tests for get_transitions command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.client import JiraClient
-from jira_utils.get_transitions import run_get_transitions
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.get_transitions import run_get_transitions, run_get_transitions_async
 
 
 class TestRunGetTransitions:
@@ -20,3 +21,13 @@ class TestRunGetTransitions:
 
         assert len(result["transitions"]) == 2
         client.get.assert_called_once_with("/rest/api/2/issue/GFD-42/transitions")
+
+
+class TestRunGetTransitionsAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.get.return_value = {"transitions": []}
+
+        asyncio.run(run_get_transitions_async("GFD-42", client=client))
+
+        client.get.assert_awaited_once_with("/rest/api/2/issue/GFD-42/transitions")
@@ -0,0 +1,183 @@
+"""Tests for the conditional-GET response cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from jira_utils.cli import app
+from jira_utils.client import JiraClient
+from jira_utils.httpcache import ResponseCache, cache_mode_from_env, ttl_for
+
+
+def _resp(status, *, body=None, headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.is_success = 200 <= status < 300
+    resp.headers = headers or {}
+    resp.content = b"{}" if body is not None else b""
+    resp.json.return_value = body
+    return resp
+
+
+class TestTtlFor:
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("/rest/agile/1.0/board", 3600),
+            ("/rest/agile/1.0/board/7/sprint", 300),
+            ("/rest/api/2/issueLinkType", 86400),
+            ("/rest/api/2/project/GFD/components", 3600),
+            ("/rest/api/2/project/GFD/versions", 3600),
+            ("/rest/api/2/issue/GFD-1", 0),
+            ("/rest/api/2/issue/GFD-1/transitions", None),
+            ("/rest/api/3/myself", None),
+        ],
+    )
+    def test_rules(self, path, expected):
+        assert ttl_for(path) == expected
+
+
+class TestCacheModeFromEnv:
+    def test_default_use(self, monkeypatch):
+        monkeypatch.delenv("JIRA_HTTP_CACHE")
+        assert cache_mode_from_env() == "use"
+
+    def test_rejects_unknown(self, monkeypatch):
+        monkeypatch.setenv("JIRA_HTTP_CACHE", "sometimes")
+        with pytest.raises(ValueError, match="JIRA_HTTP_CACHE"):
+            cache_mode_from_env()
+
+
+class TestResponseCache:
+    def _cache(self, tmp_path, mode="use"):
+        return ResponseCache("https://jira.test", "user", mode=mode, root=tmp_path)
+
+    def test_round_trip(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.store(
+            "/rest/agile/1.0/board",
+            {"name": "x"},
+            _resp(200, headers={"ETag": '"v1"'}),
+            {"values": [1]},
+        )
+
+        entry = cache.lookup("/rest/agile/1.0/board", {"name": "x"})
+
+        assert entry.body == {"values": [1]}
+        assert entry.validators() == {"If-None-Match": '"v1"'}
+        assert cache.fresh(entry)
+
+    def test_params_are_part_of_key(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.store("/rest/agile/1.0/board", {"name": "x"}, _resp(200), {})
+
+        assert cache.lookup("/rest/agile/1.0/board", {"name": "y"}) is None
+
+    def test_users_do_not_share_entries(self, tmp_path):
+        self._cache(tmp_path).store("/rest/agile/1.0/board", None, _resp(200), {})
+        other = ResponseCache("https://jira.test", "someone-else", root=tmp_path)
+
+        assert other.lookup("/rest/agile/1.0/board", None) is None
+
+    def test_zero_ttl_without_validators_not_stored(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.store("/rest/api/2/issue/GFD-1", None, _resp(200), {"key": "GFD-1"})
+
+        assert cache.lookup("/rest/api/2/issue/GFD-1", None) is None
+
+    def test_zero_ttl_entry_is_stale(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.store(
+            "/rest/api/2/issue/GFD-1",
+            None,
+            _resp(200, headers={"ETag": '"e"'}),
+            {"key": "GFD-1"},
+        )
+
+        entry = cache.lookup("/rest/api/2/issue/GFD-1", None)
+        assert entry is not None
+        assert not cache.fresh(entry)
+
+    def test_expires_after_ttl(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache._clock = lambda: 1000.0
+        cache.store("/rest/agile/1.0/board/1/sprint", None, _resp(200), {})
+        cache._clock = lambda: 1000.0 + 301
+
+        assert not cache.fresh(cache.lookup("/rest/agile/1.0/board/1/sprint", None))
+
+    def test_refresh_mode_skips_lookup(self, tmp_path):
+        self._cache(tmp_path).store("/rest/agile/1.0/board", None, _resp(200), {})
+
+        refresh = self._cache(tmp_path, mode="refresh")
+        assert refresh.lookup("/rest/agile/1.0/board", None) is None
+
+
+@patch("jira_utils.client.httpx.Client")
+class TestClientCaching:
+    def _make_client(self):
+        return JiraClient(
+            base_url="https://jira.test",
+            username="user",
+            api_token="token",
+            rate_limited=False,
+            cache_mode="use",
+        )
+
+    def test_fresh_entry_skips_network(self, mock_http_cls):
+        mock_request = mock_http_cls.return_value.request
+        mock_request.return_value = _resp(200, body={"values": ["b"]})
+        client = self._make_client()
+
+        first = client.get("/rest/agile/1.0/board")
+        second = client.get("/rest/agile/1.0/board")
+
+        assert first == second == {"values": ["b"]}
+        assert mock_request.call_count == 1
+
+    def test_revalidates_with_etag_and_uses_304(self, mock_http_cls):
+        mock_request = mock_http_cls.return_value.request
+        mock_request.side_effect = [
+            _resp(200, body={"key": "GFD-1"}, headers={"ETag": '"v1"'}),
+            _resp(304),
+        ]
+        client = self._make_client()
+
+        client.get("/rest/api/2/issue/GFD-1")
+        result = client.get("/rest/api/2/issue/GFD-1")
+
+        assert result == {"key": "GFD-1"}
+        assert mock_request.call_args[1]["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_non_get_not_cached(self, mock_http_cls):
+        mock_request = mock_http_cls.return_value.request
+        mock_request.return_value = _resp(200, body={"id": "1"})
+        client = self._make_client()
+
+        client.put("/rest/api/2/issue/GFD-1", json={})
+        client.put("/rest/api/2/issue/GFD-1", json={})
+
+        assert mock_request.call_count == 2
+
+
+class TestCliSwitches:
+    @pytest.mark.parametrize(
+        ("flag", "expected"), [("--no-cache", "off"), ("--refresh", "refresh")]
+    )
+    def test_flag_sets_cache_mode(self, flag, expected, monkeypatch):
+        monkeypatch.setenv("JIRA_URL", "https://jira.test")
+        monkeypatch.setenv("JIRA_USERNAME", "u")
+        monkeypatch.setenv("JIRA_API_TOKEN", "t")
+        monkeypatch.delenv("JIRA_HTTP_CACHE")
+        seen = {}
+
+        def fake_run(*args, client, **kwargs):
+            seen["mode"] = client._cache.mode if client._cache else "off"
+            return {}
+
+        with patch("jira_utils.get_boards.run_get_boards", side_effect=fake_run):
+            result = CliRunner().invoke(app, [flag, "get-boards"])
+
+        assert result.exit_code == 0, result.output
+        assert seen["mode"] == expected
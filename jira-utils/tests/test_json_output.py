@@ -0,0 +1,170 @@
+"""Tests for JSON output written as bytes to stdout."""
+
+import dataclasses
+import io
+import json
+import sys
+import types
+
+import pytest
+
+from jira_utils import json_output
+from jira_utils.blockers import BlockerGraph
+from jira_utils.board_issue import BoardIssue
+from jira_utils.json_output import dumps, output_json, output_ndjson
+
+_PASSTHROUGH_DATACLASS = 4
+
+
+@pytest.fixture
+def fake_orjson(monkeypatch):
+    """Stand-in for orjson recording its options.
+
+    Like orjson, it dumps dataclasses field by field unless told to pass them
+    through to ``default``.
+    """
+    calls = []
+
+    def orjson_dumps(data, default=None, option=0):
+        calls.append(option)
+
+        def fallback(value):
+            if dataclasses.is_dataclass(value) and not (
+                option & _PASSTHROUGH_DATACLASS
+            ):
+                return {
+                    f.name: getattr(value, f.name) for f in dataclasses.fields(value)
+                }
+            return default(value)
+
+        return json.dumps(data, separators=(",", ":"), default=fallback).encode()
+
+    module = types.SimpleNamespace(
+        OPT_NON_STR_KEYS=1,
+        OPT_INDENT_2=2,
+        OPT_PASSTHROUGH_DATACLASS=_PASSTHROUGH_DATACLASS,
+        dumps=orjson_dumps,
+    )
+    monkeypatch.setitem(sys.modules, "orjson", module)
+    monkeypatch.delenv(json_output.SERIALIZER_ENV, raising=False)
+    return calls
+
+
+def _board_issue():
+    issue = {
+        "key": "GFD-1",
+        "fields": {
+            "summary": "S",
+            "status": {"name": "To Do"},
+            "issuetype": {"name": "Task"},
+            "priority": {"name": "High"},
+            "project": {"key": "GFD"},
+        },
+    }
+    graph = BlockerGraph([issue], resolved_statuses={"Done"})
+    return BoardIssue.from_issue(issue, "to_do", graph)
+
+
+class TestSerializer:
+    def test_uses_orjson_when_installed(self, fake_orjson):
+        serialize = json_output._serializer()
+
+        assert serialize({"a": 1}, False) == b'{"a":1}'
+        serialize({"a": 1}, True)
+        assert fake_orjson == [5, 7]
+
+    def test_orjson_writes_board_issue_json_view(self, fake_orjson):
+        task = _board_issue()
+
+        assert json.loads(json_output._serializer()([task], False)) == [task.to_json()]
+
+    def test_real_orjson_writes_board_issue_json_view(self, monkeypatch):
+        pytest.importorskip("orjson")
+        monkeypatch.delenv(json_output.SERIALIZER_ENV, raising=False)
+        task = _board_issue()
+
+        for pretty in (False, True):
+            data = json.loads(json_output._serializer()({"tasks": [task]}, pretty))
+            assert data == {"tasks": [task.to_json()]}
+
+    def test_env_forces_stdlib(self, fake_orjson, monkeypatch):
+        monkeypatch.setenv(json_output.SERIALIZER_ENV, "json")
+
+        assert json_output._serializer() is json_output._stdlib_dumps
+
+    def test_falls_back_to_stdlib(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.delenv(json_output.SERIALIZER_ENV, raising=False)
+
+        assert json_output._serializer() is json_output._stdlib_dumps
+
+    def test_stdlib_is_compact_utf8(self):
+        data = {"summary": "naïve", "n": [1, 2]}
+
+        assert (
+            json_output._stdlib_dumps(data, False)
+            == '{"summary":"naïve","n":[1,2]}'.encode()
+        )
+        assert json_output._stdlib_dumps(data, True) == (
+            '{\n  "summary": "naïve",\n  "n": [\n    1,\n    2\n  ]\n}'.encode()
+        )
+
+    def test_real_orjson_matches_stdlib(self, monkeypatch):
+        pytest.importorskip("orjson")
+        monkeypatch.delenv(json_output.SERIALIZER_ENV, raising=False)
+        data = {
+            "summary": "naïve “quoted” ✓",
+            "n": [1, -2.5, True, None],
+            "nested": {"empty": [], "none": {}, 3: "int key"},
+            "tasks": [_board_issue()],
+        }
+
+        for pretty in (False, True):
+            assert json_output._serializer()(data, pretty) == json_output._stdlib_dumps(
+                data, pretty
+            )
+
+    def test_dumps_returns_bytes(self):
+        assert json.loads(dumps({"a": [1]}, pretty=True)) == {"a": [1]}
+
+
+class TestOutputJson:
+    def test_writes_after_pending_text(self, capsys):
+        print("before", end="\n")
+        output_json({"key": "GFD-1"})
+
+        out = capsys.readouterr().out
+        before, document = out.split("\n", 1)
+        assert before == "before"
+        assert json.loads(document) == {"key": "GFD-1"}
+        assert out.endswith("}\n")
+
+    def test_text_only_stdout(self, monkeypatch):
+        stream = io.StringIO()
+        monkeypatch.setattr(sys, "stdout", stream)
+
+        output_json([1, 2], pretty=True)
+
+        assert json.loads(stream.getvalue()) == [1, 2]
+
+    def test_non_utf8_stdout_is_reencoded(self, monkeypatch):
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-16", write_through=True)
+        monkeypatch.setattr(sys, "stdout", stream)
+
+        output_json({"summary": "naïve"})
+
+        assert json.loads(raw.getvalue().decode("utf-16")) == {"summary": "naïve"}
+
+
+class TestOutputNdjson:
+    def test_one_document_per_line(self, capsys):
+        output_ndjson(iter([{"key": "GFD-1"}, {"key": "GFD-2"}]))
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["key"] for line in lines] == ["GFD-1", "GFD-2"]
+
+    def test_empty(self, capsys):
+        output_ndjson([])
+
+        assert capsys.readouterr().out == ""
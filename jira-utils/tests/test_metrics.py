@@ -0,0 +1,185 @@
+"""Tests for request instrumentation."""
+
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from jira_utils.cli import app
+from jira_utils.client import JiraApiError, JiraClient
+from jira_utils.metrics import (
+    Histogram,
+    JsonlSink,
+    MetricsRecorder,
+    RequestMetric,
+    default_instrument,
+    install,
+    template_path,
+    uninstall,
+)
+
+
+def _resp(status, body=b"{}"):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.is_success = 200 <= status < 300
+    resp.headers = {}
+    resp.text = "err"
+    resp.content = body
+    resp.json.return_value = {}
+    return resp
+
+
+class TestTemplatePath:
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("/rest/api/2/issue/GFD-12", "/rest/api/2/issue/{issue}"),
+            (
+                "/rest/api/2/issue/GFD-12/transitions",
+                "/rest/api/2/issue/{issue}/transitions",
+            ),
+            ("/rest/agile/1.0/board/42/sprint", "/rest/agile/1.0/board/{id}/sprint"),
+            (
+                "/rest/api/2/project/GFD/components",
+                "/rest/api/2/project/{project}/components",
+            ),
+            ("/rest/api/3/search/jql", "/rest/api/3/search/jql"),
+        ],
+    )
+    def test_templates(self, path, expected):
+        assert template_path(path) == expected
+
+
+class TestHistogram:
+    def test_quantiles_use_bucket_bounds(self):
+        hist = Histogram((10, 100, 1000))
+        for value in (1, 2, 3, 50, 500):
+            hist.observe(value)
+
+        assert hist.quantile(0.5) == 10
+        assert hist.quantile(0.95) == 500
+        assert hist.to_dict()["buckets"] == {10: 3, 100: 1, 1000: 1, "inf": 0}
+
+
+class TestMetricsRecorder:
+    def test_aggregates_per_endpoint(self):
+        recorder = MetricsRecorder()
+        recorder(RequestMetric("GET", "/a", 200, 0.02, 100))
+        recorder(RequestMetric("GET", "/a", 503, 0.01, 10))
+        recorder(RequestMetric("GET", "/a", 200, 0.03, 100, attempt=2))
+        recorder(RequestMetric("GET", "/a", None, 0.0, 0, cached=True))
+        recorder(RequestMetric("POST", "/b", None, 0.001, 0))
+
+        rows = {r["method"]: r for r in recorder.summary()}
+
+        assert rows["GET"]["requests"] == 3
+        assert rows["GET"]["cached"] == 1
+        assert rows["GET"]["retries"] == 1
+        assert rows["GET"]["bytes"] == 210
+        assert rows["GET"]["statuses"] == {"200": 2, "503": 1}
+        assert rows["POST"]["statuses"] == {"error": 1}
+        assert "GET /a" in recorder.format_summary()
+
+
+class TestJsonlSink:
+    def test_appends_lines(self, tmp_path):
+        sink = JsonlSink(tmp_path / "m.jsonl")
+
+        sink(RequestMetric("GET", "/a", 200, 0.5, 10))
+        sink(RequestMetric("PUT", "/b", 204, 0.1, 0))
+
+        lines = (tmp_path / "m.jsonl").read_text().splitlines()
+        assert [json.loads(line)["method"] for line in lines] == ["GET", "PUT"]
+
+    def test_env_enables_sink(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("JIRA_METRICS_FILE", str(tmp_path / "m.jsonl"))
+
+        assert isinstance(default_instrument(), JsonlSink)
+
+
+class TestInstall:
+    def test_hooks_are_scoped_to_the_installing_thread(self, monkeypatch):
+        monkeypatch.delenv("JIRA_METRICS_FILE", raising=False)
+        both_installed = threading.Barrier(2, timeout=5)
+        seen = {}
+
+        def run(name):
+            recorder = MetricsRecorder()
+            install(recorder)
+            both_installed.wait()
+            seen[name] = (recorder, default_instrument())
+            uninstall(recorder)
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in "ab"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(mine is seen_hook for mine, seen_hook in seen.values())
+        assert default_instrument() is None
+
+
+@patch("jira_utils.client.time.sleep")
+@patch("jira_utils.client.httpx.Client")
+class TestClientInstrumentation:
+    def _make_client(self, hook):
+        return JiraClient(
+            base_url="https://jira.test",
+            username="user",
+            api_token="token",
+            rate_limited=False,
+            instrument=hook,
+        )
+
+    def test_each_attempt_reported(self, mock_http_cls, mock_sleep):
+        mock_http_cls.return_value.request.side_effect = [
+            _resp(503, b"busy"),
+            _resp(200, b'{"ok": 1}'),
+        ]
+        seen = []
+
+        self._make_client(seen.append).get("/rest/api/2/issue/GFD-1")
+
+        assert [(m.status, m.attempt, m.bytes) for m in seen] == [
+            (503, 1, 4),
+            (200, 2, 9),
+        ]
+        assert seen[0].path == "/rest/api/2/issue/{issue}"
+
+    def test_failures_reported(self, mock_http_cls, mock_sleep):
+        mock_http_cls.return_value.request.return_value = _resp(404)
+        seen = []
+
+        with pytest.raises(JiraApiError):
+            self._make_client(seen.append).put("/x", json={})
+
+        assert [m.status for m in seen] == [404]
+
+
+class TestStatsFlag:
+    @patch("jira_utils.client.httpx.Client")
+    def test_prints_summary_to_stderr(self, mock_http_cls, tmp_path, monkeypatch):
+        for name, value in [
+            ("JIRA_URL", "https://jira.test"),
+            ("JIRA_USERNAME", "u"),
+            ("JIRA_API_TOKEN", "t"),
+            ("JIRA_RATE_LIMIT", "0"),
+        ]:
+            monkeypatch.setenv(name, value)
+        # Registered so the variable the CLI sets is rolled back afterwards.
+        monkeypatch.setenv("JIRA_METRICS_FILE", "")
+        mock_http_cls.return_value.request.return_value = _resp(200)
+        metrics_file = tmp_path / "m.jsonl"
+
+        result = CliRunner().invoke(
+            app, ["--stats", "--stats-file", str(metrics_file), "get-boards"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "GET /rest/agile/1.0/board" in result.stderr
+        assert json.loads(metrics_file.read_text())["status"] == 200
+        assert default_instrument() is not None
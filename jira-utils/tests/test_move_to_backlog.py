@@ -1,9 +1,10 @@
 """Tests for move_to_backlog command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.client import JiraClient
-from jira_utils.move_to_backlog import run_move_to_backlog
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.move_to_backlog import run_move_to_backlog, run_move_to_backlog_async
 
 
 class TestRunMoveToBacklog:
@@ -18,3 +19,16 @@ class TestRunMoveToBacklog:
             "/rest/agile/1.0/backlog/issue",
             json={"issues": ["GFD-43", "GFD-44"]},
         )
+
+
+class TestRunMoveToBacklogAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.return_value = None
+
+        asyncio.run(run_move_to_backlog_async("GFD-1,GFD-2", client=client))
+
+        client.post.assert_awaited_once_with(
+            "/rest/agile/1.0/backlog/issue",
+            json={"issues": ["GFD-1", "GFD-2"]},
+        )
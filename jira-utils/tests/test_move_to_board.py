@@ -1,9 +1,10 @@
 """Tests for move_to_board command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.client import JiraClient
-from jira_utils.move_to_board import run_move_to_board
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.move_to_board import run_move_to_board, run_move_to_board_async
 
 
 class TestRunMoveToBoard:
@@ -29,3 +30,16 @@ class TestRunMoveToBoard:
             "/rest/agile/1.0/board/1/issue",
             json={"issues": ["GFD-43"]},
         )
+
+
+class TestRunMoveToBoardAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.return_value = None
+
+        asyncio.run(run_move_to_board_async(5, "GFD-1", client=client))
+
+        client.post.assert_awaited_once_with(
+            "/rest/agile/1.0/board/5/issue",
+            json={"issues": ["GFD-1"]},
+        )
@@ -0,0 +1,63 @@
+"""Tests for adaptive search page sizing."""
+
+from jira_utils.paging import MIN_PAGE_SIZE, AdaptivePageSize
+
+
+class TestAdaptivePageSize:
+    def test_doubles_on_fast_small_pages(self):
+        paging = AdaptivePageSize(maximum=300)
+
+        for _ in range(4):
+            size = paging.next()
+            paging.observe(size, size, 0.1, 1000, more=True)
+
+        assert paging.history == [MIN_PAGE_SIZE, 100, 200, 300]
+        assert paging.size == 300
+
+    def test_server_cap_becomes_ceiling(self):
+        paging = AdaptivePageSize()
+        paging.size = 400
+
+        paging.observe(400, 100, 0.1, 1000, more=True)
+
+        assert paging.size == 100
+        assert paging.maximum == 100
+
+    def test_short_last_page_is_not_a_cap(self):
+        paging = AdaptivePageSize()
+
+        paging.observe(50, 3, 0.1, 100, more=False)
+
+        assert paging.maximum == 5000
+
+    def test_halves_on_slow_page(self):
+        paging = AdaptivePageSize()
+        paging.size = 800
+
+        paging.observe(800, 800, 6.0, 1000, more=True)
+
+        assert paging.size == 400
+
+    def test_halves_on_large_payload(self):
+        paging = AdaptivePageSize(max_bytes=10_000)
+        paging.size = 800
+
+        paging.observe(800, 800, 0.1, 20_000, more=True)
+
+        assert paging.size == 400
+
+    def test_holds_between_thresholds(self):
+        paging = AdaptivePageSize()
+        paging.size = 200
+
+        paging.observe(200, 200, 2.0, 1000, more=True)
+
+        assert paging.size == 200
+
+    def test_timeout_halves_until_minimum(self):
+        paging = AdaptivePageSize()
+        paging.size = 100
+
+        assert paging.timed_out()
+        assert paging.size == MIN_PAGE_SIZE
+        assert not paging.timed_out()
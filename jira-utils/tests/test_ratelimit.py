@@ -0,0 +1,115 @@
+"""Tests for retry policy and shared token bucket."""
+
+import time
+from email.utils import formatdate
+from unittest.mock import MagicMock
+
+import pytest
+
+from jira_utils.ratelimit import RetryPolicy, TokenBucket, parse_retry_after
+
+
+def _response(status, headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = headers or {}
+    return resp
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self):
+        value = formatdate(time.time() + 30, usegmt=True)
+        assert 25 <= parse_retry_after(value) <= 30
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_unparseable(self, value):
+        assert parse_retry_after(value) is None
+
+
+class TestRetryPolicy:
+    @pytest.mark.parametrize("method", ["GET", "PUT", "DELETE", "get"])
+    def test_idempotent_methods_allowed(self, method):
+        assert RetryPolicy().allows(method)
+
+    def test_post_not_allowed_by_default(self):
+        assert not RetryPolicy().allows("POST")
+
+    def test_explicit_override(self):
+        assert RetryPolicy().allows("POST", idempotent=True)
+        assert not RetryPolicy().allows("GET", idempotent=False)
+
+    def test_non_retryable_status_gives_up(self):
+        assert RetryPolicy().next_delay(None, _response(404)) is None
+
+    def test_retry_after_wins(self):
+        delay = RetryPolicy().next_delay(None, _response(429, {"Retry-After": "3"}))
+        assert delay == 3.0
+
+    def test_retry_after_beyond_max_gives_up(self):
+        policy = RetryPolicy(max_delay=10)
+        assert policy.next_delay(None, _response(429, {"Retry-After": "60"})) is None
+
+    def test_decorrelated_jitter_bounds(self):
+        policy = RetryPolicy(base_delay=1, max_delay=20)
+        for _ in range(100):
+            delay = policy.next_delay(4.0, _response(503))
+            assert 1 <= delay <= 12
+
+    def test_jitter_capped_at_max_delay(self):
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+        for _ in range(100):
+            assert policy.next_delay(100.0) <= 5
+
+
+class TestTokenBucket:
+    def _bucket(self, path, clock, **kwargs):
+        return TokenBucket(path, _clock=lambda: clock[0], **kwargs)
+
+    def test_burst_then_wait(self, tmp_path):
+        clock = [1000.0]
+        bucket = self._bucket(tmp_path / "b.json", clock, rate=2, capacity=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.5)
+
+    def test_refills_over_time(self, tmp_path):
+        clock = [1000.0]
+        bucket = self._bucket(tmp_path / "b.json", clock, rate=1, capacity=1)
+
+        bucket.reserve()
+        clock[0] += 1
+        assert bucket.reserve() == 0
+
+    def test_state_shared_between_instances(self, tmp_path):
+        clock = [1000.0]
+        path = tmp_path / "b.json"
+        first = self._bucket(path, clock, rate=1, capacity=1)
+        second = self._bucket(path, clock, rate=1, capacity=1)
+
+        assert first.reserve() == 0
+        assert second.reserve() == pytest.approx(1.0)
+
+    def test_pause_makes_sharers_wait(self, tmp_path):
+        clock = [1000.0]
+        path = tmp_path / "b.json"
+        self._bucket(path, clock, rate=1, capacity=5).pause(10)
+
+        other = self._bucket(path, clock, rate=1, capacity=5)
+        assert other.reserve() == pytest.approx(11.0)
+
+    def test_for_site_uses_cache_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("JIRA_UTILS_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("JIRA_RATE_LIMIT", "5")
+
+        bucket = TokenBucket.for_site("https://acme.atlassian.net")
+
+        assert bucket.path == tmp_path / "ratelimit-acme.atlassian.net.json"
+        assert bucket.rate == 5
+
+    def test_for_site_disabled(self, monkeypatch):
+        monkeypatch.setenv("JIRA_RATE_LIMIT", "0")
+        assert TokenBucket.for_site("https://acme.atlassian.net") is None
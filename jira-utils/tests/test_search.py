@@ -1,9 +1,35 @@
 """Tests for search command."""
 
-from unittest.mock import MagicMock
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock, patch
 
-from jira_utils.client import JiraClient
-from jira_utils.search import run_search
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.metrics import MetricsRecorder
+from jira_utils.paging import AdaptivePageSize
+from jira_utils.ratelimit import RetryPolicy
+from jira_utils.search import (
+    app,
+    iter_search,
+    iter_search_async,
+    run_search,
+    run_search_async,
+    search_all,
+    search_all_async,
+)
+from jira_utils.simulator import JiraSimulator, SimulatorConfig
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
 
 
 class TestRunSearch:
@@ -17,6 +43,7 @@ class TestRunSearch:
         client.post.assert_called_once_with(
             "/rest/api/3/search/jql",
             json={"jql": "project = GFD", "maxResults": 50},
+            idempotent=True,
         )
 
     def test_with_fields_and_pagination(self):
@@ -39,4 +66,218 @@ class TestRunSearch:
                 "fields": ["summary", "status"],
                 "nextPageToken": "abc123",
             },
+            idempotent=True,
+        )
+
+
+class TestRunSearchAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.return_value = {"issues": [], "total": 0}
+
+        asyncio.run(run_search_async("project = GFD", fields="summary", client=client))
+
+        client.post.assert_awaited_once_with(
+            "/rest/api/3/search/jql",
+            json={"jql": "project = GFD", "maxResults": 50, "fields": ["summary"]},
+            idempotent=True,
+        )
+
+
+def _pages(*pages):
+    """Search responses chained by nextPageToken, last page marked isLast."""
+    results = []
+    for i, keys in enumerate(pages):
+        page = {"issues": [{"key": k} for k in keys]}
+        if i < len(pages) - 1:
+            page["nextPageToken"] = f"t{i + 1}"
+        else:
+            page["isLast"] = True
+        results.append(page)
+    return results
+
+
+class TestIterSearch:
+    def test_follows_page_tokens(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.side_effect = _pages(["GFD-1", "GFD-2"], ["GFD-3"])
+
+        keys = [i["key"] for i in iter_search("project = GFD", client=client)]
+
+        assert keys == ["GFD-1", "GFD-2", "GFD-3"]
+        assert client.post.call_args_list[1][1]["json"] == {
+            "jql": "project = GFD",
+            "maxResults": 100,
+            "nextPageToken": "t1",
+        }
+
+    def test_prefetches_next_page_before_first_yield(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.side_effect = _pages(["GFD-1"], ["GFD-2"])
+        issues = iter_search("project = GFD", page_size=1, client=client)
+
+        next(issues)
+        _wait_for(lambda: client.post.call_count == 2)
+        issues.close()
+
+    def test_stops_without_token(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.return_value = {"issues": [{"key": "GFD-1"}]}
+
+        assert len(list(iter_search("x", client=client))) == 1
+        client.post.assert_called_once()
+
+
+class TestIterSearchAsync:
+    def test_follows_page_tokens(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.side_effect = _pages(["GFD-1"], ["GFD-2"], ["GFD-3"])
+
+        async def collect():
+            return [i["key"] async for i in iter_search_async("x", client=client)]
+
+        assert asyncio.run(collect()) == ["GFD-1", "GFD-2", "GFD-3"]
+        assert client.post.await_count == 3
+
+
+class TestSearchAll:
+    def _sim(self, **config):
+        return JiraSimulator(
+            SimulatorConfig(issues=2000, status_weights=(1,) * 6, **config)
         )
+
+    def test_grows_pages_up_to_server_cap(self):
+        sim = self._sim(max_page_size=400)
+        paging = AdaptivePageSize()
+        with JiraClient(**sim.client_options()) as client:
+            issues = search_all("project = GFD", paging=paging, client=client)
+
+        assert len(issues) == 2000
+        assert len({i["key"] for i in issues}) == 2000
+        assert paging.history[:6] == [50, 100, 200, 400, 800, 400]
+        assert paging.maximum == 400
+        assert sim.requests["POST /rest/api/3/search/jql"] == len(paging.history)
+        assert len(paging.history) < 2000 // 50
+
+    def test_page_sizes_reach_instrumentation(self):
+        sim = self._sim(max_page_size=400)
+        recorder = MetricsRecorder()
+        with JiraClient(**sim.client_options(), instrument=recorder) as client:
+            search_all("project = GFD", client=client)
+
+        (row,) = recorder.summary()
+        assert row["page_sizes"] == {
+            "50": 1,
+            "100": 1,
+            "200": 1,
+            "400": 4,
+            "800": 1,
+        }
+        assert "page sizes POST /rest/api/3/search/jql" in recorder.format_summary()
+
+    def test_timeout_retries_smaller_page(self):
+        client = MagicMock(spec=JiraClient)
+        first = [f"GFD-{n}" for n in range(1, 51)]
+        client.post.side_effect = [
+            _pages(first, ["GFD-51"])[0],
+            httpx.ReadTimeout("slow"),
+            {"issues": [{"key": "GFD-51"}], "isLast": True},
+        ]
+        paging = AdaptivePageSize()
+
+        issues = search_all("x", paging=paging, client=client)
+
+        assert [i["key"] for i in issues] == [*first, "GFD-51"]
+        assert paging.history == [50, 100, 50]
+        calls = client.post.call_args_list
+        assert calls[2][1]["json"]["nextPageToken"] == "t1"
+        assert [c[1]["retry_timeouts"] for c in calls] == [True, False, True]
+
+    def test_timeout_shrinks_without_client_retries(self):
+        sim = self._sim()
+        sizes = []
+
+        def handler(request):
+            size = json.loads(request.content)["maxResults"]
+            sizes.append(size)
+            if size > 100:
+                raise httpx.ReadTimeout("slow", request=request)
+            return sim.handle(request)
+
+        options = {**sim.client_options(), "transport": httpx.MockTransport(handler)}
+        paging = AdaptivePageSize()
+        with JiraClient(**options, retry=RetryPolicy(base_delay=0)) as client:
+            issues = search_all("project = GFD", paging=paging, client=client)
+
+        assert len(issues) == 2000
+        assert sizes[:4] == [50, 100, 200, 100]
+
+    def test_sizes_pages_from_response_bytes(self):
+        client = MagicMock(spec=JiraClient)
+        pages = iter(_pages(["GFD-1"], ["GFD-2"], ["GFD-3"]))
+
+        def post(path, *, observer, **kwargs):
+            observer(MagicMock(bytes=10_000))
+            return next(pages)
+
+        client.post.side_effect = post
+        paging = AdaptivePageSize(max_bytes=15_000)
+
+        search_all("x", paging=paging, client=client)
+
+        assert paging.history == [50, 50, 50]
+
+    def test_timeout_at_minimum_raises(self):
+        client = MagicMock(spec=JiraClient)
+        client.post.side_effect = httpx.ReadTimeout("slow")
+
+        with pytest.raises(httpx.ReadTimeout):
+            search_all("x", client=client)
+
+    def test_async_matches_sync(self):
+        sim = self._sim(max_page_size=400)
+        paging = AdaptivePageSize()
+
+        async def run():
+            options = sim.client_options(asynchronous=True)
+            async with AsyncJiraClient(**options) as client:
+                return await search_all_async(
+                    "project = GFD", paging=paging, client=client
+                )
+
+        assert len(asyncio.run(run())) == 2000
+        assert paging.history[:4] == [50, 100, 200, 400]
+
+
+@patch("jira_utils.search.JiraClient")
+class TestSearchCli:
+    def _invoke(self, *args):
+        return CliRunner().invoke(
+            app,
+            ["--jql", "project = GFD", *args],
+            env={"JIRA_URL": "u", "JIRA_USERNAME": "u", "JIRA_API_TOKEN": "t"},
+        )
+
+    def test_all_ndjson_streams_one_issue_per_line(self, mock_client_cls):
+        client = mock_client_cls.return_value.__enter__.return_value
+        client.post.side_effect = _pages(["GFD-1", "GFD-2"], ["GFD-3"])
+
+        result = self._invoke("--all", "--ndjson")
+
+        assert result.exit_code == 0, result.output
+        lines = result.output.splitlines()
+        assert [json.loads(line)["key"] for line in lines] == [
+            "GFD-1",
+            "GFD-2",
+            "GFD-3",
+        ]
+
+    def test_all_collects_into_one_document(self, mock_client_cls):
+        client = mock_client_cls.return_value.__enter__.return_value
+        client.post.side_effect = _pages(["GFD-1"], ["GFD-2"])
+
+        result = self._invoke("--all")
+
+        assert json.loads(result.output) == {
+            "issues": [{"key": "GFD-1"}, {"key": "GFD-2"}]
+        }
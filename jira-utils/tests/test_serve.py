@@ -0,0 +1,241 @@
+"""Tests for the jira-utils daemon and its thin socket client."""
+
+import json
+import os
+import sys
+import threading
+import time
+from unittest.mock import DEFAULT, patch
+
+import pytest
+
+from jira_utils.client import JiraApiError
+from jira_utils.daemon import forward, main
+from jira_utils.metrics import MetricsRecorder, default_instrument
+from jira_utils.serve import CommandServer, run_command
+
+_ENV = {"JIRA_URL": "https://jira.test", "JIRA_USERNAME": "u", "JIRA_API_TOKEN": "t"}
+
+
+@pytest.fixture
+def server(tmp_path):
+    path = tmp_path / "d.sock"
+    srv = CommandServer(path)
+    thread = threading.Thread(
+        target=srv.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield path
+    srv.shutdown()
+    srv.server_close()
+    thread.join()
+
+
+def _run(argv, env, cwd):
+    """Run a command on this process; return its code, stdout and stderr."""
+    messages = []
+    code = run_command(argv, env, cwd, messages.append)
+    out = "".join(m.get("stdout", "") for m in messages)
+    err = "".join(m.get("stderr", "") for m in messages)
+    return code, out, err
+
+
+@pytest.fixture
+def jira_env(monkeypatch):
+    for name, value in _ENV.items():
+        monkeypatch.setenv(name, value)
+
+
+@patch("jira_utils.get_issue.JiraClient")
+class TestForward:
+    def test_relays_output_and_exit_code(self, mock_cls, server, jira_env, capsys):
+        client = mock_cls.return_value.__enter__.return_value
+        client.get.return_value = {"key": "GFD-1"}
+
+        code = forward(["get-issue", "--issue-key", "GFD-1"], server)
+
+        assert code == 0
+        assert json.loads(capsys.readouterr().out) == {"key": "GFD-1"}
+
+    def test_relays_errors(self, mock_cls, server, jira_env, capsys):
+        client = mock_cls.return_value.__enter__.return_value
+        client.get.side_effect = JiraApiError(404, "missing")
+
+        code = forward(["get-issue", "--issue-key", "GFD-9"], server)
+
+        assert code == 1
+        assert json.loads(capsys.readouterr().err)["status"] == 404
+
+    def test_uses_callers_environment(self, mock_cls, server, monkeypatch):
+        monkeypatch.setenv("JIRA_URL", "https://other.test")
+        monkeypatch.setenv("JIRA_USERNAME", "u")
+        monkeypatch.setenv("JIRA_API_TOKEN", "t")
+
+        forward(["get-issue", "--issue-key", "GFD-1"], server)
+
+        assert mock_cls.call_args[1]["base_url"] == "https://other.test"
+
+    def test_argument_named_like_local_command_is_forwarded(
+        self, mock_cls, server, jira_env, capsys
+    ):
+        mock_cls.return_value.__enter__.return_value.get.return_value = {}
+
+        assert forward(["get-issue", "--issue-key", "batch"], server) == 0
+
+
+class TestStreaming:
+    @patch("jira_utils.search.JiraClient")
+    def test_ndjson_arrives_before_command_finishes(
+        self, mock_cls, server, jira_env, capsys
+    ):
+        last_page = threading.Event()
+        first = [{"key": f"GFD-{n}", "summary": "x" * 100} for n in range(200)]
+
+        def post(path, json=None, **kwargs):
+            if "nextPageToken" not in json:
+                return {"issues": first, "nextPageToken": "t1"}
+            last_page.wait(5)
+            return {"issues": [{"key": "GFD-200"}], "isLast": True}
+
+        mock_cls.return_value.__enter__.return_value.post.side_effect = post
+        codes = []
+        argv = ["search", "--jql", "x", "--all", "--ndjson"]
+        thread = threading.Thread(target=lambda: codes.append(forward(argv, server)))
+        thread.start()
+
+        out = ""
+        deadline = time.monotonic() + 5
+        while '"GFD-0"' not in out:
+            assert time.monotonic() < deadline, "no output before the last page"
+            time.sleep(0.01)
+            out += capsys.readouterr().out
+        last_page.set()
+        thread.join()
+        out += capsys.readouterr().out
+
+        assert codes == [0]
+        assert len(out.splitlines()) == 201
+
+
+class TestLocalFallback:
+    def test_no_daemon(self, tmp_path):
+        assert forward(["get-boards"], tmp_path / "missing.sock") is None
+
+    def test_stdin_commands_stay_local(self, server):
+        assert forward(["bulk-create-issues"], server) is None
+        assert forward(["--stats-file", "s.jsonl", "--stats", "batch"], server) is None
+
+    def test_disabled_by_env(self, server, monkeypatch):
+        monkeypatch.setenv("JIRA_UTILS_NO_DAEMON", "1")
+
+        assert forward(["get-boards"], server) is None
+
+    def test_main_runs_cli_in_process(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("JIRA_UTILS_SOCKET", str(tmp_path / "missing.sock"))
+        monkeypatch.setattr("sys.argv", ["jira-utils", "get-boards"])
+
+        with patch("jira_utils.cli.app") as app:
+            main()
+
+        app.assert_called_once_with()
+
+
+class TestCommandServer:
+    def test_replaces_stale_socket(self, tmp_path):
+        path = tmp_path / "d.sock"
+        CommandServer(path).server_close()
+        path.touch()
+
+        srv = CommandServer(path)
+        srv.server_close()
+
+        assert not path.exists()
+
+    def test_refuses_second_server(self, server):
+        with pytest.raises(RuntimeError, match="already running"):
+            CommandServer(server)
+
+    def test_socket_is_private(self, server):
+        assert server.stat().st_mode & 0o777 == 0o600
+
+
+class TestRunCommand:
+    @patch("jira_utils.get_issue.JiraClient")
+    def test_restores_process_state(self, mock_cls, tmp_path):
+        mock_cls.return_value.__enter__.return_value.get.return_value = {}
+        env_before, cwd_before = dict(os.environ), os.getcwd()
+        environ, stdout = os.environ, sys.stdout
+
+        code, _, _ = _run(
+            ["get-issue", "--issue-key", "GFD-1"], {**_ENV, "X": "1"}, str(tmp_path)
+        )
+
+        assert code == 0
+        assert dict(os.environ) == env_before
+        assert os.getcwd() == cwd_before
+        assert os.environ is environ
+        assert sys.stdout is stdout
+
+    @patch("jira_utils.get_issue.JiraClient")
+    def test_same_directory_commands_run_concurrently(self, mock_cls, tmp_path):
+        both_running = threading.Barrier(2, timeout=5)
+
+        def client(**kwargs):
+            both_running.wait()
+            return DEFAULT
+
+        mock_cls.side_effect = client
+        mock_cls.return_value.__enter__.return_value.get.return_value = {}
+        codes = []
+
+        def run(url):
+            env = {**_ENV, "JIRA_URL": url}
+            code, _, _ = _run(["get-issue", "--issue-key", "GFD-1"], env, "/")
+            codes.append(code)
+
+        threads = [threading.Thread(target=run, args=(u,)) for u in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert codes == [0, 0]
+        urls = sorted(c.kwargs["base_url"] for c in mock_cls.call_args_list)
+        assert urls == ["a", "b"]
+
+    @patch("jira_utils.get_issue.JiraClient")
+    def test_stats_recorders_are_per_invocation(self, mock_cls, tmp_path):
+        both_running = threading.Barrier(2, timeout=5)
+        instruments = []
+
+        def client(**kwargs):
+            both_running.wait()
+            instruments.append(default_instrument())
+            return DEFAULT
+
+        mock_cls.side_effect = client
+        mock_cls.return_value.__enter__.return_value.get.return_value = {}
+        argv = ["--stats", "get-issue", "--issue-key", "GFD-1"]
+        threads = [
+            threading.Thread(target=_run, args=(argv, _ENV, str(tmp_path)))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(isinstance(i, MetricsRecorder) for i in instruments)
+        assert len({id(i) for i in instruments}) == 2
+
+    def test_usage_error_exit_code(self, tmp_path):
+        code, _, err = _run(["nope"], _ENV, str(tmp_path))
+
+        assert code == 2
+        assert "nope" in err
+
+    def test_missing_cwd_fails(self, tmp_path):
+        code, _, err = _run(["get-boards"], _ENV, str(tmp_path / "gone"))
+
+        assert code == 1
+        assert "gone" in err
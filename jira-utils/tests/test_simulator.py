@@ -0,0 +1,118 @@
+"""Tests for the in-process Jira simulator."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from jira_utils.add_comment import run_add_comment
+from jira_utils.client import AsyncJiraClient, JiraApiError, JiraClient
+from jira_utils.create_issue import run_create_issue
+from jira_utils.create_issue_link import run_create_issue_link
+from jira_utils.fetch_task import run_fetch_task, run_fetch_task_async
+from jira_utils.get_issue import run_get_issue
+from jira_utils.search import iter_search, run_search
+from jira_utils.simulator import JiraSimulator, SimulatorConfig
+from jira_utils.transition_issue import run_transition_issue
+
+
+def _client(sim):
+    return JiraClient(**sim.client_options())
+
+
+class TestSearch:
+    def test_paginates_with_next_page_token(self):
+        sim = JiraSimulator(SimulatorConfig(issues=250, status_weights=(1,) * 6))
+        with _client(sim) as client:
+            keys = [i["key"] for i in iter_search("project = GFD", client=client)]
+
+        assert len(keys) == 250
+        assert keys[:2] == ["GFD-1", "GFD-2"]
+        assert sim.requests["POST /rest/api/3/search/jql"] == 3
+
+    def test_filters_and_fields(self):
+        sim = JiraSimulator(SimulatorConfig(issues=50))
+        with _client(sim) as client:
+            result = run_search(
+                'project = GFD AND status IN ("To Do", Review) ORDER BY updated DESC',
+                fields="summary,status",
+                client=client,
+            )
+
+        statuses = {i["fields"]["status"]["name"] for i in result["issues"]}
+        assert statuses <= {"To Do", "Review"}
+        assert set(result["issues"][0]["fields"]) == {"summary", "status"}
+
+    def test_unsupported_jql_is_400(self):
+        sim = JiraSimulator(SimulatorConfig(issues=5))
+        with _client(sim) as client, pytest.raises(JiraApiError) as exc_info:
+            run_search("labels ~ foo", client=client)
+
+        assert exc_info.value.status_code == 400
+
+
+class TestIssueLifecycle:
+    def test_create_transition_comment_link(self):
+        sim = JiraSimulator(SimulatorConfig(issues=2))
+        with _client(sim) as client:
+            created = run_create_issue(
+                "GFD", "New work", "Task", assignee="Agent Two", client=client
+            )
+            run_transition_issue(created["key"], "13", client=client)
+            run_add_comment(created["key"], "started", client=client)
+            run_create_issue_link("Blocks", "GFD-1", created["key"], client=client)
+            issue = run_get_issue(created["key"], client=client)
+
+        fields = issue["fields"]
+        assert created["key"] == "GFD-3"
+        assert fields["status"]["name"] == "To Do"
+        assert fields["assignee"]["displayName"] == "Agent Two"
+        assert fields["issuelinks"][0]["inwardIssue"]["key"] == "GFD-1"
+
+    def test_updated_jql_sees_changes(self):
+        sim = JiraSimulator(SimulatorConfig(issues=10))
+        with _client(sim) as client:
+            run_add_comment("GFD-4", "bump", client=client)
+            result = run_search(
+                'project = GFD AND updated >= "2026-01-01 00:00" ORDER BY updated DESC',
+                client=client,
+            )
+
+        assert result["issues"][0]["key"] == "GFD-4"
+
+
+class TestThrottling:
+    @patch("jira_utils.client.time.sleep")
+    def test_429_injected_and_retried(self, mock_sleep):
+        sim = JiraSimulator(SimulatorConfig(issues=5, throttle_every=2))
+        with _client(sim) as client:
+            run_search("project = GFD", client=client)
+            result = run_search("project = GFD", client=client)
+
+        assert len(result["issues"]) == 5
+        assert sim.throttled == 1
+        assert sim.requests["POST /rest/api/3/search/jql"] == 3
+        mock_sleep.assert_called_once_with(1.0)
+
+
+class TestFetchTask:
+    def test_selects_from_large_board(self):
+        sim = JiraSimulator(SimulatorConfig(issues=1000, link_density=0.5))
+        with _client(sim) as client:
+            result = run_fetch_task("GFD", client=client)
+
+        assert result["selected_task"]["assignee"] == "Agent One"
+        assert not result["selected_task"]["blocked_by"]
+        assert sim.requests["GET /rest/api/3/myself"] == 1
+
+    def test_async_client(self):
+        sim = JiraSimulator(SimulatorConfig(issues=300, latency=0.001))
+
+        async def run():
+            options = sim.client_options(asynchronous=True)
+            async with AsyncJiraClient(**options) as client:
+                return await run_fetch_task_async("GFD", "Agent Two", client=client)
+
+        result = asyncio.run(run())
+
+        assert result["selected_task"]["assignee"] == "Agent Two"
@@ -0,0 +1,162 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from jira_utils.client import AsyncJiraClient
+from jira_utils.singleflight import AsyncSingleFlight, SingleFlight, flight_key
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.001)
+
+
+class TestFlightKey:
+    def test_param_order_ignored(self):
+        assert flight_key("get", "/x", {"a": 1, "b": 2}) == flight_key(
+            "GET", "/x", {"b": 2, "a": 1}
+        )
+
+    def test_params_distinguish(self):
+        assert flight_key("GET", "/x", {"a": 1}) != flight_key("GET", "/x", None)
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self):
+        group = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(2)
+            return {"values": [1]}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(group.do("k", fetch)))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        _wait_for(lambda: group.stats.coalesced == 3)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert results == [{"values": [1]}] * 4
+        assert len({id(r) for r in results}) == 4
+        assert (group.stats.executed, group.stats.coalesced) == (1, 3)
+
+    def test_sequential_calls_not_coalesced(self):
+        group = SingleFlight()
+
+        group.do("k", lambda: 1)
+        group.do("k", lambda: 2)
+
+        assert (group.stats.executed, group.stats.coalesced) == (2, 0)
+
+    def test_error_propagates_to_waiters(self):
+        group = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def fetch():
+            release.wait(2)
+            raise ValueError("boom")
+
+        def call():
+            try:
+                group.do("k", fetch)
+            except ValueError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=call) for _ in range(2)]
+        for t in threads:
+            t.start()
+        _wait_for(lambda: group.stats.coalesced == 1)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert len(errors) == 2
+        with pytest.raises(ValueError):
+            group.do("k", fetch)
+
+
+class TestAsyncSingleFlight:
+    def test_concurrent_coroutines_share_one_execution(self):
+        group = AsyncSingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.01)
+            return {"a": 1}
+
+        fetch = AsyncMock(side_effect=slow)
+
+        async def run():
+            return await asyncio.gather(*(group.do("k", fetch) for _ in range(3)))
+
+        results = asyncio.run(run())
+
+        assert fetch.await_count == 1
+        assert results == [{"a": 1}] * 3
+        assert (group.stats.executed, group.stats.coalesced) == (1, 2)
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        group = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        async def run():
+            first = asyncio.ensure_future(group.do("k", fetch))
+            second = asyncio.ensure_future(group.do("k", fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(run()) == "ok"
+
+
+class TestAsyncClientCoalescing:
+    @patch("jira_utils.client.httpx.AsyncClient")
+    def test_identical_gets_sent_once(self, mock_http_cls):
+        resp = MagicMock()
+        resp.is_success = True
+        resp.content = b"{}"
+        resp.json.return_value = {"key": "GFD-1"}
+
+        async def request(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return resp
+
+        mock_http_cls.return_value.request = AsyncMock(side_effect=request)
+        client = AsyncJiraClient(
+            base_url="https://jira.test",
+            username="user",
+            api_token="token",
+            rate_limited=False,
+        )
+
+        async def run():
+            return await asyncio.gather(
+                client.get("/rest/api/2/issue/GFD-1"),
+                client.get("/rest/api/2/issue/GFD-1"),
+                client.get("/rest/api/2/issue/GFD-2"),
+            )
+
+        asyncio.run(run())
+
+        assert mock_http_cls.return_value.request.await_count == 2
+        assert client.flight_stats.coalesced == 1
@@ -0,0 +1,219 @@
+"""Tests for the local board snapshot and its use by fetch-task."""
+
+import asyncio
+
+import pytest
+
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.create_issue import run_create_issue
+from jira_utils.create_issue_link import run_create_issue_link
+from jira_utils.fetch_task import run_fetch_task, run_fetch_task_async
+from jira_utils.simulator import JiraSimulator, SimulatorConfig
+from jira_utils.snapshot import BoardSnapshot, snapshot_from_env
+from jira_utils.transition_issue import run_transition_issue
+
+TO_DO, DONE = "13", "16"
+
+
+def _issue(key, status="To Do", assignee="Bot", links=None):
+    return {
+        "key": key,
+        "fields": {
+            "status": {"name": status},
+            "assignee": {"displayName": assignee} if assignee else None,
+            "issuelinks": links or [],
+        },
+    }
+
+
+def _blocked_by(key, status):
+    return {
+        "type": {"inward": "is blocked by"},
+        "inwardIssue": {"key": key, "fields": {"status": {"name": status}}},
+    }
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    return BoardSnapshot("https://x.atlassian.net", "GFD", path=tmp_path / "b.db")
+
+
+class TestBoardSnapshot:
+    def test_empty_snapshot_needs_reconcile(self, snapshot):
+        assert snapshot.delta_minutes() is None
+        assert snapshot.issues() == []
+
+    def test_replace_keeps_board_order(self, snapshot):
+        snapshot.replace([_issue("GFD-2"), _issue("GFD-1")], synced_at=0)
+
+        assert [i["key"] for i in snapshot.issues()] == ["GFD-2", "GFD-1"]
+
+    def test_delta_window_covers_time_since_last_sync(self, snapshot):
+        snapshot.replace([], synced_at=1000)
+        snapshot.clock = lambda: 1000 + 150
+
+        # 150s elapsed plus one minute of overlap.
+        assert snapshot.delta_minutes() == 4
+
+    def test_reconcile_after_interval(self, snapshot):
+        snapshot.replace([], synced_at=0)
+        snapshot.apply([], [], synced_at=800)
+        snapshot.clock = lambda: 900
+
+        assert snapshot.delta_minutes() is None
+
+    def test_refresh_mode_always_reconciles(self, tmp_path):
+        snapshot = BoardSnapshot("x", "GFD", mode="refresh", path=tmp_path / "b.db")
+        snapshot.replace([], synced_at=snapshot.clock())
+
+        assert snapshot.delta_minutes() is None
+
+    def test_apply_upserts_appends_and_removes(self, snapshot):
+        snapshot.replace([_issue("GFD-1"), _issue("GFD-2")], synced_at=0)
+
+        snapshot.apply(
+            [_issue("GFD-3"), _issue("GFD-1", status="Review")],
+            [_issue("GFD-2", status="Done")],
+            synced_at=60,
+        )
+
+        issues = snapshot.issues()
+        assert [i["key"] for i in issues] == ["GFD-1", "GFD-3"]
+        assert issues[0]["fields"]["status"]["name"] == "Review"
+
+    def test_replace_drops_issues_missing_from_full_fetch(self, snapshot):
+        snapshot.replace([_issue("GFD-1"), _issue("GFD-2")], synced_at=0)
+
+        snapshot.replace([_issue("GFD-2")], synced_at=60)
+
+        assert [i["key"] for i in snapshot.issues()] == ["GFD-2"]
+
+    def test_blocker_status_patched_from_snapshot(self, snapshot):
+        blocked = _issue("GFD-2", links=[_blocked_by("GFD-1", "To Do")])
+        snapshot.replace([_issue("GFD-1"), blocked], synced_at=0)
+
+        snapshot.apply([], [_issue("GFD-1", status="Done")], synced_at=60)
+
+        (issue,) = snapshot.issues()
+        link = issue["fields"]["issuelinks"][0]
+        assert link["inwardIssue"]["fields"]["status"]["name"] == "Done"
+
+    def test_filters_by_status_and_assignee(self, snapshot):
+        snapshot.replace(
+            [
+                _issue("GFD-1", assignee="Ann"),
+                _issue("GFD-2", status="Review", assignee="Bob"),
+                _issue("GFD-3", assignee="Bob"),
+            ],
+            synced_at=0,
+        )
+
+        assert [i["key"] for i in snapshot.issues(assignee="Bob")] == [
+            "GFD-2",
+            "GFD-3",
+        ]
+        assert [i["key"] for i in snapshot.issues(status="To Do")] == [
+            "GFD-1",
+            "GFD-3",
+        ]
+
+    def test_projects_are_separate(self, snapshot, tmp_path):
+        other = BoardSnapshot("https://x.atlassian.net", "OPS", path=snapshot.path)
+        snapshot.replace([_issue("GFD-1")], synced_at=0)
+        other.replace([_issue("OPS-1")], synced_at=0)
+
+        assert [i["key"] for i in snapshot.issues()] == ["GFD-1"]
+        assert [i["key"] for i in other.issues()] == ["OPS-1"]
+
+
+class TestSnapshotFromEnv:
+    def test_off(self):
+        assert snapshot_from_env("https://x", "GFD") is None
+
+    def test_use(self, monkeypatch):
+        monkeypatch.setenv("JIRA_HTTP_CACHE", "use")
+
+        snapshot = snapshot_from_env("https://x", "GFD")
+
+        assert snapshot.project == "GFD"
+        assert snapshot.mode == "use"
+
+    def test_no_project(self, monkeypatch):
+        monkeypatch.setenv("JIRA_HTTP_CACHE", "use")
+
+        assert snapshot_from_env("https://x", None) is None
+
+
+def _board(sim, client):
+    """Blocker GFD-1 and blocked GFD-2, both To Do for Agent One."""
+    for summary in ("Blocker", "Blocked"):
+        created = run_create_issue(
+            "GFD", summary, "Task", assignee="Agent One", client=client
+        )
+        run_transition_issue(created["key"], TO_DO, client=client)
+    run_create_issue_link("Blocks", "GFD-1", "GFD-2", client=client)
+    sim.requests.clear()
+
+
+def _searches(sim):
+    return sim.requests["POST /rest/api/3/search/jql"]
+
+
+class TestFetchTaskWithSnapshot:
+    def test_delta_sync_after_first_reconcile(self, snapshot):
+        sim = JiraSimulator(SimulatorConfig(issues=0))
+        with JiraClient(**sim.client_options()) as client:
+            _board(sim, client)
+            first = run_fetch_task("GFD", "Agent One", client=client, snapshot=snapshot)
+            run_transition_issue("GFD-1", DONE, client=client)
+            sim.requests.clear()
+            second = run_fetch_task(
+                "GFD", "Agent One", client=client, snapshot=snapshot
+            )
+
+        assert first["selected_task"]["key"] == "GFD-1"
+        assert second["selected_task"]["key"] == "GFD-2"
+        assert second["board_state"]["to_do"][0]["blocked_by"] == []
+        assert _searches(sim) == 1
+
+    def test_results_match_full_fetch(self, snapshot):
+        sim = JiraSimulator(SimulatorConfig(issues=300, link_density=0.5))
+        with JiraClient(**sim.client_options()) as client:
+            run_fetch_task("GFD", "Agent Two", client=client, snapshot=snapshot)
+            run_transition_issue("GFD-3", DONE, client=client)
+            delta = run_fetch_task("GFD", "Agent Two", client=client, snapshot=snapshot)
+            full = run_fetch_task("GFD", "Agent Two", client=client)
+
+        assert delta == full
+
+    def test_unusable_store_falls_back_to_full_fetch(self, tmp_path):
+        sim = JiraSimulator(SimulatorConfig(issues=20))
+        broken = BoardSnapshot("x", "GFD", path=tmp_path)
+        with JiraClient(**sim.client_options()) as client:
+            result = run_fetch_task("GFD", "Agent One", client=client, snapshot=broken)
+
+        assert result["board_state"]
+
+    def test_async(self, snapshot):
+        sim = JiraSimulator(SimulatorConfig(issues=0))
+
+        async def run():
+            options = sim.client_options(asynchronous=True)
+            async with AsyncJiraClient(**options) as client:
+                await run_fetch_task_async(
+                    "GFD", "Agent One", client=client, snapshot=snapshot
+                )
+                await client.post(
+                    "/rest/api/2/issue/GFD-1/transitions",
+                    json={"transition": {"id": DONE}},
+                )
+                return await run_fetch_task_async(
+                    "GFD", "Agent One", client=client, snapshot=snapshot
+                )
+
+        with JiraClient(**sim.client_options()) as client:
+            _board(sim, client)
+        result = asyncio.run(run())
+
+        assert result["selected_task"]["key"] == "GFD-2"
+        assert _searches(sim) == 2
@@ -1,9 +1,10 @@
 """Tests for transition_issue command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.client import JiraClient
-from jira_utils.transition_issue import run_transition_issue
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.transition_issue import run_transition_issue, run_transition_issue_async
 
 
 class TestRunTransitionIssue:
@@ -28,3 +29,21 @@ class TestRunTransitionIssue:
         call_json = client.post.call_args[1]["json"]
         assert call_json["transition"] == {"id": "21"}
         assert call_json["update"]["comment"] == [{"add": {"body": "Starting work"}}]
+
+
+class TestRunTransitionIssueAsync:
+    def test_awaits_client(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.post.return_value = None
+
+        asyncio.run(
+            run_transition_issue_async("GFD-42", "31", comment="Done", client=client)
+        )
+
+        client.post.assert_awaited_once_with(
+            "/rest/api/2/issue/GFD-42/transitions",
+            json={
+                "transition": {"id": "31"},
+                "update": {"comment": [{"add": {"body": "Done"}}]},
+            },
+        )
@@ -1,9 +1,10 @@
 """Tests for update_issue command."""
 
+import asyncio
 from unittest.mock import MagicMock
 
-from jira_utils.client import JiraClient
-from jira_utils.update_issue import run_update_issue
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.update_issue import run_update_issue, run_update_issue_async
 
 
 class TestRunUpdateIssue:
@@ -58,3 +59,18 @@ class TestRunUpdateIssue:
             "/rest/api/2/issue/GFD-42",
             json={},
         )
+
+
+class TestRunUpdateIssueAsync:
+    def test_resolves_assignee_and_puts(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.put.return_value = None
+        client.resolve_account_id.return_value = "abc-123"
+
+        asyncio.run(run_update_issue_async("GFD-42", assignee="matt", client=client))
+
+        client.resolve_account_id.assert_awaited_once_with("matt")
+        client.put.assert_awaited_once_with(
+            "/rest/api/2/issue/GFD-42",
+            json={"fields": {"assignee": {"accountId": "abc-123"}}},
+        )
@@ -0,0 +1,55 @@
+"""Tests for the persistent accountId cache."""
+
+from jira_utils.usercache import AccountCache
+
+
+def _cache(tmp_path, **kwargs):
+    return AccountCache("https://jira.test", path=tmp_path / "users.sqlite", **kwargs)
+
+
+class TestAccountCache:
+    def test_miss_returns_sentinel(self, tmp_path):
+        assert _cache(tmp_path).lookup("Jane Doe") is AccountCache.MISSING
+
+    def test_round_trip_is_case_insensitive(self, tmp_path):
+        cache = _cache(tmp_path)
+        cache.store("Jane Doe", "abc-123")
+
+        assert cache.lookup("  JANE   doe ") == "abc-123"
+
+    def test_negative_entry(self, tmp_path):
+        cache = _cache(tmp_path)
+        cache.store("Nobody", None)
+
+        assert cache.lookup("Nobody") is None
+
+    def test_entries_expire(self, tmp_path):
+        cache = _cache(tmp_path, positive_ttl=100, negative_ttl=10)
+        cache._clock = lambda: 1000.0
+        cache.store("Jane Doe", "abc-123")
+        cache.store("Nobody", None)
+        cache._clock = lambda: 1050.0
+
+        assert cache.lookup("Jane Doe") == "abc-123"
+        assert cache.lookup("Nobody") is AccountCache.MISSING
+
+    def test_scoped_to_site(self, tmp_path):
+        _cache(tmp_path).store("Jane Doe", "abc-123")
+        other = AccountCache("https://other.test", path=tmp_path / "users.sqlite")
+
+        assert other.lookup("Jane Doe") is AccountCache.MISSING
+
+    def test_refresh_mode_skips_lookup_but_stores(self, tmp_path):
+        refresh = _cache(tmp_path, mode="refresh")
+        refresh.store("Jane Doe", "abc-123")
+
+        assert refresh.lookup("Jane Doe") is AccountCache.MISSING
+        assert _cache(tmp_path).lookup("Jane Doe") == "abc-123"
+
+    def test_store_many(self, tmp_path):
+        cache = _cache(tmp_path)
+
+        written = cache.store_many([("A", "1"), ("B", "2"), ("", "3")])
+
+        assert written == 2
+        assert cache.lookup("b") == "2"
@@ -0,0 +1,61 @@
+"""Tests for warm_users command."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from jira_utils.client import AsyncJiraClient, JiraClient
+from jira_utils.usercache import AccountCache
+from jira_utils.warm_users import run_warm_users, run_warm_users_async
+
+
+def _user(account_id, name, **extra):
+    return {
+        "accountId": account_id,
+        "displayName": name,
+        "accountType": "atlassian",
+        "active": True,
+        **extra,
+    }
+
+
+class TestRunWarmUsers:
+    def test_resolves_named_users(self):
+        client = MagicMock(spec=JiraClient)
+        client.resolve_account_id.side_effect = ["abc", ValueError("none")]
+
+        result = run_warm_users(["Jane", "Nobody"], client=client)
+
+        assert result == {"cached": 1, "resolved": ["Jane"], "unresolved": ["Nobody"]}
+
+    def test_pages_through_user_directory(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("jira_utils.warm_users._PAGE_SIZE", 2)
+        client = MagicMock(spec=JiraClient)
+        client.base_url = "https://jira.test"
+        client.get.side_effect = [
+            [
+                _user("1", "Jane", emailAddress="jane@x.test"),
+                _user("2", "Bot", accountType="app"),
+            ],
+            [_user("3", "Gone", active=False)],
+        ]
+        cache = AccountCache("https://jira.test", path=tmp_path / "u.sqlite")
+
+        result = run_warm_users(client=client, cache=cache)
+
+        assert result["cached"] == 2
+        assert cache.lookup("jane@x.test") == "1"
+        assert cache.lookup("Bot") is AccountCache.MISSING
+        assert client.get.call_args_list[1][1]["params"] == {
+            "startAt": 2,
+            "maxResults": 2,
+        }
+
+
+class TestRunWarmUsersAsync:
+    def test_resolves_named_users_concurrently(self):
+        client = MagicMock(spec=AsyncJiraClient)
+        client.resolve_account_id.side_effect = [ValueError("none"), "abc"]
+
+        result = asyncio.run(run_warm_users_async(["Nobody", "Jane"], client=client))
+
+        assert result == {"cached": 1, "resolved": ["Jane"], "unresolved": ["Nobody"]}
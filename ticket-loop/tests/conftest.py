@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep jira-utils rate-limit state and board snapshots out of the user cache."""
+    monkeypatch.setenv("JIRA_UTILS_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture(autouse=True)
+def _jira_caches_off(monkeypatch):
+    """Disable the jira-utils response and account caches."""
+    monkeypatch.setenv("JIRA_HTTP_CACHE", "off")
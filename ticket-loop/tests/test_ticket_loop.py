@@ -2,7 +2,7 @@
 
 import json
 import subprocess
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -61,8 +61,10 @@ def _patch_load_config():
     return patch("ticket_loop.main.load_config", return_value=_FAKE_CONFIG)
 
 
-def _patch_jira_client():
-    return patch("ticket_loop.main.JiraClient", return_value=MagicMock())
+def _patch_jira_client(client=None):
+    client = client or MagicMock()
+    client.__enter__.return_value = client
+    return patch("ticket_loop.main.JiraClient", return_value=client)
 
 
 def test_run_loop_dispatches_to_review(monkeypatch):
@@ -163,15 +165,46 @@ def test_run_loop_calls_fetch_task_with_correct_args(monkeypatch):
     with (
         patch("ticket_loop.main.run_fetch_task", return_value=result) as mock_fetch,
         _patch_load_config(),
-        patch("ticket_loop.main.JiraClient", return_value=mock_client),
+        _patch_jira_client(mock_client),
     ):
         _run_loop()
 
     mock_fetch.assert_called_once_with(
-        project="GFD", assigned_to_user_name="Bot", client=mock_client
+        project=["GFD"],
+        assigned_to_user_name="Bot",
+        client=mock_client,
+        snapshot=None,
     )
 
 
+def test_run_loop_uses_configured_projects(monkeypatch):
+    """TICKET_LOOP_PROJECTS selects the projects, in priority order."""
+    monkeypatch.setenv("JIRA_AGENT_USERNAME", "Bot")
+    monkeypatch.setenv("TICKET_LOOP_PROJECTS", "OPS, GFD")
+
+    with patch("ticket_loop.main.run_fetch_task", return_value=_fetch_result()) as f:
+        _run_loop(client=MagicMock())
+
+    assert f.call_args[1]["project"] == ["OPS", "GFD"]
+
+
+def test_run_loop_reuses_provided_client(monkeypatch):
+    """_run_loop uses the given client instead of building a new one."""
+    monkeypatch.setenv("JIRA_AGENT_USERNAME", "Bot")
+    shared_client = MagicMock()
+
+    with (
+        patch(
+            "ticket_loop.main.run_fetch_task", return_value=_fetch_result()
+        ) as mock_fetch,
+        patch("ticket_loop.main.JiraClient") as mock_client_cls,
+    ):
+        _run_loop(client=shared_client)
+
+    mock_client_cls.assert_not_called()
+    assert mock_fetch.call_args[1]["client"] is shared_client
+
+
 def test_run_loop_logs_board_state(monkeypatch, capsys):
     """_run_loop prints board state summary for observability."""
     monkeypatch.setenv("JIRA_AGENT_USERNAME", "Bot")
@@ -511,6 +544,8 @@ def test_run_continuous_resets_backoff_on_work():
         patch("ticket_loop.main.BackoffTimer", return_value=mock_timer),
         patch("ticket_loop.main.threading.Event") as mock_event_cls,
         patch("ticket_loop.main.signal.signal"),
+        _patch_load_config(),
+        _patch_jira_client(),
     ):
         shutdown_event = MagicMock()
         shutdown_event.is_set.side_effect = [False, False, True]
@@ -521,6 +556,33 @@ def test_run_continuous_resets_backoff_on_work():
     assert mock_timer.reset.call_count == 2
 
 
+def test_run_continuous_shares_one_client():
+    """One pooled JiraClient serves every iteration and is closed on exit."""
+    mock_timer = MagicMock()
+    mock_timer.delay = 60
+    mock_client = MagicMock()
+
+    with (
+        patch("ticket_loop.main._run_loop", return_value=True) as mock_run_loop,
+        patch("ticket_loop.main.BackoffTimer", return_value=mock_timer),
+        patch("ticket_loop.main.threading.Event") as mock_event_cls,
+        patch("ticket_loop.main.signal.signal"),
+        _patch_load_config(),
+        _patch_jira_client(mock_client) as mock_client_cls,
+    ):
+        shutdown_event = MagicMock()
+        shutdown_event.is_set.side_effect = [False, False, True]
+        mock_event_cls.return_value = shutdown_event
+
+        _run_continuous()
+
+    mock_client_cls.assert_called_once_with(**_FAKE_CONFIG, breaker=ANY)
+    assert mock_run_loop.call_count == 2
+    for call in mock_run_loop.call_args_list:
+        assert call[1]["client"] is mock_client
+    mock_client.__exit__.assert_called_once()
+
+
 def test_run_continuous_backs_off_on_idle():
     """When no work found, waits for delay and steps the timer."""
     mock_timer = MagicMock()
@@ -531,6 +593,8 @@ def test_run_continuous_backs_off_on_idle():
         patch("ticket_loop.main.BackoffTimer", return_value=mock_timer),
         patch("ticket_loop.main.threading.Event") as mock_event_cls,
         patch("ticket_loop.main.signal.signal"),
+        _patch_load_config(),
+        _patch_jira_client(),
     ):
         shutdown_event = MagicMock()
         shutdown_event.is_set.side_effect = [False, True]
@@ -550,6 +614,8 @@ def test_run_continuous_stops_on_shutdown_event():
         patch("ticket_loop.main.BackoffTimer") as mock_timer_cls,
         patch("ticket_loop.main.threading.Event") as mock_event_cls,
         patch("ticket_loop.main.signal.signal"),
+        _patch_load_config(),
+        _patch_jira_client(),
     ):
         mock_timer = MagicMock()
         mock_timer.delay = 60
@@ -579,6 +645,8 @@ def test_run_continuous_catches_exceptions():
         patch("ticket_loop.main.BackoffTimer", return_value=mock_timer),
         patch("ticket_loop.main.threading.Event") as mock_event_cls,
         patch("ticket_loop.main.signal.signal"),
+        _patch_load_config(),
+        _patch_jira_client(),
     ):
         shutdown_event = MagicMock()
         shutdown_event.is_set.side_effect = [False, True]
@@ -592,6 +660,152 @@ def test_run_continuous_catches_exceptions():
     mock_timer.reset.assert_not_called()
 
 
+def test_run_continuous_syncs_board_snapshot(monkeypatch, tmp_path):
+    """Continuous mode keeps one board snapshot across iterations."""
+    from jira_utils.snapshot import BoardSnapshot
+
+    monkeypatch.setenv("JIRA_HTTP_CACHE", "use")
+    monkeypatch.setenv("JIRA_UTILS_CACHE_DIR", str(tmp_path))
+
+    with (
+        patch("ticket_loop.main._run_loop", return_value=True) as mock_run_loop,
+        patch("ticket_loop.main.BackoffTimer"),
+        patch("ticket_loop.main.threading.Event") as mock_event_cls,
+        patch("ticket_loop.main.signal.signal"),
+        _patch_load_config(),
+        _patch_jira_client(),
+    ):
+        shutdown_event = MagicMock()
+        shutdown_event.is_set.side_effect = [False, False, True]
+        mock_event_cls.return_value = shutdown_event
+
+        _run_continuous()
+
+    first, second = (c[1]["snapshot"] for c in mock_run_loop.call_args_list)
+    assert isinstance(first, BoardSnapshot)
+    assert first is second
+    assert first.project == "GFD"
+
+
+def test_run_continuous_keeps_one_snapshot_per_project(monkeypatch, tmp_path):
+    """With several projects, each board gets its own snapshot."""
+    monkeypatch.setenv("JIRA_HTTP_CACHE", "use")
+    monkeypatch.setenv("JIRA_UTILS_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("TICKET_LOOP_PROJECTS", "GFD,OPS")
+
+    with (
+        patch("ticket_loop.main._run_loop", return_value=True) as mock_run_loop,
+        patch("ticket_loop.main.BackoffTimer"),
+        patch("ticket_loop.main.threading.Event") as mock_event_cls,
+        patch("ticket_loop.main.signal.signal"),
+        _patch_load_config(),
+        _patch_jira_client(),
+    ):
+        shutdown_event = MagicMock()
+        shutdown_event.is_set.side_effect = [False, True]
+        mock_event_cls.return_value = shutdown_event
+
+        _run_continuous()
+
+    snapshots = mock_run_loop.call_args[1]["snapshot"]
+    assert {p: s.project for p, s in snapshots.items()} == {"GFD": "GFD", "OPS": "OPS"}
+
+
+def _open_breaker(**kwargs):
+    from jira_utils.breaker import CircuitBreaker
+
+    breaker = CircuitBreaker(min_requests=1, reset_timeout=30.0, **kwargs)
+    breaker.record(503)
+    return breaker
+
+
+def test_run_continuous_probes_while_breaker_open(capsys):
+    """While the breaker is open, only health probes are sent to Jira."""
+    mock_client = MagicMock()
+    mock_client.probe.return_value = False
+    breaker = _open_breaker()
+
+    with (
+        patch("ticket_loop.main._run_loop") as mock_run_loop,
+        patch("ticket_loop.main.CircuitBreaker", return_value=breaker),
+        patch("ticket_loop.main.BackoffTimer"),
+        patch("ticket_loop.main.threading.Event") as mock_event_cls,
+        patch("ticket_loop.main.signal.signal"),
+        _patch_load_config(),
+        _patch_jira_client(mock_client) as mock_client_cls,
+    ):
+        shutdown_event = MagicMock()
+        shutdown_event.is_set.side_effect = [False, False, True]
+        mock_event_cls.return_value = shutdown_event
+
+        _run_continuous()
+
+    mock_client_cls.assert_called_once_with(**_FAKE_CONFIG, breaker=breaker)
+    assert mock_client.probe.call_count == 2
+    mock_run_loop.assert_not_called()
+    shutdown_event.wait.assert_called_with(30.0)
+    assert "Jira still unhealthy (circuit open)" in capsys.readouterr().out
+
+
+def test_run_continuous_resumes_after_healthy_probe():
+    """A successful probe lets the loop fetch the board again."""
+    mock_client = MagicMock()
+    mock_client.probe.return_value = True
+    breaker = _open_breaker()
+
+    with (
+        patch("ticket_loop.main._run_loop", return_value=True) as mock_run_loop,
+        patch("ticket_loop.main.CircuitBreaker", return_value=breaker),
+        patch("ticket_loop.main.BackoffTimer"),
+        patch("ticket_loop.main.threading.Event") as mock_event_cls,
+        patch("ticket_loop.main.signal.signal"),
+        _patch_load_config(),
+        _patch_jira_client(mock_client),
+    ):
+        shutdown_event = MagicMock()
+        shutdown_event.is_set.side_effect = [False, True]
+        mock_event_cls.return_value = shutdown_event
+
+        _run_continuous()
+
+    mock_client.probe.assert_called_once()
+    mock_run_loop.assert_called_once()
+
+
+def test_run_continuous_circuit_open_error_skips_backoff(capsys):
+    """A request rejected by the breaker goes straight back to probing."""
+    from jira_utils.breaker import CircuitOpenError
+
+    mock_timer = MagicMock()
+
+    with (
+        patch("ticket_loop.main._run_loop", side_effect=CircuitOpenError(30.0)),
+        patch("ticket_loop.main.BackoffTimer", return_value=mock_timer),
+        patch("ticket_loop.main.threading.Event") as mock_event_cls,
+        patch("ticket_loop.main.signal.signal"),
+        _patch_load_config(),
+        _patch_jira_client(),
+    ):
+        shutdown_event = MagicMock()
+        shutdown_event.is_set.side_effect = [False, True]
+        mock_event_cls.return_value = shutdown_event
+
+        _run_continuous()
+
+    shutdown_event.wait.assert_not_called()
+    mock_timer.step.assert_not_called()
+    assert "Jira unavailable" in capsys.readouterr().out
+
+
+def test_breaker_transitions_are_logged(capsys):
+    """Breaker state changes are printed to the loop output."""
+    from ticket_loop.main import _log_breaker_change
+
+    _open_breaker(on_change=_log_breaker_change)
+
+    assert "Jira circuit breaker: closed -> open" in capsys.readouterr().out
+
+
 # -- --continuous flag wiring --
 
 
@@ -36,6 +36,10 @@ class TestResolveTaskKeyFromBranch:
         """Branches without a slug still match."""
         assert resolve_task_key_from_branch("task/GFD-7/") == "GFD-7"
 
+    def test_other_project(self):
+        """Task branches of any project key match."""
+        assert resolve_task_key_from_branch("task/OPS2-5/fix") == "OPS2-5"
+
 
 class TestResolveSessionJsonlPath:
     """Resolve task key → JSONL path via resolve_session."""
@@ -0,0 +1,341 @@
+"""Tests for the webhook receiver, replaying recorded Jira payloads."""
+
+import json
+import urllib.error
+import urllib.request
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from jira_utils.client import JiraClient
+from jira_utils.fetch_task import run_fetch_task
+from typer.testing import CliRunner
+
+from ticket_loop.main import _run_continuous, _run_loop, app
+from ticket_loop.webhooks import HEALTH_PATH, LiveBoard, WebhookServer, sign
+
+RECORDING = Path(__file__).parent / "fixtures" / "jira_webhooks.jsonl"
+
+
+def _recorded() -> list[dict]:
+    return [json.loads(line) for line in RECORDING.read_text().splitlines()]
+
+
+def _post(url: str, body: bytes, headers: dict | None = None) -> int:
+    request = urllib.request.Request(  # noqa: S310
+        url, data=body, headers=headers or {}, method="POST"
+    )
+    try:
+        with urllib.request.urlopen(request) as response:  # noqa: S310
+            return response.status
+    except urllib.error.HTTPError as exc:
+        return exc.code
+
+
+def replay(url: str, payloads: list[dict], *, secret: str | None = None) -> list[int]:
+    """POST recorded payloads to the receiver in order; return the statuses."""
+    statuses = []
+    for payload in payloads:
+        body = json.dumps(payload).encode()
+        headers = {"Content-Type": "application/json"}
+        if secret:
+            headers["X-Hub-Signature"] = sign(body, secret)
+        statuses.append(_post(url, body, headers))
+    return statuses
+
+
+def _issue(key, status, assignee=None, links=()):
+    return {
+        "key": key,
+        "fields": {
+            "summary": f"Summary for {key}",
+            "status": {"name": status},
+            "issuetype": {"name": "Task"},
+            "priority": {"name": "Medium"},
+            "assignee": {"displayName": assignee} if assignee else None,
+            "parent": None,
+            "labels": [],
+            "issuelinks": list(links),
+        },
+    }
+
+
+def _seeded_board(**kwargs) -> LiveBoard:
+    board = LiveBoard("GFD", **kwargs)
+    board.replace(
+        [
+            _issue("GFD-12", "In Progress", "Human Reviewer"),
+            _issue("GFD-13", "Review", "Agent One"),
+        ]
+    )
+    return board
+
+
+@pytest.fixture
+def server():
+    """Receiver on a free port over a seeded board."""
+    board = _seeded_board()
+    server = WebhookServer(board, port=0)
+    server.start()
+    yield server
+    server.stop()
+
+
+# -- replay harness --
+
+
+def test_replay_applies_recorded_events(server):
+    """Recorded events update the board and wake the loop."""
+    statuses = replay(server.url, _recorded())
+
+    assert statuses == [204] * len(statuses)
+    board = server.board
+    assert [i["key"] for i in board.issues()] == ["GFD-10", "GFD-11"]
+    # Comment events and other projects are ignored.
+    assert board.events == 5
+    assert board.live
+    assert board.wait(0)
+
+
+def test_replayed_board_drives_selection(server):
+    """fetch-task selects from the replayed board without a search."""
+    replay(server.url, _recorded())
+
+    result = run_fetch_task(
+        "GFD",
+        "Agent One",
+        client=MagicMock(spec=JiraClient),
+        issues=server.board.issues(),
+    )
+
+    # GFD-13 was deleted and GFD-12 (GFD-11's blocker) went Done.
+    assert result["selected_task"]["key"] == "GFD-10"
+    to_do = {t["key"]: t for t in result["board_state"]["to_do"]}
+    assert to_do["GFD-11"]["blocked_by"] == []
+
+
+def test_replay_with_secret_rejects_unsigned():
+    """With a secret, only correctly signed payloads are applied."""
+    key = "s3cret"
+    server = WebhookServer(_seeded_board(), port=0, secret=key)
+    server.start()
+    try:
+        payloads = _recorded()[:1]
+        assert replay(server.url, payloads) == [401]
+        assert replay(server.url, payloads, secret=key[::-1]) == [401]
+        assert replay(server.url, payloads, secret=key) == [204]
+    finally:
+        server.stop()
+
+
+def test_bad_requests(server):
+    """Malformed bodies and unknown paths are rejected untouched."""
+    assert _post(server.url, b"not json") == 400
+    assert _post(server.url, b"[]") == 400
+    assert _post(server.url.replace("/webhooks/jira", "/other"), b"{}") == 404
+    assert server.board.events == 0
+
+
+def test_health_endpoint(server):
+    """GET /healthz reports board stats."""
+    host, port = server.server_address[:2]
+    with urllib.request.urlopen(f"http://{host}:{port}{HEALTH_PATH}") as response:  # noqa: S310
+        stats = json.loads(response.read())
+
+    assert stats == {"projects": ["GFD"], "issues": 2, "events": 0, "live": True}
+
+
+# -- LiveBoard --
+
+
+def test_board_starts_stale_and_expires():
+    """A board is live only between a full sync and max_age."""
+    now = [0.0]
+    board = LiveBoard("GFD", max_age=60, clock=lambda: now[0])
+    assert not board.live
+
+    board.replace([])
+    assert board.live
+
+    now[0] = 61.0
+    assert not board.live
+
+
+def test_link_events_mark_board_stale():
+    """Link events cannot be applied in place and force a re-sync."""
+    board = _seeded_board()
+
+    assert board.apply({"webhookEvent": "issuelink_created", "issueLink": {}})
+    assert not board.live
+
+
+def test_wait_times_out_without_events():
+    """wait() reports a timeout when nothing changed."""
+    board = _seeded_board()
+
+    assert not board.wait(0)
+
+
+def test_resolved_blocker_patched_into_links():
+    """A blocker going Done updates the copy embedded in its links."""
+    board = LiveBoard("GFD")
+    blocker = {
+        "type": {"inward": "is blocked by"},
+        "inwardIssue": {"key": "GFD-2", "fields": {"status": {"name": "To Do"}}},
+    }
+    board.replace([_issue("GFD-1", "To Do", links=[blocker]), _issue("GFD-2", "To Do")])
+
+    board.apply(
+        {"webhookEvent": "jira:issue_updated", "issue": _issue("GFD-2", "Done")}
+    )
+
+    (issue,) = board.issues()
+    link = issue["fields"]["issuelinks"][0]
+    assert link["inwardIssue"]["fields"]["status"]["name"] == "Done"
+
+
+def test_board_tracks_several_projects():
+    """Events for any configured project are applied; others are ignored."""
+    board = LiveBoard(["GFD", "OPS"])
+    board.replace([])
+
+    assert board.apply(
+        {"webhookEvent": "jira:issue_created", "issue": _issue("OPS-1", "To Do")}
+    )
+    assert not board.apply(
+        {"webhookEvent": "jira:issue_created", "issue": _issue("GFDX-1", "To Do")}
+    )
+    assert [i["key"] for i in board.issues()] == ["OPS-1"]
+
+
+# -- dispatch loop integration --
+
+
+def test_run_loop_selects_from_live_board(monkeypatch):
+    """A live board is used as is; Jira is not queried."""
+    monkeypatch.setenv("JIRA_AGENT_USERNAME", "Agent One")
+    board = _seeded_board()
+    client = MagicMock()
+
+    with (
+        patch("ticket_loop.main.fetch_board_issues") as mock_fetch,
+        patch("ticket_loop.main.handle_review") as mock_handler,
+        patch.dict(
+            "ticket_loop.main.COLUMN_HANDLERS", {"review": mock_handler}, clear=False
+        ),
+    ):
+        assert _run_loop(client=client, board=board)
+
+    mock_fetch.assert_not_called()
+    assert mock_handler.call_args[0][0]["key"] == "GFD-13"
+
+
+def test_run_loop_seeds_stale_board(monkeypatch):
+    """A stale board is re-seeded from Jira before selection."""
+    monkeypatch.setenv("JIRA_AGENT_USERNAME", "Agent One")
+    board = LiveBoard("GFD")
+    client = MagicMock()
+
+    with patch(
+        "ticket_loop.main.fetch_board_issues",
+        return_value=[_issue("GFD-1", "To Do", "Someone")],
+    ) as mock_fetch:
+        assert not _run_loop(client=client, board=board)
+
+    mock_fetch.assert_called_once_with(["GFD"], client=client, snapshot=None)
+    assert board.live
+
+
+def test_event_during_seed_survives_replace(monkeypatch):
+    """A webhook that lands while the board is fetched is not overwritten."""
+    monkeypatch.setenv("JIRA_AGENT_USERNAME", "Agent One")
+    board = LiveBoard("GFD")
+    update = {
+        "webhookEvent": "jira:issue_updated",
+        "issue": _issue("GFD-1", "To Do", "Agent One"),
+    }
+
+    def fetch(projects, *, client, snapshot):
+        fetched = [_issue("GFD-1", "To Do", "Someone")]
+        board.apply(update)
+        return fetched
+
+    handler = MagicMock()
+    with (
+        patch("ticket_loop.main.fetch_board_issues", side_effect=fetch),
+        patch.dict("ticket_loop.main.COLUMN_HANDLERS", {"to_do": handler}),
+    ):
+        assert _run_loop(client=MagicMock(), board=board)
+
+    assert handler.call_args[0][0]["key"] == "GFD-1"
+    assert board.live
+    (issue,) = board.issues()
+    assert issue["fields"]["assignee"] == {"displayName": "Agent One"}
+
+
+def test_events_outside_sync_are_not_replayed():
+    """Only events since ``begin_sync`` are applied on top of a fetch."""
+    board = _seeded_board()
+    board.apply({"webhookEvent": "jira:issue_deleted", "issue": {"key": "GFD-12"}})
+
+    board.replace([_issue("GFD-12", "To Do")])
+
+    assert [i["key"] for i in board.issues()] == ["GFD-12"]
+
+
+def _continuous(board, found_work=False):
+    shutdown_event = MagicMock()
+    shutdown_event.is_set.side_effect = [False, True]
+    timer = MagicMock()
+    timer.delay = 60
+    with (
+        patch("ticket_loop.main._run_loop", return_value=found_work) as mock_run_loop,
+        patch("ticket_loop.main.BackoffTimer", return_value=timer),
+        patch("ticket_loop.main.threading.Event", return_value=shutdown_event),
+        patch("ticket_loop.main.signal.signal"),
+        patch("ticket_loop.main.load_config", return_value={"base_url": "u"}),
+        patch("ticket_loop.main.JiraClient"),
+    ):
+        _run_continuous(board=board)
+    return mock_run_loop, shutdown_event
+
+
+def test_idle_wait_wakes_on_event():
+    """An event ends the idle wait and keeps the board live."""
+    board = _seeded_board()
+    board.wake()
+
+    mock_run_loop, shutdown_event = _continuous(board)
+
+    assert mock_run_loop.call_args[1]["board"] is board
+    shutdown_event.wait.assert_not_called()
+    assert board.live
+
+
+def test_idle_wait_without_events_falls_back_to_polling():
+    """A quiet backoff period marks the board stale so the next pass polls."""
+    board = _seeded_board()
+    board.wait = MagicMock(return_value=False)
+
+    _continuous(board)
+
+    board.wait.assert_called_once_with(60)
+    assert not board.live
+
+
+def test_serve_webhooks_runs_continuous_and_stops_server():
+    """serve-webhooks wires the receiver into continuous mode."""
+    with (
+        patch("ticket_loop.main.WebhookServer") as mock_server_cls,
+        patch("ticket_loop.main._run_continuous") as mock_continuous,
+    ):
+        env = {"JIRA_WEBHOOK_SECRET": "s"}
+        result = CliRunner().invoke(app, ["serve-webhooks", "--port", "9999"], env=env)
+
+    assert result.exit_code == 0
+    board = mock_continuous.call_args[1]["board"]
+    mock_server_cls.assert_called_once_with(
+        board, "127.0.0.1", 9999, secret=env["JIRA_WEBHOOK_SECRET"]
+    )
+    mock_server_cls.return_value.start.assert_called_once()
+    mock_server_cls.return_value.stop.assert_called_once()
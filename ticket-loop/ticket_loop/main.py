@@ -12,15 +12,27 @@ from typing import Annotated, Any
 
 import typer
 from dotenv import load_dotenv
+from jira_utils.breaker import BreakerState, CircuitBreaker, CircuitOpenError
 from jira_utils.client import JiraClient, load_config
-from jira_utils.fetch_task import run_fetch_task
+from jira_utils.fetch_task import (
+    Snapshots,
+    fetch_board_issues,
+    run_fetch_task,
+    split_projects,
+)
+from jira_utils.snapshot import snapshot_from_env, snapshots_from_env
 
 from ticket_loop.backoff import BackoffTimer
+from ticket_loop.webhooks import SECRET_ENV, LiveBoard, WebhookServer
 
 PACKAGE_ROOT = Path(__file__).resolve().parent.parent
 REPO_ROOT = PACKAGE_ROOT.parent
 SESSIONS_FILE = PACKAGE_ROOT / "sessions.jsonl"
 
+# Comma-separated Jira projects the agent works across, in priority order
+PROJECTS_ENV = "TICKET_LOOP_PROJECTS"
+DEFAULT_PROJECTS = "GFD"
+
 PLANNING_COLUMNS = {"planning", "plan_review"}
 
 
@@ -315,21 +327,75 @@ def resume_session(issue_key: str, *, skip_permissions: bool = False) -> None:
     _run_with_session_retry(cmd, cwd=REPO_ROOT)
 
 
-def _run_loop(*, skip_permissions: bool = False) -> bool:
+def _projects() -> list[str]:
+    """Jira projects to pick tasks from, from ``TICKET_LOOP_PROJECTS``."""
+    return split_projects(os.environ.get(PROJECTS_ENV) or DEFAULT_PROJECTS)
+
+
+def _board_snapshot(base_url: str, projects: list[str]) -> Snapshots | None:
+    """Board snapshot for one project, or one per project for several."""
+    if len(projects) == 1:
+        return snapshot_from_env(base_url, projects[0])
+    return snapshots_from_env(base_url, projects)
+
+
+def _run_loop(
+    *,
+    skip_permissions: bool = False,
+    client: JiraClient | None = None,
+    snapshot: Snapshots | None = None,
+    board: LiveBoard | None = None,
+) -> bool:
     """Fetch the board and process the next agent task.
 
+    Args:
+        skip_permissions: Pass --dangerously-skip-permissions to the Claude CLI.
+        client: Pooled JiraClient to reuse. When omitted, a client is created
+            from the environment and closed once the iteration finishes.
+        snapshot: Local board snapshot (one per project when the loop serves
+            several) to sync incrementally instead of re-downloading boards.
+        board: Webhook-fed board to select from. Jira is only queried to
+            (re)seed it when it is not live.
+
     Returns:
         True if a task was dispatched, False if no work was found.
     """
+    if client is None:
+        with JiraClient(**load_config()) as owned_client:
+            return _run_loop(
+                skip_permissions=skip_permissions,
+                client=owned_client,
+                snapshot=snapshot,
+                board=board,
+            )
+
     agent_name = os.environ["JIRA_AGENT_USERNAME"]
+    projects = _projects()
     print(f"Agent: {agent_name}")
 
-    print("Fetching board state from Jira...")
-    config = load_config()
-    client = JiraClient(**config)
-    result = run_fetch_task(
-        project="GFD", assigned_to_user_name=agent_name, client=client
-    )
+    if board is None:
+        print("Fetching board state from Jira...")
+        result = run_fetch_task(
+            project=projects,
+            assigned_to_user_name=agent_name,
+            client=client,
+            snapshot=snapshot,
+        )
+    else:
+        if board.live:
+            print("Using webhook-fed board state...")
+        else:
+            print("Syncing webhook board from Jira...")
+            board.begin_sync()
+            board.replace(
+                fetch_board_issues(projects, client=client, snapshot=snapshot)
+            )
+        result = run_fetch_task(
+            project=projects,
+            assigned_to_user_name=agent_name,
+            client=client,
+            issues=board.issues(),
+        )
 
     board_state = result["board_state"]
     for col, issues in board_state.items():
@@ -350,13 +416,47 @@ def _run_loop(*, skip_permissions: bool = False) -> bool:
     return True
 
 
-def _run_continuous(*, skip_permissions: bool = False) -> None:
-    """Run _run_loop in a loop with exponential backoff on idle."""
+def _log_breaker_change(old: BreakerState, new: BreakerState) -> None:
+    """Report Jira circuit breaker transitions."""
+    print(f"Jira circuit breaker: {old.value} -> {new.value}")
+
+
+def _jira_healthy(client: JiraClient, breaker: CircuitBreaker) -> bool:
+    """Check Jira with a cheap probe while the breaker is not closed.
+
+    Returns True when the board can be fetched (breaker closed, or the probe
+    just closed it).
+    """
+    if breaker.state is BreakerState.CLOSED:
+        return True
+    print("Jira circuit breaker is open; sending health probe...")
+    return client.probe()
+
+
+def _run_continuous(
+    *, skip_permissions: bool = False, board: LiveBoard | None = None
+) -> None:
+    """Run _run_loop in a loop with exponential backoff on idle.
+
+    A single pooled JiraClient is shared by every iteration, so the
+    connection to Jira stays warm for the whole session, and the board is
+    kept in a local snapshot so each poll costs one small delta query. The
+    client's circuit breaker opens when Jira keeps failing; while open, the
+    loop sends a cheap health probe every ``reset_timeout`` seconds instead
+    of full board fetches.
+
+    With a webhook-fed ``board``, an idle wait ends as soon as an event
+    changes the board, and the next iteration selects from memory. A wait
+    that times out without events marks the board stale, so the loop falls
+    back to polling Jira.
+    """
     shutdown = threading.Event()
 
     def _handle_signal(signum: int, _frame: Any) -> None:
         print(f"\nReceived signal {signum}, shutting down...")
         shutdown.set()
+        if board is not None:
+            board.wake()
 
     signal.signal(signal.SIGINT, _handle_signal)
     signal.signal(signal.SIGTERM, _handle_signal)
@@ -364,19 +464,44 @@ def _run_continuous(*, skip_permissions: bool = False) -> None:
     timer = BackoffTimer()
     print("Continuous mode started. Press Ctrl+C to stop.")
 
-    while not shutdown.is_set():
-        try:
-            found_work = _run_loop(skip_permissions=skip_permissions)
-        except Exception as exc:
-            print(f"Error during loop iteration: {exc}")
-            found_work = False
-
-        if found_work:
-            timer.reset()
-        else:
-            print(f"No work found. Next check in {timer.delay:.0f}s...")
-            shutdown.wait(timer.delay)
-            timer.step()
+    config = load_config()
+    snapshot = _board_snapshot(config["base_url"], _projects())
+    breaker = CircuitBreaker(on_change=_log_breaker_change)
+    with JiraClient(**config, breaker=breaker) as client:
+        while not shutdown.is_set():
+            if not _jira_healthy(client, breaker):
+                print(
+                    f"Jira still unhealthy (circuit {breaker.state.value}). "
+                    f"Next probe in {breaker.reset_timeout:.0f}s..."
+                )
+                shutdown.wait(breaker.reset_timeout)
+                continue
+
+            try:
+                found_work = _run_loop(
+                    skip_permissions=skip_permissions,
+                    client=client,
+                    snapshot=snapshot,
+                    board=board,
+                )
+            except CircuitOpenError as exc:
+                print(f"Jira unavailable: {exc}")
+                continue
+            except Exception as exc:
+                print(f"Error during loop iteration: {exc}")
+                found_work = False
+
+            if found_work:
+                timer.reset()
+            else:
+                print(f"No work found. Next check in {timer.delay:.0f}s...")
+                if board is None:
+                    shutdown.wait(timer.delay)
+                elif board.wait(timer.delay):
+                    print("Board changed; checking now.")
+                else:
+                    board.mark_stale()
+                timer.step()
 
     print("Shut down complete.")
 
@@ -423,6 +548,40 @@ def main(
         _run_loop(skip_permissions=dangerously_skip_permissions)
 
 
+@app.command("serve-webhooks")
+def serve_webhooks(
+    host: Annotated[
+        str, typer.Option(help="Interface to listen on for Jira webhooks.")
+    ] = "127.0.0.1",
+    port: Annotated[int, typer.Option(help="Port to listen on.")] = 8765,
+    secret: Annotated[
+        str | None,
+        typer.Option(
+            envvar=SECRET_ENV,
+            help="Jira webhook secret; requests without a matching "
+            "X-Hub-Signature are rejected.",
+        ),
+    ] = None,
+    dangerously_skip_permissions: Annotated[
+        bool,
+        typer.Option(
+            "--dangerously-skip-permissions",
+            help="Pass --dangerously-skip-permissions to the Claude CLI, "
+            "auto-approving all tool use without permission checks.",
+        ),
+    ] = False,
+) -> None:
+    """Run the loop in continuous mode, woken by Jira issue webhooks."""
+    board = LiveBoard(_projects())
+    server = WebhookServer(board, host, port, secret=secret)
+    server.start()
+    print(f"Listening for Jira webhooks on {server.url}")
+    try:
+        _run_continuous(skip_permissions=dangerously_skip_permissions, board=board)
+    finally:
+        server.stop()
+
+
 @app.command()
 def watch(
     task: Annotated[
@@ -12,7 +12,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-_BRANCH_RE = re.compile(r"^task/(GFD-\d+)/")
+_BRANCH_RE = re.compile(r"^task/([A-Z][A-Z0-9]*-\d+)/")
 
 _TOOL_DESCRIPTION_EXTRACTORS: dict[str, list[str]] = {
     "Bash": ["description", "command"],
@@ -0,0 +1,300 @@
+"""Jira webhook receiver that keeps an in-memory board for the dispatch loop."""
+
+import copy
+import hashlib
+import hmac
+import json
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from jira_utils.fetch_task import split_projects
+from jira_utils.snapshot import RECONCILE_INTERVAL
+
+WEBHOOK_PATH = "/webhooks/jira"
+HEALTH_PATH = "/healthz"
+SECRET_ENV = "JIRA_WEBHOOK_SECRET"  # noqa: S105
+SIGNATURE_HEADER = "X-Hub-Signature"
+
+# Statuses that take an issue off the board (mirrors jira-utils fetch-task)
+_RESOLVED_STATUSES = {"Done", "Invalid"}
+
+_ISSUE_EVENTS = {"jira:issue_created", "jira:issue_updated"}
+_DELETED_EVENTS = {"jira:issue_deleted"}
+# Link events only carry issue IDs, so the board is re-synced instead.
+_LINK_EVENTS = {"issuelink_created", "issuelink_deleted"}
+
+
+class LiveBoard:
+    """Active board issues kept current by Jira webhook events.
+
+    The board is seeded with a full fetch (``replace``) and then patched by
+    ``apply`` for every issue event. Events received while a fetch is in
+    flight (after ``begin_sync``) are applied again on top of it. It counts
+    as ``live`` until it is marked stale — when an event cannot be applied
+    in place, when the dispatch loop went a whole backoff period without
+    events, or ``max_age`` seconds after the last full sync, since Jira does
+    not guarantee webhook delivery.
+    """
+
+    def __init__(
+        self,
+        project: str | Sequence[str],
+        *,
+        max_age: float = RECONCILE_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty, stale board for one or more projects."""
+        self.projects = split_projects(project)
+        self._prefixes = tuple(f"{p}-" for p in self.projects)
+        self.max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+        self._issues: dict[str, dict] = {}
+        self._statuses: dict[str, str | None] = {}
+        self._synced_at: float | None = None
+        self._stale = True
+        self._journal: list[dict] | None = None
+        self.events = 0
+
+    @property
+    def live(self) -> bool:
+        """Whether the board can be used without fetching from Jira."""
+        with self._lock:
+            return (
+                not self._stale
+                and self._synced_at is not None
+                and self._clock() - self._synced_at < self.max_age
+            )
+
+    def begin_sync(self) -> None:
+        """Start recording events for the full fetch about to be made."""
+        with self._lock:
+            self._journal = []
+
+    def replace(self, issues: Iterable[dict]) -> None:
+        """Reset the board to a full fetch of the project's active issues.
+
+        Events recorded since ``begin_sync`` may be newer than the fetch, so
+        they are applied again on top of it.
+        """
+        with self._lock:
+            self._issues = {issue["key"]: copy.deepcopy(issue) for issue in issues}
+            self._statuses = {
+                key: _status(issue) for key, issue in self._issues.items()
+            }
+            self._synced_at = self._clock()
+            self._stale = False
+            journal, self._journal = self._journal or [], None
+            for payload in journal:
+                self._apply(payload)
+
+    def mark_stale(self) -> None:
+        """Force the next dispatch iteration to re-sync from Jira."""
+        with self._lock:
+            self._stale = True
+
+    def apply(self, payload: dict) -> bool:
+        """Apply one webhook payload; wake the dispatch loop if it mattered.
+
+        Returns True when the board changed or was marked stale.
+        """
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append(payload)
+            if not self._apply(payload):
+                return False
+            if payload.get("webhookEvent") not in _LINK_EVENTS:
+                self.events += 1
+        return self._wake()
+
+    def _apply(self, payload: dict) -> bool:
+        """Apply one payload with the lock held; True if it mattered."""
+        event = payload.get("webhookEvent", "")
+        if event in _LINK_EVENTS:
+            self._stale = True
+            return True
+
+        issue = payload.get("issue") or {}
+        key = issue.get("key", "")
+        if not key.startswith(self._prefixes):
+            return False
+
+        if event in _DELETED_EVENTS:
+            self._issues.pop(key, None)
+            self._statuses[key] = None
+        elif event in _ISSUE_EVENTS:
+            status = _status(issue)
+            self._statuses[key] = status
+            if status in _RESOLVED_STATUSES:
+                self._issues.pop(key, None)
+            else:
+                # Updates keep their position. Rank is not in the payload,
+                # so new issues go last until the next full sync.
+                self._issues[key] = copy.deepcopy(issue)
+        else:
+            return False
+        return True
+
+    def issues(self) -> list[dict]:
+        """Active issues in board order, shaped like search results.
+
+        Blocker links are patched with the latest status seen for the linked
+        issue, and links to deleted issues are dropped, since an event for
+        one issue does not update the copies embedded in others.
+        """
+        with self._lock:
+            issues = copy.deepcopy(list(self._issues.values()))
+            statuses = dict(self._statuses)
+        for issue in issues:
+            fields = issue.setdefault("fields", {})
+            links = []
+            for link in fields.get("issuelinks") or []:
+                linked = link.get("inwardIssue") or link.get("outwardIssue") or {}
+                key = linked.get("key")
+                if key in statuses and statuses[key] is None:
+                    continue
+                if statuses.get(key):
+                    linked_fields = linked.setdefault("fields", {})
+                    linked_fields["status"] = {
+                        **(linked_fields.get("status") or {}),
+                        "name": statuses[key],
+                    }
+                links.append(link)
+            fields["issuelinks"] = links
+        return issues
+
+    def stats(self) -> dict:
+        """Board size, applied event count and sync state."""
+        live = self.live
+        with self._lock:
+            return {
+                "projects": self.projects,
+                "issues": len(self._issues),
+                "events": self.events,
+                "live": live,
+            }
+
+    def wake(self) -> None:
+        """Wake a dispatch loop blocked in ``wait``."""
+        self._changed.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Block until the board changes or ``timeout`` passes.
+
+        Returns True if woken by a change, False on timeout.
+        """
+        woken = self._changed.wait(timeout)
+        self._changed.clear()
+        return woken
+
+    def _wake(self) -> bool:
+        self.wake()
+        return True
+
+
+def _status(issue: dict) -> str:
+    return ((issue.get("fields") or {}).get("status") or {}).get("name", "")
+
+
+def sign(body: bytes, secret: str) -> str:
+    """Signature header value Jira sends for ``body`` with a webhook secret."""
+    digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "WebhookServer"
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Apply a Jira webhook payload to the board."""
+        if self.path.split("?", 1)[0] != WEBHOOK_PATH:
+            self._reply(HTTPStatus.NOT_FOUND)
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if not self.server.verify(body, self.headers.get(SIGNATURE_HEADER)):
+            self._reply(HTTPStatus.UNAUTHORIZED)
+            return
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self._reply(HTTPStatus.BAD_REQUEST)
+            return
+        if not isinstance(payload, dict):
+            self._reply(HTTPStatus.BAD_REQUEST)
+            return
+        self.server.board.apply(payload)
+        self._reply(HTTPStatus.NO_CONTENT)
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Report board stats for health checks."""
+        if self.path != HEALTH_PATH:
+            self._reply(HTTPStatus.NOT_FOUND)
+            return
+        self._reply(HTTPStatus.OK, self.server.board.stats())
+
+    def _reply(self, status: HTTPStatus, body: dict | None = None) -> None:
+        data = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Silence per-request access logs."""
+
+
+class WebhookServer(ThreadingHTTPServer):
+    """Local HTTP endpoint that feeds Jira webhooks into a ``LiveBoard``.
+
+    Jira posts issue events to ``WEBHOOK_PATH``; when ``secret`` is set,
+    requests must carry a matching HMAC-SHA256 ``X-Hub-Signature`` header.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        board: LiveBoard,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        *,
+        secret: str | None = None,
+    ) -> None:
+        """Bind the server; call ``start`` to begin serving."""
+        super().__init__((host, port), _Handler)
+        self.board = board
+        self._secret = secret
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Full URL of the webhook endpoint."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{WEBHOOK_PATH}"
+
+    def verify(self, body: bytes, signature: str | None) -> bool:
+        """Check the request signature when a secret is configured."""
+        if not self._secret:
+            return True
+        return signature is not None and hmac.compare_digest(
+            signature, sign(body, self._secret)
+        )
+
+    def start(self) -> None:
+        """Serve requests on a background daemon thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()